@@ -0,0 +1,10 @@
+"""Performance benchmarks for the enrollment hot paths.
+
+Benchmarks live outside ``src`` and ``tests`` on purpose: they are not part of
+the pytest suite nor of the coverage gate. Each module is runnable with
+``python -m benchmarks.<module>`` from the repository root.
+
+The registered suite (``benchmarks.suites``) is driven by ``benchmarks.run``,
+which writes JSON results; ``benchmarks.compare`` diffs two result files and
+exits non-zero on regressions over a threshold.
+"""
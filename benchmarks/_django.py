@@ -0,0 +1,75 @@
+"""Django bootstrap shared by database-backed benchmarks."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+DEFAULT_SETTINGS = "config.testing"
+
+_original_database_name: str | None = None
+
+
+def configure_django(settings_module: str = DEFAULT_SETTINGS) -> None:
+    """
+    Put the pytest.ini import roots (src and src/infrastructure/django) on the
+    path and load the app registry, without touching any database.
+    """
+    for path in (ROOT_DIR / "src" / "infrastructure" / "django", ROOT_DIR / "src"):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+    os.environ["DJANGO_SETTINGS_MODULE"] = settings_module
+
+    import django
+
+    django.setup()
+
+
+def setup_django(settings_module: str = DEFAULT_SETTINGS) -> None:
+    """
+    Configure Django and create a throwaway test database.
+
+    SQLite settings run against an in-memory database; Postgres settings create
+    (and clobber) the usual ``test_<name>`` database.
+    """
+    configure_django(settings_module)
+
+    from django.db import connection
+    from django.test.utils import setup_test_environment
+
+    global _original_database_name
+
+    setup_test_environment()
+    _original_database_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+
+
+def teardown_django() -> None:
+    """Drop the test database created by setup_django."""
+    from django.db import connection
+
+    connection.creation.destroy_test_db(_original_database_name, verbosity=0)
+
+
+class QueryCounter:
+    """Count SQL statements without keeping them (unlike CaptureQueriesContext)."""
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+    def __enter__(self) -> QueryCounter:
+        from django.db import connection
+
+        self._wrapper = connection.execute_wrapper(self)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._wrapper.__exit__(*exc_info)
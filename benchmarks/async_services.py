@@ -0,0 +1,174 @@
+"""Sync services under a thread pool against the async services, as an ASGI worker would run them.
+
+Seeds --requests active enrollments and suspends each one once, keeping
+--concurrency requests in flight on one event loop:
+
+- sync/thread_sensitive: SuspendEnrollmentService through sync_to_async()
+  with its default thread_sensitive=True, which is how Django runs a sync
+  view under ASGI (one shared thread)
+- sync/threadpool: the same service on a --threads thread pool
+- async: AsyncSuspendEnrollmentService over AsyncDjangoEnrollmentRepository
+
+Reports requests/s and p50/p99 latency per request. PostgreSQL only.
+
+    python -m benchmarks.async_services --requests 2000 --concurrency 64 --threads 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import threading
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+
+from benchmarks._django import setup_django, teardown_django
+
+Request = Callable[[str], Awaitable[object]]
+
+
+def _seed(count: int) -> list[str]:
+    from apps.academic.models.enrollment_model import EnrollmentModel
+
+    now = datetime.now(UTC)
+    rows = [
+        EnrollmentModel(
+            id=uuid.uuid4(),
+            institution_id=uuid.uuid4(),
+            student_id=uuid.uuid4(),
+            class_group_id=uuid.uuid4(),
+            academic_period_id=uuid.uuid4(),
+            state="active",
+            created_by="benchmark",
+            created_at=now,
+        )
+        for _ in range(count)
+    ]
+    EnrollmentModel.objects.bulk_create(rows, batch_size=1000)
+    return [str(row.id) for row in rows]
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    return samples[min(len(samples) - 1, round(fraction * (len(samples) - 1)))]
+
+
+async def _drive(request: Request, enrollment_ids: list[str], concurrency: int) -> dict[str, float]:
+    pending = iter(enrollment_ids)
+    latencies: list[float] = []
+    failures = 0
+
+    async def client() -> None:
+        nonlocal failures
+        for enrollment_id in pending:
+            started = time.perf_counter()
+            result = await request(enrollment_id)
+            latencies.append(time.perf_counter() - started)
+            failures += not getattr(result, "success", False)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests_per_s": len(latencies) / elapsed,
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "failures": failures,
+    }
+
+
+def _close_pool_connections(pool: ThreadPoolExecutor, threads: int) -> None:
+    from django.db import connections
+
+    # One close per worker thread: each waits at the barrier until all threads hold one
+    barrier = threading.Barrier(threads)
+
+    def close() -> None:
+        connections.close_all()
+        barrier.wait()
+
+    for future in [pool.submit(close) for _ in range(threads)]:
+        future.result()
+
+
+async def _run(mode: str, enrollment_ids: list[str], concurrency: int, threads: int) -> dict[str, float]:
+    from apps.academic.repositories.async_django_enrollment_repository import (
+        AsyncDjangoEnrollmentRepository,
+    )
+    from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+    from asgiref.sync import sync_to_async
+    from django.db import connections
+
+    from application.academic.enrollment.services.suspend_enrollment import (
+        AsyncSuspendEnrollmentService,
+        SuspendEnrollmentService,
+    )
+
+    actor_id = str(uuid.uuid4())
+    sync_service = SuspendEnrollmentService(repo=DjangoEnrollmentRepository())
+
+    def suspend(enrollment_id: str) -> object:
+        return sync_service.execute(enrollment_id=enrollment_id, actor_id=actor_id, justification="benchmark")
+
+    if mode == "sync/thread_sensitive":
+        request: Request = sync_to_async(suspend)
+        stats = await _drive(request, enrollment_ids, concurrency)
+    elif mode == "sync/threadpool":
+        loop = asyncio.get_running_loop()
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            stats = await _drive(lambda enrollment_id: loop.run_in_executor(pool, suspend, enrollment_id),
+                                 enrollment_ids, concurrency)
+            await loop.run_in_executor(None, _close_pool_connections, pool, threads)
+    else:
+        async_service = AsyncSuspendEnrollmentService(repo=AsyncDjangoEnrollmentRepository())
+        stats = await _drive(
+            lambda enrollment_id: async_service.execute(
+                enrollment_id=enrollment_id, actor_id=actor_id, justification="benchmark",
+            ),
+            enrollment_ids,
+            concurrency,
+        )
+    await sync_to_async(connections.close_all)()
+    return stats
+
+
+MODES = ("sync/thread_sensitive", "sync/threadpool", "async")
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=64, help="Requests in flight.")
+    parser.add_argument("--threads", type=int, default=16, help="Pool size for sync/threadpool.")
+    parser.add_argument("--settings", default="config.testing_pg")
+    args = parser.parse_args(argv)
+
+    setup_django(args.settings)
+    try:
+        from django.db import connection
+
+        if connection.vendor != "postgresql":
+            parser.error("the async benchmark needs PostgreSQL settings")
+        ids = {mode: _seed(args.requests) for mode in MODES}
+        connection.close()
+        results = {
+            mode: asyncio.run(_run(mode, ids[mode], args.concurrency, args.threads))
+            for mode in MODES
+        }
+    finally:
+        teardown_django()
+
+    print(f"requests={args.requests} concurrency={args.concurrency} threads={args.threads} settings={args.settings}")
+    print(f"{'mode':<24}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'failures':>10}")
+    for mode, stats in results.items():
+        print(
+            f"{mode:<24}{stats['requests_per_s']:>10.1f}{stats['p50_ms']:>10.2f}"
+            f"{stats['p99_ms']:>10.2f}{stats['failures']:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Per-item cost of the bulk state-change services against the single-item service.
+
+Seeds N active enrollments, suspends them once through SuspendEnrollmentService
+(one execute() per id) and once through BulkSuspendEnrollmentService, and
+reports wall time and SQL statements per item for each path.
+
+    python -m benchmarks.bulk_state_change --count 2000
+    python -m benchmarks.bulk_state_change --count 2000 --settings config.testing_pg
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+from datetime import UTC, datetime
+
+from benchmarks._django import DEFAULT_SETTINGS, QueryCounter, setup_django, teardown_django
+
+
+def _seed(count: int) -> list[str]:
+    from apps.academic.models.enrollment_model import EnrollmentModel
+
+    now = datetime.now(UTC)
+    class_group_id = uuid.uuid4()
+    academic_period_id = uuid.uuid4()
+    rows = [
+        EnrollmentModel(
+            id=uuid.uuid4(),
+            institution_id=uuid.uuid4(),
+            student_id=uuid.uuid4(),
+            class_group_id=class_group_id,
+            academic_period_id=academic_period_id,
+            state="active",
+            created_by="benchmark",
+            created_at=now,
+        )
+        for _ in range(count)
+    ]
+    EnrollmentModel.objects.bulk_create(rows, batch_size=1000)
+    return [str(row.id) for row in rows]
+
+
+def _measure(label: str, count: int, run) -> dict[str, float]:
+    with QueryCounter() as queries:
+        started = time.perf_counter()
+        results = run()
+        elapsed = time.perf_counter() - started
+
+    assert len(results) == count and all(result.changed for result in results), label
+    return {
+        "us_per_item": elapsed / count * 1_000_000,
+        "queries_per_item": queries.count / count,
+        "total_seconds": elapsed,
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--settings", default=DEFAULT_SETTINGS)
+    args = parser.parse_args(argv)
+
+    setup_django(args.settings)
+    try:
+        from apps.academic.repositories.django_enrollment_repository import (
+            DjangoEnrollmentRepository,
+        )
+
+        from application.academic.enrollment.services.bulk_suspend_enrollment import (
+            BulkSuspendEnrollmentService,
+        )
+        from application.academic.enrollment.services.suspend_enrollment import (
+            SuspendEnrollmentService,
+        )
+
+        repo = DjangoEnrollmentRepository()
+        actor_id = str(uuid.uuid4())
+
+        single_ids = _seed(args.count)
+        single_service = SuspendEnrollmentService(repo=repo)
+        single = _measure("single", args.count, lambda: [
+            single_service.execute(enrollment_id=enrollment_id, actor_id=actor_id, justification="benchmark")
+            for enrollment_id in single_ids
+        ])
+
+        bulk_ids = _seed(args.count)
+        bulk_service = BulkSuspendEnrollmentService(repo=repo, batch_size=args.batch_size)
+        bulk = _measure("bulk", args.count, lambda: bulk_service.execute(
+            enrollment_ids=bulk_ids, actor_id=actor_id, justification="benchmark",
+        ))
+    finally:
+        teardown_django()
+
+    print(f"items={args.count} batch_size={args.batch_size} settings={args.settings}")
+    print(f"{'path':<8}{'us/item':>12}{'queries/item':>15}{'total s':>10}")
+    for label, stats in (("single", single), ("bulk", bulk)):
+        print(
+            f"{label:<8}{stats['us_per_item']:>12.1f}"
+            f"{stats['queries_per_item']:>15.2f}{stats['total_seconds']:>10.2f}"
+        )
+    print(f"speedup x{single['us_per_item'] / bulk['us_per_item']:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compare two ``benchmarks.run`` result files and flag regressions.
+
+    python -m benchmarks.compare bench/baseline.json bench/current.json --threshold 0.10
+
+A benchmark regresses when its ops/sec drops by more than the threshold
+(fraction of the baseline) or when it issues more SQL statements per op; query
+counts are deterministic, so any increase counts. Exits with status 1 when at
+least one benchmark regressed, so it can gate CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Comparison:
+    name: str
+    baseline_ops: float
+    current_ops: float
+    baseline_queries: float | None
+    current_queries: float | None
+    threshold: float
+
+    @property
+    def change(self) -> float:
+        return self.current_ops / self.baseline_ops - 1 if self.baseline_ops else 0.0
+
+    @property
+    def slower(self) -> bool:
+        return self.change < -self.threshold
+
+    @property
+    def more_queries(self) -> bool:
+        if self.baseline_queries is None or self.current_queries is None:
+            return False
+        return self.current_queries > self.baseline_queries + 1e-9
+
+    @property
+    def regressed(self) -> bool:
+        return self.slower or self.more_queries
+
+
+def load(path: Path) -> dict[str, dict[str, Any]]:
+    return json.loads(path.read_text())["results"]
+
+
+def compare(
+        baseline: dict[str, dict[str, Any]],
+        current: dict[str, dict[str, Any]],
+        *,
+        threshold: float,
+) -> list[Comparison]:
+    return [
+        Comparison(
+            name=name,
+            baseline_ops=baseline[name]["ops_per_sec"],
+            current_ops=current[name]["ops_per_sec"],
+            baseline_queries=baseline[name]["queries_per_op"],
+            current_queries=current[name]["queries_per_op"],
+            threshold=threshold,
+        )
+        for name in sorted(baseline.keys() & current.keys())
+    ]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.10, help="Tolerated ops/sec drop (0.10 = 10%%).")
+    args = parser.parse_args(argv)
+
+    baseline, current = load(args.baseline), load(args.current)
+    comparisons = compare(baseline, current, threshold=args.threshold)
+
+    print(f"{'benchmark':<38}{'base ops/s':>12}{'ops/s':>12}{'change':>9}{'queries':>13}")
+    for c in comparisons:
+        queries = "" if c.current_queries is None else f"{c.baseline_queries:g}->{c.current_queries:g}"
+        flag = "  REGRESSION" if c.regressed else ""
+        print(f"{c.name:<38}{c.baseline_ops:>12.1f}{c.current_ops:>12.1f}{c.change:>+9.1%}{queries:>13}{flag}")
+    for name in sorted(baseline.keys() - current.keys()):
+        print(f"{name:<38} missing from current run")
+    for name in sorted(current.keys() - baseline.keys()):
+        print(f"{name:<38} new (no baseline)")
+
+    regressions = [c.name for c in comparisons if c.regressed]
+    print(f"{len(regressions)} regression(s) over threshold {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
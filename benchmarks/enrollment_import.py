@@ -0,0 +1,117 @@
+"""Throughput and memory of the streaming enrollment import against CreateEnrollment.
+
+Writes a CSV of N unique enrollments to a temporary directory, creates them
+once through CreateEnrollment (one execute() per row) and once through
+ImportEnrollments + write_results (chunked create_many), and reports rows/s
+and SQL statements per row. Then imports files of N and 4N rows under
+tracemalloc and reports the peak traced memory of each: a streaming import
+keeps it flat as the file grows.
+
+    python -m benchmarks.enrollment_import --count 5000
+    python -m benchmarks.enrollment_import --count 5000 --settings config.testing_pg
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import tempfile
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+from benchmarks._django import DEFAULT_SETTINGS, QueryCounter, setup_django, teardown_django
+
+FIELDS = ("institution_id", "student_id", "class_group_id", "academic_period_id")
+
+
+def _write_csv(path: Path, count: int) -> None:
+    institution_id, class_group_id, academic_period_id = (str(uuid.uuid4()) for _ in range(3))
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(FIELDS)
+        for _ in range(count):
+            writer.writerow((institution_id, str(uuid.uuid4()), class_group_id, academic_period_id))
+
+
+def _import(path: Path, chunk_size: int, actor_id: str) -> int:
+    from apps.academic.importing.enrollment_import import iter_csv_rows, write_results
+    from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+
+    from application.academic.enrollment.services.import_enrollments import ImportEnrollments
+
+    service = ImportEnrollments(DjangoEnrollmentRepository(), chunk_size=chunk_size)
+    with path.open(encoding="utf-8", newline="") as source, open(f"{path}.results", "w", encoding="utf-8") as target:
+        summary = write_results(service.execute(rows=iter_csv_rows(source), actor_id=actor_id), target)
+    assert summary.failed == 0, summary
+    return summary.rows
+
+
+def _create_one_by_one(path: Path, actor_id: str) -> int:
+    from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+
+    from application.academic.enrollment.services.create_enrollment import CreateEnrollment
+
+    service = CreateEnrollment(DjangoEnrollmentRepository())
+    rows = 0
+    with path.open(encoding="utf-8", newline="") as source:
+        for record in csv.DictReader(source):
+            assert service.execute(**record, actor_id=actor_id).success
+            rows += 1
+    return rows
+
+
+def _timed(run) -> dict[str, float]:
+    with QueryCounter() as queries:
+        started = time.perf_counter()
+        rows = run()
+        elapsed = time.perf_counter() - started
+    return {"rows_per_s": rows / elapsed, "queries_per_row": queries.count / rows, "total_seconds": elapsed}
+
+
+def _peak_mb(path: Path, chunk_size: int, actor_id: str) -> float:
+    tracemalloc.start()
+    try:
+        _import(path, chunk_size, actor_id)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / 2**20
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--settings", default=DEFAULT_SETTINGS)
+    args = parser.parse_args(argv)
+
+    actor_id = str(uuid.uuid4())
+    setup_django(args.settings)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            files = {name: Path(tmp) / f"{name}.csv" for name in ("single", "import", "peak_1x", "peak_4x")}
+            for name, path in files.items():
+                _write_csv(path, args.count * 4 if name == "peak_4x" else args.count)
+
+            single = _timed(lambda: _create_one_by_one(files["single"], actor_id))
+            chunked = _timed(lambda: _import(files["import"], args.chunk_size, actor_id))
+            peak_1x = _peak_mb(files["peak_1x"], args.chunk_size, actor_id)
+            peak_4x = _peak_mb(files["peak_4x"], args.chunk_size, actor_id)
+    finally:
+        teardown_django()
+
+    print(f"rows={args.count} chunk_size={args.chunk_size} settings={args.settings}")
+    print(f"{'path':<8}{'rows/s':>12}{'queries/row':>14}{'total s':>10}")
+    for label, stats in (("single", single), ("import", chunked)):
+        print(
+            f"{label:<8}{stats['rows_per_s']:>12.0f}"
+            f"{stats['queries_per_row']:>14.3f}{stats['total_seconds']:>10.2f}"
+        )
+    print(f"speedup x{chunked['rows_per_s'] / single['rows_per_s']:.2f}")
+    print(f"peak traced MB: {args.count} rows {peak_1x:.1f}, {args.count * 4} rows {peak_4x:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""Benchmark registry and measurement primitives.
+
+A benchmark is a *setup* function registered with ``@benchmark``. The runner
+calls ``setup(n)`` and gets back an operation that it then calls exactly ``n``
+times; everything the operation consumes (fresh aggregates, seeded rows) is
+prepared by the setup, so only the operation itself is timed.
+"""
+
+from __future__ import annotations
+
+import gc
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+Operation = Callable[[], Any]
+Setup = Callable[[int], Operation]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    group: str
+    setup: Setup
+    iterations: int
+    needs_db: bool
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    name: str
+    group: str
+    iterations: int
+    ops_per_sec: float
+    mean_us: float
+    p50_us: float
+    p99_us: float
+    alloc_peak_bytes: int
+    queries_per_op: float | None
+
+
+@dataclass
+class BenchmarkRun:
+    meta: dict[str, Any]
+    results: dict[str, BenchmarkResult] = field(default_factory=dict)
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "meta": self.meta,
+            "results": {name: asdict(result) for name, result in sorted(self.results.items())},
+        }
+
+
+REGISTRY: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, *, group: str, iterations: int, needs_db: bool = False) -> Callable[[Setup], Setup]:
+    """Register a setup function under ``name``; names must be unique."""
+
+    def register(setup: Setup) -> Setup:
+        if name in REGISTRY:
+            raise ValueError(f"Benchmark already registered: {name}")
+        REGISTRY[name] = Benchmark(name=name, group=group, setup=setup, iterations=iterations, needs_db=needs_db)
+        return setup
+
+    return register
+
+
+def run_meta(*, settings: str) -> dict[str, Any]:
+    return {
+        "created_at": datetime.now(UTC).isoformat(),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "settings": settings,
+    }
+
+
+def _percentile(sorted_samples: list[int], fraction: float) -> float:
+    index = min(len(sorted_samples) - 1, round(fraction * (len(sorted_samples) - 1)))
+    return sorted_samples[index] / 1000
+
+
+def _timed_pass(operation: Operation, iterations: int) -> list[int]:
+    samples = [0] * iterations
+    clock = time.perf_counter_ns
+    gc_was_enabled = gc.isenabled()
+    gc.disable()  # collections are charged to whichever op triggers them otherwise
+    try:
+        for i in range(iterations):
+            started = clock()
+            operation()
+            samples[i] = clock() - started
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return samples
+
+
+def _alloc_pass(operation: Operation, iterations: int) -> int:
+    """Median of the peak traced memory of each single op."""
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(iterations):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            operation()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+    finally:
+        tracemalloc.stop()
+    return int(statistics.median(peaks))
+
+
+def measure(
+        bench: Benchmark,
+        *,
+        iterations: int | None = None,
+        warmup: int | None = None,
+        alloc_iterations: int = 100,
+        query_counter: Callable[[], Any] | None = None,
+) -> BenchmarkResult:
+    """
+    Warm up, then time ``iterations`` calls one by one (GC paused), then run a
+    separate tracemalloc pass: tracing slows every allocation down, so it never
+    overlaps the timed pass. ``query_counter`` (a QueryCounter factory) wraps the
+    timed pass of database benchmarks.
+    """
+    iterations = iterations or bench.iterations
+    warmup = bench.iterations // 10 if warmup is None else warmup
+    if warmup:
+        _timed_pass(bench.setup(warmup), warmup)
+
+    operation = bench.setup(iterations)
+    queries_per_op = None
+    if query_counter is not None:
+        with query_counter() as counter:
+            samples = _timed_pass(operation, iterations)
+        queries_per_op = counter.count / iterations
+    else:
+        samples = _timed_pass(operation, iterations)
+
+    alloc_iterations = min(alloc_iterations, iterations)
+    alloc_peak_bytes = _alloc_pass(bench.setup(alloc_iterations), alloc_iterations)
+
+    total_ns = sum(samples)
+    samples.sort()
+    return BenchmarkResult(
+        name=bench.name,
+        group=bench.group,
+        iterations=iterations,
+        ops_per_sec=iterations / (total_ns / 1e9) if total_ns else float("inf"),
+        mean_us=total_ns / iterations / 1000,
+        p50_us=_percentile(samples, 0.50),
+        p99_us=_percentile(samples, 0.99),
+        alloc_peak_bytes=alloc_peak_bytes,
+        queries_per_op=queries_per_op,
+    )
@@ -0,0 +1,162 @@
+"""Conflict rate and throughput of KeyedLaneExecutor against a naive thread pool.
+
+Seeds --hot enrollments and submits --commands suspend/reactivate commands,
+each to a random one of them (seeded), every enrollment alternating suspend,
+reactivate, ... in stream order. The same stream runs through:
+
+- pool: --workers threads taking commands from one shared queue, so commands
+  for the same enrollment race on the optimistic version check
+- lanes: KeyedLaneExecutor(lanes=--workers), commands keyed by enrollment id
+
+Reports commands/s, applied state changes/s, and the share of commands that
+ended in CONCURRENCY_CONFLICT or ran out of order (no-change results).
+PostgreSQL only.
+
+    python -m benchmarks.lane_executor --workers 8 --hot 32 --commands 4000
+"""
+
+from __future__ import annotations
+
+import argparse
+import queue
+import random
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+
+from benchmarks._django import setup_django, teardown_django
+
+Command = tuple[str, Callable[..., object]]
+
+
+def _seed(count: int) -> list[str]:
+    from apps.academic.models.enrollment_model import EnrollmentModel
+
+    now = datetime.now(UTC)
+    rows = [
+        EnrollmentModel(
+            id=uuid.uuid4(),
+            institution_id=uuid.uuid4(),
+            student_id=uuid.uuid4(),
+            class_group_id=uuid.uuid4(),
+            academic_period_id=uuid.uuid4(),
+            state="active",
+            created_by="benchmark",
+            created_at=now,
+        )
+        for _ in range(count)
+    ]
+    EnrollmentModel.objects.bulk_create(rows)
+    return [str(row.id) for row in rows]
+
+
+def _stream(enrollment_ids: list[str], count: int) -> list[Command]:
+    from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+
+    from application.academic.enrollment.services.reactivate_enrollment import (
+        ReactivateEnrollmentService,
+    )
+    from application.academic.enrollment.services.suspend_enrollment import (
+        SuspendEnrollmentService,
+    )
+
+    repo = DjangoEnrollmentRepository()
+    commands = (SuspendEnrollmentService(repo=repo).execute, ReactivateEnrollmentService(repo=repo).execute)
+    rng = random.Random(20)
+    issued = dict.fromkeys(enrollment_ids, 0)
+    stream: list[Command] = []
+    for _ in range(count):
+        enrollment_id = rng.choice(enrollment_ids)
+        stream.append((enrollment_id, commands[issued[enrollment_id] % 2]))
+        issued[enrollment_id] += 1
+    return stream
+
+
+def _call(enrollment_id: str, execute: Callable[..., object], actor_id: str):
+    return execute(enrollment_id=enrollment_id, actor_id=actor_id, justification="benchmark")
+
+
+def run_pool(stream: list[Command], workers: int, actor_id: str) -> list[object]:
+    from django.db import connections
+
+    pending: queue.Queue[Command | None] = queue.Queue()
+    results: list[object] = []
+
+    def work() -> None:
+        try:
+            while (command := pending.get()) is not None:
+                results.append(_call(*command, actor_id))
+        finally:
+            connections.close_all()
+
+    for command in stream:
+        pending.put(command)
+    for _ in range(workers):
+        pending.put(None)
+    threads = [threading.Thread(target=work) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def run_lanes(stream: list[Command], workers: int, actor_id: str) -> list[object]:
+    from django.db import connections
+
+    from infrastructure.concurrency.keyed_executor import KeyedLaneExecutor
+
+    with KeyedLaneExecutor(lanes=workers, max_queue_depth=len(stream), on_lane_exit=connections.close_all) as lanes:
+        futures = [lanes.submit(enrollment_id, _call, enrollment_id, execute, actor_id) for enrollment_id, execute in stream]
+        return [future.result() for future in futures]
+
+
+def _measure(run, stream: list[Command], workers: int) -> dict[str, float]:
+    actor_id = str(uuid.uuid4())
+    started = time.perf_counter()
+    results = run(stream, workers, actor_id)
+    elapsed = time.perf_counter() - started
+    conflicts = sum(1 for result in results if not result.success)
+    out_of_order = sum(1 for result in results if result.success and not result.changed)
+    return {
+        "commands_per_s": len(results) / elapsed,
+        "changes_per_s": (len(results) - conflicts - out_of_order) / elapsed,
+        "conflict_rate": conflicts / len(results),
+        "out_of_order_rate": out_of_order / len(results),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--hot", type=int, default=32, help="Enrollments the commands target.")
+    parser.add_argument("--commands", type=int, default=4000)
+    parser.add_argument("--settings", default="config.testing_pg")
+    args = parser.parse_args(argv)
+
+    setup_django(args.settings)
+    try:
+        from django.db import connection
+
+        if connection.vendor != "postgresql":
+            parser.error("the executor benchmark needs PostgreSQL settings")
+        results = {
+            label: _measure(run, _stream(_seed(args.hot), args.commands), args.workers)
+            for label, run in (("pool", run_pool), ("lanes", run_lanes))
+        }
+    finally:
+        teardown_django()
+
+    print(f"workers={args.workers} hot={args.hot} commands={args.commands} settings={args.settings}")
+    print(f"{'executor':<10}{'cmd/s':>10}{'changes/s':>11}{'conflicts':>11}{'out of order':>14}")
+    for label, stats in results.items():
+        print(
+            f"{label:<10}{stats['commands_per_s']:>10.1f}{stats['changes_per_s']:>11.1f}"
+            f"{stats['conflict_rate']:>10.1%} {stats['out_of_order_rate']:>13.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
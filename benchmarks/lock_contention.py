@@ -0,0 +1,153 @@
+"""Throughput and tail latency of the repository locking modes under contention.
+
+Seeds a few hot enrollments and lets --threads workers run suspend/reactivate
+commands on them through the application services, each thread with its own
+connection, once per mode:
+
+- optimistic: plain loads; a lost race is returned as CONCURRENCY_CONFLICT
+- optimistic+retry: the same, with the services' default RetryPolicy
+- for_update / advisory: locking loads, one transaction per command
+
+Reports commands/s, p50/p99 latency per command, how many commands ended in
+a conflict and how many retries were made. PostgreSQL only (SQLite has no row
+locks and its in-memory test database is per connection).
+
+    python -m benchmarks.lock_contention --threads 8 --commands 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import threading
+import time
+import uuid
+from datetime import UTC, datetime
+
+from benchmarks._django import setup_django, teardown_django
+
+MODES = ("optimistic", "optimistic+retry", "for_update", "advisory")
+
+
+def _seed(count: int) -> list[str]:
+    from apps.academic.models.enrollment_model import EnrollmentModel
+
+    now = datetime.now(UTC)
+    rows = [
+        EnrollmentModel(
+            id=uuid.uuid4(),
+            institution_id=uuid.uuid4(),
+            student_id=uuid.uuid4(),
+            class_group_id=uuid.uuid4(),
+            academic_period_id=uuid.uuid4(),
+            state="active",
+            created_by="benchmark",
+            created_at=now,
+        )
+        for _ in range(count)
+    ]
+    EnrollmentModel.objects.bulk_create(rows)
+    return [str(row.id) for row in rows]
+
+
+def _services(mode: str):
+    from apps.academic.repositories.django_enrollment_repository import (
+        DjangoEnrollmentRepository,
+        LockingMode,
+    )
+    from apps.academic.repositories.django_transaction_manager import DjangoTransactionManager
+
+    from application.academic.enrollment.services.reactivate_enrollment import (
+        ReactivateEnrollmentService,
+    )
+    from application.academic.enrollment.services.suspend_enrollment import (
+        SuspendEnrollmentService,
+    )
+    from application.shared.retry_policy import RetryPolicy
+
+    if mode.startswith("optimistic"):
+        repo = DjangoEnrollmentRepository()
+        options = {"retry_policy": RetryPolicy()} if mode.endswith("+retry") else {}
+    else:
+        repo = DjangoEnrollmentRepository(locking=LockingMode(mode))
+        options = {"transaction": DjangoTransactionManager()}
+    return (
+        SuspendEnrollmentService(repo=repo, **options),
+        ReactivateEnrollmentService(repo=repo, **options),
+    )
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    return samples[min(len(samples) - 1, round(fraction * (len(samples) - 1)))]
+
+
+def run_mode(mode: str, enrollment_ids: list[str], threads: int, commands: int) -> dict[str, float]:
+    from django.db import connections
+
+    services = _services(mode)
+    actor_id = str(uuid.uuid4())
+    start = threading.Barrier(threads + 1)
+    latencies: list[list[float]] = [[] for _ in range(threads)]
+    conflicts = [0] * threads
+
+    def worker(index: int) -> None:
+        try:
+            start.wait()
+            for step in range(commands):
+                service = services[(index + step) % 2]
+                enrollment_id = enrollment_ids[(index + step) % len(enrollment_ids)]
+                started = time.perf_counter()
+                result = service.execute(enrollment_id=enrollment_id, actor_id=actor_id, justification="benchmark")
+                latencies[index].append(time.perf_counter() - started)
+                conflicts[index] += not result.success
+        finally:
+            connections.close_all()
+
+    workers = [threading.Thread(target=worker, args=(index,)) for index in range(threads)]
+    for thread in workers:
+        thread.start()
+    start.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    samples = sorted(latency for per_thread in latencies for latency in per_thread)
+    retry_stats = [service.retry_stats for service in services if service.retry_stats is not None]
+    return {
+        "commands_per_s": len(samples) / elapsed,
+        "p50_ms": _percentile(samples, 0.50) * 1000,
+        "p99_ms": _percentile(samples, 0.99) * 1000,
+        "conflicts": sum(conflicts),
+        "retries": sum(stats.retries for stats in retry_stats),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--commands", type=int, default=200, help="Commands per thread.")
+    parser.add_argument("--hot", type=int, default=1, help="Enrollments the threads contend on.")
+    parser.add_argument("--settings", default="config.testing_pg")
+    args = parser.parse_args(argv)
+
+    setup_django(args.settings)
+    try:
+        from django.db import connection
+
+        if connection.vendor != "postgresql":
+            parser.error("the contention benchmark needs PostgreSQL settings")
+        results = {mode: run_mode(mode, _seed(args.hot), args.threads, args.commands) for mode in MODES}
+    finally:
+        teardown_django()
+
+    print(f"threads={args.threads} commands/thread={args.commands} hot={args.hot} settings={args.settings}")
+    print(f"{'mode':<18}{'cmd/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'conflicts':>11}{'retries':>9}")
+    for mode, stats in results.items():
+        print(
+            f"{mode:<18}{stats['commands_per_s']:>10.1f}{stats['p50_ms']:>10.2f}"
+            f"{stats['p99_ms']:>10.2f}{stats['conflicts']:>11}{stats['retries']:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
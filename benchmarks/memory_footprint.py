@@ -0,0 +1,110 @@
+"""Memory retained by rehydrated transition histories.
+
+Builds unsaved EnrollmentModel / EnrollmentTransitionModel instances in
+chunks, maps them through EnrollmentMapper.to_domain and keeps only the
+resulting aggregates, then reports how many bytes each loaded transition
+retains (tracemalloc: the StateTransition VO, its actor_id string and its
+slot in the history list) next to the shallow size of one StateTransition.
+No database is touched.
+
+    python -m benchmarks.memory_footprint --count 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import tracemalloc
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from benchmarks._django import DEFAULT_SETTINGS, configure_django
+
+BASE_TIME = datetime(2026, 1, 5, 8, 0, tzinfo=UTC)
+
+
+def _models(history: int):
+    """One active snapshot whose history alternates suspend/reactivate ``history`` times (even)."""
+    from apps.academic.models.enrollment_model import EnrollmentModel
+    from apps.academic.models.enrollment_transition import EnrollmentTransitionModel
+
+    enrollment_id = uuid.uuid4()
+    # UUIDField values, as the ORM hands them back: the mapper builds one str per row
+    actor_id = uuid.uuid4()
+    occurred = [BASE_TIME + timedelta(minutes=step + 1) for step in range(history)]
+    snapshot = EnrollmentModel(
+        id=enrollment_id,
+        institution_id=uuid.uuid4(),
+        student_id=uuid.uuid4(),
+        class_group_id=uuid.uuid4(),
+        academic_period_id=uuid.uuid4(),
+        created_by="benchmark",
+        state="active",
+        created_at=BASE_TIME,
+        reactivated_at=occurred[-1] if occurred else None,
+        version=history + 1,
+    )
+    transitions = [
+        EnrollmentTransitionModel(
+            enrollment_id=enrollment_id,
+            action="suspend" if step % 2 == 0 else "reactivate",
+            from_state="active" if step % 2 == 0 else "suspended",
+            to_state="suspended" if step % 2 == 0 else "active",
+            actor_id=actor_id,
+            occurred_at=occurred_at,
+            justification="benchmark",
+        )
+        for step, occurred_at in enumerate(occurred)
+    ]
+    return snapshot, transitions
+
+
+def measure(count: int, history: int) -> dict[str, float]:
+    from apps.academic.mappers.enrollment_mapper import EnrollmentMapper
+
+    loaded = []
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(count // history):
+            snapshot, transitions = _models(history)
+            loaded.append(EnrollmentMapper.to_domain(snapshot=snapshot, transitions=transitions))
+            del snapshot, transitions
+        gc.collect()
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    total = sum(len(enrollment.transitions) for enrollment in loaded)
+    sample = loaded[0].transitions[0]
+    return {
+        "transitions": total,
+        "retained_mb": (retained - baseline) / 2**20,
+        "bytes_per_transition": (retained - baseline) / total,
+        "transition_sizeof": sys.getsizeof(sample),
+        "has_dict": hasattr(sample, "__dict__"),
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000, help="Transitions to load in total.")
+    parser.add_argument("--history", type=int, default=1000, help="Transitions per enrollment (even).")
+    parser.add_argument("--settings", default=DEFAULT_SETTINGS)
+    args = parser.parse_args(argv)
+    if args.history < 2 or args.history % 2:
+        parser.error("--history must be an even number >= 2")
+
+    configure_django(args.settings)
+    stats = measure(args.count, args.history)
+
+    print(f"transitions={stats['transitions']} history={args.history} python={sys.version.split()[0]}")
+    print(f"retained MB             {stats['retained_mb']:>10.1f}")
+    print(f"bytes per transition    {stats['bytes_per_transition']:>10.1f}")
+    print(f"StateTransition sizeof  {stats['transition_sizeof']:>10}  (__dict__: {stats['has_dict']})")
+
+
+if __name__ == "__main__":
+    main()
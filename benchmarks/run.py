@@ -0,0 +1,92 @@
+"""Run the registered hot-path benchmarks and write the results as JSON.
+
+    python -m benchmarks.run --output bench/baseline.json
+    python -m benchmarks.run -k mapper -k domain.enrollment --scale 0.2
+    python -m benchmarks.run --settings config.testing_pg --output bench/pg.json
+    python -m benchmarks.run --list
+
+Each result reports ops/sec, mean/p50/p99 latency, the median peak memory
+allocated by one op (tracemalloc) and, for database benchmarks, SQL statements
+per op. Compare two result files with ``python -m benchmarks.compare``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+
+from benchmarks._django import (
+    DEFAULT_SETTINGS,
+    QueryCounter,
+    configure_django,
+    setup_django,
+    teardown_django,
+)
+from benchmarks.harness import REGISTRY, Benchmark, BenchmarkResult, BenchmarkRun, measure, run_meta
+
+
+def select(patterns: list[str], *, include_db: bool) -> list[Benchmark]:
+    selected = [
+        bench for name, bench in sorted(REGISTRY.items())
+        if (not patterns or any(pattern in name for pattern in patterns)) and (include_db or not bench.needs_db)
+    ]
+    if not selected:
+        raise SystemExit("No benchmark matches the given filters.")
+    return selected
+
+
+def format_result(result: BenchmarkResult) -> str:
+    queries = "" if result.queries_per_op is None else f"{result.queries_per_op:.2f}"
+    return (
+        f"{result.name:<38}{result.ops_per_sec:>12.1f}{result.p50_us:>11.1f}"
+        f"{result.p99_us:>11.1f}{result.alloc_peak_bytes:>12}{queries:>10}"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-k", dest="patterns", action="append", default=[], help="Substring of benchmark names.")
+    parser.add_argument("--settings", default=DEFAULT_SETTINGS)
+    parser.add_argument("--output", type=Path, default=None, help="Write the results JSON here.")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every iteration count.")
+    parser.add_argument("--no-db", action="store_true", help="Skip database-backed benchmarks.")
+    parser.add_argument("--list", action="store_true", help="Print the benchmark names and exit.")
+    args = parser.parse_args(argv)
+
+    configure_django(args.settings)
+    import benchmarks.suites  # noqa: F401  (registers the benchmarks)
+
+    selected = select(args.patterns, include_db=not args.no_db)
+    if args.list:
+        for bench in selected:
+            print(f"{bench.name:<38}{bench.group:<12}{bench.iterations:>8}{'  db' if bench.needs_db else ''}")
+        return
+
+    needs_db = any(bench.needs_db for bench in selected)
+    if needs_db:
+        setup_django(args.settings)
+
+    run = BenchmarkRun(meta=run_meta(settings=args.settings))
+    print(f"{'benchmark':<38}{'ops/s':>12}{'p50 us':>11}{'p99 us':>11}{'alloc B':>12}{'queries':>10}")
+    try:
+        for bench in selected:
+            result = measure(
+                bench,
+                iterations=max(1, int(bench.iterations * args.scale)),
+                query_counter=QueryCounter if bench.needs_db else None,
+            )
+            run.results[bench.name] = result
+            print(format_result(result), flush=True)
+    finally:
+        if needs_db:
+            teardown_django()
+
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(run.to_json(), indent=2) + "\n")
+        print(f"results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
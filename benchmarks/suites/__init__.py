@@ -0,0 +1,10 @@
+"""Registered benchmarks, grouped by layer.
+
+Importing this package registers every benchmark in ``benchmarks.harness.REGISTRY``.
+The modules import project code at top level, so Django must be configured first
+(``benchmarks._django.configure_django``); ``benchmarks.run`` takes care of it.
+"""
+
+from benchmarks.suites import domain, mapper, memory, repository, services
+
+__all__ = ["domain", "mapper", "memory", "repository", "services"]
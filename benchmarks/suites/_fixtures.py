@@ -0,0 +1,66 @@
+"""Aggregates and seeded rows shared by the suites."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from apps.academic.mappers.enrollment_mapper import EnrollmentMapper
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.models.enrollment_transition import EnrollmentTransitionModel
+
+from domain.academic.enrollment.entities.enrollment import Enrollment
+
+ACTOR_ID = str(uuid.uuid4())
+BASE_TIME = datetime(2026, 1, 5, 8, 0, tzinfo=UTC)
+
+
+def new_enrollment(*, class_group_id: str | None = None, academic_period_id: str | None = None) -> Enrollment:
+    return Enrollment.create(
+        institution_id=str(uuid.uuid4()),
+        student_id=str(uuid.uuid4()),
+        class_group_id=class_group_id or str(uuid.uuid4()),
+        academic_period_id=academic_period_id or str(uuid.uuid4()),
+        actor_id=ACTOR_ID,
+        occurred_at=BASE_TIME,
+    )
+
+
+def enrollment_with_history(length: int) -> Enrollment:
+    """
+    An aggregate whose history alternates suspend/reactivate ``length`` times,
+    one minute apart; transitions are marked persisted and events drained, as
+    if freshly loaded.
+    """
+    enrollment = new_enrollment()
+    for step in range(length):
+        occurred_at = BASE_TIME + timedelta(minutes=step + 1)
+        if step % 2 == 0:
+            enrollment.suspend(actor_id=ACTOR_ID, justification="benchmark", occurred_at=occurred_at)
+        else:
+            enrollment.reactivate(actor_id=ACTOR_ID, justification="benchmark", occurred_at=occurred_at)
+    enrollment.mark_transitions_persisted()
+    enrollment.pull_domain_events()
+    return enrollment
+
+
+def persist(enrollments: list[Enrollment]) -> None:
+    """Insert snapshots and their whole history with two bulk inserts (no outbox, no counters)."""
+    EnrollmentModel.objects.bulk_create(
+        [EnrollmentMapper.to_snapshot(enrollment=enrollment) for enrollment in enrollments],
+        batch_size=1000,
+    )
+    EnrollmentTransitionModel.objects.bulk_create(
+        [
+            EnrollmentMapper.to_transition(state_transition=transition, enrollment_id=enrollment.id)
+            for enrollment in enrollments
+            for transition in enrollment.transitions
+        ],
+        batch_size=1000,
+    )
+
+
+def seed_ids(count: int, *, history: int = 0) -> list[str]:
+    enrollments = [enrollment_with_history(history) for _ in range(count)]
+    persist(enrollments)
+    return [enrollment.id for enrollment in enrollments]
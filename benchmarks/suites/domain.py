@@ -0,0 +1,110 @@
+"""Aggregate factory and command methods, in memory."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable
+from dataclasses import fields
+from datetime import date
+
+from apps.academic.enrollments.transition_id import make_transition_id
+
+from benchmarks.harness import Operation, benchmark
+from benchmarks.suites._fixtures import ACTOR_ID, BASE_TIME, enrollment_with_history, new_enrollment
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from domain.academic.enrollment.value_objects.conclusion_verdict import ConclusionVerdict
+from domain.identity.user.entities.user import User
+from domain.identity.user.value_objects.legal_identity import LegalIdentity, LegalIdentityType
+from domain.identity.user.value_objects.user_state import UserState
+
+
+def _each(targets: list[Enrollment], command: Callable[[Enrollment], object]) -> Operation:
+    it = iter(targets)
+    return lambda: command(next(it))
+
+
+@benchmark("domain.enrollment.create", group="domain", iterations=20_000)
+def create(n: int) -> Operation:
+    return new_enrollment
+
+
+@benchmark("domain.enrollment.suspend", group="domain", iterations=20_000)
+def suspend(n: int) -> Operation:
+    return _each(
+        [new_enrollment() for _ in range(n)],
+        lambda e: e.suspend(actor_id=ACTOR_ID, justification="benchmark"),
+    )
+
+
+@benchmark("domain.enrollment.reactivate", group="domain", iterations=20_000)
+def reactivate(n: int) -> Operation:
+    return _each(
+        [enrollment_with_history(1) for _ in range(n)],
+        lambda e: e.reactivate(actor_id=ACTOR_ID, justification="benchmark"),
+    )
+
+
+@benchmark("domain.enrollment.conclude", group="domain", iterations=20_000)
+def conclude(n: int) -> Operation:
+    verdict = ConclusionVerdict.allowed()
+    return _each(
+        [new_enrollment() for _ in range(n)],
+        lambda e: e.conclude(actor_id=ACTOR_ID, verdict=verdict),
+    )
+
+
+@benchmark("domain.enrollment.cancel", group="domain", iterations=20_000)
+def cancel(n: int) -> Operation:
+    return _each(
+        [new_enrollment() for _ in range(n)],
+        lambda e: e.cancel(actor_id=ACTOR_ID, justification="benchmark"),
+    )
+
+
+def _snapshot_kwargs(aggregate: object) -> dict[str, object]:
+    """Constructor arguments of a loaded aggregate, without history or pending events."""
+    return {
+        f.name: getattr(aggregate, f.name)
+        for f in fields(aggregate)  # type: ignore[arg-type]
+        if f.init and f.name not in {"transitions", "_domain_events"}
+    }
+
+
+@benchmark("domain.enrollment.rehydrate", group="domain", iterations=50_000)
+def rehydrate(n: int) -> Operation:
+    """__post_init__ validation of a SUSPENDED snapshot (required and forbidden timestamps)."""
+    kwargs = _snapshot_kwargs(enrollment_with_history(1))
+    return lambda: Enrollment(**kwargs)  # type: ignore[arg-type]
+
+
+@benchmark("domain.user.rehydrate", group="domain", iterations=50_000)
+def rehydrate_user(n: int) -> Operation:
+    user = User(
+        id=str(uuid.uuid4()),
+        legal_identity=LegalIdentity(
+            identity_type=LegalIdentityType.CPF, identity_number="12345678912", identity_issuer="PB"
+        ),
+        full_name="Benchmark User",
+        birth_date=date(1990, 1, 1),
+        created_by=ACTOR_ID,
+        state=UserState.SUSPENDED,
+        created_at=BASE_TIME,
+        activated_at=BASE_TIME,
+        suspended_at=BASE_TIME,
+    )
+    kwargs = _snapshot_kwargs(user)
+    return lambda: User(**kwargs)  # type: ignore[arg-type]
+
+
+@benchmark("domain.make_transition_id", group="domain", iterations=50_000)
+def transition_id(n: int) -> Operation:
+    enrollment_id = uuid.uuid4()
+    return lambda: make_transition_id(
+        enrollment_id=enrollment_id,
+        action="suspend",
+        from_state="active",
+        to_state="suspended",
+        occurred_at=BASE_TIME,
+        actor_id=ACTOR_ID,
+        justification="benchmark",
+    )
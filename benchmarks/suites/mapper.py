@@ -0,0 +1,48 @@
+"""Rehydration cost as a function of history length."""
+
+from __future__ import annotations
+
+from apps.academic.mappers.enrollment_mapper import EnrollmentMapper
+from apps.academic.mappers.rehydration_sampler import RehydrationSampler
+
+from benchmarks.harness import Operation, benchmark
+from benchmarks.suites._fixtures import enrollment_with_history
+
+HISTORY_LENGTHS = (1, 10, 100, 1000)
+
+
+def _register(length: int) -> None:
+    iterations = max(20, 20_000 // length)
+
+    @benchmark(f"mapper.to_domain_from_rows[{length}]", group="mapper", iterations=iterations)
+    def from_rows(n: int) -> Operation:
+        enrollment = enrollment_with_history(length)
+        snapshot_row = EnrollmentMapper.to_snapshot_row(enrollment=enrollment)
+        transition_rows = [EnrollmentMapper.to_transition_row(t) for t in enrollment.transitions]
+        return lambda: EnrollmentMapper.to_domain_from_rows(
+            snapshot_row=snapshot_row, transition_rows=transition_rows
+        )
+
+    @benchmark(f"mapper.to_domain_from_rows_trusted[{length}]", group="mapper", iterations=iterations)
+    def from_rows_trusted(n: int) -> Operation:
+        enrollment = enrollment_with_history(length)
+        snapshot_row = EnrollmentMapper.to_snapshot_row(enrollment=enrollment)
+        transition_rows = [EnrollmentMapper.to_transition_row(t) for t in enrollment.transitions]
+        sampler = RehydrationSampler(0.0)
+        return lambda: EnrollmentMapper.to_domain_from_rows(
+            snapshot_row=snapshot_row, transition_rows=transition_rows, sampler=sampler
+        )
+
+    @benchmark(f"mapper.to_domain[{length}]", group="mapper", iterations=iterations)
+    def from_models(n: int) -> Operation:
+        enrollment = enrollment_with_history(length)
+        snapshot = EnrollmentMapper.to_snapshot(enrollment=enrollment)
+        transitions = [
+            EnrollmentMapper.to_transition(state_transition=t, enrollment_id=enrollment.id)
+            for t in enrollment.transitions
+        ]
+        return lambda: EnrollmentMapper.to_domain(snapshot=snapshot, transitions=transitions)
+
+
+for _length in HISTORY_LENGTHS:
+    _register(_length)
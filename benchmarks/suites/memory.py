@@ -0,0 +1,61 @@
+"""The in-memory EnrollmentRepository, for comparison with the repository group (no database)."""
+
+from __future__ import annotations
+
+from benchmarks.harness import Operation, benchmark
+from benchmarks.suites._fixtures import ACTOR_ID, new_enrollment
+from infrastructure.memory.in_memory_enrollment_repository import InMemoryEnrollmentRepository
+
+GET_HISTORY = 10
+
+
+def _seeded(count: int, *, history: int = 0) -> tuple[InMemoryEnrollmentRepository, list[str]]:
+    repo = InMemoryEnrollmentRepository()
+    ids = []
+    for _ in range(count):
+        enrollment = new_enrollment()
+        repo.create(enrollment)
+        for _ in range(history):
+            _command(repo, enrollment.id)
+        ids.append(enrollment.id)
+    return repo, ids
+
+
+def _command(repo: InMemoryEnrollmentRepository, enrollment_id: str) -> None:
+    """Load, run one state-change command, save: as repository.command[10]."""
+    enrollment = repo.get_by_id(enrollment_id)
+    assert enrollment is not None
+    if enrollment.state.value == "active":
+        enrollment.suspend(actor_id=ACTOR_ID, justification="benchmark")
+    else:
+        enrollment.reactivate(actor_id=ACTOR_ID, justification="benchmark")
+    repo.save(enrollment)
+
+
+@benchmark(f"memory.get_by_id[{GET_HISTORY}]", group="memory", iterations=5000)
+def get_by_id(n: int) -> Operation:
+    repo, (enrollment_id,) = _seeded(1, history=GET_HISTORY)
+    return lambda: repo.get_by_id(enrollment_id)
+
+
+@benchmark("memory.save", group="memory", iterations=5000)
+def save(n: int) -> Operation:
+    repo, ids = _seeded(n)
+    enrollments = list(repo.get_many(ids).values())
+    for enrollment in enrollments:
+        enrollment.suspend(actor_id=ACTOR_ID, justification="benchmark")
+    it = iter(enrollments)
+    return lambda: repo.save(next(it))
+
+
+@benchmark("memory.create", group="memory", iterations=5000)
+def create(n: int) -> Operation:
+    repo = InMemoryEnrollmentRepository()
+    it = iter([new_enrollment() for _ in range(n)])
+    return lambda: repo.create(next(it))
+
+
+@benchmark(f"memory.command[{GET_HISTORY}]", group="memory", iterations=5000)
+def command(n: int) -> Operation:
+    repo, (enrollment_id,) = _seeded(1, history=GET_HISTORY)
+    return lambda: _command(repo, enrollment_id)
@@ -0,0 +1,75 @@
+"""DjangoEnrollmentRepository round trips against the configured database."""
+
+from __future__ import annotations
+
+from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+
+from benchmarks.harness import Operation, benchmark
+from benchmarks.suites._fixtures import ACTOR_ID, new_enrollment, seed_ids
+
+GET_HISTORY = 10
+
+
+@benchmark(f"repository.get_by_id[{GET_HISTORY}]", group="repository", iterations=500, needs_db=True)
+def get_by_id(n: int) -> Operation:
+    repo = DjangoEnrollmentRepository()
+    (enrollment_id,) = seed_ids(1, history=GET_HISTORY)
+    return lambda: repo.get_by_id(enrollment_id)
+
+
+@benchmark("repository.save", group="repository", iterations=300, needs_db=True)
+def save(n: int) -> Operation:
+    repo = DjangoEnrollmentRepository()
+    enrollments = list(repo.get_many(seed_ids(n)).values())
+    for enrollment in enrollments:
+        enrollment.suspend(actor_id=ACTOR_ID, justification="benchmark")
+    it = iter(enrollments)
+    return lambda: repo.save(next(it))
+
+
+@benchmark("repository.save_portable", group="repository", iterations=300, needs_db=True)
+def save_portable(n: int) -> Operation:
+    repo = DjangoEnrollmentRepository()
+    # The ORM fallback, for comparison with the single-statement PostgreSQL save
+    repo.use_returning_save = False
+    enrollments = list(repo.get_many(seed_ids(n)).values())
+    for enrollment in enrollments:
+        enrollment.suspend(actor_id=ACTOR_ID, justification="benchmark")
+    it = iter(enrollments)
+    return lambda: repo.save(next(it))
+
+
+@benchmark("repository.create", group="repository", iterations=300, needs_db=True)
+def create(n: int) -> Operation:
+    repo = DjangoEnrollmentRepository()
+    it = iter([new_enrollment() for _ in range(n)])
+    return lambda: repo.create(next(it))
+
+
+COMMAND_HISTORY_LENGTHS = (10, 1000)
+
+
+def _toggle(repo: DjangoEnrollmentRepository, enrollment_id: str) -> None:
+    """Load, run one state-change command, save: the shape of every service command."""
+    enrollment = repo.get_by_id(enrollment_id)
+    assert enrollment is not None
+    if enrollment.state.value == "active":
+        enrollment.suspend(actor_id=ACTOR_ID, justification="benchmark")
+    else:
+        enrollment.reactivate(actor_id=ACTOR_ID, justification="benchmark")
+    repo.save(enrollment)
+
+
+def _register_command(length: int) -> None:
+    for lazy in (False, True):
+        name = f"repository.command{'_lazy' if lazy else ''}[{length}]"
+
+        @benchmark(name, group="repository", iterations=200, needs_db=True)
+        def command(n: int, *, lazy: bool = lazy) -> Operation:
+            repo = DjangoEnrollmentRepository(lazy_history=lazy)
+            (enrollment_id,) = seed_ids(1, history=length)
+            return lambda: _toggle(repo, enrollment_id)
+
+
+for _length in COMMAND_HISTORY_LENGTHS:
+    _register_command(_length)
@@ -0,0 +1,109 @@
+"""Application services end to end over DjangoEnrollmentRepository."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Callable, Iterator
+
+from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+
+from application.academic.enrollment.services.bulk_cancel_enrollment import (
+    BulkCancelEnrollmentService,
+)
+from application.academic.enrollment.services.bulk_conclude_enrollment import (
+    BulkConcludeEnrollmentService,
+)
+from application.academic.enrollment.services.bulk_suspend_enrollment import (
+    BulkSuspendEnrollmentService,
+)
+from application.academic.enrollment.services.cancel_enrollment import CancelEnrollmentService
+from application.academic.enrollment.services.conclude_enrollment import ConcludeEnrollmentService
+from application.academic.enrollment.services.create_enrollment import CreateEnrollment
+from application.academic.enrollment.services.reactivate_enrollment import (
+    ReactivateEnrollmentService,
+)
+from application.academic.enrollment.services.suspend_enrollment import SuspendEnrollmentService
+from benchmarks.harness import Operation, benchmark
+from benchmarks.suites._fixtures import ACTOR_ID, seed_ids
+from domain.academic.enrollment.value_objects.conclusion_verdict import ConclusionVerdict
+
+BULK_SIZE = 100
+VERDICT = ConclusionVerdict.allowed()
+
+
+def _checked(call: Callable[[], object]) -> Operation:
+    """Fail loudly if a service reports an error: a failing path is not the one being measured."""
+
+    def operation() -> None:
+        results = call()
+        for result in results if isinstance(results, list) else [results]:
+            assert result.success and result.changed, result.error
+
+    return operation
+
+
+def _each_id(n: int, *, history: int = 0) -> Iterator[str]:
+    return iter(seed_ids(n, history=history))
+
+
+@benchmark("service.create", group="service", iterations=300, needs_db=True)
+def create(n: int) -> Operation:
+    service = CreateEnrollment(repo=DjangoEnrollmentRepository())
+    return _checked(lambda: service.execute(
+        institution_id=str(uuid.uuid4()),
+        student_id=str(uuid.uuid4()),
+        class_group_id=str(uuid.uuid4()),
+        academic_period_id=str(uuid.uuid4()),
+        actor_id=ACTOR_ID,
+    ))
+
+
+@benchmark("service.suspend", group="service", iterations=300, needs_db=True)
+def suspend(n: int) -> Operation:
+    service, ids = SuspendEnrollmentService(repo=DjangoEnrollmentRepository()), _each_id(n)
+    return _checked(lambda: service.execute(enrollment_id=next(ids), actor_id=ACTOR_ID, justification="benchmark"))
+
+
+@benchmark("service.reactivate", group="service", iterations=300, needs_db=True)
+def reactivate(n: int) -> Operation:
+    service, ids = ReactivateEnrollmentService(repo=DjangoEnrollmentRepository()), _each_id(n, history=1)
+    return _checked(lambda: service.execute(enrollment_id=next(ids), actor_id=ACTOR_ID, justification="benchmark"))
+
+
+@benchmark("service.conclude", group="service", iterations=300, needs_db=True)
+def conclude(n: int) -> Operation:
+    service, ids = ConcludeEnrollmentService(repo=DjangoEnrollmentRepository()), _each_id(n)
+    return _checked(lambda: service.execute(enrollment_id=next(ids), actor_id=ACTOR_ID, verdict=VERDICT))
+
+
+@benchmark("service.cancel", group="service", iterations=300, needs_db=True)
+def cancel(n: int) -> Operation:
+    service, ids = CancelEnrollmentService(repo=DjangoEnrollmentRepository()), _each_id(n)
+    return _checked(lambda: service.execute(enrollment_id=next(ids), actor_id=ACTOR_ID, justification="benchmark"))
+
+
+def _batches(n: int) -> Iterator[list[str]]:
+    ids = seed_ids(n * BULK_SIZE)
+    return iter([ids[i:i + BULK_SIZE] for i in range(0, len(ids), BULK_SIZE)])
+
+
+@benchmark(f"service.bulk_suspend[{BULK_SIZE}]", group="service", iterations=20, needs_db=True)
+def bulk_suspend(n: int) -> Operation:
+    service, batches = BulkSuspendEnrollmentService(repo=DjangoEnrollmentRepository()), _batches(n)
+    return _checked(lambda: service.execute(
+        enrollment_ids=next(batches), actor_id=ACTOR_ID, justification="benchmark"
+    ))
+
+
+@benchmark(f"service.bulk_conclude[{BULK_SIZE}]", group="service", iterations=20, needs_db=True)
+def bulk_conclude(n: int) -> Operation:
+    service, batches = BulkConcludeEnrollmentService(repo=DjangoEnrollmentRepository()), _batches(n)
+    return _checked(lambda: service.execute(enrollment_ids=next(batches), actor_id=ACTOR_ID, verdict=VERDICT))
+
+
+@benchmark(f"service.bulk_cancel[{BULK_SIZE}]", group="service", iterations=20, needs_db=True)
+def bulk_cancel(n: int) -> Operation:
+    service, batches = BulkCancelEnrollmentService(repo=DjangoEnrollmentRepository()), _batches(n)
+    return _checked(lambda: service.execute(
+        enrollment_ids=next(batches), actor_id=ACTOR_ID, justification="benchmark"
+    ))
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+from application.academic.enrollment.dto.results import ApplicationResult
+
+# Columns (CSV) / keys (NDJSON) every import row must provide
+ENROLLMENT_IMPORT_FIELDS = ("institution_id", "student_id", "class_group_id", "academic_period_id")
+
+
+@dataclass(frozen=True, kw_only=True)
+class EnrollmentImportRow:
+    """
+        One record of an enrollment import file, as read by an import reader.
+
+        - row_number: 1-based position of the record in the file (CSV header
+          and blank NDJSON lines are not counted).
+        - fields: raw values by column; extra columns are ignored.
+        - parse_error: set when the record could not be read at all (e.g.
+          malformed JSON); fields is then empty.
+    """
+    row_number: int
+    fields: Mapping[str, object]
+    parse_error: str | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class EnrollmentImportOutcome:
+    """What happened to one import row, as CreateEnrollment would have reported it."""
+    row_number: int
+    result: ApplicationResult
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import hashlib
+import json
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from application.academic.enrollment.errors.enrollment_errors import InvalidEnrollmentCursorError
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+@dataclass(frozen=True, kw_only=True)
+class EnrollmentListFilters:
+    """
+        Serializable filter contract for enrollment listings and exports (ADR 027).
+
+        - institution_id is mandatory: listings never cross the tenant boundary (ADR 019).
+        - date ranges are half-open: `*_from` inclusive, `*_to` exclusive.
+        - the same filters drive the paged screen and the export stream, so both
+          return the same rows in the same order.
+    """
+    institution_id: str
+    class_group_id: str | None = None
+    academic_period_id: str | None = None
+    student_id: str | None = None
+    states: frozenset[EnrollmentState] = field(default_factory=frozenset)
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    updated_from: datetime | None = None
+    updated_to: datetime | None = None
+
+    def __post_init__(self) -> None:
+        if not self.institution_id:
+            raise ValueError("'institution_id' is required.")
+        object.__setattr__(self, "states", frozenset(EnrollmentState(s) for s in self.states))
+        for name in ("created", "updated"):
+            start = getattr(self, f"{name}_from")
+            end = getattr(self, f"{name}_to")
+            if start is not None and end is not None and start >= end:
+                raise ValueError(f"'{name}_from' must be earlier than '{name}_to'.")
+
+    def to_dict(self) -> dict[str, object]:
+        """Canonical JSON-serializable form, used for auditing and cursor binding."""
+        return {
+            "institution_id": self.institution_id,
+            "class_group_id": self.class_group_id,
+            "academic_period_id": self.academic_period_id,
+            "student_id": self.student_id,
+            "states": sorted(state.value for state in self.states),
+            "created_from": _iso(self.created_from),
+            "created_to": _iso(self.created_to),
+            "updated_from": _iso(self.updated_from),
+            "updated_to": _iso(self.updated_to),
+        }
+
+    def fingerprint(self) -> str:
+        canonical = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()[:16]
+
+
+@dataclass(frozen=True, slots=True)
+class EnrollmentRow:
+    """
+        Read-only projection of one `enrollments` row.
+
+        Built straight from the database tuple (field order matches the query),
+        without rehydrating the Enrollment aggregate.
+    """
+    id: str
+    institution_id: str
+    student_id: str
+    class_group_id: str
+    academic_period_id: str
+    state: str
+    version: int
+    created_at: datetime
+    updated_at: datetime
+    concluded_at: datetime | None
+    cancelled_at: datetime | None
+    suspended_at: datetime | None
+    reactivated_at: datetime | None
+
+
+@dataclass(frozen=True, slots=True)
+class EnrollmentPage:
+    """One keyset page; `next_cursor` is None on the last page."""
+    rows: tuple[EnrollmentRow, ...]
+    next_cursor: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class EnrollmentCursor:
+    """
+        Keyset position after the last row of a page: `(created_at, id)`, the
+        listing sort key. Clients only see the opaque token produced by `encode`,
+        which is bound to the filters it was issued for.
+    """
+    created_at: datetime
+    id: str
+
+    def encode(self, filters: EnrollmentListFilters) -> str:
+        payload = {"c": self.created_at.isoformat(), "i": self.id, "f": filters.fingerprint()}
+        raw = json.dumps(payload, separators=(",", ":")).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str, filters: EnrollmentListFilters) -> EnrollmentCursor:
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            payload = json.loads(raw)
+            cursor = cls(created_at=datetime.fromisoformat(payload["c"]), id=str(uuid.UUID(payload["i"])))
+            fingerprint = payload["f"]
+        except (binascii.Error, ValueError, TypeError, KeyError, AttributeError) as exc:
+            raise InvalidEnrollmentCursorError("Malformed cursor.") from exc
+        if fingerprint != filters.fingerprint():
+            raise InvalidEnrollmentCursorError("Cursor was issued for different filters.")
+        return cursor
+
+
+def check_page_size(page_size: int) -> None:
+    if not 1 <= page_size <= MAX_PAGE_SIZE:
+        raise ValueError(f"'page_size' must be between 1 and {MAX_PAGE_SIZE}.")
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
@@ -14,3 +14,4 @@ class ErrorCodes(StrEnum):
     DUPLICATE_ENROLLMENT = "DUPLICATE_ENROLLMENT"
     DATABASE_ERROR = "DATABASE_ERROR"
     MISSING_TRANSITIONS = "MISSING_TRANSITIONS"
+    INVALID_ENROLLMENT_DATA = "INVALID_ENROLLMENT_DATA"
@@ -9,3 +9,9 @@ class EnrollmentNotFoundError(Exception):
         self.enrollment_id = enrollment_id
         super().__init__(f"Enrollment not found: {enrollment_id}")
 
+
+class InvalidEnrollmentCursorError(ValueError):
+    """
+    Raised when a listing cursor is malformed or was issued
+    for a different set of filters.
+    """
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+from domain.academic.enrollment.entities.enrollment import Enrollment
+
+
+class AsyncEnrollmentRepository(Protocol):
+    """
+    Asyncio port (contract) for Enrollment persistence, used by the async services.
+
+    Each method follows the contract of the same method on EnrollmentRepository
+    (return values and the typed errors it raises); only the calling convention
+    differs. Batch operations stay on the sync port.
+    """
+
+    async def get_by_id(self, enrollment_id: str) -> Enrollment | None:
+        """Return the Enrollment aggregate for the given id, or None if no record exists."""
+        ...
+
+    async def save(self, enrollment: Enrollment) -> int:
+        """
+        Persist the current state of an existing Enrollment aggregate and return
+        the new persisted version (optimistic concurrency, as EnrollmentRepository.save).
+        """
+        ...
+
+    async def create(self, enrollment: Enrollment) -> int:
+        """
+        Persist a new Enrollment aggregate and return its initial version.
+
+        Raises EnrollmentDuplicationError / EnrollmentTechnicalPersistenceError
+        as EnrollmentRepository.create does.
+        """
+        ...
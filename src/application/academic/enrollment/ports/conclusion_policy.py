@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+from domain.academic.enrollment.value_objects.conclusion_verdict import ConclusionVerdict
+
+
+@dataclass(frozen=True, slots=True)
+class ConclusionCandidate:
+    """ACTIVE enrollment under evaluation when an academic period is closed."""
+    enrollment_id: str
+    institution_id: str
+    student_id: str
+    class_group_id: str
+    academic_period_id: str
+
+
+class ConclusionPolicy(Protocol):
+    """
+    Port (contract) for the rules that decide whether enrollments may be concluded
+    (attendance, grades, pending documents...), evaluated in batch.
+
+    Responsibilities:
+    - Return one ConclusionVerdict per candidate, keyed by enrollment_id.
+
+    Non-responsibilities:
+    - Must not change enrollment state (the caller applies the verdicts).
+
+    Candidates without a verdict in the returned mapping are treated as denied.
+    """
+
+    def evaluate_many(self, candidates: Sequence[ConclusionCandidate]) -> Mapping[str, ConclusionVerdict]:
+        ...
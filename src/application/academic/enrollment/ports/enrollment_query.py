@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from typing import Protocol
+
+from application.academic.enrollment.dto.enrollment_query import (
+    DEFAULT_PAGE_SIZE,
+    EnrollmentListFilters,
+    EnrollmentPage,
+    EnrollmentRow,
+)
+
+
+class EnrollmentQuery(Protocol):
+    """
+    Port (contract) for read-only enrollment listings (ADR 026/027).
+
+    Responsibilities:
+    - Return one page of rows matching the filters, ordered by (created_at, id).
+    - Stream every matching row in the same order for exports.
+
+    Non-responsibilities:
+    - Must not rehydrate Enrollment aggregates (rows are read DTOs).
+    - Must not be used as input for state changes (use EnrollmentRepository).
+    """
+
+    def page(
+            self,
+            filters: EnrollmentListFilters,
+            *,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            cursor: str | None = None,
+    ) -> EnrollmentPage:
+        """
+        Return up to `page_size` rows after `cursor` (from the start when None).
+
+        Paging is keyset-based: pages stay stable when rows are inserted before
+        the cursor, and cost does not grow with the page number.
+
+        Raises:
+        - InvalidEnrollmentCursorError: malformed cursor or issued for other filters.
+        - ValueError: `page_size` out of bounds.
+        """
+        ...
+
+    def iter_rows(
+            self,
+            filters: EnrollmentListFilters,
+            *,
+            chunk_size: int = 2000,
+    ) -> Iterator[EnrollmentRow]:
+        """
+        Yield every matching row, in page order, fetching `chunk_size` rows at a time.
+
+        Memory stays bounded by the chunk size regardless of the result size.
+        """
+        ...
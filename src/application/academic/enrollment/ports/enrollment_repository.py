@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections.abc import Iterable, Sequence
 from typing import Protocol
 
+from application.academic.enrollment.errors.persistence_errors import ApplicationPersistenceError
 from domain.academic.enrollment.entities.enrollment import Enrollment
 
 
@@ -11,7 +13,11 @@ class EnrollmentRepository(Protocol):
 
     Responsibilities:
     - Retrieve an Enrollment aggregate by id.
+    - Retrieve many Enrollment aggregates in batch.
+    - Resolve the enrollment ids of a class group in an academic period.
     - Persist an existing Enrollment aggregate state.
+    - Persist many existing Enrollment aggregates in batch.
+    - Persist new Enrollment aggregates, one at a time or in batch.
 
     Non-responsibilities:
     - Must not enforce business rules (domain does).
@@ -28,13 +34,34 @@ class EnrollmentRepository(Protocol):
         """
         ...
 
+    def get_many(self, enrollment_ids: Iterable[str]) -> dict[str, Enrollment | None]:
+        """
+        Return the Enrollment aggregates for the given ids, keyed by id.
+
+        Every requested id is present in the result: ids without a persisted
+        record map explicitly to None. Duplicated ids are loaded once.
+        Implementations must load in batches (never one round trip per id) and
+        follow the same reconstruction rules as get_by_id.
+        """
+        ...
+
+    def find_ids_by_class_group(self, *, class_group_id: str, academic_period_id: str) -> list[str]:
+        """
+        Return the ids of every enrollment of the class group in the academic
+        period, in a deterministic order. Returns an empty list when none exist.
+        """
+        ...
+
     def save(self, enrollment: Enrollment) -> int:
         """
         Persist the current state of an existing Enrollment aggregate and return
         the new persisted version.
 
         Implementations must treat the aggregate version as the expected origin
-        version, enforce optimistic concurrency control, and fail explicitly on:
+        version, persist every pending transition (not only the latest one)
+        atomically with the snapshot, enforce optimistic concurrency control,
+        call enrollment.mark_persisted once the write is durable (a failed save
+        must leave the aggregate untouched), and fail explicitly on:
         - missing records for update
         - concurrency conflicts
         - data integrity violations
@@ -42,6 +69,20 @@ class EnrollmentRepository(Protocol):
         """
         ...
 
+    def save_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        """
+        Persist many existing Enrollment aggregates in one batch and return one
+        outcome per aggregate id.
+
+        Each aggregate follows the save() contract. Instead of raising, per-item
+        failures are reported as values: the new persisted version on success,
+        or the ConcurrencyConflictError / EnrollmentPersistenceNotFoundError /
+        EnrollmentTechnicalPersistenceError save() would have raised for it.
+        Failures that affect the whole batch (e.g. database errors) are raised
+        as EnrollmentTechnicalPersistenceError and nothing is persisted.
+        """
+        ...
+
     def create(self, enrollment: Enrollment) -> int:
         """
             Persists a new Enrollment aggregate.
@@ -64,3 +105,18 @@ class EnrollmentRepository(Protocol):
                     constraint violations) are encountered.
             """
         ...
+
+    def create_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        """
+        Persist many new Enrollment aggregates in one batch and return one
+        outcome per aggregate id.
+
+        Each aggregate follows the create() contract. Instead of raising, per-item
+        failures are reported as values: the initial version on success, or the
+        EnrollmentDuplicationError / EnrollmentTechnicalPersistenceError create()
+        would have raised for it. A duplicate does not prevent the rest of the
+        batch from being inserted. Failures that affect the whole batch (e.g.
+        database errors) are raised as EnrollmentTechnicalPersistenceError and
+        nothing is persisted.
+        """
+        ...
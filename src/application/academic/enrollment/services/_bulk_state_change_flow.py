@@ -0,0 +1,168 @@
+"""Shared orchestration for the bulk enrollment state-change services.
+
+A bulk run applies one domain command to many aggregates and returns one
+``ApplicationResult`` per distinct enrollment id, in request order. Each item
+keeps the exact Contract A semantics of the single-item services:
+- missing aggregate => ``ENROLLMENT_NOT_FOUND``
+- domain rejection => mapped domain failure
+- idempotent command => no-op result
+- integrity checks => decided by ``check_state_change``
+- persistence outcome => mapped exactly as ``finalize_state_change`` would
+
+Aggregates are loaded through ``EnrollmentRepository.get_many`` and persisted
+through ``EnrollmentRepository.save_many`` in batches, so a batch costs a
+constant number of round trips instead of a few per id. A batch-wide technical
+failure is reported on every item of that batch; events stay buffered in the
+aggregates that were not persisted.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+
+from application.academic.enrollment.dto.results import ApplicationResult
+from application.academic.enrollment.errors.persistence_errors import (
+    ApplicationPersistenceError,
+    EnrollmentTechnicalPersistenceError,
+)
+from application.academic.enrollment.ports.enrollment_repository import EnrollmentRepository
+from application.academic.enrollment.services._state_change_flow import (
+    build_changed_result,
+    build_domain_failure_result,
+    build_not_found_result,
+    build_save_failure_result,
+    check_state_change,
+)
+from application.shared.unit_of_work import defers_writes
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from domain.shared.domain_error import DomainError
+
+DEFAULT_BULK_BATCH_SIZE = 500
+
+EnrollmentCommand = Callable[[Enrollment], None]
+
+
+def iter_batches(enrollment_ids: Iterable[str], batch_size: int) -> Iterator[list[str]]:
+    """Yield distinct ids (first occurrence wins) in lists of at most batch_size."""
+    if batch_size < 1:
+        raise ValueError("batch_size must be >= 1")
+
+    distinct_ids = list(dict.fromkeys(enrollment_ids))
+    for start in range(0, len(distinct_ids), batch_size):
+        yield distinct_ids[start:start + batch_size]
+
+
+def _apply_command(
+        *,
+        enrollment: Enrollment,
+        enrollment_id: str,
+        action: str,
+        command: EnrollmentCommand,
+        event_without_state_change_message: str,
+        state_changed_without_event_message: str,
+) -> ApplicationResult | None:
+    """Run `command` on one loaded item; return its final result, or None if it must be persisted."""
+    previous_state = enrollment.state
+    try:
+        command(enrollment)
+    except DomainError as err:
+        return build_domain_failure_result(
+            enrollment_id=enrollment_id,
+            current_state=enrollment.state,
+            action=action,
+            err=err,
+        )
+
+    return check_state_change(
+        enrollment=enrollment,
+        enrollment_id=enrollment_id,
+        action=action,
+        previous_state=previous_state,
+        event_without_state_change_message=event_without_state_change_message,
+        state_changed_without_event_message=state_changed_without_event_message,
+    )
+
+
+def _persist(
+        *,
+        repo: EnrollmentRepository,
+        to_persist: list[Enrollment],
+        action: str,
+        persistence_failure_message: str,
+) -> dict[str, ApplicationResult]:
+    """Save one batch and map each aggregate's outcome as ``finalize_state_change`` would."""
+    outcomes: dict[str, int | ApplicationPersistenceError]
+    try:
+        outcomes = repo.save_many(to_persist)
+    except EnrollmentTechnicalPersistenceError as err:
+        outcomes = dict.fromkeys((enrollment.id for enrollment in to_persist), err)
+
+    results: dict[str, ApplicationResult] = {}
+    for enrollment in to_persist:
+        outcome = outcomes[enrollment.id]
+        if isinstance(outcome, ApplicationPersistenceError):
+            results[enrollment.id] = build_save_failure_result(
+                enrollment_id=enrollment.id,
+                action=action,
+                current_state=enrollment.state,
+                message=persistence_failure_message,
+                err=outcome,
+            )
+        else:
+            results[enrollment.id] = build_changed_result(
+                enrollment=enrollment,
+                enrollment_id=enrollment.id,
+                drain=not defers_writes(repo),
+            )
+    return results
+
+
+def run_bulk_state_change(
+        *,
+        repo: EnrollmentRepository,
+        enrollment_ids: Iterable[str],
+        action: str,
+        command: EnrollmentCommand,
+        batch_size: int,
+        persistence_failure_message: str,
+        event_without_state_change_message: str,
+        state_changed_without_event_message: str,
+) -> list[ApplicationResult]:
+    """Apply `command` to every enrollment and return one result per distinct id."""
+    results: list[ApplicationResult] = []
+
+    for batch in iter_batches(enrollment_ids, batch_size):
+        loaded = repo.get_many(batch)
+        batch_results: dict[str, ApplicationResult] = {}
+        to_persist: list[Enrollment] = []
+
+        for enrollment_id in batch:
+            enrollment = loaded.get(enrollment_id)
+            if enrollment is None:
+                batch_results[enrollment_id] = build_not_found_result(enrollment_id=enrollment_id, action=action)
+                continue
+
+            early_result = _apply_command(
+                enrollment=enrollment,
+                enrollment_id=enrollment_id,
+                action=action,
+                command=command,
+                event_without_state_change_message=event_without_state_change_message,
+                state_changed_without_event_message=state_changed_without_event_message,
+            )
+            if early_result is not None:
+                batch_results[enrollment_id] = early_result
+            else:
+                to_persist.append(enrollment)
+
+        if to_persist:
+            batch_results.update(_persist(
+                repo=repo,
+                to_persist=to_persist,
+                action=action,
+                persistence_failure_message=persistence_failure_message,
+            ))
+
+        results.extend(batch_results[enrollment_id] for enrollment_id in batch)
+
+    return results
@@ -10,19 +10,27 @@ result contract:
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from typing import Protocol, cast
 
 from application.academic.enrollment.dto.errors.error_codes import ErrorCodes
 from application.academic.enrollment.dto.results import ApplicationResult
 from application.academic.enrollment.errors.domain_error_mapper import to_application_error
 from application.academic.enrollment.errors.persistence_errors import (
+    ApplicationPersistenceError,
     ConcurrencyConflictError,
     EnrollmentPersistenceNotFoundError,
     EnrollmentTechnicalPersistenceError,
 )
+from application.academic.enrollment.ports.async_enrollment_repository import (
+    AsyncEnrollmentRepository,
+)
 from application.academic.enrollment.ports.enrollment_repository import EnrollmentRepository
 from application.shared.application_error import ApplicationError
 from application.shared.errors.error_codes import SharedErrorCodes
+from application.shared.ports.transaction_manager import TransactionManager
+from application.shared.retry_policy import ConflictRetrier, RetryPolicy
+from application.shared.unit_of_work import defers_writes
 from domain.academic.enrollment.entities.enrollment import Enrollment
 from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
 from domain.shared.domain_error import DomainError
@@ -184,31 +192,26 @@ def build_no_change_result(*, enrollment_id: str) -> ApplicationResult:
     )
 
 
-def finalize_state_change(
+def check_state_change(
         *,
-        repo: EnrollmentRepository,
         enrollment: EnrollmentLike,
         enrollment_id: str,
         action: str,
         previous_state: EnrollmentState,
-        persistence_failure_message: str,
         event_without_state_change_message: str,
         state_changed_without_event_message: str,
-) -> ApplicationResult:
-    """Finalize a successful domain command under the application contract.
+) -> ApplicationResult | None:
+    """Return the final result when nothing must be persisted, otherwise None.
 
-    Rules enforced here:
     - no state change + pending events => integrity violation
     - state change + no pending events => integrity violation
-    - on persistence failure, events remain buffered in the aggregate
-    - on success, the service returns an event snapshot and then clears the
-      aggregate buffer
+    - no state change + no events => canonical no-op
     """
     state_changed = enrollment.state != previous_state
-    events_snapshot = tuple(enrollment.peek_domain_events())
+    has_events = bool(enrollment.peek_domain_events())
 
     if not state_changed:
-        if events_snapshot:
+        if has_events:
             return build_state_integrity_result(
                 enrollment_id=enrollment_id,
                 action=action,
@@ -219,7 +222,7 @@ def finalize_state_change(
             )
         return build_no_change_result(enrollment_id=enrollment_id)
 
-    if not events_snapshot:
+    if not has_events:
         return build_state_integrity_result(
             enrollment_id=enrollment_id,
             action=action,
@@ -228,43 +231,185 @@ def finalize_state_change(
             reason="state_changed_without_event",
             message=state_changed_without_event_message,
         )
+    return None
 
-    try:
-        repo.save(cast(Enrollment, enrollment))
-    except ConcurrencyConflictError as e:
+
+def build_save_failure_result(
+        *,
+        enrollment_id: str,
+        action: str,
+        current_state: EnrollmentState,
+        message: str,
+        err: ApplicationPersistenceError,
+) -> ApplicationResult:
+    """Map a persistence error raised (or reported) by the repository to a failure result."""
+    if isinstance(err, ConcurrencyConflictError):
         return build_concurrency_conflict_result(
             enrollment_id=enrollment_id,
             action=action,
-            current_state=enrollment.state,
-            message=persistence_failure_message,
-            err=e,
+            current_state=current_state,
+            message=message,
+            err=err,
         )
-    except EnrollmentPersistenceNotFoundError as e:
-        return build_persistence_failure_result(
+    return build_persistence_failure_result(
+        enrollment_id=enrollment_id,
+        action=action,
+        current_state=current_state,
+        message=message,
+        code=cast(ErrorCodes, err.code),
+        err=err,
+    )
+
+
+def build_changed_result(*, enrollment: EnrollmentLike, enrollment_id: str, drain: bool = True) -> ApplicationResult:
+    """Drain the aggregate buffer after a successful save and return the change result."""
+    # drain=False: the write is deferred (UnitOfWork) and the flush still needs the events
+    events_snapshot = tuple(enrollment.pull_domain_events() if drain else enrollment.peek_domain_events())
+
+    return ApplicationResult(
+        aggregate_id=enrollment_id,
+        changed=True,
+        success=True,
+        domain_events=events_snapshot,
+        new_state=enrollment.state,
+        error=None
+    )
+
+
+def finalize_state_change(
+        *,
+        repo: EnrollmentRepository,
+        enrollment: EnrollmentLike,
+        enrollment_id: str,
+        action: str,
+        previous_state: EnrollmentState,
+        persistence_failure_message: str,
+        event_without_state_change_message: str,
+        state_changed_without_event_message: str,
+) -> ApplicationResult:
+    """Finalize a successful domain command under the application contract.
+
+    Rules enforced here:
+    - no state change + pending events => integrity violation
+    - state change + no pending events => integrity violation
+    - on persistence failure, events remain buffered in the aggregate
+    - on success, the service returns an event snapshot and then clears the
+      aggregate buffer, unless the repository defers writes (UnitOfWork): the
+      buffer is then left for the flush
+    """
+    early_result = check_state_change(
+        enrollment=enrollment,
+        enrollment_id=enrollment_id,
+        action=action,
+        previous_state=previous_state,
+        event_without_state_change_message=event_without_state_change_message,
+        state_changed_without_event_message=state_changed_without_event_message,
+    )
+    if early_result is not None:
+        return early_result
+
+    try:
+        repo.save(cast(Enrollment, enrollment))
+    except (
+        ConcurrencyConflictError,
+        EnrollmentPersistenceNotFoundError,
+        EnrollmentTechnicalPersistenceError,
+    ) as e:
+        return build_save_failure_result(
             enrollment_id=enrollment_id,
             action=action,
             current_state=enrollment.state,
             message=persistence_failure_message,
-            code=cast(ErrorCodes, e.code),
             err=e,
         )
-    except EnrollmentTechnicalPersistenceError as e:
-        return build_persistence_failure_result(
+
+    return build_changed_result(enrollment=enrollment, enrollment_id=enrollment_id, drain=not defers_writes(repo))
+
+
+async def afinalize_state_change(
+        *,
+        repo: AsyncEnrollmentRepository,
+        enrollment: EnrollmentLike,
+        enrollment_id: str,
+        action: str,
+        previous_state: EnrollmentState,
+        persistence_failure_message: str,
+        event_without_state_change_message: str,
+        state_changed_without_event_message: str,
+) -> ApplicationResult:
+    """finalize_state_change for the async services: same rules, awaited save."""
+    early_result = check_state_change(
+        enrollment=enrollment,
+        enrollment_id=enrollment_id,
+        action=action,
+        previous_state=previous_state,
+        event_without_state_change_message=event_without_state_change_message,
+        state_changed_without_event_message=state_changed_without_event_message,
+    )
+    if early_result is not None:
+        return early_result
+
+    try:
+        await repo.save(cast(Enrollment, enrollment))
+    except (
+        ConcurrencyConflictError,
+        EnrollmentPersistenceNotFoundError,
+        EnrollmentTechnicalPersistenceError,
+    ) as e:
+        return build_save_failure_result(
             enrollment_id=enrollment_id,
             action=action,
             current_state=enrollment.state,
             message=persistence_failure_message,
-            code=cast(ErrorCodes, e.code),
             err=e,
         )
 
-    enrollment.pull_domain_events()
+    return build_changed_result(enrollment=enrollment, enrollment_id=enrollment_id)
 
-    return ApplicationResult(
-        aggregate_id=enrollment_id,
-        changed=True,
-        success=True,
-        domain_events=events_snapshot,
-        new_state=enrollment.state,
-        error=None
-    )
+
+def is_concurrency_conflict(result: ApplicationResult) -> bool:
+    return result.error is not None and result.error.code == ErrorCodes.CONCURRENCY_CONFLICT
+
+
+def conflict_retrier(policy: RetryPolicy | None) -> ConflictRetrier | None:
+    """Per-service retrier for an opt-in policy (None: conflicts are returned as is)."""
+    return None if policy is None else ConflictRetrier(policy, is_conflict=is_concurrency_conflict)
+
+
+def run_state_change(
+        retrier: ConflictRetrier | None,
+        attempt: Callable[[], ApplicationResult],
+        transaction: TransactionManager | None = None,
+) -> ApplicationResult:
+    """
+    Run one load -> command -> finalize attempt, and run it again after a
+    CONCURRENCY_CONFLICT while the retrier allows. Each attempt re-loads the
+    aggregate, so a command that the winning write made redundant ends as a
+    no-change result and stops the retries; exhausted retries return the
+    conflict result unchanged.
+
+    With a transaction manager each attempt runs in its own transaction, so a
+    repository that locks on load holds the lock until the save and releases
+    it before any backoff.
+    """
+    if transaction is not None:
+        attempt = _in_transaction(transaction, attempt)
+    return attempt() if retrier is None else retrier.run(attempt)
+
+
+def _in_transaction(
+        transaction: TransactionManager,
+        attempt: Callable[[], ApplicationResult],
+) -> Callable[[], ApplicationResult]:
+    def run() -> ApplicationResult:
+        with transaction.atomic():
+            return attempt()
+    return run
+
+
+async def arun_state_change(
+        retrier: ConflictRetrier | None,
+        attempt: Callable[[], Awaitable[ApplicationResult]],
+) -> ApplicationResult:
+    """run_state_change for the async services; attempts are not wrapped in a TransactionManager (a sync port)."""
+    return await attempt() if retrier is None else await retrier.arun(attempt)
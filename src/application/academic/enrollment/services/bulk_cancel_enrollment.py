@@ -0,0 +1,68 @@
+from collections.abc import Iterable
+from datetime import datetime
+
+from application.academic.enrollment.dto.results import ApplicationResult
+from application.academic.enrollment.ports.enrollment_repository import EnrollmentRepository
+from application.academic.enrollment.services._bulk_state_change_flow import (
+    DEFAULT_BULK_BATCH_SIZE,
+    run_bulk_state_change,
+)
+from domain.academic.enrollment.entities.enrollment import Enrollment
+
+
+class BulkCancelEnrollmentService:
+    """Application service to cancel many enrollments in one run.
+    Responsibilities:
+    - Load the target aggregates in batches (explicit ids or a class group/period).
+    - Apply `Enrollment.cancel` per aggregate.
+    - Return one ApplicationResult per enrollment, as CancelEnrollmentService would.
+    """
+    repo: EnrollmentRepository
+
+    def __init__(self, repo: EnrollmentRepository, batch_size: int = DEFAULT_BULK_BATCH_SIZE):
+        self.repo = repo
+        self.batch_size = batch_size
+
+    def execute(
+            self,
+            *,
+            enrollment_ids: Iterable[str],
+            actor_id: str,
+            justification: str,
+            occurred_at: datetime | None = None,
+    ) -> list[ApplicationResult]:
+        """Cancel the given enrollments; duplicated ids are processed once."""
+
+        def command(enrollment: Enrollment) -> None:
+            enrollment.cancel(actor_id=actor_id, justification=justification, occurred_at=occurred_at)
+
+        return run_bulk_state_change(
+            repo=self.repo,
+            enrollment_ids=enrollment_ids,
+            action="cancel",
+            command=command,
+            batch_size=self.batch_size,
+            persistence_failure_message="Failed to persist enrollment cancellation.",
+            event_without_state_change_message="Cancellation produced pending domain events without a state change.",
+            state_changed_without_event_message="Cancellation changed state without emitting a domain event.",
+        )
+
+    def execute_for_class_group(
+            self,
+            *,
+            class_group_id: str,
+            academic_period_id: str,
+            actor_id: str,
+            justification: str,
+            occurred_at: datetime | None = None,
+    ) -> list[ApplicationResult]:
+        """Cancel every enrollment of the class group in the academic period."""
+        return self.execute(
+            enrollment_ids=self.repo.find_ids_by_class_group(
+                class_group_id=class_group_id,
+                academic_period_id=academic_period_id,
+            ),
+            actor_id=actor_id,
+            justification=justification,
+            occurred_at=occurred_at,
+        )
@@ -0,0 +1,84 @@
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+
+from application.academic.enrollment.dto.results import ApplicationResult
+from application.academic.enrollment.ports.enrollment_repository import EnrollmentRepository
+from application.academic.enrollment.services._bulk_state_change_flow import (
+    DEFAULT_BULK_BATCH_SIZE,
+    run_bulk_state_change,
+)
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from domain.academic.enrollment.value_objects.conclusion_verdict import ConclusionVerdict
+
+
+class BulkConcludeEnrollmentService:
+    """Application service to conclude many enrollments in one run (e.g. period close).
+    Responsibilities:
+    - Load the target aggregates in batches (explicit ids or a class group/period).
+    - Apply `Enrollment.conclude` per aggregate with its conclusion verdict.
+    - Return one ApplicationResult per enrollment, as ConcludeEnrollmentService would.
+    """
+    repo: EnrollmentRepository
+
+    def __init__(self, repo: EnrollmentRepository, batch_size: int = DEFAULT_BULK_BATCH_SIZE):
+        self.repo = repo
+        self.batch_size = batch_size
+
+    def execute(
+            self,
+            *,
+            enrollment_ids: Iterable[str],
+            actor_id: str,
+            verdict: ConclusionVerdict,
+            verdicts: Mapping[str, ConclusionVerdict] | None = None,
+            occurred_at: datetime | None = None,
+            justification: str | None = None,
+    ) -> list[ApplicationResult]:
+        """
+        Conclude the given enrollments; duplicated ids are processed once.
+        `verdict` applies to every enrollment unless `verdicts` overrides it per id.
+        """
+        overrides = verdicts or {}
+
+        def command(enrollment: Enrollment) -> None:
+            enrollment.conclude(
+                actor_id=actor_id,
+                verdict=overrides.get(enrollment.id, verdict),
+                occurred_at=occurred_at,
+                justification=justification,
+            )
+
+        return run_bulk_state_change(
+            repo=self.repo,
+            enrollment_ids=enrollment_ids,
+            action="conclude",
+            command=command,
+            batch_size=self.batch_size,
+            persistence_failure_message="Failed to persist enrollment conclusion.",
+            event_without_state_change_message="Conclusion produced pending domain events without a state change.",
+            state_changed_without_event_message="Conclusion changed state without emitting a domain event.",
+        )
+
+    def execute_for_class_group(
+            self,
+            *,
+            class_group_id: str,
+            academic_period_id: str,
+            actor_id: str,
+            verdict: ConclusionVerdict,
+            verdicts: Mapping[str, ConclusionVerdict] | None = None,
+            occurred_at: datetime | None = None,
+            justification: str | None = None,
+    ) -> list[ApplicationResult]:
+        """Conclude every enrollment of the class group in the academic period."""
+        return self.execute(
+            enrollment_ids=self.repo.find_ids_by_class_group(
+                class_group_id=class_group_id,
+                academic_period_id=academic_period_id,
+            ),
+            actor_id=actor_id,
+            verdict=verdict,
+            verdicts=verdicts,
+            occurred_at=occurred_at,
+            justification=justification,
+        )
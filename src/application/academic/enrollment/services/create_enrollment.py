@@ -7,6 +7,9 @@ from application.academic.enrollment.errors.persistence_errors import (
     EnrollmentDuplicationError,
     EnrollmentTechnicalPersistenceError,
 )
+from application.academic.enrollment.ports.async_enrollment_repository import (
+    AsyncEnrollmentRepository,
+)
 from application.academic.enrollment.ports.enrollment_repository import EnrollmentRepository
 from application.academic.enrollment.services._state_change_flow import (
     build_persistence_failure_result,
@@ -55,31 +58,83 @@ class CreateEnrollment:
 
         try:
             self.repo.create(enrollment)
-        except EnrollmentDuplicationError as e:
-            return build_persistence_failure_result(
-                enrollment_id=enrollment.id,
-                action="create",
-                current_state=enrollment.state,
-                code=ErrorCodes.DUPLICATE_ENROLLMENT,
-                message="An enrollment with the same identifiers already exists.",
-                err=e,
-            )
-
-        except EnrollmentTechnicalPersistenceError as e:
-            return build_persistence_failure_result(
-                enrollment_id=enrollment.id,
-                action="create",
-                current_state=enrollment.state,
-                code=cast(ErrorCodes, e.code),
-                message="Failed to create enrollment due to a technical persistence error.",
-                err=e,
-            )
-        
-        return ApplicationResult(
-            aggregate_id=enrollment.id,
-            changed=True,
-            success=True,
-            domain_events=tuple(enrollment.pull_domain_events()),
-            new_state=enrollment.state,
-            error=None
-        )
\ No newline at end of file
+        except (EnrollmentDuplicationError, EnrollmentTechnicalPersistenceError) as e:
+            return build_create_failure_result(enrollment=enrollment, err=e)
+
+        return build_created_result(enrollment=enrollment)
+
+
+class AsyncCreateEnrollment:
+    """Asyncio variant of CreateEnrollment, over an AsyncEnrollmentRepository."""
+    repo: AsyncEnrollmentRepository
+
+    def __init__(self, repo: AsyncEnrollmentRepository):
+        self.repo = repo
+
+    async def execute(
+            self,
+            *,
+            institution_id: str,
+            student_id: str,
+            class_group_id: str,
+            academic_period_id: str,
+            actor_id: str,
+            occurred_at: datetime | None = None
+            ) -> ApplicationResult:
+        """
+        Execute the create enrollment process.
+        Steps:
+        - Create a new enrollment aggregate.
+        - Persist the new aggregate state.
+        """
+
+        enrollment = Enrollment.create(
+            institution_id=institution_id,
+            student_id=student_id,
+            class_group_id=class_group_id,
+            academic_period_id=academic_period_id,
+            actor_id=actor_id,
+            occurred_at=occurred_at
+        )
+
+        try:
+            await self.repo.create(enrollment)
+        except (EnrollmentDuplicationError, EnrollmentTechnicalPersistenceError) as e:
+            return build_create_failure_result(enrollment=enrollment, err=e)
+
+        return build_created_result(enrollment=enrollment)
+
+
+def build_create_failure_result(
+        *,
+        enrollment: Enrollment,
+        err: EnrollmentDuplicationError | EnrollmentTechnicalPersistenceError,
+) -> ApplicationResult:
+    if isinstance(err, EnrollmentDuplicationError):
+        return build_persistence_failure_result(
+            enrollment_id=enrollment.id,
+            action="create",
+            current_state=enrollment.state,
+            code=ErrorCodes.DUPLICATE_ENROLLMENT,
+            message="An enrollment with the same identifiers already exists.",
+            err=err,
+        )
+    return build_persistence_failure_result(
+        enrollment_id=enrollment.id,
+        action="create",
+        current_state=enrollment.state,
+        code=cast(ErrorCodes, err.code),
+        message="Failed to create enrollment due to a technical persistence error.",
+        err=err,
+    )
+
+
+def build_created_result(*, enrollment: Enrollment) -> ApplicationResult:
+    return ApplicationResult(
+        aggregate_id=enrollment.id,
+        changed=True,
+        success=True,
+        domain_events=tuple(enrollment.pull_domain_events()),
+        new_state=enrollment.state,
+        error=None
+    )
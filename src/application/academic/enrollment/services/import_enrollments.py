@@ -0,0 +1,172 @@
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from itertools import islice
+from typing import cast
+
+from application.academic.enrollment.dto.enrollment_import import (
+    ENROLLMENT_IMPORT_FIELDS,
+    EnrollmentImportOutcome,
+    EnrollmentImportRow,
+)
+from application.academic.enrollment.dto.errors.error_codes import ErrorCodes
+from application.academic.enrollment.dto.results import ApplicationResult
+from application.academic.enrollment.errors.persistence_errors import (
+    EnrollmentDuplicationError,
+    EnrollmentTechnicalPersistenceError,
+)
+from application.academic.enrollment.ports.enrollment_repository import EnrollmentRepository
+from application.academic.enrollment.services.create_enrollment import (
+    build_create_failure_result,
+    build_created_result,
+)
+from application.shared.application_error import ApplicationError
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from domain.shared.domain_error import DomainError
+
+DEFAULT_IMPORT_CHUNK_SIZE = 1000
+
+
+class ImportEnrollments:
+    """Application service to create enrollments in bulk from a stream of import rows.
+    Responsibilities:
+    - Consume the rows lazily, `chunk_size` at a time, so memory does not grow
+      with the size of the input.
+    - Validate each row through `Enrollment.create`.
+    - Drop rows repeating a business key already seen in the same chunk
+      before anything reaches the repository.
+    - Persist each chunk with one `EnrollmentRepository.create_many`.
+    - Yield one outcome per row, in input order, carrying the ApplicationResult
+      CreateEnrollment would have returned for it.
+
+    Duplicates across chunks are reported by the repository (unique business
+    key), with the same DUPLICATE_ENROLLMENT result.
+    """
+    repo: EnrollmentRepository
+
+    def __init__(self, repo: EnrollmentRepository, chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self.repo = repo
+        self.chunk_size = chunk_size
+
+    def execute(
+            self,
+            *,
+            rows: Iterable[EnrollmentImportRow],
+            actor_id: str,
+            occurred_at: datetime | None = None,
+    ) -> Iterator[EnrollmentImportOutcome]:
+        """Import the rows; the returned iterator drives the work, one chunk per step."""
+        iterator = iter(rows)
+        while chunk := list(islice(iterator, self.chunk_size)):
+            yield from self._import_chunk(chunk, actor_id=actor_id, occurred_at=occurred_at)
+
+    def _import_chunk(
+            self,
+            chunk: list[EnrollmentImportRow],
+            *,
+            actor_id: str,
+            occurred_at: datetime | None,
+    ) -> list[EnrollmentImportOutcome]:
+        results: dict[int, ApplicationResult] = {}
+        pending: list[tuple[EnrollmentImportRow, Enrollment]] = []
+        first_row_by_key: dict[tuple[str, ...], int] = {}
+
+        for row in chunk:
+            enrollment = self._validate(row, actor_id=actor_id, occurred_at=occurred_at, results=results)
+            if enrollment is None:
+                continue
+            key = (enrollment.institution_id, enrollment.student_id,
+                   enrollment.class_group_id, enrollment.academic_period_id)
+            if key in first_row_by_key:
+                results[row.row_number] = _duplicate_row_result(duplicate_of_row=first_row_by_key[key])
+                continue
+            first_row_by_key[key] = row.row_number
+            pending.append((row, enrollment))
+
+        if pending:
+            results.update(self._persist(pending))
+
+        return [EnrollmentImportOutcome(row_number=row.row_number, result=results[row.row_number]) for row in chunk]
+
+    @staticmethod
+    def _validate(
+            row: EnrollmentImportRow,
+            *,
+            actor_id: str,
+            occurred_at: datetime | None,
+            results: dict[int, ApplicationResult],
+    ) -> Enrollment | None:
+        if row.parse_error is not None:
+            results[row.row_number] = _invalid_row_result(message=row.parse_error, details={})
+            return None
+
+        values = {name: row.fields.get(name) for name in ENROLLMENT_IMPORT_FIELDS}
+        missing = [name for name, value in values.items() if value is None]
+        if missing:
+            results[row.row_number] = _invalid_row_result(
+                message="Import row is missing required fields.",
+                details={"missing_fields": missing},
+            )
+            return None
+
+        try:
+            return Enrollment.create(
+                **{name: str(value).strip() for name, value in values.items()},
+                actor_id=actor_id,
+                occurred_at=occurred_at,
+            )
+        except DomainError as err:
+            results[row.row_number] = _invalid_row_result(
+                message=err.message,
+                details={**(err.details or {}), "domain_code": err.code},
+            )
+            return None
+
+    def _persist(self, pending: list[tuple[EnrollmentImportRow, Enrollment]]) -> dict[int, ApplicationResult]:
+        try:
+            outcomes = self.repo.create_many([enrollment for _, enrollment in pending])
+        except EnrollmentTechnicalPersistenceError as e:
+            # Batch-wide failure: nothing of the chunk was persisted
+            return {
+                row.row_number: build_create_failure_result(enrollment=enrollment, err=e)
+                for row, enrollment in pending
+            }
+
+        results: dict[int, ApplicationResult] = {}
+        for row, enrollment in pending:
+            outcome = outcomes[enrollment.id]
+            if isinstance(outcome, int):
+                results[row.row_number] = build_created_result(enrollment=enrollment)
+            else:
+                results[row.row_number] = build_create_failure_result(
+                    enrollment=enrollment,
+                    err=cast(EnrollmentDuplicationError | EnrollmentTechnicalPersistenceError, outcome),
+                )
+        return results
+
+
+def _invalid_row_result(*, message: str, details: dict[str, object]) -> ApplicationResult:
+    return ApplicationResult(
+        aggregate_id=None,
+        success=False,
+        changed=False,
+        error=ApplicationError(
+            code=ErrorCodes.INVALID_ENROLLMENT_DATA,
+            message=message,
+            details={**details, "action": "create"},
+        ),
+    )
+
+
+def _duplicate_row_result(*, duplicate_of_row: int) -> ApplicationResult:
+    return ApplicationResult(
+        aggregate_id=None,
+        success=False,
+        changed=False,
+        error=ApplicationError(
+            code=ErrorCodes.DUPLICATE_ENROLLMENT,
+            message="An earlier row of the import has the same identifiers.",
+            details={"action": "create", "duplicate_of_row": duplicate_of_row},
+        ),
+    )
@@ -1,12 +1,21 @@
 from datetime import datetime
 
 from application.academic.enrollment.dto.results import ApplicationResult
+from application.academic.enrollment.ports.async_enrollment_repository import (
+    AsyncEnrollmentRepository,
+)
 from application.academic.enrollment.ports.enrollment_repository import EnrollmentRepository
 from application.academic.enrollment.services._state_change_flow import (
+    afinalize_state_change,
+    arun_state_change,
     build_domain_failure_result,
     build_not_found_result,
+    conflict_retrier,
     finalize_state_change,
+    run_state_change,
 )
+from application.shared.ports.transaction_manager import TransactionManager
+from application.shared.retry_policy import RetryPolicy, RetryStats
 from domain.shared.domain_error import DomainError
 
 
@@ -20,8 +29,22 @@ class ReactivateEnrollmentService:
     """
     repo: EnrollmentRepository
 
-    def __init__(self, repo: EnrollmentRepository):
+    def __init__(
+            self,
+            repo: EnrollmentRepository,
+            *,
+            retry_policy: RetryPolicy | None = None,
+            transaction: TransactionManager | None = None,
+    ):
         self.repo = repo
+        # Opt-in: on a version conflict, re-load and re-apply the command (see RetryPolicy)
+        self._retrier = conflict_retrier(retry_policy)
+        # Opt-in: each attempt in one transaction, required by a repository that locks on load
+        self._transaction = transaction
+
+    @property
+    def retry_stats(self) -> RetryStats | None:
+        return None if self._retrier is None else self._retrier.stats
 
     def execute(
             self,
@@ -36,6 +59,26 @@ class ReactivateEnrollmentService:
         Steps:
         - Retrieve the enrollment aggregate.
         """
+        return run_state_change(
+            self._retrier,
+            lambda: self._execute_once(
+                enrollment_id=enrollment_id,
+                actor_id=actor_id,
+                justification=justification,
+                occurred_at=occurred_at,
+            ),
+            transaction=self._transaction,
+        )
+
+    def _execute_once(
+            self,
+            *,
+            enrollment_id: str,
+            actor_id: str,
+            justification: str,
+            occurred_at: datetime | None = None,
+    ) -> ApplicationResult:
+        """One attempt: load, apply the command, finalize."""
         enrollment = self.repo.get_by_id(enrollment_id)
         if enrollment is None:
             return build_not_found_result(enrollment_id=enrollment_id, action="reactivate")
@@ -65,3 +108,79 @@ class ReactivateEnrollmentService:
             event_without_state_change_message="Reactivation produced pending domain events without a state change.",
             state_changed_without_event_message="Reactivation changed state without emitting a domain event.",
         )
+
+
+class AsyncReactivateEnrollmentService:
+    """Asyncio variant of ReactivateEnrollmentService, over an AsyncEnrollmentRepository."""
+    repo: AsyncEnrollmentRepository
+
+    def __init__(self, repo: AsyncEnrollmentRepository, *, retry_policy: RetryPolicy | None = None):
+        self.repo = repo
+        # Opt-in: on a version conflict, re-load and re-apply the command (see RetryPolicy)
+        self._retrier = conflict_retrier(retry_policy)
+
+    @property
+    def retry_stats(self) -> RetryStats | None:
+        return None if self._retrier is None else self._retrier.stats
+
+    async def execute(
+            self,
+            *,
+            enrollment_id: str,
+            actor_id: str,
+            justification: str,
+            occurred_at: datetime | None = None,
+    ) -> ApplicationResult:
+        """
+        Execute the reactivate enrollment process.
+        Steps:
+        - Retrieve the enrollment aggregate.
+        """
+        return await arun_state_change(
+            self._retrier,
+            lambda: self._execute_once(
+                enrollment_id=enrollment_id,
+                actor_id=actor_id,
+                justification=justification,
+                occurred_at=occurred_at,
+            ),
+        )
+
+    async def _execute_once(
+            self,
+            *,
+            enrollment_id: str,
+            actor_id: str,
+            justification: str,
+            occurred_at: datetime | None = None,
+    ) -> ApplicationResult:
+        """One attempt: load, apply the command, finalize."""
+        enrollment = await self.repo.get_by_id(enrollment_id)
+        if enrollment is None:
+            return build_not_found_result(enrollment_id=enrollment_id, action="reactivate")
+
+        previous_state = enrollment.state
+        try:
+            enrollment.reactivate(
+                actor_id=actor_id,
+                occurred_at=occurred_at,
+                justification=justification
+            )
+        except DomainError as err:
+            return build_domain_failure_result(
+                enrollment_id=enrollment_id,
+                current_state=enrollment.state,
+                action="reactivate",
+                err=err,
+            )
+
+        return await afinalize_state_change(
+            repo=self.repo,
+            enrollment=enrollment,
+            enrollment_id=enrollment_id,
+            action="reactivate",
+            previous_state=previous_state,
+            persistence_failure_message="Failed to persist enrollment reactivation.",
+            event_without_state_change_message="Reactivation produced pending domain events without a state change.",
+            state_changed_without_event_message="Reactivation changed state without emitting a domain event.",
+        )
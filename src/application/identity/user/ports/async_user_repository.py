@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+from domain.identity.user.entities.user import User
+
+
+class AsyncUserRepository(Protocol):
+    """
+    Asyncio port (contract) for User persistence, used by the async services.
+
+    Each method follows the contract of the same method on UserRepository;
+    only the calling convention differs.
+    """
+
+    async def get_by_id(self, user_id: str) -> User | None:
+        """Return the User aggregate for the given id, or None if no record exists."""
+        ...
+
+    async def save(self, user: User) -> int:
+        """Persist the current state of an existing User aggregate and return the new persisted version."""
+        ...
+
+    async def create(self, user: User) -> int:
+        """
+        Persist a new User aggregate and return its initial version.
+
+        Raises UserDuplicationError / UserTechnicalPersistenceError as
+        UserRepository.create does.
+        """
+        ...
@@ -10,6 +10,7 @@ result contract:
 
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from typing import Protocol, cast
 
 from application.identity.user.dto.errors.error_codes import ErrorCodes
@@ -20,9 +21,12 @@ from application.identity.user.errors.persistence_errors import (
     UserPersistenceNotFoundError,
     UserTechnicalPersistenceError,
 )
+from application.identity.user.ports.async_user_repository import AsyncUserRepository
 from application.identity.user.ports.user_repository import UserRepository
 from application.shared.application_error import ApplicationError
 from application.shared.errors.error_codes import SharedErrorCodes
+from application.shared.retry_policy import ConflictRetrier, RetryPolicy
+from application.shared.unit_of_work import defers_writes
 from domain.identity.user.entities.user import User
 from domain.identity.user.value_objects.user_state import UserState
 from domain.shared.domain_error import DomainError
@@ -154,86 +158,199 @@ def build_no_change_result(*, user_id: str) -> ApplicationResult:
         error=None
     )
     
-def finalize_state_change(
+def check_state_change(
         *,
-        repo: UserRepository,
         user: UserLike,
         user_id: str,
         action: str,
         previous_state: UserState,
-        persistence_failure_message: str,
         event_without_state_change_message: str,
         state_changed_without_event_message: str,
-) -> ApplicationResult:
-    """Finalize a successful domain command under the application contract. 
-    Rules enforced here:
+) -> ApplicationResult | None:
+    """Return the final result when nothing must be persisted, otherwise None.
+
     - no state change + pending events => integrity violation
     - state change + no pending events => integrity violation
-    - on persistence failure, events remain buffered in the aggregate
-    - on success, the service returns an event snapshot and then clears the
-      aggregate buffer
+    - no state change + no events => canonical no-op
     """
     state_changed = user.state != previous_state
-    events_snapshot = tuple(user.peek_domain_events())
+    has_events = bool(user.peek_domain_events())
 
     if not state_changed:
-        if events_snapshot:
+        if has_events:
             return build_state_integrity_result(
                 user_id=user_id,
                 action=action,
                 previous_state=previous_state,
                 current_state=user.state,
                 reason="event_without_state_change",
-                message=event_without_state_change_message,               
+                message=event_without_state_change_message,
             )
         return build_no_change_result(user_id=user_id)
-    
-    if not events_snapshot:
+
+    if not has_events:
         return build_state_integrity_result(
             user_id=user_id,
             action=action,
             previous_state=previous_state,
             current_state=user.state,
             reason="state_changed_without_event",
-            message=state_changed_without_event_message,               
+            message=state_changed_without_event_message,
         )
+    return None
+
+
+def build_save_failure_result(
+        *,
+        user_id: str,
+        action: str,
+        current_state: UserState,
+        message: str,
+        err: ConcurrencyConflictError | UserPersistenceNotFoundError | UserTechnicalPersistenceError,
+) -> ApplicationResult:
+    """Map a persistence error raised by the repository to a failure result."""
+    code = ErrorCodes.CONCURRENCY_CONFLICT if isinstance(err, ConcurrencyConflictError) else cast(ErrorCodes, err.code)
+    return build_persistence_failure_result(
+        user_id=user_id,
+        action=action,
+        current_state=current_state,
+        code=code,
+        message=message,
+        err=err,
+    )
+
+
+def build_changed_result(*, user: UserLike, user_id: str, drain: bool = True) -> ApplicationResult:
+    """Drain the aggregate buffer after a successful save and return the change result."""
+    # drain=False: the write is deferred (UnitOfWork) and the flush still needs the events
+    events_snapshot = tuple(user.pull_domain_events() if drain else user.peek_domain_events())
+
+    return ApplicationResult(
+        aggregate_id=user_id,
+        changed=True,
+        success=True,
+        domain_events=events_snapshot,
+        new_state=user.state,
+        error=None
+    )
+
+
+def finalize_state_change(
+        *,
+        repo: UserRepository,
+        user: UserLike,
+        user_id: str,
+        action: str,
+        previous_state: UserState,
+        persistence_failure_message: str,
+        event_without_state_change_message: str,
+        state_changed_without_event_message: str,
+) -> ApplicationResult:
+    """Finalize a successful domain command under the application contract. 
+    Rules enforced here:
+    - no state change + pending events => integrity violation
+    - state change + no pending events => integrity violation
+    - on persistence failure, events remain buffered in the aggregate
+    - on success, the service returns an event snapshot and then clears the
+      aggregate buffer, unless the repository defers writes (UnitOfWork): the
+      buffer is then left for the flush
+    """
+    early_result = check_state_change(
+        user=user,
+        user_id=user_id,
+        action=action,
+        previous_state=previous_state,
+        event_without_state_change_message=event_without_state_change_message,
+        state_changed_without_event_message=state_changed_without_event_message,
+    )
+    if early_result is not None:
+        return early_result
+
     try:
         repo.save(cast(User, user))
-    except ConcurrencyConflictError as e:
-        return build_persistence_failure_result(
+    except (
+        ConcurrencyConflictError,
+        UserPersistenceNotFoundError,
+        UserTechnicalPersistenceError,
+    ) as e:
+        return build_save_failure_result(
             user_id=user_id,
             action=action,
             current_state=user.state,
-            code=ErrorCodes.CONCURRENCY_CONFLICT,
             message=persistence_failure_message,
             err=e,
         )
-    except UserPersistenceNotFoundError as e:
-        return build_persistence_failure_result(
-            user_id=user_id,
-            action=action,
-            current_state=user.state,
-            code=cast(ErrorCodes, e.code),
-            message=persistence_failure_message,
-            err=e,            
-        )
-    except UserTechnicalPersistenceError as e:
-        return build_persistence_failure_result(
+
+    return build_changed_result(user=user, user_id=user_id, drain=not defers_writes(repo))
+
+
+async def afinalize_state_change(
+        *,
+        repo: AsyncUserRepository,
+        user: UserLike,
+        user_id: str,
+        action: str,
+        previous_state: UserState,
+        persistence_failure_message: str,
+        event_without_state_change_message: str,
+        state_changed_without_event_message: str,
+) -> ApplicationResult:
+    """finalize_state_change for the async services: same rules, awaited save."""
+    early_result = check_state_change(
+        user=user,
+        user_id=user_id,
+        action=action,
+        previous_state=previous_state,
+        event_without_state_change_message=event_without_state_change_message,
+        state_changed_without_event_message=state_changed_without_event_message,
+    )
+    if early_result is not None:
+        return early_result
+
+    try:
+        await repo.save(cast(User, user))
+    except (
+        ConcurrencyConflictError,
+        UserPersistenceNotFoundError,
+        UserTechnicalPersistenceError,
+    ) as e:
+        return build_save_failure_result(
             user_id=user_id,
             action=action,
             current_state=user.state,
-            code=cast(ErrorCodes, e.code),
             message=persistence_failure_message,
-            err=e,            
+            err=e,
         )
-    
-    user.pull_domain_events()
 
-    return ApplicationResult(
-        aggregate_id=user_id,
-        changed=True,
-        success=True,
-        domain_events=events_snapshot,
-        new_state=user.state,
-        error=None
-    )
\ No newline at end of file
+    return build_changed_result(user=user, user_id=user_id)
+
+
+def is_concurrency_conflict(result: ApplicationResult) -> bool:
+    return result.error is not None and result.error.code == ErrorCodes.CONCURRENCY_CONFLICT
+
+
+def conflict_retrier(policy: RetryPolicy | None) -> ConflictRetrier | None:
+    """Per-service retrier for an opt-in policy (None: conflicts are returned as is)."""
+    return None if policy is None else ConflictRetrier(policy, is_conflict=is_concurrency_conflict)
+
+
+def run_state_change(
+        retrier: ConflictRetrier | None,
+        attempt: Callable[[], ApplicationResult],
+) -> ApplicationResult:
+    """
+    Run one load -> command -> finalize attempt, and run it again after a
+    CONCURRENCY_CONFLICT while the retrier allows. Each attempt re-loads the
+    aggregate, so a command that the winning write made redundant ends as a
+    no-change result and stops the retries; exhausted retries return the
+    conflict result unchanged.
+    """
+    return attempt() if retrier is None else retrier.run(attempt)
+
+
+async def arun_state_change(
+        retrier: ConflictRetrier | None,
+        attempt: Callable[[], Awaitable[ApplicationResult]],
+) -> ApplicationResult:
+    """run_state_change for the async services."""
+    return await attempt() if retrier is None else await retrier.arun(attempt)
@@ -1,12 +1,18 @@
 from datetime import datetime
 
 from application.identity.user.dto.results import ApplicationResult
+from application.identity.user.ports.async_user_repository import AsyncUserRepository
 from application.identity.user.ports.user_repository import UserRepository
 from application.identity.user.services._state_change_flow import (
+    afinalize_state_change,
+    arun_state_change,
     build_domain_failure_result,
     build_not_found_result,
+    conflict_retrier,
     finalize_state_change,
+    run_state_change,
 )
+from application.shared.retry_policy import RetryPolicy, RetryStats
 from domain.identity.user.entities.user import User
 from domain.shared.domain_error import DomainError
 
@@ -21,8 +27,14 @@ class ActivateUserService:
     """
     repo: UserRepository
 
-    def __init__(self, repo: UserRepository):
+    def __init__(self, repo: UserRepository, *, retry_policy: RetryPolicy | None = None):
         self.repo = repo
+        # Opt-in: on a version conflict, re-load and re-apply the command (see RetryPolicy)
+        self._retrier = conflict_retrier(retry_policy)
+
+    @property
+    def retry_stats(self) -> RetryStats | None:
+        return None if self._retrier is None else self._retrier.stats
 
     def execute(
             self,
@@ -31,7 +43,23 @@ class ActivateUserService:
             actor_id: str,
             occurred_at: datetime,
         ) -> ApplicationResult:
+        return run_state_change(
+            self._retrier,
+            lambda: self._execute_once(
+                user_id=user_id,
+                actor_id=actor_id,
+                occurred_at=occurred_at,
+            ),
+        )
 
+    def _execute_once(
+            self,
+            *,
+            user_id: str,
+            actor_id: str,
+            occurred_at: datetime,
+    ) -> ApplicationResult:
+        """One attempt: load, apply the command, finalize."""
         user = self.repo.get_by_id(user_id)
         if user is None:
             return build_not_found_result(user_id=user_id, action="activate")
@@ -59,4 +87,69 @@ class ActivateUserService:
             event_without_state_change_message="Activation produced pending domain events without a state change.",
             state_changed_without_event_message="Activation changed state without emitting a domain event.",
         )
-        
+
+
+class AsyncActivateUserService:
+    """Asyncio variant of ActivateUserService, over an AsyncUserRepository."""
+    repo: AsyncUserRepository
+
+    def __init__(self, repo: AsyncUserRepository, *, retry_policy: RetryPolicy | None = None):
+        self.repo = repo
+        # Opt-in: on a version conflict, re-load and re-apply the command (see RetryPolicy)
+        self._retrier = conflict_retrier(retry_policy)
+
+    @property
+    def retry_stats(self) -> RetryStats | None:
+        return None if self._retrier is None else self._retrier.stats
+
+    async def execute(
+            self,
+            *,
+            user_id: str,
+            actor_id: str,
+            occurred_at: datetime,
+    ) -> ApplicationResult:
+        return await arun_state_change(
+            self._retrier,
+            lambda: self._execute_once(
+                user_id=user_id,
+                actor_id=actor_id,
+                occurred_at=occurred_at,
+            ),
+        )
+
+    async def _execute_once(
+            self,
+            *,
+            user_id: str,
+            actor_id: str,
+            occurred_at: datetime,
+    ) -> ApplicationResult:
+        """One attempt: load, apply the command, finalize."""
+        user = await self.repo.get_by_id(user_id)
+        if user is None:
+            return build_not_found_result(user_id=user_id, action="activate")
+        previous_state = user.state
+
+        try:
+            user.activate(
+                actor_id=actor_id,
+                occurred_at=occurred_at,
+            )
+        except DomainError as err:
+            return build_domain_failure_result(
+                user_id=user_id,
+                current_state=user.state,
+                action="activate",
+                err=err,
+            )
+        return await afinalize_state_change(
+            repo=self.repo,
+            user=user,
+            user_id=user_id,
+            action="activate",
+            previous_state=previous_state,
+            persistence_failure_message="Failed to persist user activation.",
+            event_without_state_change_message="Activation produced pending domain events without a state change.",
+            state_changed_without_event_message="Activation changed state without emitting a domain event.",
+        )
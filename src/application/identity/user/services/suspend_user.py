@@ -1,12 +1,18 @@
 from datetime import datetime
 
 from application.identity.user.dto.results import ApplicationResult
+from application.identity.user.ports.async_user_repository import AsyncUserRepository
 from application.identity.user.ports.user_repository import UserRepository
 from application.identity.user.services._state_change_flow import (
+    afinalize_state_change,
+    arun_state_change,
     build_domain_failure_result,
     build_not_found_result,
+    conflict_retrier,
     finalize_state_change,
+    run_state_change,
 )
+from application.shared.retry_policy import RetryPolicy, RetryStats
 from domain.identity.user.entities.user import User
 from domain.shared.domain_error import DomainError
 
@@ -21,8 +27,14 @@ class SuspendUserService:
     """
     repo: UserRepository
 
-    def __init__(self, repo: UserRepository):
+    def __init__(self, repo: UserRepository, *, retry_policy: RetryPolicy | None = None):
         self.repo = repo
+        # Opt-in: on a version conflict, re-load and re-apply the command (see RetryPolicy)
+        self._retrier = conflict_retrier(retry_policy)
+
+    @property
+    def retry_stats(self) -> RetryStats | None:
+        return None if self._retrier is None else self._retrier.stats
 
     def execute(
             self,
@@ -32,7 +44,25 @@ class SuspendUserService:
             justification: str,
             occurred_at: datetime | None = None,
         ) -> ApplicationResult:
+        return run_state_change(
+            self._retrier,
+            lambda: self._execute_once(
+                user_id=user_id,
+                actor_id=actor_id,
+                justification=justification,
+                occurred_at=occurred_at,
+            ),
+        )
 
+    def _execute_once(
+            self,
+            *,
+            user_id: str,
+            actor_id: str,
+            justification: str,
+            occurred_at: datetime | None = None,
+    ) -> ApplicationResult:
+        """One attempt: load, apply the command, finalize."""
         user = self.repo.get_by_id(user_id)
         if user is None:
             return build_not_found_result(user_id=user_id, action="suspend")
@@ -63,3 +93,75 @@ class SuspendUserService:
             event_without_state_change_message="Suspension produced pending domain events without a state change.",
             state_changed_without_event_message="Suspension changed state without emitting a domain event.",
         )
+
+
+class AsyncSuspendUserService:
+    """Asyncio variant of SuspendUserService, over an AsyncUserRepository."""
+    repo: AsyncUserRepository
+
+    def __init__(self, repo: AsyncUserRepository, *, retry_policy: RetryPolicy | None = None):
+        self.repo = repo
+        # Opt-in: on a version conflict, re-load and re-apply the command (see RetryPolicy)
+        self._retrier = conflict_retrier(retry_policy)
+
+    @property
+    def retry_stats(self) -> RetryStats | None:
+        return None if self._retrier is None else self._retrier.stats
+
+    async def execute(
+            self,
+            *,
+            user_id: str,
+            actor_id: str,
+            justification: str,
+            occurred_at: datetime | None = None,
+    ) -> ApplicationResult:
+        return await arun_state_change(
+            self._retrier,
+            lambda: self._execute_once(
+                user_id=user_id,
+                actor_id=actor_id,
+                justification=justification,
+                occurred_at=occurred_at,
+            ),
+        )
+
+    async def _execute_once(
+            self,
+            *,
+            user_id: str,
+            actor_id: str,
+            justification: str,
+            occurred_at: datetime | None = None,
+    ) -> ApplicationResult:
+        """One attempt: load, apply the command, finalize."""
+        user = await self.repo.get_by_id(user_id)
+        if user is None:
+            return build_not_found_result(user_id=user_id, action="suspend")
+
+        previous_state = user.state
+
+        try:
+            user.suspend(
+                actor_id=actor_id,
+                occurred_at=occurred_at,
+                justification=justification,
+            )
+        except DomainError as err:
+            return build_domain_failure_result(
+                user_id=user_id,
+                current_state=user.state,
+                action="suspend",
+                err=err,
+            )
+
+        return await afinalize_state_change(
+            repo=self.repo,
+            user=user,
+            user_id=user_id,
+            action="suspend",
+            previous_state=previous_state,
+            persistence_failure_message="Failed to persist user suspension.",
+            event_without_state_change_message="Suspension produced pending domain events without a state change.",
+            state_changed_without_event_message="Suspension changed state without emitting a domain event.",
+        )
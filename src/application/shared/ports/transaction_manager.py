@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from contextlib import AbstractContextManager
+from typing import Protocol
+
+
+class TransactionManager(Protocol):
+    """
+    Port (contract) for running a unit of application work in one transaction.
+
+    Responsibilities:
+    - Open a transaction on enter, commit it on a clean exit and roll it back
+      when an exception leaves the block.
+    - Nest: an inner atomic() inside an open one must not commit early.
+
+    Services use it to keep a load and the save that follows it in the same
+    transaction, which is what a repository that locks on load (pessimistic
+    locking) needs to hold the lock until the write.
+    """
+
+    def atomic(self) -> AbstractContextManager[object]:
+        ...
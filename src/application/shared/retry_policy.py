@@ -0,0 +1,143 @@
+"""Bounded, jittered retries for state-change use cases that hit a version conflict.
+
+A state-change attempt (load -> domain command -> finalize) that ends in a
+concurrency conflict can simply be run again: the re-load sees the winning
+write, and the command either applies on top of it, becomes a no-op or is
+rejected by the domain. ``ConflictRetrier`` runs the attempt again until its
+result is no longer a conflict, the attempts are used up or the deadline
+would be crossed; the last result is always returned (Contract A: nothing
+is raised).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+R = TypeVar("R")
+
+
+@dataclass(frozen=True, kw_only=True)
+class RetryPolicy:
+    """
+    - max_attempts: total attempts, the first one included
+    - base_delay / max_delay: seconds; the n-th retry sleeps a uniform random
+      time in [0, min(max_delay, base_delay * 2 ** (n - 1))] (full jitter)
+    - deadline: seconds from the first attempt after which no retry starts
+      (None: bounded by max_attempts only)
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.005
+    max_delay: float = 0.1
+    deadline: float | None = 0.5
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1.")
+        if self.base_delay < 0 or self.max_delay < self.base_delay:
+            raise ValueError("Delays must satisfy 0 <= base_delay <= max_delay.")
+        if self.deadline is not None and self.deadline <= 0:
+            raise ValueError("deadline must be positive.")
+
+    def backoff(self, retry: int, rng: random.Random) -> float:
+        """Sleep before the ``retry``-th retry (1-based)."""
+        return rng.uniform(0.0, min(self.max_delay, self.base_delay * 2 ** (retry - 1)))
+
+
+@dataclass(frozen=True)
+class RetryStats:
+    executions: int
+    retries: int
+    # Metric: executions that ended without a conflict after at least one retry
+    recovered: int
+    # Metric: executions that still ended in a conflict (attempts or deadline used up)
+    exhausted: int
+
+
+class ConflictRetrier:
+    """
+    Runs one use case's attempts under a RetryPolicy and counts what happened.
+
+    One instance per use case (service), so the counters are per use case;
+    it is safe to share between threads. run() drives sync attempts and
+    arun() coroutine attempts, under the same policy and counters.
+    """
+
+    def __init__(
+            self,
+            policy: RetryPolicy,
+            *,
+            is_conflict: Callable[[Any], bool],
+            sleep: Callable[[float], None] = time.sleep,
+            asleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+            clock: Callable[[], float] = time.monotonic,
+            rng: random.Random | None = None,
+    ) -> None:
+        self.policy = policy
+        self._is_conflict = is_conflict
+        self._sleep = sleep
+        self._asleep = asleep
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._executions = 0
+        self._retries = 0
+        self._recovered = 0
+        self._exhausted = 0
+
+    @property
+    def stats(self) -> RetryStats:
+        return RetryStats(
+            executions=self._executions,
+            retries=self._retries,
+            recovered=self._recovered,
+            exhausted=self._exhausted,
+        )
+
+    def run(self, attempt: Callable[[], R]) -> R:
+        started = self._clock()
+        retries = 0
+        result = attempt()
+        while (delay := self._next_delay(result, retries, started)) is not None:
+            self._sleep(delay)
+            retries += 1
+            result = attempt()
+        return self._record(result, retries)
+
+    async def arun(self, attempt: Callable[[], Awaitable[R]]) -> R:
+        """run() for coroutine attempts; the backoff awaits `asleep` instead of blocking."""
+        started = self._clock()
+        retries = 0
+        result = await attempt()
+        while (delay := self._next_delay(result, retries, started)) is not None:
+            await self._asleep(delay)
+            retries += 1
+            result = await attempt()
+        return self._record(result, retries)
+
+    def _next_delay(self, result: Any, retries: int, started: float) -> float | None:
+        """Backoff before the next attempt, or None when the result stands."""
+        policy = self.policy
+        if not self._is_conflict(result) or retries + 1 >= policy.max_attempts:
+            return None
+        with self._lock:
+            delay = policy.backoff(retries + 1, self._rng)
+        if policy.deadline is not None and self._clock() + delay - started > policy.deadline:
+            return None
+        return delay
+
+    def _record(self, result: R, retries: int) -> R:
+        conflict = self._is_conflict(result)
+        with self._lock:
+            self._executions += 1
+            self._retries += retries
+            if conflict:
+                self._exhausted += 1
+            elif retries:
+                self._recovered += 1
+        return result
@@ -0,0 +1,252 @@
+"""One transaction and one identity map for a use case that spans aggregates.
+
+A use case that changes several aggregates (inactivate a user and cancel the
+enrollments of that user, say) would otherwise open a transaction per
+service call, re-load the same aggregates and save them one by one.
+``UnitOfWork`` wraps the whole block in one ``TransactionManager.atomic()``:
+
+- the repositories it exposes keep an identity map, so a second get_by_id
+  (or a get_many over ids already loaded) returns the same instance without
+  a round trip; misses are loaded in one get_many;
+- save() and save_many() only register the aggregate; every aggregate that
+  was registered or changed state since it was loaded is flushed on a clean
+  exit, enrollments through one save_many() and users through save();
+- create() and create_many() insert at once; a created aggregate is not
+  saved again by the flush unless it is registered or changes state later;
+- a failed flush raises and rolls the whole transaction back, leaving the
+  domain events buffered in the aggregates;
+- after the commit, the domain events of every created or flushed aggregate
+  are pulled into ``events`` (users first, then enrollments, each in load
+  order).
+
+    with UnitOfWork(transaction=tx, enrollments=enrollment_repo, users=user_repo) as uow:
+        user = uow.users.get_by_id(user_id)
+        user.inactivate(actor_id=actor_id, justification="left")
+        for enrollment in uow.enrollments.get_many(enrollment_ids).values():
+            enrollment.cancel(actor_id=actor_id, justification="user inactivated")
+    publish(uow.events)
+
+Services can run inside the block on ``uow.enrollments`` / ``uow.users``:
+their save() then succeeds at once and persistence errors surface when the
+unit commits. The state-change flows check ``defers_writes(repo)`` and, for
+these repositories, copy the events into the result without draining the
+aggregate, so the flush still writes them to the outbox and ``events``
+still collects them. A UnitOfWork is single use.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from contextlib import AbstractContextManager
+from types import TracebackType
+from typing import TypeVar
+
+from application.academic.enrollment.errors.persistence_errors import ApplicationPersistenceError
+from application.academic.enrollment.ports.enrollment_repository import EnrollmentRepository
+from application.identity.user.ports.user_repository import UserRepository
+from application.shared.ports.transaction_manager import TransactionManager
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from domain.identity.user.entities.user import User
+from domain.shared.domain_event import DomainEvent
+
+A = TypeVar("A")
+
+
+def _track(loaded: dict[str, A | None], kind: str, aggregate_id: str, aggregate: A) -> None:
+    current = loaded.get(aggregate_id)
+    if current is not None and current is not aggregate:
+        raise ValueError(f"Another instance of {kind} {aggregate_id} is already tracked by this unit of work.")
+    loaded[aggregate_id] = aggregate
+
+
+def _written(loaded: dict[str, A | None], aggregate_ids: set[str]) -> list[A]:
+    return [
+        aggregate
+        for aggregate_id, aggregate in loaded.items()
+        if aggregate is not None and aggregate_id in aggregate_ids
+    ]
+
+
+class UnitOfWorkEnrollmentRepository:
+    """EnrollmentRepository view of a UnitOfWork: identity-mapped loads, deferred saves."""
+
+    def __init__(self, inner: EnrollmentRepository) -> None:
+        self._inner = inner
+        # Identity map; None records an id that was looked up and not found
+        self._loaded: dict[str, Enrollment | None] = {}
+        self._registered: set[str] = set()
+        self._created: set[str] = set()
+
+    def get_by_id(self, enrollment_id: str) -> Enrollment | None:
+        if enrollment_id not in self._loaded:
+            self._loaded[enrollment_id] = self._inner.get_by_id(enrollment_id)
+        return self._loaded[enrollment_id]
+
+    def get_many(self, enrollment_ids: Iterable[str]) -> dict[str, Enrollment | None]:
+        requested = list(dict.fromkeys(enrollment_ids))
+        missing = [enrollment_id for enrollment_id in requested if enrollment_id not in self._loaded]
+        if missing:
+            self._loaded.update(self._inner.get_many(missing))
+        return {enrollment_id: self._loaded[enrollment_id] for enrollment_id in requested}
+
+    def find_ids_by_class_group(self, *, class_group_id: str, academic_period_id: str) -> list[str]:
+        return self._inner.find_ids_by_class_group(
+            class_group_id=class_group_id,
+            academic_period_id=academic_period_id,
+        )
+
+    def save(self, enrollment: Enrollment) -> int:
+        """Register the aggregate for the flush and return the version it will be saved with."""
+        _track(self._loaded, "enrollment", enrollment.id, enrollment)
+        self._registered.add(enrollment.id)
+        return enrollment.version + 1
+
+    def save_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        return {enrollment.id: self.save(enrollment) for enrollment in enrollments}
+
+    def create(self, enrollment: Enrollment) -> int:
+        """Insert right away (inside the unit's transaction), so duplicates fail where they happen."""
+        version = self._inner.create(enrollment)
+        _track(self._loaded, "enrollment", enrollment.id, enrollment)
+        self._created.add(enrollment.id)
+        return version
+
+    def create_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        outcomes = self._inner.create_many(enrollments)
+        for enrollment in enrollments:
+            if not isinstance(outcomes[enrollment.id], ApplicationPersistenceError):
+                _track(self._loaded, "enrollment", enrollment.id, enrollment)
+                self._created.add(enrollment.id)
+        return outcomes
+
+    def dirty(self) -> list[Enrollment]:
+        """Registered aggregates and tracked ones with unsaved transitions, in load order."""
+        return [
+            enrollment
+            for enrollment_id, enrollment in self._loaded.items()
+            if enrollment is not None
+            and (enrollment_id in self._registered or enrollment.pending_transitions())
+        ]
+
+    def flush(self) -> list[Enrollment]:
+        """Save the dirty aggregates; return them and the created ones, in load order."""
+        dirty = self.dirty()
+        if dirty:
+            outcomes = self._inner.save_many(dirty)
+            for enrollment in dirty:
+                outcome = outcomes[enrollment.id]
+                if isinstance(outcome, ApplicationPersistenceError):
+                    raise outcome
+        return _written(self._loaded, {enrollment.id for enrollment in dirty} | self._created)
+
+
+class UnitOfWorkUserRepository:
+    """UserRepository view of a UnitOfWork: identity-mapped loads, deferred saves."""
+
+    def __init__(self, inner: UserRepository) -> None:
+        self._inner = inner
+        self._loaded: dict[str, User | None] = {}
+        self._registered: set[str] = set()
+        self._created: set[str] = set()
+        # User keeps its whole transition history; a longer one means unsaved state changes
+        self._origin_transitions: dict[str, int] = {}
+
+    def get_by_id(self, user_id: str) -> User | None:
+        if user_id not in self._loaded:
+            user = self._inner.get_by_id(user_id)
+            self._loaded[user_id] = user
+            if user is not None:
+                self._origin_transitions[user_id] = len(user.transitions)
+        return self._loaded[user_id]
+
+    def save(self, user: User) -> int:
+        """Register the aggregate for the flush and return the version it will be saved with."""
+        _track(self._loaded, "user", user.id, user)
+        self._registered.add(user.id)
+        return user.version + 1
+
+    def create(self, user: User) -> int:
+        version = self._inner.create(user)
+        _track(self._loaded, "user", user.id, user)
+        self._created.add(user.id)
+        self._origin_transitions[user.id] = len(user.transitions)
+        return version
+
+    def dirty(self) -> list[User]:
+        """Registered aggregates and tracked ones with unsaved transitions, in load order."""
+        return [
+            user
+            for user_id, user in self._loaded.items()
+            if user is not None
+            and (user_id in self._registered or len(user.transitions) > self._origin_transitions.get(user_id, 0))
+        ]
+
+    def flush(self) -> list[User]:
+        """Save the dirty aggregates; return them and the created ones, in load order."""
+        # UserRepository has no batched save; a workflow touches few users
+        dirty = self.dirty()
+        for user in dirty:
+            self._inner.save(user)
+        return _written(self._loaded, {user.id for user in dirty} | self._created)
+
+
+def defers_writes(repo: object) -> bool:
+    """True when `repo` is a UnitOfWork view, whose save() only registers the aggregate."""
+    return isinstance(repo, UnitOfWorkEnrollmentRepository | UnitOfWorkUserRepository)
+
+
+class UnitOfWork:
+    """
+    Context manager running a block in one transaction over identity-mapped repositories.
+
+    Leaving the block normally flushes the dirty aggregates and commits;
+    an exception (from the block or the flush) rolls everything back and
+    propagates. ``events`` holds the created and flushed aggregates' domain
+    events once the transaction has committed.
+    """
+
+    def __init__(
+            self,
+            *,
+            transaction: TransactionManager,
+            enrollments: EnrollmentRepository,
+            users: UserRepository | None = None,
+    ) -> None:
+        self._transaction = transaction
+        self.enrollments = UnitOfWorkEnrollmentRepository(enrollments)
+        self.users = UnitOfWorkUserRepository(users) if users is not None else None
+        self.events: tuple[DomainEvent, ...] = ()
+        self.committed = False
+        self._atomic: AbstractContextManager[object] | None = None
+        self._used = False
+
+    def __enter__(self) -> UnitOfWork:
+        if self._used:
+            raise RuntimeError("A UnitOfWork can only be entered once.")
+        self._used = True
+        self._atomic = self._transaction.atomic()
+        self._atomic.__enter__()
+        return self
+
+    def __exit__(
+            self,
+            exc_type: type[BaseException] | None,
+            exc: BaseException | None,
+            tb: TracebackType | None,
+    ) -> None:
+        assert self._atomic is not None
+        atomic, self._atomic = self._atomic, None
+        if exc_type is not None:
+            atomic.__exit__(exc_type, exc, tb)
+            return
+
+        try:
+            flushed: list[User | Enrollment] = [*self.users.flush()] if self.users is not None else []
+            flushed.extend(self.enrollments.flush())
+        except BaseException as error:
+            atomic.__exit__(type(error), error, error.__traceback__)
+            raise
+        atomic.__exit__(None, None, None)
+
+        self.committed = True
+        self.events = tuple(event for aggregate in flushed for event in aggregate.pull_domain_events())
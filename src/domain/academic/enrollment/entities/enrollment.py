@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Protocol
 from uuid import uuid4
 
+from domain.shared.lazy_history import LazyHistory
+from domain.shared.state_machine import EdgeSpec, IntegrityFault, JustificationPolicy
+
 from ..errors.enrollment_errors import (
     ConclusionNotAllowedError,
     DomainError,
@@ -14,28 +16,12 @@ from ..errors.enrollment_errors import (
 )
 from ..events.enrollment_events import (
     DomainEvent,
-    EnrollmentCancelled,
-    EnrollmentConcluded,
     EnrollmentCreated,
-    EnrollmentReactivated,
-    EnrollmentSuspended,
 )
 from ..value_objects.conclusion_verdict import ConclusionVerdict
 from ..value_objects.enrollment_status import EnrollmentState
 from ..value_objects.state_transition import StateTransition
-
-
-class EnrollmentEventClass(Protocol):
-    def __call__(
-        self,
-        *,
-        aggregate_id: str,
-        actor_id: str,
-        from_state: EnrollmentState,
-        to_state: EnrollmentState,
-        occurred_at: datetime,
-        justification: str | None,
-    ) -> DomainEvent: ...
+from .enrollment_state_machine import ENROLLMENT_STATE_MACHINE
 
 
 @dataclass
@@ -47,6 +33,11 @@ class Enrollment:
     - State transitions are applied through command methods and recorded as:
       - StateTransition (VO)
       - DomainEvent (for integration after persistence)
+    - Transitions given at construction are the persisted history; those
+      appended afterwards by commands are pending until marked persisted.
+      The history may be a LazyHistory: commands only append to it, so they
+      never force the persisted transitions to load
+    - Allowed edges and the timestamp matrix come from ENROLLMENT_STATE_MACHINE
     """
     # alguns comentários tem apenas finalidade didática
 
@@ -67,8 +58,12 @@ class Enrollment:
 
     version: int = 1
 
-    transitions: list[StateTransition] = field(default_factory=list)
+    transitions: list[StateTransition] | LazyHistory[StateTransition] = field(default_factory=list)
     _domain_events: list[DomainEvent] = field(default_factory=list)
+    # Transitions appended since rehydration (or the last mark_persisted): the
+    # persisted high-water mark, tracked apart from the history so reading
+    # them never loads a LazyHistory.
+    _pending_transitions: list[StateTransition] = field(default_factory=list, init=False, compare=False, repr=False)
 
     def __post_init__(self) -> None:
         self._validate_fields_id()
@@ -130,56 +125,35 @@ class Enrollment:
 
 
     def _validate_state_integrity(self) -> None:
-        # 4) State Consistency Matrix (Solution Implementation)
-        # Def  : {State: (Required Fields, Forbidden Fields)}
-        state_integrity_matrix = {
-            EnrollmentState.ACTIVE: (
-                [],
-                ["concluded_at", "cancelled_at", "suspended_at"]
-            ),
-            EnrollmentState.SUSPENDED: (
-                ["suspended_at"],
-                ["concluded_at", "cancelled_at", "reactivated_at"]
-            ),
-            EnrollmentState.CONCLUDED: (
-                ["concluded_at"],
-                ["cancelled_at", "suspended_at", "reactivated_at"]
-            ),
-            EnrollmentState.CANCELLED: (
-                ["cancelled_at"],
-                ["concluded_at", "suspended_at", "reactivated_at"]
-            ),
-        }
+        # 4) State Consistency Matrix, compiled once in ENROLLMENT_STATE_MACHINE
+        violation = ENROLLMENT_STATE_MACHINE.integrity_violation(self.state, self)
+        if violation is None:
+            return
 
-        state_integrity = state_integrity_matrix.get(self.state)
-        if state_integrity is None:
+        if violation.fault is IntegrityFault.UNKNOWN_STATE:
             raise DomainError(
                 code="invalid_state",
                 message="Enrollment state is invalid",
                 details={"state": str(self.state)},
             )
-        required, forbidden = state_integrity
 
         # Validation A: Require mandatory fields for the current state.
-        for field_name in required:
-            if getattr(self, field_name) is None:
-                raise DomainError(
-                    code=f"missing_{field_name}",
-                    message=f"Enrollment in state {self.state.value} requires field {field_name}.",
-                    details={
-                        "state": self.state.value,
-                        "required_field": field_name,
-                    }
-                )
+        if violation.fault is IntegrityFault.MISSING:
+            raise DomainError(
+                code=f"missing_{violation.field}",
+                message=f"Enrollment in state {self.state.value} requires field {violation.field}.",
+                details={
+                    "state": self.state.value,
+                    "required_field": violation.field,
+                }
+            )
 
         # Validation B: Prohibit fields from other states (Total Uniqueness)
-        for field_name in forbidden:
-            if getattr(self, field_name) is not None:
-                raise DomainError(
-                    code="inconsistent_timestamps",
-                    message=f"Enrollment in state {self.state.value} cannot have {field_name} field.",
-                    details={"state": self.state.value, "forbidden_field": field_name}
-                )
+        raise DomainError(
+            code="inconsistent_timestamps",
+            message=f"Enrollment in state {self.state.value} cannot have {violation.field} field.",
+            details={"state": self.state.value, "forbidden_field": violation.field}
+        )
 
     @staticmethod
     def _normalize_datetime_strict(dt: datetime, *, field_name: str) -> datetime:
@@ -213,23 +187,55 @@ class Enrollment:
             return datetime.now(UTC)
         return Enrollment._normalize_datetime_strict(occurred_at, field_name="occurred_at")
 
+    def pending_transitions(self) -> list[StateTransition]:
+        """
+        Return the transitions recorded since rehydration (or since the last
+        mark_persisted), in the order they were applied. A save that failed
+        keeps them, so retrying it is a replay of the same write.
+        """
+        return list(self._pending_transitions)
+
+    def mark_persisted(self, *, version: int) -> None:
+        """
+        Called by the repository once a save is durable: the pending transitions
+        join the persisted history and `version` becomes the new origin version,
+        so the aggregate can be changed and saved again.
+        """
+        self._pending_transitions.clear()
+        self.version = version
+
     def peek_domain_events(self) -> list[DomainEvent]:
         """
         Return pending domain events
         """
         return list(self._domain_events)
 
+    @staticmethod
+    def _allowed_from_states(to_state: EnrollmentState) -> list[str]:
+        return [state.value for state in ENROLLMENT_STATE_MACHINE.sources(to_state)]
+
+    @staticmethod
+    def _assert_justification(edge: EdgeSpec, justification: str | None) -> None:
+        if edge.justification is JustificationPolicy.REQUIRED and not (justification and justification.strip()):
+            raise JustificationRequiredError(
+                code="justification_required",
+                message=f"Justification is required to {edge.command} enrollment.",
+                details={
+                    "policy": "justification_required",
+                    "attempted_action": edge.command,
+                },
+            )
+
     def _apply_state_transition(
         self,
         *,
-        to_state: EnrollmentState,
+        edge: EdgeSpec,
         actor_id: str,
-        event_cls: EnrollmentEventClass,
         occurred_at: datetime | None = None,
         justification: str | None = None,
     ) -> None:
         """
-        Atomic transition: logic first, mutation last.
+        Atomic transition along an edge of ENROLLMENT_STATE_MACHINE: logic first, mutation last.
         (Implements the 'Logic First, Mutation Last' pattern.)
         Ensures the aggregate never reaches an inconsistent state if an
         exception occurs during object instantiation.
@@ -238,6 +244,7 @@ class Enrollment:
         # 1. Preparation and Validation (It can fail here without corrupting the state)
         utc_now = self._occurred_at_or_now(occurred_at)
         from_state = self.state
+        to_state: EnrollmentState = edge.target  # type: ignore[assignment]
 
         # Instancia o VO de Transição
         new_transition = StateTransition(
@@ -249,7 +256,7 @@ class Enrollment:
         )
 
         # Instantiates the Domain Event (Event __post_init__ validations run here)
-        new_event = event_cls(
+        new_event = edge.event_cls(
             aggregate_id=self.id,
             actor_id=actor_id,
             from_state=from_state,
@@ -259,26 +266,13 @@ class Enrollment:
         )
 
         # 2. Final Mutation (Happy Path: nothing here should throw exceptions)
-        # Total reset to satisfy the Consistency Matrix
-        self.concluded_at = None
-        self.cancelled_at = None
-        self.suspended_at = None
-        self.reactivated_at = None
-
-
+        # Total reset + edge stamp, to satisfy the Consistency Matrix
         self.state = to_state
-        if to_state == EnrollmentState.CONCLUDED:
-            self.concluded_at = utc_now
-        elif to_state == EnrollmentState.CANCELLED:
-            self.cancelled_at = utc_now
-        elif to_state == EnrollmentState.SUSPENDED:
-            self.suspended_at = utc_now
-        elif to_state == EnrollmentState.ACTIVE:
-            self.reactivated_at = utc_now
-
+        ENROLLMENT_STATE_MACHINE.apply_timestamps(self, edge, utc_now)
 
         # Record in internal records
         self.transitions.append(new_transition)
+        self._pending_transitions.append(new_transition)
         self._domain_events.append(new_event)
 
     def pull_domain_events(self) -> list[DomainEvent]:
@@ -296,7 +290,7 @@ class Enrollment:
         return domain_events
 
     def is_final(self) -> bool:
-        return self.state in {EnrollmentState.CONCLUDED, EnrollmentState.CANCELLED}
+        return ENROLLMENT_STATE_MACHINE.is_terminal(self.state)
 
     def conclude(
         self,
@@ -309,7 +303,8 @@ class Enrollment:
         if self.state == EnrollmentState.CONCLUDED:
             return
 
-        if self.state != EnrollmentState.ACTIVE:
+        edge = ENROLLMENT_STATE_MACHINE.edge(self.state, EnrollmentState.CONCLUDED)
+        if edge is None:
             raise EnrollmentNotActiveError(
                 code="enrollment_not_active",
                 message=f"Cannot conclude enrollment from state {self.state.value}.",
@@ -341,9 +336,8 @@ class Enrollment:
             )
 
         self._apply_state_transition(
-            to_state=EnrollmentState.CONCLUDED,
+            edge=edge,
             actor_id=actor_id,
-            event_cls=EnrollmentConcluded,
             occurred_at=occurred_at,
             justification=justification,
         )
@@ -358,34 +352,23 @@ class Enrollment:
         if self.state == EnrollmentState.CANCELLED:
             return
 
-        if self.is_final():
+        edge = ENROLLMENT_STATE_MACHINE.edge(self.state, EnrollmentState.CANCELLED)
+        if edge is None:
             raise InvalidStateTransitionError(
                 code="invalid_state_transition",
                 message=f"Cannot cancel enrollment from state {self.state.value}.",
                 details={
                     "current_state": self.state.value,
                     "attempted_action": "cancel",
-                    "allowed_from_states": [
-                        EnrollmentState.ACTIVE.value,
-                        EnrollmentState.SUSPENDED.value,
-                    ],
+                    "allowed_from_states": self._allowed_from_states(EnrollmentState.CANCELLED),
                 },
             )
 
-        if not justification or not justification.strip():
-            raise JustificationRequiredError(
-                code="justification_required",
-                message="Justification is required to cancel enrollment.",
-                details={
-                    "policy": "justification_required",
-                    "attempted_action": "cancel",
-                },
-            )
+        self._assert_justification(edge, justification)
 
         self._apply_state_transition(
-            to_state=EnrollmentState.CANCELLED,
+            edge=edge,
             actor_id=actor_id,
-            event_cls=EnrollmentCancelled,
             occurred_at=occurred_at,
             justification=justification,
         )
@@ -400,31 +383,23 @@ class Enrollment:
         if self.state == EnrollmentState.SUSPENDED:
             return
 
-        if self.state != EnrollmentState.ACTIVE:
+        edge = ENROLLMENT_STATE_MACHINE.edge(self.state, EnrollmentState.SUSPENDED)
+        if edge is None:
             raise InvalidStateTransitionError(
                 code="invalid_state_transition",
                 message=f"Cannot suspend enrollment from state {self.state.value}.",
                 details={
                     "current_state": self.state.value,
                     "attempted_action": "suspend",
-                    "allowed_from_states": [EnrollmentState.ACTIVE.value],
+                    "allowed_from_states": self._allowed_from_states(EnrollmentState.SUSPENDED),
                 },
             )
 
-        if not justification or not justification.strip():
-            raise JustificationRequiredError(
-                code="justification_required",
-                message="Justification is required to suspend enrollment.",
-                details={
-                    "policy": "justification_required",
-                    "attempted_action": "suspend",
-                },
-            )
+        self._assert_justification(edge, justification)
 
         self._apply_state_transition(
-            to_state=EnrollmentState.SUSPENDED,
+            edge=edge,
             actor_id=actor_id,
-            event_cls=EnrollmentSuspended,
             occurred_at=occurred_at,
             justification=justification,
         )
@@ -443,7 +418,8 @@ class Enrollment:
         if self.state == EnrollmentState.ACTIVE:
             return
 
-        if self.state != EnrollmentState.SUSPENDED:
+        edge = ENROLLMENT_STATE_MACHINE.edge(self.state, EnrollmentState.ACTIVE)
+        if edge is None:
             raise InvalidStateTransitionError(
                 code="invalid_state_transition",
                 message=f"Cannot reactivate enrollment from state {self.state.value}.",
@@ -451,28 +427,66 @@ class Enrollment:
                     "current_state": self.state.value,
                     "required_state": EnrollmentState.SUSPENDED.value,
                     "attempted_action": "reactivate",
-                    "allowed_from_states": [EnrollmentState.SUSPENDED.value],
+                    "allowed_from_states": self._allowed_from_states(EnrollmentState.ACTIVE),
                 }
             )
 
-        if not justification or not justification.strip():
-            raise JustificationRequiredError(
-                code="justification_required",
-                message="Justification is required to reactivate enrollment.",
-                details={
-                    "policy": "justification_required",
-                    "attempted_action": "reactivate",
-                }
-            )
+        self._assert_justification(edge, justification)
 
         self._apply_state_transition(
-            to_state=EnrollmentState.ACTIVE,
+            edge=edge,
             actor_id=actor_id,
-            event_cls=EnrollmentReactivated,
             occurred_at=occurred_at,
             justification=justification
         )
 
+    @classmethod
+    def rehydrate_trusted(
+        cls,
+        *,
+        id: str,
+        institution_id: str,
+        student_id: str,
+        class_group_id: str,
+        academic_period_id: str,
+        created_by: str,
+        state: EnrollmentState,
+        created_at: datetime,
+        concluded_at: datetime | None,
+        cancelled_at: datetime | None,
+        suspended_at: datetime | None,
+        reactivated_at: datetime | None,
+        version: int,
+        transitions: list[StateTransition] | LazyHistory[StateTransition],
+    ) -> Enrollment:
+        """
+        Trusted reconstruction for repositories: builds the aggregate WITHOUT
+        running __post_init__ (no id checks, state coercion, datetime
+        normalization or integrity matrix).
+
+        Only for values read back from storage that this aggregate wrote and the
+        database constraints still guard: ids as str, state as EnrollmentState,
+        UTC-aware datetimes. Anything else must go through the constructor.
+        """
+        enrollment = cls.__new__(cls)
+        enrollment.id = id
+        enrollment.institution_id = institution_id
+        enrollment.student_id = student_id
+        enrollment.class_group_id = class_group_id
+        enrollment.academic_period_id = academic_period_id
+        enrollment.created_by = created_by
+        enrollment.state = state
+        enrollment.created_at = created_at
+        enrollment.concluded_at = concluded_at
+        enrollment.cancelled_at = cancelled_at
+        enrollment.suspended_at = suspended_at
+        enrollment.reactivated_at = reactivated_at
+        enrollment.version = version
+        enrollment.transitions = transitions
+        enrollment._domain_events = []
+        enrollment._pending_transitions = []
+        return enrollment
+
     @classmethod
     def create(
         cls,
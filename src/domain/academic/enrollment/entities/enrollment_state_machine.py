@@ -0,0 +1,85 @@
+from domain.shared.state_machine import (
+    EdgeSpec,
+    JustificationPolicy,
+    StateMachineDefinition,
+    StateSpec,
+)
+
+from ..events.enrollment_events import (
+    EnrollmentCancelled,
+    EnrollmentConcluded,
+    EnrollmentReactivated,
+    EnrollmentSuspended,
+)
+from ..value_objects.enrollment_status import EnrollmentState
+
+# Single source of truth for the Enrollment lifecycle (ADR 023):
+# the aggregate, the rehydration checks and the database CHECK constraints read it.
+ENROLLMENT_STATE_MACHINE = StateMachineDefinition(
+    name="enrollment",
+    state_enum=EnrollmentState,
+    timestamp_fields=("concluded_at", "cancelled_at", "suspended_at", "reactivated_at"),
+    # Def  : {State: (Required Fields, Forbidden Fields)} - Total Uniqueness
+    states=(
+        StateSpec(
+            state=EnrollmentState.ACTIVE,
+            forbidden=("concluded_at", "cancelled_at", "suspended_at"),
+        ),
+        StateSpec(
+            state=EnrollmentState.SUSPENDED,
+            required=("suspended_at",),
+            forbidden=("concluded_at", "cancelled_at", "reactivated_at"),
+        ),
+        StateSpec(
+            state=EnrollmentState.CONCLUDED,
+            required=("concluded_at",),
+            forbidden=("cancelled_at", "suspended_at", "reactivated_at"),
+        ),
+        StateSpec(
+            state=EnrollmentState.CANCELLED,
+            required=("cancelled_at",),
+            forbidden=("concluded_at", "suspended_at", "reactivated_at"),
+        ),
+    ),
+    edges=(
+        EdgeSpec(
+            source=EnrollmentState.ACTIVE,
+            target=EnrollmentState.SUSPENDED,
+            command="suspend",
+            event_cls=EnrollmentSuspended,
+            stamps="suspended_at",
+        ),
+        EdgeSpec(
+            source=EnrollmentState.SUSPENDED,
+            target=EnrollmentState.ACTIVE,
+            command="reactivate",
+            event_cls=EnrollmentReactivated,
+            stamps="reactivated_at",
+        ),
+        EdgeSpec(
+            source=EnrollmentState.ACTIVE,
+            target=EnrollmentState.CONCLUDED,
+            command="conclude",
+            event_cls=EnrollmentConcluded,
+            # required or not according to the ConclusionVerdict
+            justification=JustificationPolicy.DELEGATED,
+            stamps="concluded_at",
+        ),
+        EdgeSpec(
+            source=EnrollmentState.ACTIVE,
+            target=EnrollmentState.CANCELLED,
+            command="cancel",
+            event_cls=EnrollmentCancelled,
+            stamps="cancelled_at",
+        ),
+        EdgeSpec(
+            source=EnrollmentState.SUSPENDED,
+            target=EnrollmentState.CANCELLED,
+            command="cancel",
+            event_cls=EnrollmentCancelled,
+            stamps="cancelled_at",
+        ),
+    ),
+    # Total reset to satisfy the Consistency Matrix
+    reset_on_transition=("concluded_at", "cancelled_at", "suspended_at", "reactivated_at"),
+).compile()
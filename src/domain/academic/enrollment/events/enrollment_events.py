@@ -7,7 +7,7 @@ from ..errors.enrollment_errors import InvalidStateTransitionError
 from ..value_objects.enrollment_status import EnrollmentState
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class EnrollmentConcluded(DomainEvent):
     """
         Domain event: Enrollment has been successfully concluded.
@@ -35,7 +35,7 @@ class EnrollmentConcluded(DomainEvent):
             )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class EnrollmentCancelled(DomainEvent):
     """
     Domain event: Enrollment has been cancelled.
@@ -61,7 +61,7 @@ class EnrollmentCancelled(DomainEvent):
             )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class EnrollmentSuspended(DomainEvent):
     """
         Domain event: Enrollment has been suspended.
@@ -88,7 +88,7 @@ class EnrollmentSuspended(DomainEvent):
             )
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class EnrollmentReactivated(DomainEvent):
     """
     Domain event: Enrollment has been reactivated.
@@ -116,7 +116,7 @@ class EnrollmentReactivated(DomainEvent):
                 message="Rule 4.2: Reactivation is only allowed from the SUSPENDED state."
             )
         
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class EnrollmentCreated(DomainEvent):
     """
     Domain event: Enrollment has been created.
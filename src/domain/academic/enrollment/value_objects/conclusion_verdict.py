@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from domain.shared.domain_error import DomainError
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class ConclusionVerdict:
     """
     Represents the conclusion verdict for an enrollment (Value Object).
@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 
@@ -5,7 +7,7 @@ from ..errors.enrollment_errors import DomainError
 from .enrollment_status import EnrollmentState
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class StateTransition:
     """
         Transition between enrollment states
@@ -44,3 +46,25 @@ class StateTransition:
                 code="invalid_state_transition",
                 message="from_state and to_state cannot be the same",
                 details={"from_state": self.from_state.value, "to_state": self.to_state.value})
+
+    @classmethod
+    def rehydrate_trusted(
+        cls,
+        *,
+        from_state: EnrollmentState,
+        actor_id: str,
+        to_state: EnrollmentState,
+        occurred_at: datetime,
+        justification: str | None,
+    ) -> StateTransition:
+        """
+        Trusted reconstruction for repositories: skips __post_init__ (see
+        Enrollment.rehydrate_trusted). occurred_at must already be UTC-aware.
+        """
+        transition = cls.__new__(cls)
+        object.__setattr__(transition, "from_state", from_state)
+        object.__setattr__(transition, "actor_id", actor_id)
+        object.__setattr__(transition, "to_state", to_state)
+        object.__setattr__(transition, "occurred_at", occurred_at)
+        object.__setattr__(transition, "justification", justification)
+        return transition
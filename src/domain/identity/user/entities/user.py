@@ -2,43 +2,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
-from typing import Protocol
 from uuid import uuid4
 
+from domain.identity.user.entities.user_state_machine import USER_STATE_MACHINE
 from domain.identity.user.errors.user_errors import (
     InvalidStateTransitionError,
     JustificationRequiredError,
     UserRequiredGuardianIDError,
 )
-from domain.identity.user.events.user_events import (
-    UserActivated,
-    UserCreated,
-    UserInactivated,
-    UserSuspended,
-    UserUnlocked,
-)
+from domain.identity.user.events.user_events import UserCreated
 from domain.identity.user.value_objects.legal_identity import LegalIdentity
 from domain.identity.user.value_objects.user_state import UserState
 from domain.identity.user.value_objects.user_transition import UserTransition
 from domain.shared.domain_error import DomainError
 from domain.shared.domain_event import DomainEvent
+from domain.shared.state_machine import EdgeSpec, IntegrityFault, JustificationPolicy
 
 
-class UserEventFactory(Protocol):
-    def __call__(
-            self,
-            *,
-            aggregate_id:str,
-            actor_id: str,
-            from_state:UserState,
-            to_state: UserState,
-            occurred_at: datetime,
-            justification: str | None = None
-    ) -> DomainEvent:
-        ...
-
-
-        
 @dataclass
 class User:
     """
@@ -48,6 +28,7 @@ class User:
         - StateTransition (VO)
         - DomainEvent (for integration after persistence)
         - Creation and updates are timestamped and attributed to an actor (created_by, created_at, etc.)
+        - Allowed edges and required timestamps come from USER_STATE_MACHINE
 
     """
 
@@ -122,28 +103,30 @@ class User:
             self.inactivated_at = self._normalize_datetime_strict(self.inactivated_at, field_name="inactivated_at")
         if self.unlocked_at is not None:
             self.unlocked_at = self._normalize_datetime_strict(self.unlocked_at, field_name="unlocked_at")
-    
-    
-    # matrix de transições permitidas
-    ALLOWED_TRANSITIONS = {
-        UserState.PENDING:   {UserState.ACTIVE, UserState.INACTIVE},
-        UserState.ACTIVE:    {UserState.SUSPENDED, UserState.INACTIVE},
-        UserState.SUSPENDED: {UserState.INACTIVE, UserState.ACTIVE},
-}
 
-    def _assert_transition_allowed(self, to_state: UserState) -> None:
-        allowed = self.ALLOWED_TRANSITIONS.get(self.state, set())
+    # matrix de transições permitidas: USER_STATE_MACHINE
+    def _assert_transition_allowed(self, to_state: UserState) -> EdgeSpec:
+        edge = USER_STATE_MACHINE.edge(self.state, to_state)
 
-        if to_state not in allowed:
+        if edge is None:
             raise InvalidStateTransitionError(
                 code="invalid_state_transition",
                 message=f"Cannot transition from {self.state.value} to {to_state.value}.",
                 details={
                     "from": self.state.value,
                     "to": to_state.value,
-                    "allowed": [s.value for s in allowed],
+                    "allowed": [s.value for s in USER_STATE_MACHINE.targets(self.state)],
                 },
             )
+        return edge
+
+    def _assert_justification(self, edge: EdgeSpec, justification: str | None) -> None:
+        if edge.justification is JustificationPolicy.REQUIRED and not (justification and justification.strip()):
+            raise JustificationRequiredError(
+                code="justification_required",
+                message=f"Justification is required to {edge.command} a user.",
+                details={"transition": f"{self.state.value} -> {edge.target.value}"}
+            )
 
     def _is_adult(self):
         today = date.today()
@@ -163,42 +146,27 @@ class User:
             )
 
     def _validate_state_integrity(self) -> None:
-        # 4) State Consistency Matrix (Solution Implementation)
-        # Def  : {State: (Required Fields, Forbidden Fields)}
-        state_integrity_matrix = {
-            UserState.ACTIVE: (
-                ["created_at", "activated_at"],
-            ),
-            UserState.SUSPENDED: (
-                ["suspended_at"],
-            ),
-            UserState.INACTIVE: (
-                ["inactivated_at"],
-            ),
-            UserState.PENDING: (
-                ["created_at"],              
-            ),
-        }
-        state_integrity = state_integrity_matrix.get(self.state)
-        if state_integrity is None:
+        # 4) State Consistency Matrix, compiled once in USER_STATE_MACHINE
+        violation = USER_STATE_MACHINE.integrity_violation(self.state, self)
+        if violation is None:
+            return
+
+        if violation.fault is IntegrityFault.UNKNOWN_STATE:
             raise DomainError(
                 code="invalid_state",
                 message="User state is invalid",
                 details={"state": str(self.state)},
             )
-        required = state_integrity[0]
 
         # Validation A: Require mandatory fields for the current state.
-        for field_name in required:
-            if getattr(self, field_name) is None:
-                raise DomainError(
-                    code=f"missing_{field_name}",
-                    message=f"User in state {self.state.value} requires field {field_name}.",
-                    details={
-                        "state": self.state.value,
-                        "required_field": field_name,
-                    }
-                )
+        raise DomainError(
+            code=f"missing_{violation.field}",
+            message=f"User in state {self.state.value} requires field {violation.field}.",
+            details={
+                "state": self.state.value,
+                "required_field": violation.field,
+            }
+        )
 
 
     @staticmethod
@@ -238,24 +206,23 @@ class User:
     def _apply_state_transition(
         self,
         *,
-        to_state: UserState,
+        edge: EdgeSpec,
         actor_id: str,
-        event_cls: UserEventFactory,
         occurred_at: datetime | None = None,
         justification: str | None = None,
     ) -> None:
         """
-        Core logic for applying a state transition:
-        1) Assert transition is allowed from current state to to_state.
-        2) Validate justification if required for this transition.
-        3) Create the Domain Event using event_cls (which should be specific to the transition
-              e.g., UserActivated for ACTIVE, UserSuspended for SUSPENDED, etc.)
-        4) Update User state and relevant timestamps.
-        5) Record the UserTransition and DomainEvent for later persistence and integration.
+        Core logic for applying a state transition along an edge of USER_STATE_MACHINE
+        (the command already asserted the edge and its justification policy):
+        1) Create the Domain Event using the edge event class
+              e.g., UserActivated for PENDING -> ACTIVE, UserUnlocked for SUSPENDED -> ACTIVE, etc.
+        2) Update User state and the timestamp stamped by the edge.
+        3) Record the UserTransition and DomainEvent for later persistence and integration.
         """
         
         utc_now = self._occurred_at_or_now(occurred_at)
         from_state = self.state
+        to_state: UserState = edge.target  # type: ignore[assignment]
 
         new_transition=UserTransition(
             from_state=from_state,
@@ -266,7 +233,7 @@ class User:
         )
 
         # Instantiates the Domain Event (Event __post_init__ validations run here)
-        new_event = event_cls(
+        new_event = edge.event_cls(
             aggregate_id=self.id,
             actor_id=actor_id,
             from_state=from_state,
@@ -277,15 +244,7 @@ class User:
 
         # Final Mutation (Happy Path: nothing here should throw exceptions)
         self.state = to_state
-        if to_state == UserState.SUSPENDED:
-            self.suspended_at = utc_now
-        if to_state == UserState.INACTIVE:
-            self.inactivated_at = utc_now
-        if to_state == UserState.ACTIVE and from_state == UserState.SUSPENDED:
-            self.unlocked_at = utc_now
-        if to_state == UserState.ACTIVE and from_state == UserState.PENDING:
-            if self.activated_at is None:
-                self.activated_at = utc_now
+        USER_STATE_MACHINE.apply_timestamps(self, edge, utc_now)
 
 
         # Record in internal records
@@ -365,11 +324,20 @@ class User:
 
     ) -> None:
     
-        self._assert_transition_allowed(UserState.ACTIVE)
+        edge = self._assert_transition_allowed(UserState.ACTIVE)
+        if edge.command != "activate":
+            raise InvalidStateTransitionError(
+                code="invalid_state_transition",
+                message="User can only be activated from PENDING state",
+                details={
+                    'event': "UserActivated",
+                    'actual_state': self.state.value,
+                    'expected_state': UserState.PENDING.value
+                }
+            )
         self._apply_state_transition(
-            to_state=UserState.ACTIVE,
+            edge=edge,
             actor_id=actor_id,
-            event_cls=UserActivated,  # This should be a specific event for activation, e.g., UserActivated   
             occurred_at=occurred_at,
         )
         
@@ -380,17 +348,11 @@ class User:
             occurred_at: datetime | None = None,
             justification: str
     ) -> None:
-        self._assert_transition_allowed(UserState.SUSPENDED)
-        if not justification.strip():
-            raise JustificationRequiredError(
-                code="justification_required",
-                message="Justification is required to suspend a user.",
-                details={"transition": f"{self.state.value} -> {UserState.SUSPENDED.value}"}
-            )
+        edge = self._assert_transition_allowed(UserState.SUSPENDED)
+        self._assert_justification(edge, justification)
         self._apply_state_transition(
-            to_state=UserState.SUSPENDED,
+            edge=edge,
             actor_id=actor_id,
-            event_cls=UserSuspended,  # This should be a specific event for suspension, e.g., UserSuspended
             occurred_at=occurred_at,
             justification=justification
         )
@@ -403,17 +365,11 @@ class User:
             occurred_at: datetime | None = None,
             justification: str
     ) -> None:
-        self._assert_transition_allowed(UserState.INACTIVE)
-        if not justification.strip():
-            raise JustificationRequiredError(
-                code="justification_required",
-                message="Justification is required to inactivate a user.",
-                details={"transition": f"{self.state.value} -> {UserState.INACTIVE.value}"}
-            )
+        edge = self._assert_transition_allowed(UserState.INACTIVE)
+        self._assert_justification(edge, justification)
         self._apply_state_transition(
-            to_state=UserState.INACTIVE,
+            edge=edge,
             actor_id=actor_id,
-            event_cls=UserInactivated,
             occurred_at=occurred_at,
             justification=justification
         )
@@ -425,8 +381,8 @@ class User:
             occurred_at: datetime | None = None,
             justification: str
     ) -> None:
-        self._assert_transition_allowed(UserState.ACTIVE)
-        if self.state != UserState.SUSPENDED:
+        edge = self._assert_transition_allowed(UserState.ACTIVE)
+        if edge.command != "unlock":
             raise InvalidStateTransitionError(
                 code="invalid_state_transition",
                 message="User can only be unlocked from SUSPENDED state",
@@ -437,17 +393,11 @@ class User:
                 }  
             )
 
-        if not justification.strip():
-            raise JustificationRequiredError(
-                code="justification_required",
-                message="Justification is required to unlock a user.",
-                details={"transition": f"{self.state.value} -> {UserState.ACTIVE.value}"}
-            )
+        self._assert_justification(edge, justification)
         
         self._apply_state_transition(
-            to_state=UserState.ACTIVE,
+            edge=edge,
             actor_id=actor_id,
-            event_cls=UserUnlocked,
             occurred_at=occurred_at,
             justification=justification
         )
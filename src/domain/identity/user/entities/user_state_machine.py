@@ -0,0 +1,74 @@
+from domain.identity.user.events.user_events import (
+    UserActivated,
+    UserInactivated,
+    UserSuspended,
+    UserUnlocked,
+)
+from domain.identity.user.value_objects.user_state import UserState
+from domain.shared.state_machine import (
+    EdgeSpec,
+    JustificationPolicy,
+    StateMachineDefinition,
+    StateSpec,
+)
+
+# Single source of truth for the User lifecycle (ADR 032).
+USER_STATE_MACHINE = StateMachineDefinition(
+    name="user",
+    state_enum=UserState,
+    timestamp_fields=("created_at", "activated_at", "suspended_at", "inactivated_at", "unlocked_at"),
+    # Def  : {State: (Required Fields, Forbidden Fields)}
+    states=(
+        StateSpec(state=UserState.PENDING, required=("created_at",)),
+        StateSpec(state=UserState.ACTIVE, required=("created_at", "activated_at")),
+        StateSpec(state=UserState.SUSPENDED, required=("suspended_at",)),
+        StateSpec(state=UserState.INACTIVE, required=("inactivated_at",)),
+    ),
+    edges=(
+        EdgeSpec(
+            source=UserState.PENDING,
+            target=UserState.ACTIVE,
+            command="activate",
+            event_cls=UserActivated,
+            justification=JustificationPolicy.OPTIONAL,
+            # activated_at records the first activation only
+            stamps="activated_at",
+            stamp_once=True,
+        ),
+        EdgeSpec(
+            source=UserState.PENDING,
+            target=UserState.INACTIVE,
+            command="inactivate",
+            event_cls=UserInactivated,
+            stamps="inactivated_at",
+        ),
+        EdgeSpec(
+            source=UserState.ACTIVE,
+            target=UserState.SUSPENDED,
+            command="suspend",
+            event_cls=UserSuspended,
+            stamps="suspended_at",
+        ),
+        EdgeSpec(
+            source=UserState.ACTIVE,
+            target=UserState.INACTIVE,
+            command="inactivate",
+            event_cls=UserInactivated,
+            stamps="inactivated_at",
+        ),
+        EdgeSpec(
+            source=UserState.SUSPENDED,
+            target=UserState.INACTIVE,
+            command="inactivate",
+            event_cls=UserInactivated,
+            stamps="inactivated_at",
+        ),
+        EdgeSpec(
+            source=UserState.SUSPENDED,
+            target=UserState.ACTIVE,
+            command="unlock",
+            event_cls=UserUnlocked,
+            stamps="unlocked_at",
+        ),
+    ),
+).compile()
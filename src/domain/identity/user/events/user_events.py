@@ -11,7 +11,7 @@ from domain.shared.domain_error import DomainError
 from domain.shared.domain_event import DomainEvent
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UserStateChanged(DomainEvent):
     from_state: UserState
     actor_id:str
@@ -19,7 +19,7 @@ class UserStateChanged(DomainEvent):
     justification: str | None = None
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UserCreated(DomainEvent):
 
     actor_id:str
@@ -51,7 +51,7 @@ class UserCreated(DomainEvent):
                 raise DomainError(code=code, message=message)
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UserActivated(UserStateChanged):
 
     def __post_init__(self):
@@ -76,7 +76,7 @@ class UserActivated(UserStateChanged):
                 }
             )
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UserSuspended(UserStateChanged):
 
     def __post_init__(self):
@@ -101,7 +101,7 @@ class UserSuspended(UserStateChanged):
                 }
             )
         
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UserInactivated(UserStateChanged):
 
     def __post_init__(self):
@@ -126,7 +126,7 @@ class UserInactivated(UserStateChanged):
                     'expected_state': UserState.INACTIVE.value,
                 }
             )
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UserUnlocked(UserStateChanged):
 
     def __post_init__(self):
@@ -16,7 +16,7 @@ class LegalIdentityType(StrEnum):
     RG = 'rg'
     CNI = 'cni'
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class LegalIdentity:
     
     identity_type: LegalIdentityType
@@ -8,7 +8,7 @@ from domain.identity.user.value_objects.user_state import UserState
 from domain.shared.domain_error import DomainError
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class UserTransition:
     """
     Transition between user states
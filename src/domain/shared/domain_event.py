@@ -3,7 +3,7 @@ from datetime import UTC, datetime
 from uuid import uuid4
 
 
-@dataclass(frozen=True, kw_only=True)
+@dataclass(frozen=True, kw_only=True, slots=True)
 class DomainEvent:
     """Base class for all domain events.
 
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any, TypeVar, overload
+
+T = TypeVar("T")
+
+
+class LazyHistory(Sequence[T]):
+    """
+    Append-only history whose persisted prefix is fetched on first read.
+
+    - append() never triggers the load: new items stay local, after the
+      persisted ones once they are loaded
+    - any read (len, iteration, indexing, comparison) loads the prefix once
+    - repr() does not load
+    - appended items the loader already returns (they were stored after
+      being appended) are kept once, in append position: items are value
+      objects, and equal ones stand for the same fact
+
+    Lets an aggregate be modified in O(1) regardless of how long its stored
+    history is, while code that does read the history sees the full sequence.
+    """
+
+    __slots__ = ("_loader", "_items")
+
+    def __init__(self, loader: Callable[[], Iterable[T]]) -> None:
+        self._loader: Callable[[], Iterable[T]] | None = loader
+        self._items: list[T] = []
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._loader is None
+
+    def append(self, item: T) -> None:
+        self._items.append(item)
+
+    def _load(self) -> list[T]:
+        if self._loader is not None:
+            persisted = list(self._loader())
+            for item in self._items:
+                if item in persisted:
+                    persisted.remove(item)
+            # Only drop the loader once it succeeded, so a failed load can be retried
+            self._loader = None
+            self._items[:0] = persisted
+        return self._items
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._load())
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        return self._load()[index]
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyHistory):
+            return self._load() == other._load()
+        if isinstance(other, (list, tuple)):
+            return self._load() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        if self._loader is None:
+            return f"LazyHistory({self._items!r})"
+        return f"LazyHistory(<not loaded>, appended={self._items!r})"
@@ -0,0 +1,250 @@
+"""
+Declarative state machines for aggregate lifecycles.
+
+A ``StateMachineDefinition`` lists, for one aggregate:
+- every state with the lifecycle timestamp fields it requires / forbids;
+- every allowed edge (source -> target) with the command that performs it,
+  the DomainEvent class it records, its justification policy and the
+  timestamp field it stamps.
+
+``compile()`` turns the definition, once at import time, into dense tables
+indexed by the state enum ordinal (edge bitmasks, per-state attrgetters), so
+that transition checks and rehydration validation are plain tuple lookups
+instead of dicts rebuilt per call.
+
+The compiled machine only answers questions; the aggregates keep raising
+their own DomainErrors (codes and details are part of their contract).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum, StrEnum
+from operator import attrgetter
+from typing import Any, NamedTuple
+
+from domain.shared.domain_event import DomainEvent
+
+
+class JustificationPolicy(StrEnum):
+    REQUIRED = "required"
+    OPTIONAL = "optional"
+    # Decided by the command at runtime (e.g. by a ConclusionVerdict)
+    DELEGATED = "delegated"
+
+
+class IntegrityFault(StrEnum):
+    UNKNOWN_STATE = "unknown_state"
+    MISSING = "missing"
+    FORBIDDEN = "forbidden"
+
+
+class IntegrityViolation(NamedTuple):
+    fault: IntegrityFault
+    field: str | None = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class StateSpec:
+    state: Enum
+    required: tuple[str, ...] = ()
+    forbidden: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, kw_only=True)
+class EdgeSpec:
+    """
+    source -> target, performed by ``command``.
+    - stamps: timestamp field set to occurred_at on arrival (None: no stamp)
+    - stamp_once: keep a previously set stamp (e.g. first activation)
+    """
+    source: Enum
+    target: Enum
+    command: str
+    event_cls: Callable[..., DomainEvent]
+    justification: JustificationPolicy = JustificationPolicy.REQUIRED
+    stamps: str | None = None
+    stamp_once: bool = False
+
+
+@dataclass(frozen=True, kw_only=True)
+class StateMachineDefinition:
+    """
+    - state_enum: every member must have a StateSpec
+    - timestamp_fields: lifecycle fields covered by the integrity rules
+    - reset_on_transition: fields cleared before the edge stamp is applied
+    """
+    name: str
+    state_enum: type[Enum]
+    timestamp_fields: tuple[str, ...]
+    states: tuple[StateSpec, ...]
+    edges: tuple[EdgeSpec, ...]
+    reset_on_transition: tuple[str, ...] = ()
+
+    def compile(self) -> CompiledStateMachine:
+        return CompiledStateMachine(self)
+
+
+def _tuple_getter(names: tuple[str, ...]) -> Callable[[Any], tuple[Any, ...]]:
+    """attrgetter that always returns a tuple (attrgetter('a') returns a scalar)."""
+    if not names:
+        return lambda _obj: ()
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    return attrgetter(*names)
+
+
+class CompiledStateMachine:
+    """
+    Lookup tables built from a StateMachineDefinition.
+    Ordinals follow the declaration order of the state enum.
+    """
+
+    __slots__ = (
+        "definition",
+        "states",
+        "_ordinal",
+        "_edge_mask",
+        "_edges",
+        "_targets",
+        "_sources",
+        "_required",
+        "_forbidden",
+        "_required_getter",
+        "_forbidden_getter",
+        "_all_none",
+    )
+
+    def __init__(self, definition: StateMachineDefinition) -> None:
+        self.definition = definition
+        self.states: tuple[Any, ...] = tuple(definition.state_enum)
+        # StrEnum members hash/compare like their values, so raw strings resolve too
+        self._ordinal: dict[Any, int] = {state: index for index, state in enumerate(self.states)}
+        size = len(self.states)
+
+        specs: list[StateSpec | None] = [None] * size
+        for spec in definition.states:
+            index = self._index(spec.state, definition.name)
+            if specs[index] is not None:
+                raise ValueError(f"{definition.name}: state {spec.state} declared twice.")
+            unknown = set(spec.required + spec.forbidden) - set(definition.timestamp_fields)
+            if unknown:
+                raise ValueError(f"{definition.name}: {spec.state} uses undeclared fields {sorted(unknown)}.")
+            if set(spec.required) & set(spec.forbidden):
+                raise ValueError(f"{definition.name}: {spec.state} requires and forbids the same field.")
+            specs[index] = spec
+        missing = [state for state, spec in zip(self.states, specs, strict=True) if spec is None]
+        if missing:
+            raise ValueError(f"{definition.name}: no StateSpec for {missing}.")
+
+        edges: list[list[EdgeSpec | None]] = [[None] * size for _ in range(size)]
+        masks = [0] * size
+        for edge in definition.edges:
+            source = self._index(edge.source, definition.name)
+            target = self._index(edge.target, definition.name)
+            if source == target:
+                raise ValueError(f"{definition.name}: self-loop on {edge.source}.")
+            if edges[source][target] is not None:
+                raise ValueError(f"{definition.name}: edge {edge.source} -> {edge.target} declared twice.")
+            if edge.stamps is not None and edge.stamps not in definition.timestamp_fields:
+                raise ValueError(f"{definition.name}: edge stamps undeclared field {edge.stamps}.")
+            edges[source][target] = edge
+            masks[source] |= 1 << target
+
+        self._edge_mask: tuple[int, ...] = tuple(masks)
+        self._edges: tuple[tuple[EdgeSpec | None, ...], ...] = tuple(tuple(row) for row in edges)
+        self._targets: tuple[tuple[Any, ...], ...] = tuple(
+            tuple(self.states[t] for t in range(size) if masks[s] >> t & 1) for s in range(size)
+        )
+        # Declaration order of the edges, not enum order: it is what error details list
+        self._sources: tuple[tuple[Any, ...], ...] = tuple(
+            tuple(edge.source for edge in definition.edges if edge.target == state) for state in self.states
+        )
+
+        resolved = [spec for spec in specs if spec is not None]
+        self._required: tuple[tuple[str, ...], ...] = tuple(spec.required for spec in resolved)
+        self._forbidden: tuple[tuple[str, ...], ...] = tuple(spec.forbidden for spec in resolved)
+        self._required_getter = tuple(_tuple_getter(names) for names in self._required)
+        self._forbidden_getter = tuple(_tuple_getter(names) for names in self._forbidden)
+        self._all_none: tuple[tuple[None, ...], ...] = tuple((None,) * len(names) for names in self._forbidden)
+
+    def _index(self, state: Enum, name: str) -> int:
+        try:
+            return self._ordinal[state]
+        except KeyError:
+            raise ValueError(f"{name}: {state!r} is not a {self.definition.state_enum.__name__}.") from None
+
+    # --- transitions ---
+
+    def ordinal(self, state: Any) -> int | None:
+        return self._ordinal.get(state)
+
+    def can_transition(self, source: Any, target: Any) -> bool:
+        s = self._ordinal.get(source)
+        t = self._ordinal.get(target)
+        if s is None or t is None:
+            return False
+        return bool(self._edge_mask[s] >> t & 1)
+
+    def edge(self, source: Any, target: Any) -> EdgeSpec | None:
+        s = self._ordinal.get(source)
+        t = self._ordinal.get(target)
+        if s is None or t is None:
+            return None
+        return self._edges[s][t]
+
+    def targets(self, source: Any) -> tuple[Any, ...]:
+        """States reachable in one step from source, in enum order."""
+        s = self._ordinal.get(source)
+        return () if s is None else self._targets[s]
+
+    def sources(self, target: Any) -> tuple[Any, ...]:
+        """States from which target is reachable in one step, in edge declaration order."""
+        t = self._ordinal.get(target)
+        return () if t is None else self._sources[t]
+
+    def is_terminal(self, state: Any) -> bool:
+        s = self._ordinal.get(state)
+        return s is not None and self._edge_mask[s] == 0
+
+    def apply_timestamps(self, instance: object, edge: EdgeSpec, occurred_at: datetime) -> None:
+        """Clear reset_on_transition fields, then apply the edge stamp (mutation step)."""
+        for name in self.definition.reset_on_transition:
+            setattr(instance, name, None)
+        if edge.stamps is not None and not (edge.stamp_once and getattr(instance, edge.stamps) is not None):
+            setattr(instance, edge.stamps, occurred_at)
+
+    # --- rehydration ---
+
+    def integrity_violation(self, state: Any, instance: object) -> IntegrityViolation | None:
+        """
+        First broken rule for ``state`` on ``instance``: required fields are
+        checked before forbidden ones, each in declaration order. None if consistent.
+        """
+        s = self._ordinal.get(state)
+        if s is None:
+            return IntegrityViolation(IntegrityFault.UNKNOWN_STATE)
+        required = self._required_getter[s](instance)
+        forbidden = self._forbidden_getter[s](instance)
+        # Fast path: one C-level membership test and one tuple comparison
+        if None not in required and forbidden == self._all_none[s]:
+            return None
+        for name, value in zip(self._required[s], required, strict=True):
+            if value is None:
+                return IntegrityViolation(IntegrityFault.MISSING, name)
+        for name, value in zip(self._forbidden[s], forbidden, strict=True):
+            if value is not None:
+                return IntegrityViolation(IntegrityFault.FORBIDDEN, name)
+        return None  # pragma: no cover - the fast path already accepted it
+
+    # --- persistence rules (consumed by infrastructure to build CHECK constraints) ---
+
+    def integrity_rules(self) -> Iterable[tuple[Any, tuple[str, ...], tuple[str, ...]]]:
+        """(state, required, forbidden) for every state, in enum order."""
+        return tuple(zip(self.states, self._required, self._forbidden, strict=True))
+
+    def edge_list(self) -> tuple[EdgeSpec, ...]:
+        return self.definition.edges
@@ -0,0 +1,303 @@
+"""Run commands one at a time per aggregate, and different aggregates in parallel.
+
+Commands submitted under the same key (an aggregate id) go to the same lane, a
+single worker thread with its own FIFO queue, so they run in submission order
+and never race each other on the optimistic version check. Keys are spread
+over the lanes with a consistent-hash ring, so resizing the executor moves
+only about 1/N of the keys to another lane.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from infrastructure.errors.persistence_errors import InfrastructureError
+
+R = TypeVar("R")
+
+_STOP = object()
+
+
+class LaneBackpressureError(InfrastructureError):
+    """Raised by submit() when the key's lane queue stays full for the whole timeout."""
+
+
+@dataclass(frozen=True)
+class LaneStats:
+    lane: int
+    submitted: int
+    completed: int
+    failed: int
+    queue_depth: int
+    # Metric: deepest queue seen since the executor started
+    max_queue_depth: int
+    # Metric: submit -> finished over the last `latency_window` commands, in ms
+    p50_latency_ms: float | None
+    p99_latency_ms: float | None
+
+
+@dataclass
+class _Command:
+    future: Future[Any]
+    fn: Callable[..., Any]
+    args: tuple[Any, ...]
+    kwargs: dict[str, Any]
+    submitted_at: float
+
+
+class _HashRing:
+    """Consistent-hash ring with `replicas` virtual nodes per lane."""
+
+    def __init__(self, lanes: int, replicas: int) -> None:
+        points = sorted(
+            (self.hash(f"lane-{lane}#{replica}"), lane)
+            for lane in range(lanes)
+            for replica in range(replicas)
+        )
+        self._hashes = [point for point, _ in points]
+        self._lanes = [lane for _, lane in points]
+
+    @staticmethod
+    def hash(value: str) -> int:
+        # Stable across processes (unlike hash(), which is salted per interpreter)
+        return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+    def lane_for(self, key: str) -> int:
+        index = bisect.bisect(self._hashes, self.hash(key)) % len(self._hashes)
+        return self._lanes[index]
+
+
+class _Lane:
+    def __init__(self, index: int, max_queue_depth: int, latency_window: int) -> None:
+        self.index = index
+        self.queue: queue.Queue[_Command | object] = queue.Queue(maxsize=max_queue_depth)
+        self.submitted = 0
+        self.completed = 0
+        self.failed = 0
+        self.max_queue_depth = 0
+        self.latencies: deque[float] = deque(maxlen=latency_window)
+        self.thread: threading.Thread | None = None
+
+
+def _percentile_ms(samples: list[float], fraction: float) -> float | None:
+    if not samples:
+        return None
+    return samples[min(len(samples) - 1, round(fraction * (len(samples) - 1)))] * 1000
+
+
+class KeyedLaneExecutor:
+    """
+    Executor that serializes commands per key over a fixed set of lanes.
+
+    - submit(key, fn, ...) returns a concurrent.futures.Future; commands with
+      the same key run in submission order on one lane, other keys in parallel
+    - backpressure: each lane queue holds at most `max_queue_depth` commands;
+      submit blocks while it is full and raises LaneBackpressureError after
+      `timeout` seconds (None: wait indefinitely)
+    - stats: per-lane counters, queue depth and latency percentiles
+    - drain() waits for everything submitted so far; shutdown() stops the lanes
+
+    `on_lane_exit` runs in each lane thread before it ends, e.g.
+    django.db.connections.close_all to release that thread's connections.
+
+    A command must not submit to its own lane and wait for the result: the
+    lane runs one command at a time, so that would deadlock.
+    """
+
+    def __init__(
+            self,
+            *,
+            lanes: int = 8,
+            max_queue_depth: int = 1000,
+            latency_window: int = 1024,
+            replicas: int = 64,
+            on_lane_exit: Callable[[], None] | None = None,
+            name: str = "lane",
+    ) -> None:
+        if lanes < 1:
+            raise ValueError("lanes must be at least 1.")
+        if max_queue_depth < 1:
+            raise ValueError("max_queue_depth must be at least 1.")
+        self._ring = _HashRing(lanes, replicas)
+        self._lanes = [_Lane(index, max_queue_depth, latency_window) for index in range(lanes)]
+        self._on_lane_exit = on_lane_exit
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._enqueued = threading.Condition(self._lock)
+        self._pending = 0
+        # submit() calls past the shutdown check whose command is not queued yet
+        self._enqueuing = 0
+        self._shutdown = False
+        for lane in self._lanes:
+            lane.thread = threading.Thread(target=self._work, args=(lane,), name=f"{name}-{lane.index}", daemon=True)
+            lane.thread.start()
+
+    def __enter__(self) -> KeyedLaneExecutor:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown(wait=True)
+
+    @property
+    def lanes(self) -> int:
+        return len(self._lanes)
+
+    def lane_for(self, key: str) -> int:
+        return self._ring.lane_for(key)
+
+    def submit(
+            self,
+            key: str,
+            fn: Callable[..., R],
+            /,
+            *args: Any,
+            timeout: float | None = None,
+            **kwargs: Any,
+    ) -> Future[R]:
+        """
+        Queue fn(*args, **kwargs) on the lane of `key`.
+
+        Raises:
+            RuntimeError: after shutdown().
+            LaneBackpressureError: the lane queue stayed full for `timeout` seconds.
+        """
+        lane = self._lanes[self.lane_for(key)]
+        future: Future[R] = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit after shutdown.")
+            self._pending += 1
+            self._enqueuing += 1
+            lane.submitted += 1
+        try:
+            lane.queue.put(_Command(future, fn, args, kwargs, time.perf_counter()), timeout=timeout)
+        except queue.Full:
+            with self._lock:
+                lane.submitted -= 1
+                self._enqueued_one()
+            self._finished(lane=None)
+            raise LaneBackpressureError(
+                code="lane_queue_full",
+                message="The lane queue for this key is full.",
+                details={"key": key, "lane": lane.index, "queue_depth": lane.queue.qsize()},
+            ) from None
+        with self._lock:
+            lane.max_queue_depth = max(lane.max_queue_depth, lane.queue.qsize())
+            self._enqueued_one()
+        return future
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every submitted command has finished; False if `timeout` passed first."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout=timeout)
+
+    def shutdown(self, *, wait: bool = True, cancel_pending: bool = False) -> None:
+        """
+        Stop accepting commands and stop the lanes once their queues are empty.
+
+        cancel_pending cancels the commands that have not started yet instead
+        of running them; wait blocks until every lane thread has ended.
+        """
+        with self._lock:
+            already = self._shutdown
+            self._shutdown = True
+            # A submit() that passed the check must queue its command before _STOP
+            self._enqueued.wait_for(lambda: self._enqueuing == 0)
+        if cancel_pending:
+            for lane in self._lanes:
+                self._cancel_queued(lane)
+        if not already:
+            for lane in self._lanes:
+                # Blocks while the lane is full; its worker keeps taking commands off
+                lane.queue.put(_STOP)
+        if wait:
+            for lane in self._lanes:
+                assert lane.thread is not None
+                lane.thread.join()
+
+    @property
+    def stats(self) -> tuple[LaneStats, ...]:
+        with self._lock:
+            snapshot = [
+                (lane, lane.submitted, lane.completed, lane.failed, lane.max_queue_depth, sorted(lane.latencies))
+                for lane in self._lanes
+            ]
+        return tuple(
+            LaneStats(
+                lane=lane.index,
+                submitted=submitted,
+                completed=completed,
+                failed=failed,
+                queue_depth=lane.queue.qsize(),
+                max_queue_depth=max_depth,
+                p50_latency_ms=_percentile_ms(latencies, 0.50),
+                p99_latency_ms=_percentile_ms(latencies, 0.99),
+            )
+            for lane, submitted, completed, failed, max_depth, latencies in snapshot
+        )
+
+    def _cancel_queued(self, lane: _Lane) -> None:
+        while True:
+            try:
+                item = lane.queue.get_nowait()
+            except queue.Empty:
+                return
+            lane.queue.task_done()
+            if item is _STOP:
+                # Keep the marker for the worker; shutdown() queued it after the
+                # last accepted command, so nothing after it is a command
+                lane.queue.put_nowait(_STOP)
+                return
+            assert isinstance(item, _Command)
+            item.future.cancel()
+            self._finished(lane=None)
+
+    def _enqueued_one(self) -> None:
+        # Caller holds self._lock
+        self._enqueuing -= 1
+        if self._enqueuing == 0:
+            self._enqueued.notify_all()
+
+    def _finished(self, *, lane: _Lane | None, latency: float | None = None, failed: bool = False) -> None:
+        with self._lock:
+            if lane is not None:
+                lane.completed += 1
+                lane.failed += failed
+                if latency is not None:
+                    lane.latencies.append(latency)
+            self._pending -= 1
+            if self._pending == 0:
+                self._idle.notify_all()
+
+    def _work(self, lane: _Lane) -> None:
+        try:
+            while True:
+                item = lane.queue.get()
+                lane.queue.task_done()
+                if item is _STOP:
+                    return
+                assert isinstance(item, _Command)
+                if not item.future.set_running_or_notify_cancel():
+                    self._finished(lane=None)
+                    continue
+                failed = False
+                try:
+                    result = item.fn(*item.args, **item.kwargs)
+                except BaseException as exc:
+                    failed = True
+                    item.future.set_exception(exc)
+                else:
+                    item.future.set_result(result)
+                self._finished(lane=lane, latency=time.perf_counter() - item.submitted_at, failed=failed)
+        finally:
+            if self._on_lane_exit is not None:
+                self._on_lane_exit()
@@ -0,0 +1,353 @@
+"""Set-based closing of an academic period (ADR 023).
+
+Concluding a period through ConcludeEnrollmentService loads, validates and
+saves one aggregate at a time. The engine instead walks the period's ACTIVE
+enrollments in keyset chunks (ordered by id) and, per chunk, in one transaction:
+
+1. asks the ConclusionPolicy for every verdict of the chunk at once;
+2. concludes the eligible enrollments with a single
+   ``UPDATE ... WHERE academic_period_id = ... AND state = 'active' AND id IN (...) RETURNING``;
+3. inserts their transitions with one multi-row INSERT, each carrying the same
+   deterministic transition_id the aggregate path would compute (uuid5 is not
+   portable SQL, so ids are computed here rather than in an INSERT ... SELECT);
+4. records one EnrollmentConcluded per enrollment in the outbox and applies the
+   state deltas to the counts read model;
+5. reports denied enrollments, those whose verdict requires a justification
+   the run does not carry and eligible ones another writer moved out of ACTIVE
+   before the UPDATE, so concluded + reported covers every candidate;
+6. advances the run cursor.
+
+Resumable: the cursor commits with the chunk, so a crashed run restarts after
+the last committed chunk. Idempotent: the UPDATE only matches ACTIVE rows, and
+transitions (transition_id), outbox records (event_id, derived from the
+transition_id) and report entries are inserted ignoring conflicts.
+"""
+
+from __future__ import annotations
+
+import uuid
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+
+from application.academic.enrollment.ports.conclusion_policy import (
+    ConclusionCandidate,
+    ConclusionPolicy,
+)
+from apps.academic.enrollments.transition_id import make_transition_id
+from apps.academic.mappers.outbox_mapper import OutboxMapper
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.models.enrollment_transition import EnrollmentTransitionModel
+from apps.academic.models.outbox_event import OutboxEventModel
+from apps.academic.models.period_closing import PeriodClosingReportModel, PeriodClosingRunModel
+from apps.academic.read_models import enrollment_state_counts
+from apps.academic.repositories.django_enrollment_repository import ENROLLMENT_AGGREGATE_TYPE
+from domain.academic.enrollment.events.enrollment_events import EnrollmentConcluded
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+
+RUNNING = PeriodClosingRunModel.StatusChoices.RUNNING
+COMPLETED = PeriodClosingRunModel.StatusChoices.COMPLETED
+DENIED = PeriodClosingReportModel.OutcomeChoices.DENIED
+JUSTIFICATION_REQUIRED = PeriodClosingReportModel.OutcomeChoices.JUSTIFICATION_REQUIRED
+SKIPPED_CONCURRENT_CHANGE = PeriodClosingReportModel.OutcomeChoices.SKIPPED_CONCURRENT_CHANGE
+
+_ACTIVE = EnrollmentState.ACTIVE.value
+_CONCLUDED = EnrollmentState.CONCLUDED.value
+_CONCLUDE_ACTION = EnrollmentTransitionModel.ActionChoices.CONCLUDE.value
+
+
+class _Concluded(NamedTuple):
+    enrollment_id: str
+    version: int
+    institution_id: str
+    class_group_id: str
+
+
+@dataclass(frozen=True)
+class ClosingProgress:
+    run_id: str
+    status: str
+    chunks: int
+    concluded: int
+    reported: int
+
+
+def closing_event_id(transition_id: uuid.UUID) -> str:
+    """Event id derived from the transition id, so retried chunks never duplicate outbox records."""
+    return str(uuid.uuid5(transition_id, EnrollmentConcluded.__name__))
+
+
+def _uuid_str(value: Any) -> str:
+    # Raw RETURNING values: uuid text on PostgreSQL, 32-char hex on SQLite.
+    return str(value if isinstance(value, uuid.UUID) else uuid.UUID(str(value)))
+
+
+class PeriodClosingEngine:
+    """
+        Concludes every eligible ACTIVE enrollment of an academic period, chunk by chunk.
+        The rows and events written match what ConcludeEnrollmentService would write
+        with the run's actor, occurred_at and justification (except outbox event ids,
+        which are deterministic here).
+    """
+
+    def __init__(
+            self,
+            policy: ConclusionPolicy,
+            *,
+            chunk_size: int = 1000,
+            clock: Callable[[], datetime] = timezone.now,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' must be positive.")
+        self.policy = policy
+        self.chunk_size = chunk_size
+        self.clock = clock
+
+    def open_run(
+            self,
+            *,
+            academic_period_id: str,
+            actor_id: str,
+            occurred_at: datetime | None = None,
+            justification: str | None = None,
+    ) -> PeriodClosingRunModel:
+        """
+        Return the period's running run if there is one (resume), otherwise start a
+        new run with the given parameters frozen.
+        """
+        running = PeriodClosingRunModel.objects.filter(academic_period_id=academic_period_id, status=RUNNING).first()
+        if running is not None:
+            return running
+
+        occurred_at = occurred_at or self.clock()
+        if timezone.is_naive(occurred_at):
+            raise ValueError("'occurred_at' must be timezone-aware.")
+        try:
+            with transaction.atomic():
+                return PeriodClosingRunModel.objects.create(
+                    academic_period_id=academic_period_id,
+                    actor_id=actor_id,
+                    occurred_at=occurred_at,
+                    justification=justification,
+                    chunk_size=self.chunk_size,
+                )
+        except IntegrityError:
+            # Another process opened the run between our lookup and insert.
+            return PeriodClosingRunModel.objects.get(academic_period_id=academic_period_id, status=RUNNING)
+
+    def run(self, run_id: str, *, max_chunks: int | None = None) -> ClosingProgress:
+        """Process chunks until the period has no ACTIVE enrollment left past the cursor (or `max_chunks`)."""
+        chunks = 0
+        while max_chunks is None or chunks < max_chunks:
+            if not self._process_chunk(run_id):
+                break
+            chunks += 1
+
+        run = PeriodClosingRunModel.objects.get(id=run_id)
+        return ClosingProgress(
+            run_id=str(run.id),
+            status=run.status,
+            chunks=chunks,
+            concluded=run.concluded_count,
+            reported=run.reported_count,
+        )
+
+    def close_period(
+            self,
+            *,
+            academic_period_id: str,
+            actor_id: str,
+            occurred_at: datetime | None = None,
+            justification: str | None = None,
+            max_chunks: int | None = None,
+    ) -> ClosingProgress:
+        run = self.open_run(
+            academic_period_id=academic_period_id,
+            actor_id=actor_id,
+            occurred_at=occurred_at,
+            justification=justification,
+        )
+        return self.run(str(run.id), max_chunks=max_chunks)
+
+    def _process_chunk(self, run_id: str) -> bool:
+        """One chunk in one transaction; False once the run is (or becomes) completed."""
+        with transaction.atomic():
+            run = PeriodClosingRunModel.objects.select_for_update().get(id=run_id)
+            if run.status != RUNNING:
+                return False
+
+            now = self.clock()
+            candidates = self._next_candidates(run)
+            if not candidates:
+                run.status = COMPLETED
+                run.finished_at = now
+                run.updated_at = now
+                run.save(update_fields=["status", "finished_at", "updated_at"])
+                return False
+
+            eligible, report_entries = self._partition(run, candidates)
+            concluded = self._conclude(run, eligible, now=now) if eligible else []
+            report_entries.extend(self._skipped_entries(run, eligible, concluded))
+            self._record_transitions_and_events(run, concluded)
+            enrollment_state_counts.apply_deltas(self._deltas(run, concluded))
+            PeriodClosingReportModel.objects.bulk_create(report_entries, ignore_conflicts=True)
+
+            run.last_enrollment_id = candidates[-1].enrollment_id
+            run.concluded_count += len(concluded)
+            run.reported_count += len(report_entries)
+            run.updated_at = now
+            run.save(update_fields=["last_enrollment_id", "concluded_count", "reported_count", "updated_at"])
+            return True
+
+    def _next_candidates(self, run: PeriodClosingRunModel) -> list[ConclusionCandidate]:
+        rows = EnrollmentModel.objects.filter(academic_period_id=run.academic_period_id, state=_ACTIVE)
+        if run.last_enrollment_id is not None:
+            rows = rows.filter(id__gt=run.last_enrollment_id)
+        period_id = str(run.academic_period_id)
+        return [
+            ConclusionCandidate(
+                enrollment_id=str(enrollment_id),
+                institution_id=str(institution_id),
+                student_id=str(student_id),
+                class_group_id=str(class_group_id),
+                academic_period_id=period_id,
+            )
+            for enrollment_id, institution_id, student_id, class_group_id in rows.order_by("id").values_list(
+                "id", "institution_id", "student_id", "class_group_id"
+            )[: run.chunk_size]
+        ]
+
+    def _partition(
+            self,
+            run: PeriodClosingRunModel,
+            candidates: Sequence[ConclusionCandidate],
+    ) -> tuple[list[str], list[PeriodClosingReportModel]]:
+        verdicts = self.policy.evaluate_many(candidates)
+        has_justification = bool(run.justification and run.justification.strip())
+        eligible: list[str] = []
+        report_entries: list[PeriodClosingReportModel] = []
+        for candidate in candidates:
+            verdict = verdicts.get(candidate.enrollment_id)
+            if verdict is None:
+                outcome, reasons = DENIED, ["missing_verdict"]
+            elif not verdict.is_allowed:
+                outcome, reasons = DENIED, list(verdict.reasons)
+            elif verdict.requires_justification and not has_justification:
+                outcome, reasons = JUSTIFICATION_REQUIRED, []
+            else:
+                eligible.append(candidate.enrollment_id)
+                continue
+            report_entries.append(PeriodClosingReportModel(
+                run=run, enrollment_id=candidate.enrollment_id, outcome=outcome, reasons=reasons,
+            ))
+        return eligible, report_entries
+
+    @staticmethod
+    def _conclude(run: PeriodClosingRunModel, enrollment_ids: Sequence[str], *, now: datetime) -> list[_Concluded]:
+        """Snapshot update of the aggregate conclude(): lifecycle fields reset, concluded_at set, version + 1."""
+        meta = EnrollmentModel._meta
+        qn = connection.ops.quote_name
+
+        def prep(field_name: str, value: Any) -> Any:
+            return meta.get_field(field_name).get_db_prep_value(value, connection)
+
+        placeholders = ", ".join(["%s"] * len(enrollment_ids))
+        sql = (
+            f"UPDATE {qn(meta.db_table)} SET "
+            f"{qn('state')} = %s, {qn('concluded_at')} = %s, {qn('cancelled_at')} = NULL, "
+            f"{qn('suspended_at')} = NULL, {qn('reactivated_at')} = NULL, "
+            f"{qn('version')} = {qn('version')} + 1, {qn('updated_at')} = %s "
+            f"WHERE {qn('academic_period_id')} = %s AND {qn('state')} = %s AND {qn('id')} IN ({placeholders}) "
+            f"RETURNING {qn('id')}, {qn('version')}, {qn('institution_id')}, {qn('class_group_id')}"
+        )
+        params = [
+            _CONCLUDED,
+            prep("concluded_at", run.occurred_at),
+            prep("updated_at", now),
+            prep("academic_period_id", run.academic_period_id),
+            _ACTIVE,
+            *(prep("id", enrollment_id) for enrollment_id in enrollment_ids),
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            returned = cursor.fetchall()
+        concluded = [
+            _Concluded(_uuid_str(enrollment_id), version, _uuid_str(institution_id), _uuid_str(class_group_id))
+            for enrollment_id, version, institution_id, class_group_id in returned
+        ]
+        concluded.sort(key=lambda row: row.enrollment_id)
+        return concluded
+
+    @staticmethod
+    def _skipped_entries(
+            run: PeriodClosingRunModel,
+            eligible: Sequence[str],
+            concluded: Sequence[_Concluded],
+    ) -> list[PeriodClosingReportModel]:
+        """Eligible enrollments the UPDATE did not match: no longer ACTIVE (or moved) since they were read."""
+        concluded_ids = {row.enrollment_id for row in concluded}
+        return [
+            PeriodClosingReportModel(run=run, enrollment_id=enrollment_id, outcome=SKIPPED_CONCURRENT_CHANGE)
+            for enrollment_id in eligible
+            if enrollment_id not in concluded_ids
+        ]
+
+    @staticmethod
+    def _record_transitions_and_events(run: PeriodClosingRunModel, concluded: Sequence[_Concluded]) -> None:
+        if not concluded:
+            return
+        actor_id = str(run.actor_id)
+        transitions: list[EnrollmentTransitionModel] = []
+        outbox_events: list[OutboxEventModel] = []
+        for row in concluded:
+            transition_id = make_transition_id(
+                enrollment_id=uuid.UUID(row.enrollment_id),
+                action=_CONCLUDE_ACTION,
+                from_state=_ACTIVE,
+                to_state=_CONCLUDED,
+                occurred_at=run.occurred_at,
+                actor_id=actor_id,
+                justification=run.justification,
+            )
+            transitions.append(EnrollmentTransitionModel(
+                enrollment_id=row.enrollment_id,
+                transition_id=transition_id,
+                occurred_at=run.occurred_at,
+                action=_CONCLUDE_ACTION,
+                from_state=_ACTIVE,
+                to_state=_CONCLUDED,
+                justification=run.justification,
+                actor_id=actor_id,
+            ))
+            event = EnrollmentConcluded(
+                aggregate_id=row.enrollment_id,
+                occurred_at=run.occurred_at,
+                event_id=closing_event_id(transition_id),
+                actor_id=actor_id,
+                from_state=EnrollmentState.ACTIVE,
+                to_state=EnrollmentState.CONCLUDED,
+                justification=run.justification,
+            )
+            outbox_events.extend(OutboxMapper.to_outbox_events(
+                events=[event], aggregate_type=ENROLLMENT_AGGREGATE_TYPE, aggregate_version=row.version,
+            ))
+        EnrollmentTransitionModel.objects.bulk_create(transitions, ignore_conflicts=True)
+        OutboxEventModel.objects.bulk_create(outbox_events, ignore_conflicts=True)
+
+    @staticmethod
+    def _deltas(
+            run: PeriodClosingRunModel,
+            concluded: Sequence[_Concluded],
+    ) -> Counter[enrollment_state_counts.StateCountKey]:
+        deltas: Counter[enrollment_state_counts.StateCountKey] = Counter()
+        period_id = str(run.academic_period_id)
+        for row in concluded:
+            key = enrollment_state_counts.StateCountKey(row.institution_id, period_id, row.class_group_id, _ACTIVE)
+            deltas[key] -= 1
+            deltas[key._replace(state=_CONCLUDED)] += 1
+        return deltas
@@ -0,0 +1,15 @@
+from collections.abc import Mapping, Sequence
+
+from application.academic.enrollment.ports.conclusion_policy import (
+    ConclusionCandidate,
+    ConclusionPolicy,
+)
+from domain.academic.enrollment.value_objects.conclusion_verdict import ConclusionVerdict
+
+
+class AllowAllConclusionPolicy(ConclusionPolicy):
+    """Allows every candidate; default until grade and attendance policies exist."""
+
+    def evaluate_many(self, candidates: Sequence[ConclusionCandidate]) -> Mapping[str, ConclusionVerdict]:
+        verdict = ConclusionVerdict.allowed()
+        return {candidate.enrollment_id: verdict for candidate in candidates}
@@ -0,0 +1,104 @@
+"""Streaming readers and result writer for enrollment import files.
+
+Readers turn a text stream into ``EnrollmentImportRow`` objects one record at
+a time (nothing is read ahead), and ``write_results`` writes one NDJSON line
+per ``EnrollmentImportOutcome`` as they are produced, so an import of any
+size holds a single chunk in memory.
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import IO, Any
+
+from application.academic.enrollment.dto.enrollment_import import (
+    EnrollmentImportOutcome,
+    EnrollmentImportRow,
+)
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+
+def detect_format(path: str) -> str:
+    """File format from the extension: .csv -> csv, .ndjson/.jsonl -> ndjson."""
+    lowered = path.lower()
+    if lowered.endswith(".csv"):
+        return "csv"
+    if lowered.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    raise ValueError(f"Cannot tell the format of {path!r}; pass it explicitly ({', '.join(IMPORT_FORMATS)}).")
+
+
+def iter_csv_rows(stream: IO[str]) -> Iterator[EnrollmentImportRow]:
+    """Rows of a CSV file with a header line; a short record leaves its last columns missing."""
+    for row_number, record in enumerate(csv.DictReader(stream), start=1):
+        yield EnrollmentImportRow(
+            row_number=row_number,
+            fields={column: value for column, value in record.items() if column is not None and value is not None},
+        )
+
+
+def iter_ndjson_rows(stream: IO[str]) -> Iterator[EnrollmentImportRow]:
+    """Rows of an NDJSON file, one JSON object per line; blank lines are skipped."""
+    row_number = 0
+    for line in stream:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield EnrollmentImportRow(row_number=row_number, fields={}, parse_error=f"Invalid JSON: {exc.msg}.")
+            continue
+        if not isinstance(record, dict):
+            yield EnrollmentImportRow(row_number=row_number, fields={}, parse_error="Expected a JSON object.")
+            continue
+        yield EnrollmentImportRow(row_number=row_number, fields=record)
+
+
+def iter_rows(stream: IO[str], file_format: str) -> Iterator[EnrollmentImportRow]:
+    if file_format == "csv":
+        return iter_csv_rows(stream)
+    if file_format == "ndjson":
+        return iter_ndjson_rows(stream)
+    raise ValueError(f"Unknown import format {file_format!r}; expected one of {', '.join(IMPORT_FORMATS)}.")
+
+
+def outcome_to_record(outcome: EnrollmentImportOutcome) -> dict[str, Any]:
+    """JSON-ready view of an outcome: the ApplicationResult without its domain events."""
+    result = outcome.result
+    return {
+        "row": outcome.row_number,
+        "success": result.success,
+        "changed": result.changed,
+        "aggregate_id": result.aggregate_id,
+        "new_state": result.new_state.value if result.new_state is not None else None,
+        "error": (
+            {"code": str(result.error.code), "message": result.error.message, "details": result.error.details}
+            if result.error is not None
+            else None
+        ),
+    }
+
+
+@dataclass
+class ImportSummary:
+    rows: int = 0
+    created: int = 0
+    failed: int = 0
+
+
+def write_results(outcomes: Iterable[EnrollmentImportOutcome], stream: IO[str]) -> ImportSummary:
+    """Write one NDJSON line per outcome as it arrives and count them."""
+    summary = ImportSummary()
+    for outcome in outcomes:
+        stream.write(json.dumps(outcome_to_record(outcome), default=str) + "\n")
+        summary.rows += 1
+        if outcome.result.success:
+            summary.created += 1
+        else:
+            summary.failed += 1
+    return summary
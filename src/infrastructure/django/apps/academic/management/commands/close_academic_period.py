@@ -0,0 +1,44 @@
+from datetime import datetime
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils.module_loading import import_string
+
+from apps.academic.closing.engine import PeriodClosingEngine
+
+DEFAULT_POLICY = "apps.academic.closing.policies.AllowAllConclusionPolicy"
+
+
+class Command(BaseCommand):
+    help = (
+        "Conclude every eligible ACTIVE enrollment of an academic period with set-based statements. "
+        "Re-running resumes the period's unfinished run; denied enrollments go to period_closing_report."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--period", required=True, help="Academic period id.")
+        parser.add_argument("--actor", required=True, help="Actor id recorded on the transitions.")
+        parser.add_argument("--justification", default=None)
+        parser.add_argument("--occurred-at", default=None, help="ISO 8601 conclusion timestamp (default: now).")
+        parser.add_argument("--policy", default=DEFAULT_POLICY, help="Dotted path of the ConclusionPolicy class.")
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Enrollments per transaction.")
+        parser.add_argument("--max-chunks", type=int, default=None, help="Stop after this many chunks.")
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        try:
+            occurred_at = datetime.fromisoformat(options["occurred_at"]) if options["occurred_at"] else None
+            engine = PeriodClosingEngine(import_string(options["policy"])(), chunk_size=options["chunk_size"])
+            progress = engine.close_period(
+                academic_period_id=options["period"],
+                actor_id=options["actor"],
+                occurred_at=occurred_at,
+                justification=options["justification"],
+                max_chunks=options["max_chunks"],
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        self.stdout.write(
+            f"run={progress.run_id} status={progress.status} chunks={progress.chunks} "
+            f"concluded={progress.concluded} reported={progress.reported}"
+        )
@@ -0,0 +1,75 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils.module_loading import import_string
+
+from apps.academic.outbox.dispatcher import DispatchReport, OutboxDispatcher, OutboxRetryPolicy
+
+DEFAULT_SINK = "apps.academic.outbox.sinks.LoggingOutboxSink"
+
+
+class Command(BaseCommand):
+    help = (
+        "Deliver pending outbox events through a sink, in batches. "
+        "Run several processes to scale throughput; each claims its own leased batches."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--sink", default=DEFAULT_SINK, help="Dotted path of the OutboxSink class.")
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument("--lease-seconds", type=float, default=60.0)
+        parser.add_argument("--max-attempts", type=int, default=10)
+        parser.add_argument("--backoff-base", type=float, default=1.0, help="Seconds before the first retry.")
+        parser.add_argument("--backoff-max", type=float, default=300.0, help="Upper bound of the retry delay.")
+        parser.add_argument("--poll-interval", type=float, default=1.0, help="Sleep when nothing is claimable.")
+        parser.add_argument("--once", action="store_true", help="Exit once no event is claimable.")
+        parser.add_argument("--max-batches", type=int, default=None, help="Exit after this many batches.")
+        parser.add_argument(
+            "--report-interval", type=float, default=60.0,
+            help="Seconds between progress and lag reports while running (0: every batch).",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        dispatcher = OutboxDispatcher(
+            import_string(options["sink"])(),
+            batch_size=options["batch_size"],
+            lease_seconds=options["lease_seconds"],
+            retry_policy=OutboxRetryPolicy(
+                max_attempts=options["max_attempts"],
+                backoff_base_seconds=options["backoff_base"],
+                backoff_max_seconds=options["backoff_max"],
+            ),
+        )
+        totals = DispatchReport()
+        batches = 0
+        next_report_at = time.monotonic() + options["report_interval"]
+
+        try:
+            while options["max_batches"] is None or batches < options["max_batches"]:
+                report = dispatcher.dispatch_once()
+                batches += 1
+                totals.add(report)
+
+                if time.monotonic() >= next_report_at:
+                    self._report(dispatcher, batches=batches, totals=totals)
+                    next_report_at = time.monotonic() + options["report_interval"]
+
+                if report.claimed == 0:
+                    if options["once"]:
+                        break
+                    time.sleep(options["poll_interval"])
+        except KeyboardInterrupt:
+            pass
+
+        self._report(dispatcher, batches=batches, totals=totals)
+
+    def _report(self, dispatcher: OutboxDispatcher, *, batches: int, totals: DispatchReport) -> None:
+        """One line of running totals and backlog lag (a long-running worker prints one per interval)."""
+        lag = dispatcher.lag()
+        self.stdout.write(
+            f"worker={dispatcher.worker_id} batches={batches} claimed={totals.claimed} "
+            f"dispatched={totals.dispatched} retried={totals.retried} dead_lettered={totals.dead_lettered} "
+            f"pending={lag.pending} dead_letter={lag.dead_letter} "
+            f"oldest_pending_age_seconds={lag.oldest_pending_age_seconds}"
+        )
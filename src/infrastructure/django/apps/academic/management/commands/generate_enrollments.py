@@ -0,0 +1,89 @@
+import time
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from apps.academic.read_models import enrollment_state_counts
+from apps.academic.synthetic.generator import (
+    DEFAULT_STATE_MIX,
+    EnrollmentGenerator,
+    GeneratorConfig,
+)
+from apps.academic.synthetic.loader import LOAD_METHODS, load_batch, resolve_method
+
+
+def _parse_state_mix(value: str) -> dict[str, float]:
+    """'active=70,suspended=8,concluded=17,cancelled=5' -> weights (need not sum to 1)."""
+    mix: dict[str, float] = {}
+    try:
+        for item in value.split(","):
+            state, weight = item.split("=")
+            mix[state.strip()] = float(weight)
+    except ValueError as exc:
+        raise CommandError(f"Invalid --state-mix {value!r}; expected state=weight pairs.") from exc
+    return mix
+
+
+class Command(BaseCommand):
+    help = (
+        "Fill enrollments and enrollment_transitions with a seeded synthetic population "
+        "(COPY on PostgreSQL, batched inserts elsewhere). Sizing and benchmarking only."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--count", type=int, required=True, help="Number of enrollments.")
+        parser.add_argument("--institutions", type=int, default=10)
+        parser.add_argument("--periods", type=int, default=4, help="Academic periods per institution.")
+        parser.add_argument("--class-groups", type=int, default=25, help="Class groups per period.")
+        parser.add_argument("--students", type=int, default=5000, help="Students per institution.")
+        parser.add_argument(
+            "--state-mix",
+            default=",".join(f"{state}={weight:g}" for state, weight in DEFAULT_STATE_MIX.items()),
+            help="Relative weights of the final states.",
+        )
+        parser.add_argument("--mean-suspensions", type=float, default=0.4, help="Mean suspend/reactivate cycles.")
+        parser.add_argument("--max-suspensions", type=int, default=10)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--batch-size", type=int, default=10_000, help="Enrollments per transaction.")
+        parser.add_argument("--method", choices=LOAD_METHODS, default="auto")
+        parser.add_argument(
+            "--skip-counts", action="store_true", help="Do not rebuild the enrollment state counts read model."
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be positive.")
+        try:
+            config = GeneratorConfig(
+                enrollments=options["count"],
+                institutions=options["institutions"],
+                periods_per_institution=options["periods"],
+                class_groups_per_period=options["class_groups"],
+                students_per_institution=options["students"],
+                state_mix=_parse_state_mix(options["state_mix"]),
+                mean_suspension_cycles=options["mean_suspensions"],
+                max_suspension_cycles=options["max_suspensions"],
+                seed=options["seed"],
+            )
+            method = resolve_method(options["method"])
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        started = time.perf_counter()
+        enrollments = transitions = 0
+        for snapshot_rows, transition_rows in EnrollmentGenerator(config).iter_batches(options["batch_size"]):
+            load_batch(snapshot_rows, transition_rows, method=method)
+            enrollments += len(snapshot_rows)
+            transitions += len(transition_rows)
+            if options["verbosity"] > 1:
+                self.stdout.write(f"  {enrollments}/{config.enrollments} enrollments")
+        elapsed = time.perf_counter() - started
+
+        if not options["skip_counts"]:
+            enrollment_state_counts.rebuild()
+
+        rate = (enrollments + transitions) / elapsed if elapsed else 0.0
+        self.stdout.write(
+            f"generated enrollments={enrollments} transitions={transitions} method={method} "
+            f"seconds={elapsed:.1f} rows_per_second={rate:.0f}"
+        )
@@ -0,0 +1,58 @@
+from datetime import datetime
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from application.academic.enrollment.services.import_enrollments import (
+    DEFAULT_IMPORT_CHUNK_SIZE,
+    ImportEnrollments,
+)
+from apps.academic.importing.enrollment_import import (
+    IMPORT_FORMATS,
+    detect_format,
+    iter_rows,
+    write_results,
+)
+from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+
+
+class Command(BaseCommand):
+    help = (
+        "Create enrollments from a CSV or NDJSON file, streaming it in chunks of bulk inserts. "
+        "Writes one NDJSON result line per input row; failed rows do not stop the import."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", help="CSV (with header) or NDJSON file to import.")
+        parser.add_argument("--actor", required=True, help="Actor id recorded as the creator.")
+        parser.add_argument("--format", choices=IMPORT_FORMATS, default=None, help="Default: from the extension.")
+        parser.add_argument("--output", default=None, help="Result file (default: <path>.results.ndjson).")
+        parser.add_argument("--occurred-at", default=None, help="ISO 8601 creation timestamp (default: now).")
+        parser.add_argument(
+            "--chunk-size", type=int, default=DEFAULT_IMPORT_CHUNK_SIZE, help="Rows per bulk insert (transaction)."
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        path = options["path"]
+        output = options["output"] or f"{path}.results.ndjson"
+        try:
+            file_format = options["format"] or detect_format(path)
+            occurred_at = datetime.fromisoformat(options["occurred_at"]) if options["occurred_at"] else None
+            service = ImportEnrollments(DjangoEnrollmentRepository(), chunk_size=options["chunk_size"])
+        except ValueError as exc:
+            raise CommandError(str(exc)) from exc
+
+        try:
+            with open(path, encoding="utf-8", newline="") as source, open(output, "w", encoding="utf-8") as target:
+                outcomes = service.execute(
+                    rows=iter_rows(source, file_format),
+                    actor_id=options["actor"],
+                    occurred_at=occurred_at,
+                )
+                summary = write_results(outcomes, target)
+        except OSError as exc:
+            raise CommandError(str(exc)) from exc
+
+        self.stdout.write(
+            f"rows={summary.rows} created={summary.created} failed={summary.failed} results={output}"
+        )
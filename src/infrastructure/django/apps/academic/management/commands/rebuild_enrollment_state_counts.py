@@ -0,0 +1,13 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand
+
+from apps.academic.read_models import enrollment_state_counts
+
+
+class Command(BaseCommand):
+    help = "Recompute the enrollment state counts read model from the enrollments table."
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        counters = enrollment_state_counts.rebuild()
+        self.stdout.write(f"rebuilt enrollment_state_counts: {counters} counters")
@@ -0,0 +1,28 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.academic.read_models import enrollment_state_counts
+
+
+class Command(BaseCommand):
+    help = (
+        "Diff the enrollment state counts read model against the enrollments table; "
+        "exits with an error when they disagree."
+    )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        mismatches = enrollment_state_counts.verify()
+        for mismatch in mismatches:
+            key = mismatch.key
+            self.stdout.write(
+                f"institution={key.institution_id} period={key.academic_period_id} "
+                f"class_group={key.class_group_id} state={key.state} "
+                f"expected={mismatch.expected} projected={mismatch.projected}"
+            )
+
+        if mismatches:
+            raise CommandError(
+                f"{len(mismatches)} enrollment state counters differ; run rebuild_enrollment_state_counts."
+            )
+        self.stdout.write("enrollment_state_counts is consistent with enrollments")
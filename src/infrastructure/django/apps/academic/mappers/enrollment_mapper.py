@@ -1,11 +1,45 @@
 import uuid
+from collections.abc import Callable, Iterable, Sequence
+from typing import Any
 
 from apps.academic.enrollments.transition_id import make_transition_id
+from apps.academic.mappers.rehydration_sampler import RehydrationSampler
 from apps.academic.models.enrollment_model import EnrollmentModel
 from apps.academic.models.enrollment_transition import EnrollmentTransitionModel
 from domain.academic.enrollment.entities.enrollment import Enrollment
 from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
 from domain.academic.enrollment.value_objects.state_transition import StateTransition
+from domain.shared.domain_error import DomainError
+from domain.shared.lazy_history import LazyHistory
+
+# Raw row layouts consumed by the row-based mapping path.
+# Repositories must select columns in exactly this order (values_list).
+SNAPSHOT_FIELDS: tuple[str, ...] = (
+    "id",
+    "institution_id",
+    "student_id",
+    "class_group_id",
+    "academic_period_id",
+    "created_by",
+    "state",
+    "created_at",
+    "concluded_at",
+    "cancelled_at",
+    "suspended_at",
+    "reactivated_at",
+    "version",
+)
+TRANSITION_FIELDS: tuple[str, ...] = (
+    "from_state",
+    "to_state",
+    "actor_id",
+    "occurred_at",
+    "justification",
+)
+
+# Trusted path: stored states are guaranteed valid by the CHECK constraints,
+# so a dict lookup replaces the (validating) EnrollmentState(...) call.
+_STATE_BY_VALUE: dict[str, EnrollmentState] = {state.value: state for state in EnrollmentState}
 
 
 class EnrollmentMapper:
@@ -82,6 +116,179 @@ class EnrollmentMapper:
                 version=version,
                 transitions=domain_transitions,
             )
+
+    @staticmethod
+    def to_state_transition(row: Sequence[Any]) -> StateTransition:
+        """
+            Build a StateTransition VO straight from a raw row laid out as TRANSITION_FIELDS,
+            without materializing an EnrollmentTransitionModel instance first.
+        """
+        from_state, to_state, actor_id, occurred_at, justification = row
+        return StateTransition(
+            from_state=EnrollmentState(from_state),
+            actor_id=str(actor_id),
+            to_state=EnrollmentState(to_state),
+            occurred_at=occurred_at,
+            justification=justification,
+        )
+
+    @staticmethod
+    def _to_state_transition_trusted(row: Sequence[Any]) -> StateTransition:
+        from_state, to_state, actor_id, occurred_at, justification = row
+        return StateTransition.rehydrate_trusted(
+            from_state=_STATE_BY_VALUE[from_state],
+            actor_id=str(actor_id),
+            to_state=_STATE_BY_VALUE[to_state],
+            occurred_at=occurred_at,
+            justification=justification,
+        )
+
+    @staticmethod
+    def to_domain_from_rows(
+            *,
+            snapshot_row: Sequence[Any],
+            transition_rows: Iterable[Sequence[Any]],
+            sampler: RehydrationSampler | None = None,
+            ) -> Enrollment:
+        """
+            Convert raw database rows into a domain Enrollment entity.
+                - snapshot_row: values laid out as SNAPSHOT_FIELDS
+                - transition_rows: values laid out as TRANSITION_FIELDS, ordered by occurred_at
+                - sampler: repositories only; rows the sampler does not pick are rebuilt
+                  with Enrollment.rehydrate_trusted (no __post_init__ validation).
+                  None validates every aggregate.
+            Same result as to_domain, but skips the ORM instance layer entirely.
+        """
+        validate = sampler is None or sampler.should_validate()
+        to_transition = (
+            EnrollmentMapper.to_state_transition if validate else EnrollmentMapper._to_state_transition_trusted
+        )
+        try:
+            transitions = [to_transition(row) for row in transition_rows]
+            return EnrollmentMapper._rehydrate(snapshot_row=snapshot_row, transitions=transitions, validate=validate)
+        except DomainError as exc:
+            if sampler is not None:
+                sampler.record_failure(aggregate_id=snapshot_row[0], error=exc)
+            raise
+
+    @staticmethod
+    def to_domain_with_lazy_history(
+            *,
+            snapshot_row: Sequence[Any],
+            load_transition_rows: Callable[[], Iterable[Sequence[Any]]],
+            sampler: RehydrationSampler | None = None,
+            ) -> Enrollment:
+        """
+            Same as to_domain_from_rows, but `enrollment.transitions` is a LazyHistory:
+            load_transition_rows (rows laid out as TRANSITION_FIELDS, ordered by
+            occurred_at) only runs when the history is first read. State-change
+            commands and save() never read it.
+        """
+        validate = sampler is None or sampler.should_validate()
+        to_transition = (
+            EnrollmentMapper.to_state_transition if validate else EnrollmentMapper._to_state_transition_trusted
+        )
+
+        def load() -> list[StateTransition]:
+            try:
+                return [to_transition(row) for row in load_transition_rows()]
+            except DomainError as exc:
+                if sampler is not None:
+                    sampler.record_failure(aggregate_id=snapshot_row[0], error=exc)
+                raise
+
+        try:
+            return EnrollmentMapper._rehydrate(
+                snapshot_row=snapshot_row, transitions=LazyHistory(load), validate=validate
+            )
+        except DomainError as exc:
+            if sampler is not None:
+                sampler.record_failure(aggregate_id=snapshot_row[0], error=exc)
+            raise
+
+    @staticmethod
+    def _rehydrate(
+            *,
+            snapshot_row: Sequence[Any],
+            transitions: list[StateTransition] | LazyHistory[StateTransition],
+            validate: bool,
+            ) -> Enrollment:
+        (
+            enrollment_id,
+            institution_id,
+            student_id,
+            class_group_id,
+            academic_period_id,
+            created_by,
+            state,
+            created_at,
+            concluded_at,
+            cancelled_at,
+            suspended_at,
+            reactivated_at,
+            version,
+        ) = snapshot_row
+
+        build: Callable[..., Enrollment]
+        if validate:
+            # Constructor: domain validates invariants + normalizes datetimes
+            build = Enrollment
+            state = EnrollmentState(state)
+        else:
+            build = Enrollment.rehydrate_trusted
+            state = _STATE_BY_VALUE[state]
+
+        return build(
+                id=str(enrollment_id),
+                institution_id=str(institution_id),
+                student_id=str(student_id),
+                class_group_id=str(class_group_id),
+                academic_period_id=str(academic_period_id),
+                state=state,
+                created_by=created_by,
+                created_at=created_at,
+                concluded_at=concluded_at,
+                cancelled_at=cancelled_at,
+                suspended_at=suspended_at,
+                reactivated_at=reactivated_at,
+                version=version,
+                transitions=transitions,
+            )
+
+    @staticmethod
+    def to_snapshot_row(*, enrollment: Enrollment, version: int | None = None) -> tuple[Any, ...]:
+        """
+            Flatten an Enrollment into a plain row laid out as SNAPSHOT_FIELDS
+            (inverse of to_domain_from_rows). `version` overrides the aggregate
+            version, e.g. with the version returned by a successful save.
+        """
+        return (
+            enrollment.id,
+            enrollment.institution_id,
+            enrollment.student_id,
+            enrollment.class_group_id,
+            enrollment.academic_period_id,
+            enrollment.created_by,
+            enrollment.state.value,
+            enrollment.created_at,
+            enrollment.concluded_at,
+            enrollment.cancelled_at,
+            enrollment.suspended_at,
+            enrollment.reactivated_at,
+            enrollment.version if version is None else version,
+        )
+
+    @staticmethod
+    def to_transition_row(state_transition: StateTransition) -> tuple[Any, ...]:
+        """Flatten a StateTransition VO into a plain row laid out as TRANSITION_FIELDS."""
+        return (
+            state_transition.from_state.value,
+            state_transition.to_state.value,
+            state_transition.actor_id,
+            state_transition.occurred_at,
+            state_transition.justification,
+        )
+
     @staticmethod
     def to_snapshot(
         *,
@@ -0,0 +1,56 @@
+from dataclasses import fields
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+from apps.academic.models.outbox_event import OutboxEventModel
+from domain.shared.domain_event import DomainEvent
+
+# Envelope fields stored in their own columns rather than in the payload.
+_ENVELOPE_FIELDS = frozenset({"aggregate_id", "event_id", "occurred_at"})
+
+
+class OutboxMapper:
+    """
+        Mapper from domain events to outbox records (ADR 016).
+        The event class name is the event type; the remaining dataclass fields
+        become a JSON payload (enums by value, datetimes in ISO 8601).
+    """
+
+    @staticmethod
+    def to_payload(event: DomainEvent) -> dict[str, Any]:
+        payload: dict[str, Any] = {}
+        for event_field in fields(event):
+            if event_field.name in _ENVELOPE_FIELDS:
+                continue
+            value = getattr(event, event_field.name)
+            if isinstance(value, Enum):
+                value = value.value
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            payload[event_field.name] = value
+        return payload
+
+    @staticmethod
+    def to_outbox_events(
+            *,
+            events: list[DomainEvent],
+            aggregate_type: str,
+            aggregate_version: int,
+    ) -> list[OutboxEventModel]:
+        """
+            Build one unsaved OutboxEventModel per domain event, tagged with the
+            aggregate version persisted in the same transaction.
+        """
+        return [
+            OutboxEventModel(
+                event_id=event.event_id,
+                event_type=type(event).__name__,
+                aggregate_type=aggregate_type,
+                aggregate_id=event.aggregate_id,
+                aggregate_version=aggregate_version,
+                occurred_at=event.occurred_at,
+                payload=OutboxMapper.to_payload(event),
+            )
+            for event in events
+        ]
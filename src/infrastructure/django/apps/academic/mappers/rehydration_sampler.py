@@ -0,0 +1,82 @@
+"""Sampled validation for the trusted rehydration path.
+
+Rows read back by the repositories were validated by the aggregate on write
+and are guarded by the database constraints, so they are normally rebuilt
+with ``Enrollment.rehydrate_trusted``. A ``RehydrationSampler`` still sends a
+configurable fraction of them through the validating constructor, so that
+corruption the constraints cannot see (a bad manual fix, a faulty migration
+or import) surfaces, and counts what it found.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+from dataclasses import dataclass
+
+from domain.shared.domain_error import DomainError
+
+logger = logging.getLogger("apps.academic.rehydration")
+
+DEFAULT_SAMPLE_RATE = 0.01
+
+
+@dataclass(frozen=True)
+class RehydrationStats:
+    trusted: int
+    validated: int
+    # Metric: sampled aggregates whose full validation failed
+    sampled_failures: int
+
+
+class RehydrationSampler:
+    """
+        Decides, per loaded aggregate, whether it is rebuilt trusted or fully validated.
+
+        - sample_rate = 0.0: always trusted; 1.0: always validated
+        - a sampled failure is counted, logged and re-raised: the aggregate is not
+          returned, exactly as the validating path would behave
+    """
+
+    def __init__(self, sample_rate: float = DEFAULT_SAMPLE_RATE, *, rng: random.Random | None = None) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1.")
+        self.sample_rate = sample_rate
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._trusted = 0
+        self._validated = 0
+        self._sampled_failures = 0
+
+    @property
+    def stats(self) -> RehydrationStats:
+        return RehydrationStats(
+            trusted=self._trusted,
+            validated=self._validated,
+            sampled_failures=self._sampled_failures,
+        )
+
+    def should_validate(self) -> bool:
+        with self._lock:
+            validate = self.sample_rate >= 1.0 or (self.sample_rate > 0.0 and self._rng.random() < self.sample_rate)
+            if validate:
+                self._validated += 1
+            else:
+                self._trusted += 1
+        return validate
+
+    def record_failure(self, *, aggregate_id: object, error: DomainError) -> None:
+        with self._lock:
+            self._sampled_failures += 1
+        logger.error(
+            "sampled rehydration failed for %s: %s",
+            aggregate_id,
+            error,
+            extra={"aggregate_id": str(aggregate_id), "error_code": error.code},
+        )
+
+
+# Process-wide sampler used by the repositories unless one is injected,
+# so the counters aggregate every load of the process.
+default_sampler = RehydrationSampler()
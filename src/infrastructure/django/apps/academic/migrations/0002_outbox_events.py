@@ -0,0 +1,41 @@
+# Generated by Django 5.2.11 on 2026-10-18 00:48
+
+import uuid
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxEventModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(db_column='created_at', default=django.utils.timezone.now, editable=False, help_text='The date and time when the record was created (UTC).', verbose_name='Created At')),
+                ('event_id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='Idempotency key of the domain event (UUID).', unique=True, verbose_name='Event ID')),
+                ('event_type', models.CharField(help_text='Domain event name, e.g. EnrollmentSuspended.', max_length=100, verbose_name='Event Type')),
+                ('aggregate_type', models.CharField(help_text='Aggregate that produced the event, e.g. enrollment.', max_length=50, verbose_name='Aggregate Type')),
+                ('aggregate_id', models.UUIDField(help_text='Identifier of the aggregate that produced the event.', verbose_name='Aggregate ID')),
+                ('aggregate_version', models.PositiveIntegerField(help_text='Aggregate version persisted together with the event.', verbose_name='Aggregate Version')),
+                ('occurred_at', models.DateTimeField(help_text='When the domain event occurred (UTC).', verbose_name='Occurred At')),
+                ('payload', models.JSONField(help_text='Serialized domain event fields.', verbose_name='Payload')),
+                ('status', models.CharField(choices=[('pending', 'pending'), ('dispatched', 'dispatched'), ('dead_letter', 'dead_letter')], default='pending', help_text='Delivery status of the event.', max_length=20, verbose_name='Status')),
+                ('attempts', models.PositiveIntegerField(default=0, help_text='Number of failed delivery attempts.', verbose_name='Attempts')),
+                ('available_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Earliest time the next delivery attempt may run (UTC).', verbose_name='Available At')),
+                ('locked_by', models.CharField(blank=True, help_text='Dispatcher worker holding the delivery lease.', max_length=100, null=True, verbose_name='Locked By')),
+                ('locked_until', models.DateTimeField(blank=True, help_text='When the delivery lease expires (UTC).', null=True, verbose_name='Locked Until')),
+                ('dispatched_at', models.DateTimeField(blank=True, help_text='When the event was delivered (UTC).', null=True, verbose_name='Dispatched At')),
+                ('last_error', models.TextField(blank=True, help_text='Error of the last failed delivery attempt.', null=True, verbose_name='Last Error')),
+            ],
+            options={
+                'db_table': 'outbox_events',
+                'indexes': [models.Index(fields=['status', 'available_at', 'id'], name='ix_outbox_status_available'), models.Index(fields=['aggregate_type', 'aggregate_id', 'aggregate_version'], name='ix_outbox_aggregate')],
+            },
+        ),
+    ]
@@ -0,0 +1,46 @@
+# Generated by Django 5.2.11 on 2026-10-18 00:51
+
+import django.utils.timezone
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_state_counts(apps, schema_editor):
+    """Seed the projection from the existing enrollments."""
+    Enrollment = apps.get_model("academic", "EnrollmentModel")
+    StateCount = apps.get_model("academic", "EnrollmentStateCountModel")
+    group_fields = ("institution_id", "academic_period_id", "class_group_id", "state")
+    StateCount.objects.bulk_create(
+        [
+            StateCount(**{name: row[name] for name in group_fields}, count=row["total"])
+            for row in Enrollment.objects.values(*group_fields).annotate(total=Count("id")).order_by()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0002_outbox_events'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EnrollmentStateCountModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('institution_id', models.UUIDField(help_text='The unique identifier of the institution.', verbose_name='Institution ID')),
+                ('academic_period_id', models.UUIDField(help_text='The unique identifier of the academic period.', verbose_name='Academic Period ID')),
+                ('class_group_id', models.UUIDField(help_text='The unique identifier of the class group.', verbose_name='Class Group ID')),
+                ('state', models.CharField(help_text='Enrollment state being counted.', max_length=20, verbose_name='State')),
+                ('count', models.IntegerField(default=0, help_text='Number of enrollments in this state.', verbose_name='Count')),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Last time the counter changed (UTC).', verbose_name='Updated At')),
+            ],
+            options={
+                'db_table': 'enrollment_state_counts',
+                'constraints': [models.UniqueConstraint(fields=('institution_id', 'academic_period_id', 'class_group_id', 'state'), name='unique_enrollment_state_count')],
+            },
+        ),
+        migrations.RunPython(populate_state_counts, migrations.RunPython.noop),
+    ]
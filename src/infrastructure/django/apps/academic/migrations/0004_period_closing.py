@@ -0,0 +1,54 @@
+# Generated by Django 5.2.11 on 2026-10-18 01:01
+
+import uuid
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0003_enrollment_state_counts'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PeriodClosingRunModel',
+            fields=[
+                ('created_at', models.DateTimeField(db_column='created_at', default=django.utils.timezone.now, editable=False, help_text='The date and time when the record was created (UTC).', verbose_name='Created At')),
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, help_text='Unique identifier of the closing run (UUID).', primary_key=True, serialize=False, verbose_name='Run ID')),
+                ('academic_period_id', models.UUIDField(help_text='The academic period being closed.', verbose_name='Academic Period ID')),
+                ('actor_id', models.UUIDField(help_text='Actor recorded on every transition of the run.', verbose_name='Actor ID')),
+                ('occurred_at', models.DateTimeField(help_text='Conclusion timestamp applied to every enrollment of the run (UTC).', verbose_name='Occurred At')),
+                ('justification', models.TextField(blank=True, help_text='Justification recorded on every transition of the run.', null=True, verbose_name='Justification')),
+                ('status', models.CharField(choices=[('running', 'running'), ('completed', 'completed')], default='running', help_text='Progress of the run.', max_length=20, verbose_name='Status')),
+                ('chunk_size', models.PositiveIntegerField(help_text='Enrollments evaluated per transaction.', verbose_name='Chunk Size')),
+                ('last_enrollment_id', models.UUIDField(blank=True, help_text='Keyset cursor: last enrollment id of the last committed chunk.', null=True, verbose_name='Last Enrollment ID')),
+                ('concluded_count', models.PositiveIntegerField(default=0, help_text='Enrollments concluded by the run.', verbose_name='Concluded Count')),
+                ('reported_count', models.PositiveIntegerField(default=0, help_text='Enrollments left active and written to the report.', verbose_name='Reported Count')),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now, help_text='Last committed chunk (UTC).', verbose_name='Updated At')),
+                ('finished_at', models.DateTimeField(blank=True, help_text='When the run completed (UTC).', null=True, verbose_name='Finished At')),
+            ],
+            options={
+                'db_table': 'period_closing_runs',
+                'constraints': [models.UniqueConstraint(condition=models.Q(('status', 'running')), fields=('academic_period_id',), name='unique_running_period_closing')],
+            },
+        ),
+        migrations.CreateModel(
+            name='PeriodClosingReportModel',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(db_column='created_at', default=django.utils.timezone.now, editable=False, help_text='The date and time when the record was created (UTC).', verbose_name='Created At')),
+                ('enrollment_id', models.UUIDField(help_text='Enrollment left active by the run.', verbose_name='Enrollment ID')),
+                ('outcome', models.CharField(choices=[('denied', 'denied'), ('justification_required', 'justification_required')], help_text='Why the enrollment was not concluded.', max_length=30, verbose_name='Outcome')),
+                ('reasons', models.JSONField(default=list, help_text='Reasons given by the conclusion policy.', verbose_name='Reasons')),
+                ('run', models.ForeignKey(help_text='Closing run that evaluated the enrollment.', on_delete=django.db.models.deletion.PROTECT, related_name='report_entries', to='academic.periodclosingrunmodel', verbose_name='Run')),
+            ],
+            options={
+                'db_table': 'period_closing_report',
+                'constraints': [models.UniqueConstraint(fields=('run', 'enrollment_id'), name='unique_period_closing_report_entry')],
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.11 on 2026-10-18 01:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0004_period_closing'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='enrollmentmodel',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('state', 'active'), ('concluded_at__isnull', True), ('cancelled_at__isnull', True), ('suspended_at__isnull', True)), models.Q(('state', 'suspended'), ('suspended_at__isnull', False), ('concluded_at__isnull', True), ('cancelled_at__isnull', True), ('reactivated_at__isnull', True)), models.Q(('state', 'concluded'), ('concluded_at__isnull', False), ('cancelled_at__isnull', True), ('suspended_at__isnull', True), ('reactivated_at__isnull', True)), models.Q(('state', 'cancelled'), ('cancelled_at__isnull', False), ('concluded_at__isnull', True), ('suspended_at__isnull', True), ('reactivated_at__isnull', True)), _connector='OR'), name='ck_enrollment_state_timestamps'),
+        ),
+        migrations.AddConstraint(
+            model_name='enrollmenttransitionmodel',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('action', 'suspend'), ('from_state', 'active'), ('to_state', 'suspended')), models.Q(('action', 'reactivate'), ('from_state', 'suspended'), ('to_state', 'active')), models.Q(('action', 'conclude'), ('from_state', 'active'), ('to_state', 'concluded')), models.Q(('action', 'cancel'), ('from_state', 'active'), ('to_state', 'cancelled')), models.Q(('action', 'cancel'), ('from_state', 'suspended'), ('to_state', 'cancelled')), _connector='OR'), name='ck_transition_allowed_edge'),
+        ),
+    ]
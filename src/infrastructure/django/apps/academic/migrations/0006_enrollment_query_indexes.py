@@ -0,0 +1,37 @@
+# Generated by Django 5.2.11 on 2026-10-18 02:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0005_state_machine_checks'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enrollmentmodel',
+            index=models.Index(fields=['institution_id', 'state'], name='ix_enrollment_institution_st'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollmentmodel',
+            index=models.Index(fields=['class_group_id', 'academic_period_id', 'state'], name='ix_enrollment_group_period_st'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollmentmodel',
+            index=models.Index(fields=['student_id', 'created_at'], name='ix_enrollment_student_created'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollmentmodel',
+            index=models.Index(condition=models.Q(('state__in', ['active', 'suspended'])), fields=['institution_id', 'created_at', 'id'], name='ix_enrollment_open_listing'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollmentmodel',
+            index=models.Index(condition=models.Q(('state', 'active')), fields=['academic_period_id', 'id'], name='ix_enrollment_active_period'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollmenttransitionmodel',
+            index=models.Index(fields=['actor_id', 'occurred_at'], name='ix_transition_actor_occurred'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-18 02:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academic', '0006_enrollment_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='periodclosingreportmodel',
+            name='outcome',
+            field=models.CharField(choices=[('denied', 'denied'), ('justification_required', 'justification_required'), ('skipped_concurrent_change', 'skipped_concurrent_change')], help_text='Why the enrollment was not concluded.', max_length=30, verbose_name='Outcome'),
+        ),
+    ]
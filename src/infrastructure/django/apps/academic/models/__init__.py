@@ -1,2 +1,5 @@
 from .enrollment_model import EnrollmentModel
+from .enrollment_state_count import EnrollmentStateCountModel
 from .enrollment_transition import EnrollmentTransitionModel
+from .outbox_event import OutboxEventModel
+from .period_closing import PeriodClosingReportModel, PeriodClosingRunModel
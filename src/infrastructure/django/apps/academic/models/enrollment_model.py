@@ -2,7 +2,10 @@ import uuid
 
 from django.db import models
 
+from domain.academic.enrollment.entities.enrollment_state_machine import ENROLLMENT_STATE_MACHINE
+
 from .base_models import CreatedAtModel, MutableSnapshotModel
+from .state_machine_checks import integrity_check
 
 
 class EnrollmentModel(CreatedAtModel, MutableSnapshotModel):
@@ -93,9 +96,29 @@ class EnrollmentModel(CreatedAtModel, MutableSnapshotModel):
         db_table = "enrollments"
         verbose_name = "Enrollment"
         verbose_name_plural = "Enrollments"
+        indexes = [
+            models.Index(fields=["institution_id", "state"], name="ix_enrollment_institution_st"),
+            models.Index(
+                fields=["class_group_id", "academic_period_id", "state"],
+                name="ix_enrollment_group_period_st",
+            ),
+            models.Index(fields=["student_id", "created_at"], name="ix_enrollment_student_created"),
+            # Partial: only the rows still open, the ones listings and closing scan
+            models.Index(
+                fields=["institution_id", "created_at", "id"],
+                condition=models.Q(state__in=["active", "suspended"]),
+                name="ix_enrollment_open_listing",
+            ),
+            models.Index(
+                fields=["academic_period_id", "id"],
+                condition=models.Q(state="active"),
+                name="ix_enrollment_active_period",
+            ),
+        ]
         constraints = [
             models.UniqueConstraint(
                 fields=["institution_id", "student_id", "class_group_id", "academic_period_id"],
                 name="unique_enrollment"
-            )
+            ),
+            integrity_check(ENROLLMENT_STATE_MACHINE, name="ck_enrollment_state_timestamps"),
         ]
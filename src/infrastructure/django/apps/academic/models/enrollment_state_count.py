@@ -0,0 +1,48 @@
+from django.db import models
+from django.utils import timezone
+
+
+class EnrollmentStateCountModel(models.Model):
+    """Read model (ADR 026): quantidade de matriculas por turma/periodo/estado.
+    - mantido incrementalmente pelo repository na mesma transacao do snapshot
+    - reconstruivel a partir de `enrollments` (rebuild_enrollment_state_counts)
+    - nunca e fonte de verdade; verify_enrollment_state_counts compara com a base
+    """
+    objects: models.Manager["EnrollmentStateCountModel"]  # type: ignore[override]
+
+    institution_id = models.UUIDField(
+        verbose_name="Institution ID",
+        help_text="The unique identifier of the institution.",
+    )
+    academic_period_id = models.UUIDField(
+        verbose_name="Academic Period ID",
+        help_text="The unique identifier of the academic period.",
+    )
+    class_group_id = models.UUIDField(
+        verbose_name="Class Group ID",
+        help_text="The unique identifier of the class group.",
+    )
+    state = models.CharField(
+        max_length=20,
+        verbose_name="State",
+        help_text="Enrollment state being counted.",
+    )
+    count = models.IntegerField(
+        default=0,
+        verbose_name="Count",
+        help_text="Number of enrollments in this state.",
+    )
+    updated_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="Updated At",
+        help_text="Last time the counter changed (UTC).",
+    )
+
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride]
+        db_table = "enrollment_state_counts"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["institution_id", "academic_period_id", "class_group_id", "state"],
+                name="unique_enrollment_state_count",
+            )
+        ]
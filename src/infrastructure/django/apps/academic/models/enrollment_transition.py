@@ -3,7 +3,10 @@ import uuid
 from django.db import models
 from django.utils import timezone
 
+from domain.academic.enrollment.entities.enrollment_state_machine import ENROLLMENT_STATE_MACHINE
+
 from .base_models import CreatedAtModel
+from .state_machine_checks import transition_check
 
 
 class EnrollmentTransitionModel(CreatedAtModel):
@@ -80,10 +83,12 @@ class EnrollmentTransitionModel(CreatedAtModel):
         db_table = "enrollment_transitions"
         indexes = [
             models.Index(fields=["enrollment", "occurred_at"]),
+            models.Index(fields=["actor_id", "occurred_at"], name="ix_transition_actor_occurred"),
         ]
         constraints = [
             models.CheckConstraint(
                 condition=~models.Q(from_state=models.F("to_state")),  # from_state != to_state
                 name="ck_transition_from_state_diff_to_state",
             ),
+            transition_check(ENROLLMENT_STATE_MACHINE, name="ck_transition_allowed_edge"),
         ]
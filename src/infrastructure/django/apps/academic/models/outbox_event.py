@@ -0,0 +1,104 @@
+import uuid
+
+from django.db import models
+from django.utils import timezone
+
+from .base_models import CreatedAtModel
+
+
+class OutboxEventModel(CreatedAtModel):
+    """Registro de evento de dominio pendente de entrega externa (outbox transacional, ADR 016).
+    - gravado na mesma transacao do snapshot/transicoes
+    - event_id: chave de idempotencia do evento (DomainEvent.event_id)
+    - status/attempts/available_at: ciclo de entrega com retry e dead letter
+    - locked_by/locked_until: lease do dispatcher que reivindicou o registro
+    """
+    objects: models.Manager["OutboxEventModel"]  # type: ignore[override]
+
+    class StatusChoices(models.TextChoices):
+        PENDING = "pending", "pending"
+        DISPATCHED = "dispatched", "dispatched"
+        DEAD_LETTER = "dead_letter", "dead_letter"
+
+    event_id = models.UUIDField(
+        default=uuid.uuid4,
+        unique=True,
+        editable=False,
+        verbose_name="Event ID",
+        help_text="Idempotency key of the domain event (UUID).",
+    )
+    event_type = models.CharField(
+        max_length=100,
+        verbose_name="Event Type",
+        help_text="Domain event name, e.g. EnrollmentSuspended.",
+    )
+    aggregate_type = models.CharField(
+        max_length=50,
+        verbose_name="Aggregate Type",
+        help_text="Aggregate that produced the event, e.g. enrollment.",
+    )
+    aggregate_id = models.UUIDField(
+        verbose_name="Aggregate ID",
+        help_text="Identifier of the aggregate that produced the event.",
+    )
+    aggregate_version = models.PositiveIntegerField(
+        verbose_name="Aggregate Version",
+        help_text="Aggregate version persisted together with the event.",
+    )
+    occurred_at = models.DateTimeField(
+        verbose_name="Occurred At",
+        help_text="When the domain event occurred (UTC).",
+    )
+    payload = models.JSONField(
+        verbose_name="Payload",
+        help_text="Serialized domain event fields.",
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=StatusChoices.choices,
+        default=StatusChoices.PENDING,
+        verbose_name="Status",
+        help_text="Delivery status of the event.",
+    )
+    attempts = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Attempts",
+        help_text="Number of failed delivery attempts.",
+    )
+    available_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="Available At",
+        help_text="Earliest time the next delivery attempt may run (UTC).",
+    )
+    locked_by = models.CharField(
+        max_length=100,
+        null=True,
+        blank=True,
+        verbose_name="Locked By",
+        help_text="Dispatcher worker holding the delivery lease.",
+    )
+    locked_until = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Locked Until",
+        help_text="When the delivery lease expires (UTC).",
+    )
+    dispatched_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Dispatched At",
+        help_text="When the event was delivered (UTC).",
+    )
+    last_error = models.TextField(
+        null=True,
+        blank=True,
+        verbose_name="Last Error",
+        help_text="Error of the last failed delivery attempt.",
+    )
+
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride]
+        db_table = "outbox_events"
+        indexes = [
+            models.Index(fields=["status", "available_at", "id"], name="ix_outbox_status_available"),
+            models.Index(fields=["aggregate_type", "aggregate_id", "aggregate_version"], name="ix_outbox_aggregate"),
+        ]
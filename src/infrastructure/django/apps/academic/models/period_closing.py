@@ -0,0 +1,132 @@
+import uuid
+
+from django.db import models
+from django.utils import timezone
+
+from .base_models import CreatedAtModel
+
+
+class PeriodClosingRunModel(CreatedAtModel):
+    """Execucao do fechamento em lote de um periodo letivo (ADR 023).
+    - occurred_at/actor_id/justification congelados na abertura: retomadas geram as mesmas transicoes
+    - last_enrollment_id: cursor keyset do ultimo chunk confirmado (retomada)
+    - no maximo uma execucao em andamento por periodo
+    """
+    objects: models.Manager["PeriodClosingRunModel"]  # type: ignore[override]
+
+    class StatusChoices(models.TextChoices):
+        RUNNING = "running", "running"
+        COMPLETED = "completed", "completed"
+
+    id = models.UUIDField(
+        primary_key=True,
+        default=uuid.uuid4,
+        editable=False,
+        verbose_name="Run ID",
+        help_text="Unique identifier of the closing run (UUID).",
+    )
+    academic_period_id = models.UUIDField(
+        verbose_name="Academic Period ID",
+        help_text="The academic period being closed.",
+    )
+    actor_id = models.UUIDField(
+        verbose_name="Actor ID",
+        help_text="Actor recorded on every transition of the run.",
+    )
+    occurred_at = models.DateTimeField(
+        verbose_name="Occurred At",
+        help_text="Conclusion timestamp applied to every enrollment of the run (UTC).",
+    )
+    justification = models.TextField(
+        null=True,
+        blank=True,
+        verbose_name="Justification",
+        help_text="Justification recorded on every transition of the run.",
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=StatusChoices.choices,
+        default=StatusChoices.RUNNING,
+        verbose_name="Status",
+        help_text="Progress of the run.",
+    )
+    chunk_size = models.PositiveIntegerField(
+        verbose_name="Chunk Size",
+        help_text="Enrollments evaluated per transaction.",
+    )
+    last_enrollment_id = models.UUIDField(
+        null=True,
+        blank=True,
+        verbose_name="Last Enrollment ID",
+        help_text="Keyset cursor: last enrollment id of the last committed chunk.",
+    )
+    concluded_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Concluded Count",
+        help_text="Enrollments concluded by the run.",
+    )
+    reported_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Reported Count",
+        help_text="Enrollments left active and written to the report.",
+    )
+    updated_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name="Updated At",
+        help_text="Last committed chunk (UTC).",
+    )
+    finished_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name="Finished At",
+        help_text="When the run completed (UTC).",
+    )
+
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride]
+        db_table = "period_closing_runs"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["academic_period_id"],
+                condition=models.Q(status="running"),
+                name="unique_running_period_closing",
+            )
+        ]
+
+
+class PeriodClosingReportModel(CreatedAtModel):
+    """Matricula nao concluida por um fechamento: veredito negado, justificativa exigida ou alteracao concorrente."""
+    objects: models.Manager["PeriodClosingReportModel"]  # type: ignore[override]
+
+    class OutcomeChoices(models.TextChoices):
+        DENIED = "denied", "denied"
+        JUSTIFICATION_REQUIRED = "justification_required", "justification_required"
+        SKIPPED_CONCURRENT_CHANGE = "skipped_concurrent_change", "skipped_concurrent_change"
+
+    run = models.ForeignKey(
+        PeriodClosingRunModel,
+        on_delete=models.PROTECT,
+        related_name="report_entries",
+        verbose_name="Run",
+        help_text="Closing run that evaluated the enrollment.",
+    )
+    enrollment_id = models.UUIDField(
+        verbose_name="Enrollment ID",
+        help_text="Enrollment left active by the run.",
+    )
+    outcome = models.CharField(
+        max_length=30,
+        choices=OutcomeChoices.choices,
+        verbose_name="Outcome",
+        help_text="Why the enrollment was not concluded.",
+    )
+    reasons = models.JSONField(
+        default=list,
+        verbose_name="Reasons",
+        help_text="Reasons given by the conclusion policy.",
+    )
+
+    class Meta:  # type: ignore[reportIncompatibleVariableOverride]
+        db_table = "period_closing_report"
+        constraints = [
+            models.UniqueConstraint(fields=["run", "enrollment_id"], name="unique_period_closing_report_entry")
+        ]
@@ -0,0 +1,51 @@
+"""CHECK constraints generated from a compiled domain state machine.
+
+The domain definition stays the single source of truth: the constraints are
+rebuilt from it at import, so a change to the lifecycle shows up as a schema
+change in ``makemigrations``.
+"""
+
+from __future__ import annotations
+
+from functools import reduce
+from operator import or_
+
+from django.db import models
+
+from domain.shared.state_machine import CompiledStateMachine
+
+
+def integrity_check(
+        machine: CompiledStateMachine,
+        *,
+        name: str,
+        state_field: str = "state",
+) -> models.CheckConstraint:
+    """Each row carries exactly the lifecycle timestamps its state requires and none it forbids."""
+    clauses = []
+    for state, required, forbidden in machine.integrity_rules():
+        clause = models.Q(**{state_field: state.value})
+        for field_name in required:
+            clause &= models.Q(**{f"{field_name}__isnull": False})
+        for field_name in forbidden:
+            clause &= models.Q(**{f"{field_name}__isnull": True})
+        clauses.append(clause)
+    return models.CheckConstraint(condition=reduce(or_, clauses), name=name)
+
+
+def transition_check(
+        machine: CompiledStateMachine,
+        *,
+        name: str,
+        from_field: str = "from_state",
+        to_field: str = "to_state",
+        action_field: str | None = "action",
+) -> models.CheckConstraint:
+    """Only (from, to[, action]) combinations that are edges of the machine."""
+    clauses = []
+    for edge in machine.edge_list():
+        values = {from_field: edge.source.value, to_field: edge.target.value}
+        if action_field is not None:
+            values[action_field] = edge.command
+        clauses.append(models.Q(**values))
+    return models.CheckConstraint(condition=reduce(or_, clauses), name=name)
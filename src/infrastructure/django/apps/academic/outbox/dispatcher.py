@@ -0,0 +1,198 @@
+import os
+import socket
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from django.db import connection, transaction
+from django.db.models import Count, Min, Q, QuerySet
+from django.utils import timezone
+
+from apps.academic.models.outbox_event import OutboxEventModel
+from apps.academic.outbox.sinks import OutboxMessage, OutboxSink
+
+_PENDING = OutboxEventModel.StatusChoices.PENDING
+_DISPATCHED = OutboxEventModel.StatusChoices.DISPATCHED
+_DEAD_LETTER = OutboxEventModel.StatusChoices.DEAD_LETTER
+
+
+@dataclass(frozen=True)
+class OutboxRetryPolicy:
+    """Exponential backoff between failed attempts, then dead letter after max_attempts."""
+
+    max_attempts: int = 10
+    backoff_base_seconds: float = 1.0
+    backoff_max_seconds: float = 300.0
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("max_attempts must be >= 1")
+
+    def delay_for(self, attempts: int) -> timedelta:
+        """Delay before the next attempt, given the number of failed attempts so far."""
+        seconds = self.backoff_base_seconds * (2 ** max(attempts - 1, 0))
+        return timedelta(seconds=min(seconds, self.backoff_max_seconds))
+
+
+@dataclass
+class DispatchReport:
+    claimed: int = 0
+    dispatched: int = 0
+    retried: int = 0
+    dead_lettered: int = 0
+
+    def add(self, other: "DispatchReport") -> None:
+        self.claimed += other.claimed
+        self.dispatched += other.dispatched
+        self.retried += other.retried
+        self.dead_lettered += other.dead_lettered
+
+
+@dataclass(frozen=True)
+class OutboxLag:
+    pending: int
+    dead_letter: int
+    oldest_pending_age_seconds: float | None
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class OutboxDispatcher:
+    """
+        Claims pending outbox records in batches and delivers them through a sink.
+
+        Claiming takes a lease (locked_by/locked_until) with a conditional UPDATE,
+        so concurrent dispatcher processes never hold the same record; on
+        backends that support it the candidate rows are also selected with
+        FOR UPDATE SKIP LOCKED, so workers skip each other's rows instead of
+        waiting. Delivery happens outside the claiming transaction. A record
+        whose lease expires (crashed worker) becomes claimable again.
+    """
+
+    def __init__(
+            self,
+            sink: OutboxSink,
+            *,
+            worker_id: str | None = None,
+            batch_size: int = 100,
+            lease_seconds: float = 60.0,
+            retry_policy: OutboxRetryPolicy | None = None,
+            clock: Callable[[], datetime] = timezone.now,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+
+        self.sink = sink
+        self.worker_id = worker_id or default_worker_id()
+        self.batch_size = batch_size
+        self.lease = timedelta(seconds=lease_seconds)
+        self.retry_policy = retry_policy or OutboxRetryPolicy()
+        self._clock = clock
+
+    def claim_batch(self) -> list[OutboxMessage]:
+        """Lease up to batch_size due records to this worker, oldest first."""
+        now = self._clock()
+        lease_until = now + self.lease
+        claimable = self._claimable(now)
+
+        with transaction.atomic():
+            candidates = claimable.order_by("id")
+            if connection.features.has_select_for_update_skip_locked:
+                candidates = candidates.select_for_update(skip_locked=True)
+            ids = list(candidates.values_list("id", flat=True)[:self.batch_size])
+            if not ids:
+                return []
+
+            # The lease condition is re-checked by the UPDATE itself.
+            claimable.filter(id__in=ids).update(locked_by=self.worker_id, locked_until=lease_until)
+
+            rows = OutboxEventModel.objects.filter(
+                id__in=ids,
+                locked_by=self.worker_id,
+                locked_until=lease_until,
+            ).order_by("id")
+            return [self._to_message(row) for row in rows]
+
+    def dispatch_once(self) -> DispatchReport:
+        """Claim one batch, deliver it and record each outcome."""
+        messages = self.claim_batch()
+        report = DispatchReport(claimed=len(messages))
+
+        delivered: list[int] = []
+        for message in messages:
+            try:
+                self.sink.deliver(message)
+            except Exception as e:  # any sink failure is a failed attempt
+                if self._record_failure(message, e):
+                    report.dead_lettered += 1
+                else:
+                    report.retried += 1
+            else:
+                delivered.append(message.id)
+
+        if delivered:
+            self._owned(delivered).update(
+                status=_DISPATCHED,
+                dispatched_at=self._clock(),
+                locked_by=None,
+                locked_until=None,
+                last_error=None,
+            )
+        report.dispatched = len(delivered)
+        return report
+
+    def lag(self) -> OutboxLag:
+        """Backlog metrics in one query: pending and dead-letter counts, oldest pending age."""
+        metrics = OutboxEventModel.objects.aggregate(
+            pending=Count("id", filter=Q(status=_PENDING)),
+            dead_letter=Count("id", filter=Q(status=_DEAD_LETTER)),
+            oldest_pending=Min("created_at", filter=Q(status=_PENDING)),
+        )
+        oldest = metrics["oldest_pending"]
+        return OutboxLag(
+            pending=metrics["pending"],
+            dead_letter=metrics["dead_letter"],
+            oldest_pending_age_seconds=None if oldest is None else (self._clock() - oldest).total_seconds(),
+        )
+
+    def _claimable(self, now: datetime) -> QuerySet[OutboxEventModel]:
+        return OutboxEventModel.objects.filter(status=_PENDING, available_at__lte=now).filter(
+            Q(locked_until__isnull=True) | Q(locked_until__lte=now)
+        )
+
+    def _owned(self, ids: list[int]) -> QuerySet[OutboxEventModel]:
+        # Updates only apply while this worker still holds the lease.
+        return OutboxEventModel.objects.filter(id__in=ids, locked_by=self.worker_id)
+
+    def _record_failure(self, message: OutboxMessage, error: Exception) -> bool:
+        """Schedule a retry or move to dead letter; returns True when dead-lettered."""
+        attempts = message.attempts + 1
+        dead = attempts >= self.retry_policy.max_attempts
+        now = self._clock()
+
+        self._owned([message.id]).update(
+            status=_DEAD_LETTER if dead else _PENDING,
+            attempts=attempts,
+            available_at=now if dead else now + self.retry_policy.delay_for(attempts),
+            locked_by=None,
+            locked_until=None,
+            last_error=f"{type(error).__name__}: {error}",
+        )
+        return dead
+
+    @staticmethod
+    def _to_message(row: OutboxEventModel) -> OutboxMessage:
+        return OutboxMessage(
+            id=row.pk,
+            event_id=str(row.event_id),
+            event_type=row.event_type,
+            aggregate_type=row.aggregate_type,
+            aggregate_id=str(row.aggregate_id),
+            aggregate_version=row.aggregate_version,
+            occurred_at=row.occurred_at,
+            payload=row.payload,
+            attempts=row.attempts,
+        )
@@ -0,0 +1,55 @@
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Protocol
+
+logger = logging.getLogger("apps.academic.outbox")
+
+
+@dataclass(frozen=True)
+class OutboxMessage:
+    """Outbox record as handed to a sink: envelope + serialized payload."""
+
+    id: int
+    event_id: str
+    event_type: str
+    aggregate_type: str
+    aggregate_id: str
+    aggregate_version: int
+    occurred_at: datetime
+    payload: dict[str, Any]
+    attempts: int
+
+
+class OutboxSink(Protocol):
+    """
+        Destination of outbox messages (broker, queue, webhook...).
+
+        deliver() must raise to signal a failed delivery; the dispatcher then
+        schedules a retry or moves the record to dead letter. Delivery is
+        at-least-once: consumers deduplicate by event_id.
+    """
+
+    def deliver(self, message: OutboxMessage) -> None:
+        ...
+
+
+class LoggingOutboxSink:
+    """Default sink: writes each message as one JSON log line."""
+
+    def deliver(self, message: OutboxMessage) -> None:
+        logger.info(
+            json.dumps(
+                {
+                    "event_id": message.event_id,
+                    "event_type": message.event_type,
+                    "aggregate_type": message.aggregate_type,
+                    "aggregate_id": message.aggregate_id,
+                    "aggregate_version": message.aggregate_version,
+                    "occurred_at": message.occurred_at.isoformat(),
+                    "payload": message.payload,
+                },
+                sort_keys=True,
+            )
+        )
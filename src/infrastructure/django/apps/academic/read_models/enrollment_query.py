@@ -0,0 +1,114 @@
+"""Keyset-paginated enrollment listings (ADR 026/027).
+
+Rows are read with ``values_list`` and mapped straight to slotted
+``EnrollmentRow`` DTOs; no model instances or aggregates are built. Ordering is
+always ``(created_at, id)``: ``id`` breaks ties, so the order is total and a
+page boundary never skips or repeats a row. Pages seek past the last key
+(``WHERE (created_at, id) > cursor``) instead of using OFFSET.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from django.db.models import Q, QuerySet
+
+from application.academic.enrollment.dto.enrollment_query import (
+    DEFAULT_PAGE_SIZE,
+    EnrollmentCursor,
+    EnrollmentListFilters,
+    EnrollmentPage,
+    EnrollmentRow,
+    check_page_size,
+)
+from application.academic.enrollment.ports.enrollment_query import EnrollmentQuery
+from apps.academic.models.enrollment_model import EnrollmentModel
+
+# Column order matches the EnrollmentRow fields; the first five are UUIDs.
+ROW_FIELDS = (
+    "id",
+    "institution_id",
+    "student_id",
+    "class_group_id",
+    "academic_period_id",
+    "state",
+    "version",
+    "created_at",
+    "updated_at",
+    "concluded_at",
+    "cancelled_at",
+    "suspended_at",
+    "reactivated_at",
+)
+ORDERING = ("created_at", "id")
+
+
+def _to_rows(values: Iterable[tuple[Any, ...]]) -> Iterator[EnrollmentRow]:
+    for v in values:
+        yield EnrollmentRow(str(v[0]), str(v[1]), str(v[2]), str(v[3]), str(v[4]), *v[5:])
+
+
+class DjangoEnrollmentQuery(EnrollmentQuery):
+    """
+        Django implementation of the EnrollmentQuery port.
+
+        - `page` issues a single `LIMIT page_size + 1` query; the extra row only
+          tells whether a next page exists.
+        - `iter_rows` streams with `QuerySet.iterator(chunk_size=...)`: a
+          server-side cursor on PostgreSQL, chunked fetches elsewhere.
+    """
+
+    def page(
+            self,
+            filters: EnrollmentListFilters,
+            *,
+            page_size: int = DEFAULT_PAGE_SIZE,
+            cursor: str | None = None,
+    ) -> EnrollmentPage:
+        check_page_size(page_size)
+        queryset = self._filtered(filters)
+        if cursor is not None:
+            after = EnrollmentCursor.decode(cursor, filters)
+            queryset = queryset.filter(
+                Q(created_at__gt=after.created_at) | Q(created_at=after.created_at, id__gt=after.id)
+            )
+
+        rows = tuple(_to_rows(queryset.values_list(*ROW_FIELDS)[: page_size + 1]))
+        if len(rows) <= page_size:
+            return EnrollmentPage(rows=rows, next_cursor=None)
+
+        rows = rows[:page_size]
+        last = rows[-1]
+        next_cursor = EnrollmentCursor(created_at=last.created_at, id=last.id).encode(filters)
+        return EnrollmentPage(rows=rows, next_cursor=next_cursor)
+
+    def iter_rows(
+            self,
+            filters: EnrollmentListFilters,
+            *,
+            chunk_size: int = 2000,
+    ) -> Iterator[EnrollmentRow]:
+        if chunk_size < 1:
+            raise ValueError("'chunk_size' must be positive.")
+        values = self._filtered(filters).values_list(*ROW_FIELDS).iterator(chunk_size=chunk_size)
+        return _to_rows(values)
+
+    @staticmethod
+    def _filtered(filters: EnrollmentListFilters) -> QuerySet[EnrollmentModel]:
+        lookups: dict[str, Any] = {"institution_id": filters.institution_id}
+        if filters.class_group_id is not None:
+            lookups["class_group_id"] = filters.class_group_id
+        if filters.academic_period_id is not None:
+            lookups["academic_period_id"] = filters.academic_period_id
+        if filters.student_id is not None:
+            lookups["student_id"] = filters.student_id
+        if filters.states:
+            lookups["state__in"] = sorted(state.value for state in filters.states)
+        if filters.created_from is not None:
+            lookups["created_at__gte"] = filters.created_from
+        if filters.created_to is not None:
+            lookups["created_at__lt"] = filters.created_to
+        if filters.updated_from is not None:
+            lookups["updated_at__gte"] = filters.updated_from
+        if filters.updated_to is not None:
+            lookups["updated_at__lt"] = filters.updated_to
+        return EnrollmentModel.objects.filter(**lookups).order_by(*ORDERING)
@@ -0,0 +1,190 @@
+"""Enrollment statistics read model: counts by institution/period/class group/state.
+
+The projection is maintained with delta increments inside the repository
+transaction that changes the snapshot, so it is always consistent with the
+committed `enrollments` table. Counters are upserted with
+``INSERT ... ON CONFLICT ... DO UPDATE SET count = count + excluded.count``
+(PostgreSQL and SQLite >= 3.24), one statement per batch of deltas.
+"""
+
+from collections import Counter
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any, NamedTuple
+
+from django.db import connection, transaction
+from django.db.models import Count, Sum
+from django.utils import timezone
+
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.models.enrollment_state_count import EnrollmentStateCountModel
+from domain.academic.enrollment.entities.enrollment import Enrollment
+
+_GROUP_FIELDS = ("institution_id", "academic_period_id", "class_group_id", "state")
+
+
+class StateCountKey(NamedTuple):
+    institution_id: str
+    academic_period_id: str
+    class_group_id: str
+    state: str
+
+
+@dataclass(frozen=True)
+class StateCountMismatch:
+    key: StateCountKey
+    expected: int
+    projected: int
+
+
+def _key(enrollment: Enrollment, state: str) -> StateCountKey:
+    return StateCountKey(
+        institution_id=str(enrollment.institution_id),
+        academic_period_id=str(enrollment.academic_period_id),
+        class_group_id=str(enrollment.class_group_id),
+        state=state,
+    )
+
+
+def created_deltas(enrollments: Iterable[Enrollment]) -> Counter[StateCountKey]:
+    """+1 on the initial state of every newly created enrollment."""
+    return Counter(_key(enrollment, enrollment.state.value) for enrollment in enrollments)
+
+
+def transition_deltas(enrollments: Iterable[Enrollment]) -> Counter[StateCountKey]:
+    """
+    Net delta of the pending transitions of each aggregate: -1 on the state the
+    first pending transition left, +1 on the current state. Round trips (e.g.
+    suspend then reactivate) cancel out.
+    """
+    deltas: Counter[StateCountKey] = Counter()
+    for enrollment in enrollments:
+        pending = enrollment.pending_transitions()
+        if not pending:
+            continue
+        from_state = pending[0].from_state.value
+        to_state = enrollment.state.value
+        if from_state != to_state:
+            deltas[_key(enrollment, from_state)] -= 1
+            deltas[_key(enrollment, to_state)] += 1
+    return deltas
+
+
+def apply_deltas(deltas: Mapping[StateCountKey, int]) -> None:
+    """Upsert all non-zero deltas in one statement. Must run inside the writer's transaction."""
+    rows = [(key, delta) for key, delta in deltas.items() if delta]
+    if not rows:
+        return
+
+    qn = connection.ops.quote_name
+    table = qn(EnrollmentStateCountModel._meta.db_table)
+    uuid_field = EnrollmentStateCountModel._meta.get_field("institution_id")
+    now = timezone.now()
+
+    def uuid_param(value: str) -> Any:
+        return uuid_field.get_db_prep_value(value, connection)
+
+    params: list[Any] = []
+    for key, delta in rows:
+        params.extend([
+            uuid_param(key.institution_id),
+            uuid_param(key.academic_period_id),
+            uuid_param(key.class_group_id),
+            key.state,
+            delta,
+            EnrollmentStateCountModel._meta.get_field("updated_at").get_db_prep_value(now, connection),
+        ])
+
+    columns = ", ".join(qn(name) for name in (*_GROUP_FIELDS, "count", "updated_at"))
+    conflict = ", ".join(qn(name) for name in _GROUP_FIELDS)
+    placeholders = ", ".join(["(%s, %s, %s, %s, %s, %s)"] * len(rows))
+    sql = (
+        f"INSERT INTO {table} ({columns}) VALUES {placeholders} "
+        f"ON CONFLICT ({conflict}) DO UPDATE SET "
+        f"{qn('count')} = {table}.{qn('count')} + excluded.{qn('count')}, "
+        f"{qn('updated_at')} = excluded.{qn('updated_at')}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+
+
+def _expected_counts() -> dict[StateCountKey, int]:
+    return {
+        StateCountKey(str(institution_id), str(academic_period_id), str(class_group_id), state): total
+        for institution_id, academic_period_id, class_group_id, state, total in (
+            EnrollmentModel.objects.values(*_GROUP_FIELDS)
+            .annotate(total=Count("id"))
+            .order_by()
+            .values_list(*_GROUP_FIELDS, "total")
+        )
+    }
+
+
+def rebuild() -> int:
+    """
+    Recompute the projection from `enrollments` from scratch; returns the number of counters.
+
+    The counts are read inside the transaction that replaces them. On PostgreSQL
+    the counts table is locked first (EXCLUSIVE blocks the writers' upserts but
+    not reads): writers that already applied their deltas commit before the
+    lock is granted and are seen by the aggregate query, and writers that have
+    not yet wait and apply theirs on top of the rebuilt counters.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                table = connection.ops.quote_name(EnrollmentStateCountModel._meta.db_table)
+                cursor.execute(f"LOCK TABLE {table} IN EXCLUSIVE MODE")
+        expected = _expected_counts()
+        EnrollmentStateCountModel.objects.all().delete()
+        EnrollmentStateCountModel.objects.bulk_create(
+            [
+                EnrollmentStateCountModel(**key._asdict(), count=total, updated_at=now)
+                for key, total in expected.items()
+            ],
+            batch_size=1000,
+        )
+    return len(expected)
+
+
+def verify() -> list[StateCountMismatch]:
+    """Diff the projection against `enrollments`; an empty list means they agree."""
+    expected = _expected_counts()
+    projected = {
+        StateCountKey(str(institution_id), str(academic_period_id), str(class_group_id), state): total
+        for institution_id, academic_period_id, class_group_id, state, total in (
+            EnrollmentStateCountModel.objects.values_list(*_GROUP_FIELDS, "count")
+        )
+    }
+
+    return [
+        StateCountMismatch(key=key, expected=expected.get(key, 0), projected=projected.get(key, 0))
+        for key in sorted(expected.keys() | projected.keys())
+        if expected.get(key, 0) != projected.get(key, 0)
+    ]
+
+
+def count_by_state(
+        *,
+        institution_id: str,
+        academic_period_id: str | None = None,
+        class_group_id: str | None = None,
+) -> dict[str, int]:
+    """
+    Enrollment counts per state for an institution, optionally narrowed to a
+    period and class group. Reads only the projection rows of that scope.
+    """
+    rows = EnrollmentStateCountModel.objects.filter(institution_id=institution_id)
+    if academic_period_id is not None:
+        rows = rows.filter(academic_period_id=academic_period_id)
+    if class_group_id is not None:
+        rows = rows.filter(class_group_id=class_group_id)
+
+    return {
+        state: total
+        for state, total in rows.values("state").annotate(total=Sum("count")).order_by("state").values_list(
+            "state", "total"
+        )
+        if total
+    }
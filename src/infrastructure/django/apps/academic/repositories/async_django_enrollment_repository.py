@@ -0,0 +1,47 @@
+from asgiref.sync import sync_to_async
+
+from application.academic.enrollment.ports.async_enrollment_repository import (
+    AsyncEnrollmentRepository,
+)
+from apps.academic.mappers.rehydration_sampler import RehydrationSampler
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.repositories.django_enrollment_repository import (
+    DjangoEnrollmentRepository,
+    from_joined_rows,
+    joined_rows,
+)
+from domain.academic.enrollment.entities.enrollment import Enrollment
+
+
+class AsyncDjangoEnrollmentRepository(AsyncEnrollmentRepository):
+    """
+        Django implementation of the AsyncEnrollmentRepository port, on top of
+        DjangoEnrollmentRepository (`sync`, also usable for the batch operations).
+
+        - get_by_id runs the same single joined query through the async ORM
+          and rebuilds the aggregate with the same trusted rehydration
+        - save/create run the sync methods through sync_to_async: they need
+          transaction.atomic(), which Django only offers to sync code
+
+        Both go through asgiref's thread-sensitive executor, as every async ORM
+        query does in Django 5.2, so the event loop never blocks on the
+        database, and these calls share one connection with the rest of the
+        async ORM work in the request.
+
+        Histories are always loaded eagerly: a LazyHistory would query from sync
+        code on its first read, which Django rejects inside an event loop.
+    """
+
+    def __init__(self, *, rehydration_sampler: RehydrationSampler | None = None) -> None:
+        self.sync = DjangoEnrollmentRepository(rehydration_sampler=rehydration_sampler)
+
+    async def get_by_id(self, enrollment_id: str) -> Enrollment | None:
+        snapshots = EnrollmentModel.objects.filter(id=enrollment_id)
+        rows = [row async for row in joined_rows(snapshots)]
+        return from_joined_rows(rows, sampler=self.sync.rehydration_sampler)
+
+    async def save(self, enrollment: Enrollment) -> int:
+        return await sync_to_async(self.sync.save)(enrollment)
+
+    async def create(self, enrollment: Enrollment) -> int:
+        return await sync_to_async(self.sync.create)(enrollment)
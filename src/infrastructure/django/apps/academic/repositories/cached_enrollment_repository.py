@@ -0,0 +1,188 @@
+import threading
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from functools import partial
+
+from django.db import transaction
+
+from application.academic.enrollment.errors.persistence_errors import (
+    ApplicationPersistenceError,
+    ConcurrencyConflictError,
+)
+from application.academic.enrollment.ports.enrollment_repository import EnrollmentRepository
+from apps.academic.mappers.enrollment_mapper import EnrollmentMapper
+from apps.academic.mappers.rehydration_sampler import RehydrationSampler, default_sampler
+from apps.academic.repositories.enrollment_cache import CachedEnrollment, EnrollmentCacheBackend
+from domain.academic.enrollment.entities.enrollment import Enrollment
+
+
+@dataclass(frozen=True)
+class EnrollmentCacheStats:
+    hits: int
+    misses: int
+    invalidations: int
+    evictions: int
+
+
+class CachedEnrollmentRepository(EnrollmentRepository):
+    """
+        Read-through cache decorator over any EnrollmentRepository.
+
+        Responsible for:
+        - serving get_by_id/get_many from cached snapshot + transition rows keyed by id
+        - filling the cache on misses with the version read from the inner repository
+        - replacing entries with the newly persisted version after save/save_many/create
+        - invalidating entries whose persisted state is unknown after a failed write
+
+        Inside an atomic block nothing read or written is committed yet, so
+        entries are stored through `transaction.on_commit`, and a write drops
+        the current entry right away: a rollback leaves the cache without the
+        entry instead of with a state the database never had.
+
+        Every read returns a freshly rebuilt aggregate, so callers never share
+        mutable state through the cache. Entries carry their persisted version and
+        backends never replace an entry with an older one; after a concurrency
+        conflict a tombstone at the persisted version blocks stale fills until
+        the newer state is read back; a tombstone replaces any entry, whatever
+        its version.
+
+        Cached rows were flattened from aggregates, so hits are rebuilt through the
+        trusted rehydration path, sampled by `rehydration_sampler`.
+    """
+
+    def __init__(
+            self,
+            inner: EnrollmentRepository,
+            backend: EnrollmentCacheBackend,
+            *,
+            rehydration_sampler: RehydrationSampler | None = None,
+    ) -> None:
+        self.inner = inner
+        self.backend = backend
+        self.rehydration_sampler = rehydration_sampler or default_sampler
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def stats(self) -> EnrollmentCacheStats:
+        return EnrollmentCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            invalidations=self._invalidations,
+            evictions=getattr(self.backend, "evictions", 0),
+        )
+
+    def get_by_id(self, enrollment_id: str) -> Enrollment | None:
+        cached = self._cached(enrollment_id)
+        if cached is not None:
+            return cached
+
+        enrollment = self.inner.get_by_id(enrollment_id)
+        if enrollment is not None:
+            self._put(enrollment_id, self._entry(enrollment, version=enrollment.version))
+        return enrollment
+
+    def get_many(self, enrollment_ids: Iterable[str]) -> dict[str, Enrollment | None]:
+        result: dict[str, Enrollment | None] = {}
+        missing: list[str] = []
+
+        for enrollment_id in dict.fromkeys(enrollment_ids):
+            cached = self._cached(enrollment_id)
+            result[enrollment_id] = cached
+            if cached is None:
+                missing.append(enrollment_id)
+
+        if missing:
+            for enrollment_id, enrollment in self.inner.get_many(missing).items():
+                result[enrollment_id] = enrollment
+                if enrollment is not None:
+                    self._put(enrollment_id, self._entry(enrollment, version=enrollment.version))
+        return result
+
+    def find_ids_by_class_group(self, *, class_group_id: str, academic_period_id: str) -> list[str]:
+        return self.inner.find_ids_by_class_group(
+            class_group_id=class_group_id,
+            academic_period_id=academic_period_id,
+        )
+
+    def save(self, enrollment: Enrollment) -> int:
+        try:
+            new_version = self.inner.save(enrollment)
+        except ApplicationPersistenceError as e:
+            self._invalidate(enrollment.id, e)
+            raise
+
+        self._put(enrollment.id, self._entry(enrollment, version=new_version), written=True)
+        return new_version
+
+    def save_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        try:
+            outcomes = self.inner.save_many(enrollments)
+        except ApplicationPersistenceError as e:
+            for enrollment in enrollments:
+                self._invalidate(enrollment.id, e)
+            raise
+
+        for enrollment in enrollments:
+            outcome = outcomes[enrollment.id]
+            if isinstance(outcome, ApplicationPersistenceError):
+                self._invalidate(enrollment.id, outcome)
+            else:
+                self._put(enrollment.id, self._entry(enrollment, version=outcome), written=True)
+        return outcomes
+
+    def create(self, enrollment: Enrollment) -> int:
+        version = self.inner.create(enrollment)
+        self._put(enrollment.id, self._entry(enrollment, version=version), written=True)
+        return version
+
+    def create_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        outcomes = self.inner.create_many(enrollments)
+        for enrollment in enrollments:
+            outcome = outcomes[enrollment.id]
+            if not isinstance(outcome, ApplicationPersistenceError):
+                self._put(enrollment.id, self._entry(enrollment, version=outcome), written=True)
+        return outcomes
+
+    def _put(self, enrollment_id: str, entry: CachedEnrollment, *, written: bool = False) -> None:
+        if not transaction.get_connection().in_atomic_block:
+            self.backend.put(enrollment_id, entry)
+            return
+
+        if written:
+            self.backend.delete(enrollment_id)
+        transaction.on_commit(partial(self.backend.put, enrollment_id, entry))
+
+    def _cached(self, enrollment_id: str) -> Enrollment | None:
+        entry = self.backend.get(enrollment_id)
+        with self._lock:
+            if entry is None or entry.is_tombstone:
+                self._misses += 1
+                return None
+            self._hits += 1
+
+        return EnrollmentMapper.to_domain_from_rows(
+            snapshot_row=entry.snapshot_row or (),
+            transition_rows=entry.transition_rows,
+            sampler=self.rehydration_sampler,
+        )
+
+    def _invalidate(self, enrollment_id: str, error: ApplicationPersistenceError) -> None:
+        with self._lock:
+            self._invalidations += 1
+
+        persisted_version = (error.details or {}).get("persisted_version")
+        if isinstance(error, ConcurrencyConflictError) and isinstance(persisted_version, int):
+            self.backend.put(enrollment_id, CachedEnrollment(version=persisted_version, snapshot_row=None))
+        else:
+            self.backend.delete(enrollment_id)
+
+    @staticmethod
+    def _entry(enrollment: Enrollment, *, version: int) -> CachedEnrollment:
+        return CachedEnrollment(
+            version=version,
+            snapshot_row=EnrollmentMapper.to_snapshot_row(enrollment=enrollment, version=version),
+            transition_rows=tuple(EnrollmentMapper.to_transition_row(t) for t in enrollment.transitions),
+        )
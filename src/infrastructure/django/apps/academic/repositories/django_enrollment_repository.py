@@ -1,19 +1,102 @@
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
 from datetime import UTC, datetime
+from enum import StrEnum
+from functools import reduce
+from operator import or_
+from typing import Any
 
-from django.db import DatabaseError, IntegrityError, transaction
+from django.core.exceptions import ValidationError
+from django.db import DatabaseError, IntegrityError, connection, transaction
+from django.db.models import Case, DateTimeField, F, IntegerField, Q, QuerySet, Value, When
+from django.db.transaction import TransactionManagementError
 
 from application.academic.enrollment.dto.errors.error_codes import ErrorCodes
 from application.academic.enrollment.errors.persistence_errors import (
+    ApplicationPersistenceError,
     ConcurrencyConflictError,
     EnrollmentDuplicationError,
     EnrollmentPersistenceNotFoundError,
     EnrollmentTechnicalPersistenceError,
 )
 from application.academic.enrollment.ports.enrollment_repository import EnrollmentRepository
-from apps.academic.mappers.enrollment_mapper import EnrollmentMapper
+from apps.academic.mappers.enrollment_mapper import (
+    SNAPSHOT_FIELDS,
+    TRANSITION_FIELDS,
+    EnrollmentMapper,
+)
+from apps.academic.mappers.outbox_mapper import OutboxMapper
+from apps.academic.mappers.rehydration_sampler import RehydrationSampler, default_sampler
 from apps.academic.models.enrollment_model import EnrollmentModel
 from apps.academic.models.enrollment_transition import EnrollmentTransitionModel
+from apps.academic.models.outbox_event import OutboxEventModel
+from apps.academic.read_models import enrollment_state_counts
 from domain.academic.enrollment.entities.enrollment import Enrollment
+from domain.academic.enrollment.value_objects.state_transition import StateTransition
+
+ENROLLMENT_AGGREGATE_TYPE = "enrollment"
+
+# Identity and business key (unique_enrollment) of a snapshot, id first
+_KEY_FIELDS = ("id", "institution_id", "student_id", "class_group_id", "academic_period_id")
+_INSERT_BATCH_SIZE = 1000
+
+
+class _SaveOutcome(StrEnum):
+    """How a version-guarded save resolved, before it is turned into a result or error."""
+    UPDATED = "updated"
+    REPLAYED = "replayed"
+    CONFLICT = "conflict"
+    NOT_FOUND = "not_found"
+
+
+class LockingMode(StrEnum):
+    """
+    How get_by_id guards the load -> command -> save cycle against concurrent writers.
+
+    - OPTIMISTIC: plain reads; save() detects a lost race as a version conflict
+    - FOR_UPDATE: the snapshot row is read with SELECT ... FOR UPDATE
+    - ADVISORY: a transaction-scoped PostgreSQL advisory lock keyed by the
+      enrollment id is taken before the read (FOR_UPDATE on other backends)
+
+    The pessimistic modes hold the lock until the surrounding transaction ends,
+    so they must be used inside one (TransactionManager.atomic() in the services).
+    """
+    OPTIMISTIC = "optimistic"
+    FOR_UPDATE = "for_update"
+    ADVISORY = "advisory"
+
+
+# Transition columns reached from the snapshot through the reverse FK (LEFT OUTER JOIN).
+_JOINED_TRANSITION_FIELDS = tuple(f"transitions__{name}" for name in TRANSITION_FIELDS)
+
+
+def joined_rows(snapshots: QuerySet[EnrollmentModel]) -> QuerySet[EnrollmentModel, tuple[Any, ...]]:
+    """
+    The single-query load of get_by_id: one row per transition of the selected
+    snapshot (or one row with NULL transition columns when there is no history),
+    in history order. Shared with AsyncDjangoEnrollmentRepository, which
+    iterates it with the async ORM; rebuild the aggregate with from_joined_rows.
+    """
+    return (
+        snapshots
+        .order_by("transitions__occurred_at", "transitions__id")
+        .values_list(*SNAPSHOT_FIELDS, *_JOINED_TRANSITION_FIELDS)
+    )
+
+
+def from_joined_rows(rows: Sequence[tuple[Any, ...]], *, sampler: RehydrationSampler) -> Enrollment | None:
+    """Rebuild the aggregate from the rows of joined_rows; None when there are none (no snapshot)."""
+    if not rows:
+        return None
+
+    split = len(SNAPSHOT_FIELDS)
+    transition_rows = [row[split:] for row in rows if row[split] is not None]
+
+    return EnrollmentMapper.to_domain_from_rows(
+        snapshot_row=rows[0][:split],
+        transition_rows=transition_rows,
+        sampler=sampler,
+    )
 
 
 class DjangoEnrollmentRepository(EnrollmentRepository):
@@ -22,33 +105,168 @@ class DjangoEnrollmentRepository(EnrollmentRepository):
 
         Responsible for:
         - loading an Enrollment aggregate from snapshot + transitions
+        - loading many aggregates with a constant number of queries per chunk
         - persisting snapshot updates with optimistic concurrency control
-        - ensure that persists the latest transition in the same transaction.
+        - persisting many snapshot updates with one bulk UPDATE per batch
+        - ensure that persists every pending transition in the same transaction.
+        - recording pending domain events in the outbox in that same transaction.
+        - keeping the enrollment state counts read model in step, also in that transaction.
+
+        Loaded rows are rebuilt through the trusted rehydration path; `rehydration_sampler`
+        decides which ones still get full domain validation (process-wide default).
+
+        With `lazy_history=True` reads fetch the snapshot only: `enrollment.transitions`
+        is a LazyHistory that queries the stored transitions the first time it is
+        read. State-change commands and save() never read it, so their cost no
+        longer grows with the history length; code that iterates the history of
+        many aggregates pays one query each and should keep the eager default
+        (as does a CachedEnrollmentRepository wrapper, whose entries hold the full
+        history and therefore read it on every fill).
+
+        `locking` (LockingMode) makes get_by_id lock the enrollment for the rest of
+        the caller's transaction, for hot aggregates whose optimistic conflicts
+        turn into retry storms: concurrent commands queue on the lock instead of
+        failing at save(). save() keeps its version check either way. get_many and
+        the bulk path stay optimistic, and a cached wrapper must not be put in
+        front of a locking repository (a cache hit would skip the lock).
     """
 
+    # Ids per IN (...) query; keeps SQLite under its bound-parameter limit.
+    get_many_chunk_size: int = 500
+    # PostgreSQL: save() in one CTE statement; False forces the portable ORM path.
+    use_returning_save: bool = True
+
+    def __init__(
+            self,
+            *,
+            rehydration_sampler: RehydrationSampler | None = None,
+            lazy_history: bool = False,
+            locking: LockingMode = LockingMode.OPTIMISTIC,
+    ) -> None:
+        self.rehydration_sampler = rehydration_sampler or default_sampler
+        self.lazy_history = lazy_history
+        self.locking = locking
+
+    @staticmethod
+    def _transition_rows_loader(enrollment_id: Any) -> Callable[[], list[tuple[Any, ...]]]:
+        def load() -> list[tuple[Any, ...]]:
+            return list(
+                EnrollmentTransitionModel.objects.filter(enrollment_id=enrollment_id)
+                .order_by("occurred_at", "id")
+                .values_list(*TRANSITION_FIELDS)
+            )
+        return load
+
+    def _with_lazy_history(self, snapshot_row: Sequence[Any]) -> Enrollment:
+        return EnrollmentMapper.to_domain_with_lazy_history(
+            snapshot_row=snapshot_row,
+            load_transition_rows=self._transition_rows_loader(snapshot_row[0]),
+            sampler=self.rehydration_sampler,
+        )
+
+    def _for_load(self, enrollment_id: str) -> QuerySet[EnrollmentModel]:
+        """The snapshot queryset of get_by_id, with the configured lock applied."""
+        snapshots = EnrollmentModel.objects.filter(id=enrollment_id)
+        if self.locking is LockingMode.OPTIMISTIC:
+            return snapshots
+        if not connection.in_atomic_block:
+            raise TransactionManagementError(
+                f"Loading with locking={self.locking.value} must run inside a transaction."
+            )
+        if self.locking is LockingMode.ADVISORY and connection.vendor == "postgresql":
+            key = f"{ENROLLMENT_AGGREGATE_TYPE}:{EnrollmentModel._meta.pk.to_python(enrollment_id)}"
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_xact_lock(hashtextextended(%s, 0))", [key])
+            return snapshots
+        # of=self: only the snapshot row; the transitions are on the nullable side of the join
+        return snapshots.select_for_update(of=("self",))
+
     def get_by_id(self, enrollment_id: str) -> Enrollment | None:
         """
-        Load the enrollment snapshot and its transitions, then reconstruct
-        the aggregate.
+        Load the enrollment snapshot and its transitions in a single round trip,
+        then reconstruct the aggregate.
+
+        The snapshot is LEFT JOINed with its transitions (ordered by occurred_at),
+        so the database returns one row per transition (or a single row with NULL
+        transition columns when there is no history). Raw rows are mapped straight
+        to domain objects; no ORM instances are built.
 
         Returns:
             Enrollment | None:
                 - None only when the snapshot does not exist
                 - Enrollment aggregate otherwise
 
+        With a pessimistic `locking` mode the enrollment stays locked until the
+        surrounding transaction ends.
+
         Raises:
+            TransactionManagementError: a pessimistic `locking` mode outside a transaction.
             Any mapper/persistence inconsistency exception is allowed to propagate.
         """
-        snapshot = EnrollmentModel.objects.filter(id=enrollment_id).first()
+        snapshots = self._for_load(enrollment_id)
+        if self.lazy_history:
+            snapshot_row = snapshots.values_list(*SNAPSHOT_FIELDS).first()
+            return None if snapshot_row is None else self._with_lazy_history(snapshot_row)
 
-        if snapshot is None:
-            return None
+        return from_joined_rows(list(joined_rows(snapshots)), sampler=self.rehydration_sampler)
 
-        transitions_list = list(
-            EnrollmentTransitionModel.objects.filter(enrollment=snapshot).order_by("occurred_at")
-        )
+    def get_many(self, enrollment_ids: Iterable[str]) -> dict[str, Enrollment | None]:
+        """
+        Load many aggregates in chunks of `get_many_chunk_size` ids.
+
+        Each chunk costs two queries regardless of history length: one IN query
+        for the snapshots and one IN query for their transitions, ordered by
+        (enrollment, occurred_at) so they can be grouped per enrollment in a
+        single pass.
 
-        return EnrollmentMapper.to_domain(snapshot=snapshot, transitions=transitions_list)
+        Returns:
+            dict[str, Enrollment | None]: one entry per distinct requested id;
+            ids without a snapshot map to None.
+        """
+        requested = list(dict.fromkeys(enrollment_ids))
+        result: dict[str, Enrollment | None] = dict.fromkeys(requested)
+
+        for start in range(0, len(requested), self.get_many_chunk_size):
+            chunk = requested[start:start + self.get_many_chunk_size]
+
+            snapshot_rows = list(EnrollmentModel.objects.filter(id__in=chunk).values_list(*SNAPSHOT_FIELDS))
+            if not snapshot_rows:
+                continue
+
+            if self.lazy_history:
+                for snapshot_row in snapshot_rows:
+                    result[str(snapshot_row[0])] = self._with_lazy_history(snapshot_row)
+                continue
+
+            transitions_by_enrollment: defaultdict[Any, list[tuple[Any, ...]]] = defaultdict(list)
+            transition_rows = (
+                EnrollmentTransitionModel.objects.filter(enrollment_id__in=[row[0] for row in snapshot_rows])
+                .order_by("enrollment_id", "occurred_at", "id")
+                .values_list("enrollment_id", *TRANSITION_FIELDS)
+            )
+            for row in transition_rows:
+                transitions_by_enrollment[row[0]].append(row[1:])
+
+            for snapshot_row in snapshot_rows:
+                result[str(snapshot_row[0])] = EnrollmentMapper.to_domain_from_rows(
+                    snapshot_row=snapshot_row,
+                    transition_rows=transitions_by_enrollment.get(snapshot_row[0], ()),
+                    sampler=self.rehydration_sampler,
+                )
+
+        return result
+
+    def find_ids_by_class_group(self, *, class_group_id: str, academic_period_id: str) -> list[str]:
+        """Return the enrollment ids of a class group in an academic period, ordered by id."""
+        return [
+            str(enrollment_id)
+            for enrollment_id in EnrollmentModel.objects.filter(
+                class_group_id=class_group_id,
+                academic_period_id=academic_period_id,
+            )
+            .order_by("id")
+            .values_list("id", flat=True)
+        ]
 
     @staticmethod
     def _is_same_persisted_snapshot(
@@ -70,6 +288,83 @@ class DjangoEnrollmentRepository(EnrollmentRepository):
             and snapshot.version == version
         )
 
+    @staticmethod
+    def _version_conflict_error(*, enrollment: Enrollment, persisted_version: int) -> ConcurrencyConflictError:
+        return ConcurrencyConflictError(
+            code="version_mismatch",
+            message="The enrollment exists, but its persisted version \
+                                  does not match the aggregate origin version.",
+            details={
+                "aggregate_id": enrollment.id,
+                "expected_version": enrollment.version,
+                "persisted_version": persisted_version,
+                }
+        )
+
+    @staticmethod
+    def _not_found_error(*, enrollment: Enrollment) -> EnrollmentPersistenceNotFoundError:
+        return EnrollmentPersistenceNotFoundError(
+            code="enrollment_not_found",
+            message="The enrollment snapshot was not found for persistence update.",
+            details={
+                        "enrollment_id": enrollment.id,
+                        "origin_version": enrollment.version,
+                        "attempted_new_version": enrollment.version + 1,
+                    }
+        )
+
+    @staticmethod
+    def _missing_transitions_error(*, enrollment: Enrollment) -> EnrollmentTechnicalPersistenceError:
+        return EnrollmentTechnicalPersistenceError(
+            code=ErrorCodes.MISSING_TRANSITIONS,
+            message="No transitions to persist for the enrollment.",
+            details={"enrollment_id": enrollment.id},
+        )
+
+    @staticmethod
+    def _pending_transition_models(
+        enrollment: Enrollment,
+        pending_transitions: list[StateTransition],
+    ) -> list[EnrollmentTransitionModel]:
+        return [
+            EnrollmentMapper.to_transition(state_transition=transition, enrollment_id=enrollment.id)
+            for transition in pending_transitions
+        ]
+
+    @staticmethod
+    def _write_outbox(persisted: list[tuple[Enrollment, int]]) -> None:
+        """
+        Record the pending domain events of each (aggregate, persisted version)
+        pair in the outbox (ADR 016).
+        Must run inside the transaction that persists the aggregates. Events
+        already recorded (same event_id) are skipped, so replays never duplicate them.
+        """
+        outbox_events = [
+            outbox_event
+            for enrollment, version in persisted
+            for outbox_event in OutboxMapper.to_outbox_events(
+                events=enrollment.peek_domain_events(),
+                aggregate_type=ENROLLMENT_AGGREGATE_TYPE,
+                aggregate_version=version,
+            )
+        ]
+        if outbox_events:
+            OutboxEventModel.objects.bulk_create(outbox_events, ignore_conflicts=True)
+
+    @staticmethod
+    def _mark_persisted_on_commit(persisted: list[tuple[Enrollment, int]]) -> None:
+        """
+        Advance each (aggregate, persisted version) pair past its saved
+        transitions once the outermost transaction commits; a rollback keeps
+        them pending.
+        """
+        def mark() -> None:
+            for enrollment, version in persisted:
+                enrollment.mark_persisted(version=version)
+
+        if persisted:
+            transaction.on_commit(mark)
+
     def save(self, enrollment: Enrollment) -> int:
         """
         Persist an existing Enrollment aggregate using optimistic concurrency control.
@@ -77,8 +372,20 @@ class DjangoEnrollmentRepository(EnrollmentRepository):
         Semantics:
         - Uses enrollment.version as the origin version.
         - Updates the snapshot only if (id, version) still matches in persistence.
-        - Persists the latest transition in the same transaction.
+        - Persists every pending transition (recorded since rehydration) with one
+          batched insert in the same transaction.
+        - Records the pending domain events in the outbox and applies the net
+          state delta to the state counts read model in the same transaction.
         - Returns the newly persisted version.
+        - Marks the aggregate persisted (pending transitions cleared, version
+          advanced) when the transaction commits. A failed save leaves it
+          untouched, so its retry is detected as a replay (last pending
+          transition_id already stored).
+
+        On PostgreSQL the snapshot UPDATE, the transitions INSERT and the
+        classification of a missed UPDATE run as one CTE statement
+        (`use_returning_save`); other backends use the portable ORM path, which
+        needs two statements on success and up to three on a conflict.
 
         Args:
             enrollment: Enrollment aggregate to be persisted.
@@ -93,96 +400,35 @@ class DjangoEnrollmentRepository(EnrollmentRepository):
             If the snapshot exists but the persisted version differs from
             the aggregate origin version.
             EnrollmentTechnicalPersistenceError:
-            For integrity, database-level technical failures or missing  transitions list.
+            For integrity, database-level technical failures or no pending transitions.
         """
-        # Extracting aggregate metadata for persistence logic
-        origin_id = enrollment.id
-        origin_version = enrollment.version
-
-        state = enrollment.state.value
-        concluded_at = enrollment.concluded_at
-        cancelled_at = enrollment.cancelled_at
-        suspended_at = enrollment.suspended_at
-        reactivated_at = enrollment.reactivated_at
-
-        new_version = origin_version + 1
+        new_version = enrollment.version + 1
         now = datetime.now(UTC)
 
-        if not enrollment.transitions:
-            raise EnrollmentTechnicalPersistenceError(
-                code=ErrorCodes.MISSING_TRANSITIONS,
-                message="No transitions to persist for the enrollment.",
-                details={"enrollment_id": enrollment.id},
-            )
+        pending_transitions = enrollment.pending_transitions()
+        if not pending_transitions:
+            raise self._missing_transitions_error(enrollment=enrollment)
         try:
             # Atomic block to ensure Snapshot and Transition are persisted together
             with transaction.atomic():
-                updated_rows = EnrollmentModel.objects.filter(id=origin_id, version=origin_version).update(
-                    state=state,
-                    concluded_at=concluded_at,
-                    cancelled_at=cancelled_at,
-                    suspended_at=suspended_at,
-                    reactivated_at=reactivated_at,
-                    version=new_version,
-                    updated_at=now
-                )
-
-                # Handle cases where no rows were updated (Conflict or Not Found)
-                if updated_rows == 0:
-                    persisted_snapshot = EnrollmentModel.objects.filter(id=origin_id).first()
-
-                    if persisted_snapshot is not None:
-                        persisted_transition = EnrollmentMapper.to_transition(
-                            state_transition=enrollment.transitions[-1],
-                            enrollment_id=origin_id,
-                        )
-
-                        if (
-                            EnrollmentTransitionModel.objects.filter(
-                                transition_id=persisted_transition.transition_id
-                            ).exists()
-                            and self._is_same_persisted_snapshot(
-                                snapshot=persisted_snapshot,
-                                state=state,
-                                concluded_at=concluded_at,
-                                cancelled_at=cancelled_at,
-                                suspended_at=suspended_at,
-                                reactivated_at=reactivated_at,
-                                version=new_version,
-                            )
-                        ):
-                            return new_version
-
-                        # Raise conflict error if the version in the DB is different
-                        raise ConcurrencyConflictError(
-                            code="version_mismatch",
-                            message="The enrollment exists, but its persisted version \
-                                  does not match the aggregate origin version.",
-                            details={
-                                "aggregate_id": enrollment.id,
-                                "expected_version": enrollment.version,
-                                "persisted_version": persisted_snapshot.version,
-                                }
-                        )
-                    else:
-                        raise EnrollmentPersistenceNotFoundError(
-                            code="enrollment_not_found",
-                            message="The enrollment snapshot was not found for persistence update.",
-                            details={
-                                        "enrollment_id": origin_id,
-                                        "origin_version": origin_version,
-                                        "attempted_new_version": new_version,
-                                    }
-                        )
+                if connection.vendor == "postgresql" and self.use_returning_save:
+                    outcome, persisted_version = self._save_returning(enrollment, pending_transitions, now)
                 else:
-                    
-                    # Successful update: Persist the latest transition
-                    EnrollmentMapper.to_transition(
-                        state_transition=enrollment.transitions[-1],
-                        enrollment_id=origin_id
-                    ).save()
+                    outcome, persisted_version = self._save_portable(enrollment, pending_transitions, now)
+
+                if outcome is _SaveOutcome.UPDATED:
+                    enrollment_state_counts.apply_deltas(enrollment_state_counts.transition_deltas([enrollment]))
+                    self._write_outbox([(enrollment, new_version)])
+                    self._mark_persisted_on_commit([(enrollment, new_version)])
                     return new_version
-        
+                if outcome is _SaveOutcome.REPLAYED:
+                    self._mark_persisted_on_commit([(enrollment, new_version)])
+                    return new_version
+                if outcome is _SaveOutcome.NOT_FOUND:
+                    raise self._not_found_error(enrollment=enrollment)
+                # Raise conflict error if the version in the DB is different
+                raise self._version_conflict_error(enrollment=enrollment, persisted_version=persisted_version)
+
         except (EnrollmentPersistenceNotFoundError, ConcurrencyConflictError):
             raise
 
@@ -193,6 +439,360 @@ class DjangoEnrollmentRepository(EnrollmentRepository):
                 details={"error": str(e)}
             ) from e
 
+    def _save_portable(
+            self,
+            enrollment: Enrollment,
+            pending_transitions: list[StateTransition],
+            now: datetime,
+    ) -> tuple[_SaveOutcome, int | None]:
+        """
+        Portable compare-and-set: version-guarded UPDATE, then either the
+        transitions INSERT or the follow-up reads that classify a missed UPDATE.
+        """
+        origin_id = enrollment.id
+        new_version = enrollment.version + 1
+        state = enrollment.state.value
+
+        updated_rows = EnrollmentModel.objects.filter(id=origin_id, version=enrollment.version).update(
+            state=state,
+            concluded_at=enrollment.concluded_at,
+            cancelled_at=enrollment.cancelled_at,
+            suspended_at=enrollment.suspended_at,
+            reactivated_at=enrollment.reactivated_at,
+            version=new_version,
+            updated_at=now
+        )
+        if updated_rows:
+            # Successful update: Persist every pending transition in one INSERT
+            EnrollmentTransitionModel.objects.bulk_create(
+                self._pending_transition_models(enrollment, pending_transitions)
+            )
+            return _SaveOutcome.UPDATED, new_version
+
+        # No rows were updated: Conflict, Not Found or a replay of this same save
+        persisted_snapshot = EnrollmentModel.objects.filter(id=origin_id).first()
+        if persisted_snapshot is None:
+            return _SaveOutcome.NOT_FOUND, None
+
+        persisted_transition = EnrollmentMapper.to_transition(
+            state_transition=pending_transitions[-1],
+            enrollment_id=origin_id,
+        )
+        if (
+            EnrollmentTransitionModel.objects.filter(transition_id=persisted_transition.transition_id).exists()
+            and self._is_same_persisted_snapshot(
+                snapshot=persisted_snapshot,
+                state=state,
+                concluded_at=enrollment.concluded_at,
+                cancelled_at=enrollment.cancelled_at,
+                suspended_at=enrollment.suspended_at,
+                reactivated_at=enrollment.reactivated_at,
+                version=new_version,
+            )
+        ):
+            return _SaveOutcome.REPLAYED, new_version
+        return _SaveOutcome.CONFLICT, persisted_snapshot.version
+
+    def _save_returning(
+            self,
+            enrollment: Enrollment,
+            pending_transitions: list[StateTransition],
+            now: datetime,
+    ) -> tuple[_SaveOutcome, int | None]:
+        """
+        PostgreSQL: one statement does what _save_portable needs up to four for.
+
+        - `upd` updates the snapshot guarded by (id, version)
+        - `ins` inserts the pending transitions only if `upd` applied,
+          ON CONFLICT (transition_id) DO NOTHING
+        - the outer SELECT reads the snapshot as it was before the statement
+          and returns the outcome discriminator plus the persisted version
+
+        Every part sees the same snapshot, so the row lock taken by `upd` is
+        held for one round trip instead of several.
+        """
+        models = self._pending_transition_models(enrollment, pending_transitions)
+        qn = connection.ops.quote_name
+        enrollments_table = qn(EnrollmentModel._meta.db_table)
+        transitions_table = qn(EnrollmentTransitionModel._meta.db_table)
+        new_version = enrollment.version + 1
+        lifecycle = (
+            enrollment.concluded_at,
+            enrollment.cancelled_at,
+            enrollment.suspended_at,
+            enrollment.reactivated_at,
+        )
+
+        # INSERT ... SELECT does not infer parameter types from the target columns
+        insert_fields = [f for f in EnrollmentTransitionModel._meta.concrete_fields if not f.primary_key]
+        row_sql = "SELECT " + ", ".join(f"%s::{f.cast_db_type(connection)}" for f in insert_fields)
+        try:
+            insert_params = [
+                f.get_db_prep_save(getattr(model, f.attname), connection)
+                for model in models
+                for f in insert_fields
+            ]
+        except ValidationError:
+            # Values the ORM cannot prepare only fail the portable path once it
+            # actually inserts them; let it decide so both paths report the same.
+            return self._save_portable(enrollment, pending_transitions, now)
+
+        sql = (
+            "WITH upd AS ("
+            f"UPDATE {enrollments_table} SET state = %s, concluded_at = %s, cancelled_at = %s, "
+            "suspended_at = %s, reactivated_at = %s, version = %s, updated_at = %s "
+            "WHERE id = %s AND version = %s RETURNING version"
+            "), ins AS ("
+            f"INSERT INTO {transitions_table} ({', '.join(qn(f.column) for f in insert_fields)}) "
+            f"SELECT * FROM ({' UNION ALL '.join([row_sql] * len(models))}) AS pending "
+            "WHERE EXISTS (SELECT 1 FROM upd) "
+            "ON CONFLICT (transition_id) DO NOTHING RETURNING 1"
+            ") "
+            "SELECT CASE "
+            f"WHEN EXISTS (SELECT 1 FROM upd) THEN '{_SaveOutcome.UPDATED}' "
+            f"WHEN cur.id IS NULL THEN '{_SaveOutcome.NOT_FOUND}' "
+            "WHEN cur.version = %s AND cur.state = %s "
+            "AND cur.concluded_at IS NOT DISTINCT FROM %s::timestamptz "
+            "AND cur.cancelled_at IS NOT DISTINCT FROM %s::timestamptz "
+            "AND cur.suspended_at IS NOT DISTINCT FROM %s::timestamptz "
+            "AND cur.reactivated_at IS NOT DISTINCT FROM %s::timestamptz "
+            f"AND EXISTS (SELECT 1 FROM {transitions_table} WHERE transition_id = %s::uuid) "
+            f"THEN '{_SaveOutcome.REPLAYED}' "
+            f"ELSE '{_SaveOutcome.CONFLICT}' END, "
+            "COALESCE((SELECT version FROM upd), cur.version), "
+            "(SELECT count(*) FROM ins) "
+            f"FROM (SELECT 1) AS one LEFT JOIN {enrollments_table} AS cur ON cur.id = %s"
+        )
+        params = [
+            enrollment.state.value, *lifecycle, new_version, now, enrollment.id, enrollment.version,
+            *insert_params,
+            new_version, enrollment.state.value, *lifecycle, models[-1].transition_id,
+            enrollment.id,
+        ]
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            discriminator, persisted_version, inserted = cursor.fetchone()
+
+        outcome = _SaveOutcome(discriminator)
+        if outcome is _SaveOutcome.UPDATED and inserted != len(models):
+            # Snapshot advanced but a transition_id was already stored: same
+            # failure the portable path reports through the unique constraint.
+            raise IntegrityError(
+                f"enrollment {enrollment.id}: {len(models) - inserted} pending transition(s) already stored."
+            )
+        if outcome is _SaveOutcome.CONFLICT and persisted_version == enrollment.version:
+            # A concurrent writer committed after this statement took its snapshot, so
+            # the classification above used stale data: redo it with fresh statements.
+            return self._save_portable(enrollment, pending_transitions, now)
+        return outcome, persisted_version
+
+    def save_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        """
+        Persist many existing Enrollment aggregates in one transaction.
+
+        Semantics (per aggregate, as in save()):
+        - Uses enrollment.version as the origin version.
+        - Every (id, version) pair is checked by one bulk UPDATE statement.
+        - The pending transitions and domain events (outbox) of every updated
+          aggregate are inserted with one bulk_create each, and the state counts
+          read model gets one upsert for the whole batch, in the same transaction.
+        - Aggregates whose UPDATE did not apply are classified in batch: a
+          replay (transition_id already stored and snapshot already at the new
+          version) returns the new version, otherwise a conflict or not-found
+          error is reported.
+        - Aggregates saved (or replayed) are marked persisted on commit.
+
+        On PostgreSQL the UPDATE joins a VALUES list and uses RETURNING to learn
+        which rows were updated; other backends use a portable ORM fallback.
+
+        Args:
+            enrollments: aggregates to persist; ids must be distinct.
+
+        Returns:
+            dict[str, int | ApplicationPersistenceError]: per aggregate id, the
+            newly persisted version or the error save() would have raised.
+
+        Raises:
+            ValueError: If the same aggregate id appears more than once.
+            EnrollmentTechnicalPersistenceError:
+            For database-level failures; nothing from the batch is persisted.
+        """
+        outcomes: dict[str, int | ApplicationPersistenceError] = {}
+        candidates: list[Enrollment] = []
+        seen_ids: set[str] = set()
+
+        for enrollment in enrollments:
+            if enrollment.id in seen_ids:
+                raise ValueError(f"Duplicated enrollment id in save_many batch: {enrollment.id}")
+            seen_ids.add(enrollment.id)
+            if not enrollment.pending_transitions():
+                outcomes[enrollment.id] = self._missing_transitions_error(enrollment=enrollment)
+            else:
+                candidates.append(enrollment)
+
+        if not candidates:
+            return outcomes
+
+        now = datetime.now(UTC)
+        try:
+            with transaction.atomic():
+                if connection.vendor == "postgresql":
+                    updated_ids = self._bulk_update_returning(candidates, now)
+                else:
+                    updated_ids = self._bulk_update_portable(candidates, now)
+
+                updated = [e for e in candidates if e.id in updated_ids]
+                if updated:
+                    EnrollmentTransitionModel.objects.bulk_create([
+                        model
+                        for e in updated
+                        for model in self._pending_transition_models(e, e.pending_transitions())
+                    ])
+                    enrollment_state_counts.apply_deltas(enrollment_state_counts.transition_deltas(updated))
+                    self._write_outbox([(e, e.version + 1) for e in updated])
+                outcomes.update({e.id: e.version + 1 for e in updated})
+                outcomes.update(self._classify_not_updated([e for e in candidates if e.id not in updated_ids]))
+                self._mark_persisted_on_commit([
+                    (e, outcome) for e in candidates if isinstance(outcome := outcomes[e.id], int)
+                ])
+
+        except DatabaseError as e:
+            raise EnrollmentTechnicalPersistenceError(
+                code=ErrorCodes.DATABASE_ERROR,
+                message="A critical error occurred on the database server.",
+                details={"error": str(e)}
+            ) from e
+
+        return {enrollment.id: outcomes[enrollment.id] for enrollment in enrollments}
+
+    @staticmethod
+    def _bulk_update_returning(enrollments: list[Enrollment], now: datetime) -> set[str]:
+        """
+        PostgreSQL: compare-and-set every (id, version) pair with a single
+        UPDATE ... FROM (VALUES ...) RETURNING id.
+        """
+        qn = connection.ops.quote_name
+        table = qn(EnrollmentModel._meta.db_table)
+        row_sql = "(%s::uuid, %s::integer, %s, %s::timestamptz, %s::timestamptz, %s::timestamptz, %s::timestamptz)"
+        params: list[Any] = [now]
+        for e in enrollments:
+            params.extend([
+                e.id, e.version, e.state.value,
+                e.concluded_at, e.cancelled_at, e.suspended_at, e.reactivated_at,
+            ])
+
+        sql = (
+            f"UPDATE {table} AS e SET "
+            "state = v.state, concluded_at = v.concluded_at, cancelled_at = v.cancelled_at, "
+            "suspended_at = v.suspended_at, reactivated_at = v.reactivated_at, "
+            "version = v.origin_version + 1, updated_at = %s "
+            f"FROM (VALUES {', '.join([row_sql] * len(enrollments))}) "
+            "AS v(id, origin_version, state, concluded_at, cancelled_at, suspended_at, reactivated_at) "
+            "WHERE e.id = v.id AND e.version = v.origin_version "
+            "RETURNING e.id"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return {str(row[0]) for row in cursor.fetchall()}
+
+    @staticmethod
+    def _bulk_update_portable(enrollments: list[Enrollment], now: datetime) -> set[str]:
+        """
+        Portable fallback: lock the current (id, version) pairs, then apply one
+        CASE-based UPDATE to the rows whose version still matches.
+        """
+        current_versions = {
+            str(enrollment_id): version
+            for enrollment_id, version in EnrollmentModel.objects.select_for_update()
+            .filter(id__in=[e.id for e in enrollments])
+            .values_list("id", "version")
+        }
+        matched = [e for e in enrollments if current_versions.get(e.id) == e.version]
+        if not matched:
+            return set()
+
+        def case(field: str, output_field: Any) -> Case | None:
+            values = [getattr(e, field) for e in matched]
+            if all(value is None for value in values):
+                # An all-NULL CASE has no inferable type on PostgreSQL; assign NULL directly.
+                return None
+            return Case(
+                *(
+                    When(id=e.id, then=Value(value, output_field=output_field))
+                    for e, value in zip(matched, values, strict=True)
+                ),
+                output_field=output_field,
+            )
+
+        pairs = Q()
+        for e in matched:
+            pairs |= Q(id=e.id, version=e.version)
+
+        updated_rows = EnrollmentModel.objects.filter(pairs).update(
+            state=Case(
+                *(When(id=e.id, then=Value(e.state.value)) for e in matched),
+                output_field=EnrollmentModel._meta.get_field("state"),
+            ),
+            concluded_at=case("concluded_at", DateTimeField()),
+            cancelled_at=case("cancelled_at", DateTimeField()),
+            suspended_at=case("suspended_at", DateTimeField()),
+            reactivated_at=case("reactivated_at", DateTimeField()),
+            version=F("version") + Value(1, output_field=IntegerField()),
+            updated_at=now,
+        )
+        if updated_rows == len(matched):
+            return {e.id for e in matched}
+
+        # A concurrent writer slipped in between the read and the UPDATE
+        # (backends without row locks): only rows stamped by this statement are ours.
+        return {
+            str(enrollment_id)
+            for enrollment_id in EnrollmentModel.objects.filter(
+                id__in=[e.id for e in matched],
+                updated_at=now,
+            ).values_list("id", flat=True)
+        }
+
+    def _classify_not_updated(self, enrollments: list[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        """Tell replays apart from conflicts and missing snapshots with two queries."""
+        if not enrollments:
+            return {}
+
+        snapshots = {
+            str(snapshot.id): snapshot
+            for snapshot in EnrollmentModel.objects.filter(id__in=[e.id for e in enrollments])
+        }
+        transition_ids = {
+            e.id: EnrollmentMapper.to_transition(
+                state_transition=e.pending_transitions()[-1],
+                enrollment_id=e.id,
+            ).transition_id
+            for e in enrollments
+        }
+        stored_transition_ids = set(
+            EnrollmentTransitionModel.objects.filter(
+                transition_id__in=list(transition_ids.values())
+            ).values_list("transition_id", flat=True)
+        )
+
+        outcomes: dict[str, int | ApplicationPersistenceError] = {}
+        for e in enrollments:
+            snapshot = snapshots.get(e.id)
+            if snapshot is None:
+                outcomes[e.id] = self._not_found_error(enrollment=e)
+            elif transition_ids[e.id] in stored_transition_ids and self._is_same_persisted_snapshot(
+                snapshot=snapshot,
+                state=e.state.value,
+                concluded_at=e.concluded_at,
+                cancelled_at=e.cancelled_at,
+                suspended_at=e.suspended_at,
+                reactivated_at=e.reactivated_at,
+                version=e.version + 1,
+            ):
+                outcomes[e.id] = e.version + 1
+            else:
+                outcomes[e.id] = self._version_conflict_error(enrollment=e, persisted_version=snapshot.version)
+        return outcomes
 
     def create(self, enrollment: Enrollment) ->int:
         """
@@ -201,7 +801,9 @@ class DjangoEnrollmentRepository(EnrollmentRepository):
             This method is strictly for creating a new enrollment record. It must 
             not be used to update an existing aggregate. Final uniqueness is 
             guaranteed by the persistence layer (e.g., database constraints) at 
-            the moment of insertion to prevent race conditions.
+            the moment of insertion to prevent race conditions. Pending domain
+            events (EnrollmentCreated) are recorded in the outbox and the state
+            counts read model is incremented in the same transaction.
 
             Returns:
                 int: The initial version of the newly persisted enrollment.
@@ -220,6 +822,8 @@ class DjangoEnrollmentRepository(EnrollmentRepository):
             with transaction.atomic():
                 snapshot = EnrollmentMapper.to_snapshot(enrollment=enrollment)
                 snapshot.save()
+                enrollment_state_counts.apply_deltas(enrollment_state_counts.created_deltas([enrollment]))
+                self._write_outbox([(enrollment, snapshot.version)])
                 
                 return snapshot.version
 
@@ -260,6 +864,178 @@ class DjangoEnrollmentRepository(EnrollmentRepository):
                 message="Failed to create enrollment due to a database error.",
                 details={"error": str(e)},
             ) from e
+
+    def create_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        """
+        Persist many new Enrollment aggregates in one transaction.
+
+        Semantics (per aggregate, as in create()):
+        - All snapshots go through one bulk INSERT that skips conflicting rows
+          (ON CONFLICT DO NOTHING), so a duplicate never aborts the batch.
+        - Only the rows this INSERT wrote count as created: on PostgreSQL the
+          INSERT returns their ids; elsewhere the batch is stamped with one
+          `updated_at` and read back. A row already stored with the same id
+          and business key (a retried batch) is a duplicate, as in create().
+        - A skipped row whose id or business key (unique_enrollment) is stored
+          is reported as EnrollmentDuplicationError; any other skipped row as
+          EnrollmentTechnicalPersistenceError. SQLite turns the insert into
+          INSERT OR IGNORE, which also skips NOT NULL and CHECK violations.
+        - The state counts read model gets one upsert and the outbox one
+          bulk_create for every inserted aggregate, in the same transaction.
+        - Aggregates the ORM cannot prepare (e.g. an id that is not a UUID) are
+          reported as EnrollmentTechnicalPersistenceError without being sent.
+
+        Returns:
+            dict[str, int | ApplicationPersistenceError]: per aggregate id, the
+            initial version or the error create() would have raised.
+
+        Raises:
+            ValueError: If the same aggregate id appears more than once.
+            EnrollmentTechnicalPersistenceError:
+            For database-level failures; nothing from the batch is persisted.
+        """
+        outcomes, candidates = self._prepare_snapshots(enrollments)
+        if not candidates:
+            return outcomes
+
+        try:
+            with transaction.atomic():
+                snapshots = [snapshot for _, snapshot in candidates]
+                if connection.vendor == "postgresql":
+                    inserted_ids = self._bulk_insert_returning(snapshots)
+                else:
+                    inserted_ids = self._bulk_insert_portable(snapshots)
+
+                created = [(e, snapshot.version) for e, snapshot in candidates if e.id in inserted_ids]
+                if created:
+                    enrollment_state_counts.apply_deltas(
+                        enrollment_state_counts.created_deltas(enrollment for enrollment, _ in created)
+                    )
+                    self._write_outbox(created)
+                outcomes.update({enrollment.id: version for enrollment, version in created})
+                outcomes.update(self._classify_not_inserted(
+                    [snapshot for e, snapshot in candidates if e.id not in inserted_ids]
+                ))
+
+        except DatabaseError as e:
+            raise EnrollmentTechnicalPersistenceError(
+                code=ErrorCodes.DATABASE_ERROR,
+                message="Failed to create enrollments due to a database error.",
+                details={"error": str(e)},
+            ) from e
+
+        return {enrollment.id: outcomes[enrollment.id] for enrollment in enrollments}
+
+    @staticmethod
+    def _prepare_snapshots(
+            enrollments: Sequence[Enrollment],
+    ) -> tuple[dict[str, int | ApplicationPersistenceError], list[tuple[Enrollment, EnrollmentModel]]]:
+        """Map each aggregate to its snapshot; ids and keys the ORM rejects become per-row errors."""
+        outcomes: dict[str, int | ApplicationPersistenceError] = {}
+        candidates: list[tuple[Enrollment, EnrollmentModel]] = []
+        seen_ids: set[str] = set()
+
+        for enrollment in enrollments:
+            if enrollment.id in seen_ids:
+                raise ValueError(f"Duplicated enrollment id in create_many batch: {enrollment.id}")
+            seen_ids.add(enrollment.id)
+            snapshot = EnrollmentMapper.to_snapshot(enrollment=enrollment)
+            try:
+                # bulk_create would only fail on these once the whole batch is sent
+                for name in _KEY_FIELDS:
+                    setattr(snapshot, name, EnrollmentModel._meta.get_field(name).to_python(getattr(snapshot, name)))
+            except ValidationError as e:
+                outcomes[enrollment.id] = EnrollmentTechnicalPersistenceError(
+                    code=ErrorCodes.ENROLLMENT_CREATION_FAILED,
+                    message="Failed to create enrollment due to an integrity error.",
+                    details={"error": str(e)},
+                )
+                continue
+            candidates.append((enrollment, snapshot))
+        return outcomes, candidates
+
+    @staticmethod
+    def _bulk_insert_returning(snapshots: list[EnrollmentModel]) -> set[str]:
+        """
+        PostgreSQL: INSERT ... ON CONFLICT DO NOTHING RETURNING id, so the ids
+        returned are exactly the rows this statement wrote.
+        """
+        qn = connection.ops.quote_name
+        fields = EnrollmentModel._meta.concrete_fields
+        row_sql = f"({', '.join(['%s'] * len(fields))})"
+        inserted: set[str] = set()
+        with connection.cursor() as cursor:
+            # Stay well under PostgreSQL's 65535 bind parameters per statement
+            for start in range(0, len(snapshots), _INSERT_BATCH_SIZE):
+                batch = snapshots[start:start + _INSERT_BATCH_SIZE]
+                params = [
+                    field.get_db_prep_save(getattr(snapshot, field.attname), connection)
+                    for snapshot in batch
+                    for field in fields
+                ]
+                cursor.execute(
+                    f"INSERT INTO {qn(EnrollmentModel._meta.db_table)} "
+                    f"({', '.join(qn(field.column) for field in fields)}) "
+                    f"VALUES {', '.join([row_sql] * len(batch))} "
+                    "ON CONFLICT DO NOTHING RETURNING id",
+                    params,
+                )
+                inserted.update(str(row[0]) for row in cursor.fetchall())
+        return inserted
+
+    @staticmethod
+    def _bulk_insert_portable(snapshots: list[EnrollmentModel]) -> set[str]:
+        """
+        Portable fallback: stamp the batch with one `updated_at`, insert with
+        bulk_create(ignore_conflicts=True) and read the stamp back; rows that
+        were already stored keep their own `updated_at`.
+        """
+        stamp = datetime.now(UTC)
+        for snapshot in snapshots:
+            snapshot.updated_at = stamp
+        EnrollmentModel.objects.bulk_create(snapshots, ignore_conflicts=True)
+        return {
+            str(enrollment_id)
+            for enrollment_id in EnrollmentModel.objects.filter(
+                id__in=[snapshot.id for snapshot in snapshots], updated_at=stamp,
+            ).values_list("id", flat=True)
+        }
+
+    @staticmethod
+    def _classify_not_inserted(snapshots: list[EnrollmentModel]) -> dict[str, ApplicationPersistenceError]:
+        """Tell skipped rows that collided with a stored id or business key from rows skipped for another reason."""
+        if not snapshots:
+            return {}
+
+        business_key = _KEY_FIELDS[1:]
+        matches = Q(id__in=[snapshot.id for snapshot in snapshots]) | reduce(or_, (
+            Q(**{name: getattr(snapshot, name) for name in business_key}) for snapshot in snapshots
+        ))
+        stored_ids: set[Any] = set()
+        stored_keys: set[tuple[Any, ...]] = set()
+        for row in EnrollmentModel.objects.filter(matches).values_list(*_KEY_FIELDS):
+            stored_ids.add(row[0])
+            stored_keys.add(row[1:])
+
+        errors: dict[str, ApplicationPersistenceError] = {}
+        for snapshot in snapshots:
+            if tuple(getattr(snapshot, name) for name in business_key) in stored_keys:
+                constraint = "unique_enrollment"
+            elif snapshot.id in stored_ids:
+                constraint = "id"
+            else:
+                errors[str(snapshot.id)] = EnrollmentTechnicalPersistenceError(
+                    code=ErrorCodes.ENROLLMENT_CREATION_FAILED,
+                    message="The database skipped the enrollment without a duplicate to explain it.",
+                    details={"error": "row ignored by the conflict-skipping insert"},
+                )
+                continue
+            errors[str(snapshot.id)] = EnrollmentDuplicationError(
+                code=ErrorCodes.DUPLICATE_ENROLLMENT,
+                message="An enrollment with the same identifiers already exists.",
+                details={"constraint": constraint},
+            )
+        return errors
         
         
     
\ No newline at end of file
@@ -0,0 +1,21 @@
+from contextlib import AbstractContextManager
+
+from django.db import transaction
+
+from application.shared.ports.transaction_manager import TransactionManager
+
+
+class DjangoTransactionManager(TransactionManager):
+    """
+        Concrete Django implementation of the TransactionManager port.
+
+        atomic() is django.db.transaction.atomic on the given database alias:
+        the outermost block is a transaction, nested ones are savepoints, so the
+        repository's own atomic blocks inside it commit with it.
+    """
+
+    def __init__(self, *, using: str | None = None) -> None:
+        self.using = using
+
+    def atomic(self) -> AbstractContextManager[object]:
+        return transaction.atomic(using=self.using)
@@ -0,0 +1,152 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, NamedTuple, Protocol
+
+from django.core.cache import caches
+
+
+class CachedEnrollment(NamedTuple):
+    """
+        Compact, picklable cache entry for one enrollment aggregate.
+
+        - version: persisted version the rows correspond to
+        - snapshot_row: values laid out as SNAPSHOT_FIELDS, or None for a
+          tombstone ("persistence is at least at `version`, reload it")
+        - transition_rows: values laid out as TRANSITION_FIELDS, ordered by occurred_at
+    """
+
+    version: int
+    snapshot_row: tuple[Any, ...] | None
+    transition_rows: tuple[tuple[Any, ...], ...] = ()
+
+    @property
+    def is_tombstone(self) -> bool:
+        return self.snapshot_row is None
+
+
+class EnrollmentCacheBackend(Protocol):
+    """
+        Storage contract used by CachedEnrollmentRepository.
+
+        put() is version-guarded: an entry is never replaced by one with a lower
+        version, so a slow reader cannot overwrite what a newer write stored.
+        Tombstones are the exception and replace any entry: the cached version
+        may be one that was never committed.
+    """
+
+    def get(self, enrollment_id: str) -> CachedEnrollment | None:
+        ...
+
+    def put(self, enrollment_id: str, entry: CachedEnrollment) -> None:
+        ...
+
+    def delete(self, enrollment_id: str) -> None:
+        ...
+
+
+class LocalLRUEnrollmentCache:
+    """
+        In-process backend: bounded LRU with a per-entry TTL.
+
+        All operations run under one lock, so the version guard is atomic. Entries
+        are only coherent within the process; other processes' writes are seen
+        once the entry expires.
+    """
+
+    def __init__(
+            self,
+            *,
+            max_entries: int = 10_000,
+            ttl_seconds: float = 300.0,
+            clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be > 0")
+
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.evictions = 0
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[float, CachedEnrollment]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, enrollment_id: str) -> CachedEnrollment | None:
+        with self._lock:
+            stored = self._live_entry(enrollment_id)
+            if stored is None:
+                return None
+            self._entries.move_to_end(enrollment_id)
+            return stored
+
+    def put(self, enrollment_id: str, entry: CachedEnrollment) -> None:
+        with self._lock:
+            current = self._live_entry(enrollment_id)
+            if current is not None and current.version > entry.version and not entry.is_tombstone:
+                return
+
+            self._entries[enrollment_id] = (self._clock() + self.ttl_seconds, entry)
+            self._entries.move_to_end(enrollment_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, enrollment_id: str) -> None:
+        with self._lock:
+            self._entries.pop(enrollment_id, None)
+
+    def _live_entry(self, enrollment_id: str) -> CachedEnrollment | None:
+        stored = self._entries.get(enrollment_id)
+        if stored is None:
+            return None
+
+        expires_at, entry = stored
+        if expires_at <= self._clock():
+            del self._entries[enrollment_id]
+            return None
+        return entry
+
+
+class DjangoCacheEnrollmentCache:
+    """
+        Backend on top of the Django cache framework (shared across processes
+        when the configured cache is, e.g. Redis or Memcached).
+
+        Eviction is delegated to the cache server; TTL is passed as the timeout.
+        The Django cache API has no compare-and-set, so the version guard is a
+        read-then-write and is best effort under concurrent writers of the same key.
+    """
+
+    def __init__(
+            self,
+            *,
+            cache_alias: str = "default",
+            ttl_seconds: float = 300.0,
+            key_prefix: str = "academic:enrollment:",
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+        self._cache = caches[cache_alias]
+
+    def get(self, enrollment_id: str) -> CachedEnrollment | None:
+        raw = self._cache.get(self._key(enrollment_id))
+        return None if raw is None else CachedEnrollment(*raw)
+
+    def put(self, enrollment_id: str, entry: CachedEnrollment) -> None:
+        current = self.get(enrollment_id)
+        if current is not None and current.version > entry.version and not entry.is_tombstone:
+            return
+        # Stored as a plain tuple: cheaper to pickle and independent of this module's layout.
+        self._cache.set(self._key(enrollment_id), tuple(entry), timeout=self.ttl_seconds)
+
+    def delete(self, enrollment_id: str) -> None:
+        self._cache.delete(self._key(enrollment_id))
+
+    def _key(self, enrollment_id: str) -> str:
+        return f"{self.key_prefix}{enrollment_id}"
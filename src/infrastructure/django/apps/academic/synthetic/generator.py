@@ -0,0 +1,236 @@
+"""Seeded synthetic enrollments for sizing tests and benchmarks.
+
+Rows are produced as plain tuples laid out as SNAPSHOT_COLUMNS and
+TRANSITION_COLUMNS, ready for bulk loading. Histories only follow transitions
+the aggregate allows (suspend/reactivate cycles, then the final move), and the
+lifecycle timestamps mirror what the command methods leave behind, so every
+generated snapshot passes `Enrollment._validate_state_integrity`.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import random
+import uuid
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from apps.academic.enrollments.transition_id import make_transition_id
+
+SNAPSHOT_COLUMNS: tuple[str, ...] = (
+    "id",
+    "institution_id",
+    "student_id",
+    "class_group_id",
+    "academic_period_id",
+    "created_by",
+    "state",
+    "created_at",
+    "updated_at",
+    "version",
+    "concluded_at",
+    "cancelled_at",
+    "suspended_at",
+    "reactivated_at",
+)
+TRANSITION_COLUMNS: tuple[str, ...] = (
+    "transition_id",
+    "enrollment_id",
+    "occurred_at",
+    "action",
+    "from_state",
+    "to_state",
+    "justification",
+    "actor_id",
+    "created_at",
+)
+
+DEFAULT_STATE_MIX: Mapping[str, float] = {
+    "active": 0.70,
+    "suspended": 0.08,
+    "concluded": 0.17,
+    "cancelled": 0.05,
+}
+
+_ACTIONS = {"suspended": "suspend", "active": "reactivate", "concluded": "conclude", "cancelled": "cancel"}
+_JUSTIFICATIONS = {"suspended": "synthetic leave", "active": "synthetic return", "cancelled": "synthetic dropout"}
+_PERIOD_LENGTH = timedelta(days=182)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GeneratorConfig:
+    """
+        Shape of the synthetic population.
+
+        Enrollments are spread round-robin over every class group
+        (institutions x periods x class groups); inside a group each student
+        appears at most once, so `students_per_institution` must cover the
+        largest group.
+        Suspension cycles per enrollment follow a geometric distribution with
+        mean `mean_suspension_cycles`, capped at `max_suspension_cycles`.
+    """
+    enrollments: int
+    institutions: int = 10
+    periods_per_institution: int = 4
+    class_groups_per_period: int = 25
+    students_per_institution: int = 5000
+    state_mix: Mapping[str, float] = field(default_factory=lambda: dict(DEFAULT_STATE_MIX))
+    mean_suspension_cycles: float = 0.4
+    max_suspension_cycles: int = 10
+    start: datetime = datetime(2024, 2, 1, tzinfo=UTC)
+    seed: int = 0
+
+    def __post_init__(self) -> None:
+        for name in ("institutions", "periods_per_institution", "class_groups_per_period", "students_per_institution"):
+            if getattr(self, name) < 1:
+                raise ValueError(f"'{name}' must be positive.")
+        if self.enrollments < 0:
+            raise ValueError("'enrollments' cannot be negative.")
+        if self.mean_suspension_cycles < 0 or self.max_suspension_cycles < 0:
+            raise ValueError("Suspension cycle settings cannot be negative.")
+        unknown = set(self.state_mix) - set(DEFAULT_STATE_MIX)
+        if unknown:
+            raise ValueError(f"Unknown states in state_mix: {sorted(unknown)}.")
+        if any(weight < 0 for weight in self.state_mix.values()) or sum(self.state_mix.values()) <= 0:
+            raise ValueError("state_mix weights must be non-negative and not all zero.")
+        if self.start.tzinfo is None:
+            raise ValueError("'start' must be timezone-aware.")
+
+        largest_group = -(-self.enrollments // self.class_groups)
+        if largest_group > self.students_per_institution:
+            raise ValueError(
+                f"{largest_group} enrollments per class group need at least that many students "
+                f"per institution (got {self.students_per_institution})."
+            )
+
+    @property
+    def class_groups(self) -> int:
+        return self.institutions * self.periods_per_institution * self.class_groups_per_period
+
+
+class EnrollmentGenerator:
+    """Deterministic for a given config: the same seed yields the same rows."""
+
+    def __init__(self, config: GeneratorConfig) -> None:
+        self.config = config
+        self._rng = random.Random(config.seed)
+        # Shared ids are kept as strings: formatting a UUID costs more than generating it.
+        self._actors = [str(self._uuid()) for _ in range(50)]
+        self._institutions = [str(self._uuid()) for _ in range(config.institutions)]
+        self._students = [
+            [str(self._uuid()) for _ in range(config.students_per_institution)] for _ in self._institutions
+        ]
+        self._periods = [
+            [str(self._uuid()) for _ in range(config.periods_per_institution)] for _ in self._institutions
+        ]
+        self._class_groups = [str(self._uuid()) for _ in range(config.class_groups)]
+        self._group_offsets = [
+            self._rng.randrange(config.students_per_institution) for _ in range(config.class_groups)
+        ]
+        states = list(config.state_mix)
+        self._states = states
+        self._cumulative_weights = list(itertools.accumulate(config.state_mix[s] for s in states))
+        mean = config.mean_suspension_cycles
+        self._cycle_probability = mean / (1 + mean)
+
+    def _uuid(self) -> uuid.UUID:
+        return uuid.UUID(int=self._rng.getrandbits(128), version=4)
+
+    def _final_state(self) -> str:
+        point = self._rng.random() * self._cumulative_weights[-1]
+        return self._states[bisect.bisect_right(self._cumulative_weights, point)]
+
+    def _suspension_cycles(self) -> int:
+        cycles = 0
+        while cycles < self.config.max_suspension_cycles and self._rng.random() < self._cycle_probability:
+            cycles += 1
+        return cycles
+
+    def _path(self, final_state: str) -> list[str]:
+        """States visited after the initial ACTIVE one."""
+        path = ["suspended", "active"] * self._suspension_cycles()
+        if final_state == "suspended":
+            path.append("suspended")
+        elif final_state == "concluded":
+            path.append("concluded")
+        elif final_state == "cancelled":
+            if self._rng.random() < 0.3:
+                path.append("suspended")
+            path.append("cancelled")
+        return path
+
+    def iter_batches(self, batch_size: int) -> Iterator[tuple[list[tuple[Any, ...]], list[tuple[Any, ...]]]]:
+        """Yield (snapshot rows, transition rows) for at most `batch_size` enrollments at a time."""
+        snapshots: list[tuple[Any, ...]] = []
+        transitions: list[tuple[Any, ...]] = []
+        for index in range(self.config.enrollments):
+            self._append(index, snapshots, transitions)
+            if len(snapshots) == batch_size:
+                yield snapshots, transitions
+                snapshots, transitions = [], []
+        if snapshots:
+            yield snapshots, transitions
+
+    def _append(self, index: int, snapshots: list[tuple[Any, ...]], transitions: list[tuple[Any, ...]]) -> None:
+        config = self.config
+        rng = self._rng
+        group = index % config.class_groups
+        per_institution = config.periods_per_institution * config.class_groups_per_period
+        institution = group // per_institution
+        period = (group // config.class_groups_per_period) % config.periods_per_institution
+        student = (self._group_offsets[group] + index // config.class_groups) % config.students_per_institution
+
+        enrollment_uuid = self._uuid()
+        enrollment_id = str(enrollment_uuid)
+        created_at = config.start + period * _PERIOD_LENGTH + timedelta(seconds=rng.uniform(0, 14 * 86400))
+        created_at = created_at.replace(microsecond=created_at.microsecond // 1000 * 1000)
+
+        state = "active"
+        occurred_at = created_at
+        history_length = 0
+        for to_state in self._path(self._final_state()):
+            occurred_at += timedelta(seconds=rng.randint(3600, 20 * 86400))
+            action = _ACTIONS[to_state]
+            actor_id = self._actors[rng.randrange(len(self._actors))]
+            justification = _JUSTIFICATIONS.get(to_state)
+            transition_id = make_transition_id(
+                enrollment_id=enrollment_uuid,
+                action=action,
+                from_state=state,
+                to_state=to_state,
+                occurred_at=occurred_at,
+                actor_id=actor_id,
+                justification=justification,
+            )
+            transitions.append((
+                str(transition_id), enrollment_id, occurred_at, action, state, to_state,
+                justification, actor_id, occurred_at,
+            ))
+            state = to_state
+            history_length += 1
+
+        lifecycle: dict[str, datetime | None] = {
+            "concluded": None, "cancelled": None, "suspended": None, "active": None,
+        }
+        if history_length:  # the last transition stamps its own field only
+            lifecycle[state] = occurred_at
+
+        snapshots.append((
+            enrollment_id,
+            self._institutions[institution],
+            self._students[institution][student],
+            self._class_groups[group],
+            self._periods[institution][period],
+            self._actors[0],
+            state,
+            created_at,
+            occurred_at,
+            1 + history_length,
+            lifecycle["concluded"],
+            lifecycle["cancelled"],
+            lifecycle["suspended"],
+            lifecycle["active"],
+        ))
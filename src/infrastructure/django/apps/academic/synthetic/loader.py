@@ -0,0 +1,85 @@
+"""Bulk loading of raw enrollment rows, bypassing the ORM.
+
+``copy`` streams each batch through ``COPY ... FROM STDIN`` (PostgreSQL only);
+``insert`` uses one batched ``executemany`` per table and works on every
+backend. Each batch is committed in its own transaction.
+"""
+
+from __future__ import annotations
+
+import io
+import re
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from typing import Any
+
+from django.db import connection, transaction
+from django.db.models import Model
+
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.models.enrollment_transition import EnrollmentTransitionModel
+from apps.academic.synthetic.generator import SNAPSHOT_COLUMNS, TRANSITION_COLUMNS
+
+LOAD_METHODS = ("auto", "copy", "insert")
+
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+_NEEDS_ESCAPE = re.compile(r"[\\\t\n\r]")
+
+
+def resolve_method(method: str) -> str:
+    if method not in LOAD_METHODS:
+        raise ValueError(f"Unknown load method: {method}.")
+    if method == "auto":
+        return "copy" if connection.vendor == "postgresql" else "insert"
+    if method == "copy" and connection.vendor != "postgresql":
+        raise ValueError("COPY is only available on PostgreSQL.")
+    return method
+
+
+def _copy_value(value: Any) -> str:
+    if value is None:
+        return "\\N"
+    if isinstance(value, str):
+        return value.translate(_COPY_ESCAPES) if _NEEDS_ESCAPE.search(value) else value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _copy(model: type[Model], columns: Sequence[str], rows: Sequence[tuple[Any, ...]]) -> None:
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(map(_copy_value, row)))
+        buffer.write("\n")
+    buffer.seek(0)
+    qn = connection.ops.quote_name
+    sql = f"COPY {qn(model._meta.db_table)} ({', '.join(map(qn, columns))}) FROM STDIN"
+    with connection.cursor() as cursor:
+        cursor.copy_expert(sql, buffer)
+
+
+def _insert(model: type[Model], columns: Sequence[str], rows: Sequence[tuple[Any, ...]]) -> None:
+    preparers: list[Callable[..., Any]] = [model._meta.get_field(name).get_db_prep_value for name in columns]
+    params = [
+        tuple(prepare(value, connection) for prepare, value in zip(preparers, row, strict=True))
+        for row in rows
+    ]
+    qn = connection.ops.quote_name
+    placeholders = ", ".join(["%s"] * len(columns))
+    sql = f"INSERT INTO {qn(model._meta.db_table)} ({', '.join(map(qn, columns))}) VALUES ({placeholders})"
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, params)
+
+
+def load_batch(
+        snapshots: Sequence[tuple[Any, ...]],
+        transitions: Sequence[tuple[Any, ...]],
+        *,
+        method: str,
+) -> None:
+    """Write one generated batch (snapshots first, for the FK) in a single transaction."""
+    write = _copy if method == "copy" else _insert
+    with transaction.atomic():
+        write(EnrollmentModel, SNAPSHOT_COLUMNS, snapshots)
+        if transitions:
+            write(EnrollmentTransitionModel, TRANSITION_COLUMNS, transitions)
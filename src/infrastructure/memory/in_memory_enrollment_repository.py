@@ -0,0 +1,408 @@
+"""EnrollmentRepository kept in process memory, with hash indexes and no database.
+
+Meant for single-node deployments, load tests and benchmarks. It follows the
+same contract as DjangoEnrollmentRepository (optimistic version check,
+idempotent replays, per-item outcomes in the batch methods, duplicate
+detection by id and business key) without the outbox and the read models.
+
+Each enrollment is stored as an immutable record (snapshot fields plus its
+history as a tuple of StateTransition VOs) and rehydrated into a fresh
+aggregate on every load, so callers never share state with the store.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from collections import defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from application.academic.enrollment.dto.errors.error_codes import ErrorCodes
+from application.academic.enrollment.errors.persistence_errors import (
+    ApplicationPersistenceError,
+    ConcurrencyConflictError,
+    EnrollmentDuplicationError,
+    EnrollmentPersistenceNotFoundError,
+    EnrollmentTechnicalPersistenceError,
+)
+from application.academic.enrollment.ports.enrollment_repository import EnrollmentRepository
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+from domain.academic.enrollment.value_objects.state_transition import StateTransition
+
+SNAPSHOT_FORMAT = "enrollment-snapshot/1"
+
+BusinessKey = tuple[str, str, str, str]
+
+_LIFECYCLE_FIELDS = ("created_at", "concluded_at", "cancelled_at", "suspended_at", "reactivated_at")
+
+
+@dataclass(frozen=True, slots=True)
+class _Record:
+    id: str
+    institution_id: str
+    student_id: str
+    class_group_id: str
+    academic_period_id: str
+    created_by: str
+    state: EnrollmentState
+    created_at: datetime
+    concluded_at: datetime | None
+    cancelled_at: datetime | None
+    suspended_at: datetime | None
+    reactivated_at: datetime | None
+    version: int
+    transitions: tuple[StateTransition, ...]
+
+    @classmethod
+    def of(cls, enrollment: Enrollment, *, version: int, transitions: tuple[StateTransition, ...]) -> _Record:
+        return cls(
+            id=enrollment.id,
+            institution_id=enrollment.institution_id,
+            student_id=enrollment.student_id,
+            class_group_id=enrollment.class_group_id,
+            academic_period_id=enrollment.academic_period_id,
+            created_by=enrollment.created_by,
+            state=enrollment.state,
+            created_at=enrollment.created_at,
+            concluded_at=enrollment.concluded_at,
+            cancelled_at=enrollment.cancelled_at,
+            suspended_at=enrollment.suspended_at,
+            reactivated_at=enrollment.reactivated_at,
+            version=version,
+            transitions=transitions,
+        )
+
+    @property
+    def business_key(self) -> BusinessKey:
+        return (self.institution_id, self.student_id, self.class_group_id, self.academic_period_id)
+
+    def to_domain(self) -> Enrollment:
+        return Enrollment(
+            id=self.id,
+            institution_id=self.institution_id,
+            student_id=self.student_id,
+            class_group_id=self.class_group_id,
+            academic_period_id=self.academic_period_id,
+            created_by=self.created_by,
+            state=self.state,
+            created_at=self.created_at,
+            concluded_at=self.concluded_at,
+            cancelled_at=self.cancelled_at,
+            suspended_at=self.suspended_at,
+            reactivated_at=self.reactivated_at,
+            version=self.version,
+            transitions=list(self.transitions),
+        )
+
+    def same_snapshot_as(self, enrollment: Enrollment) -> bool:
+        return self.state == enrollment.state and all(
+            getattr(self, name) == getattr(enrollment, name) for name in _LIFECYCLE_FIELDS
+        )
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "institution_id": self.institution_id,
+            "student_id": self.student_id,
+            "class_group_id": self.class_group_id,
+            "academic_period_id": self.academic_period_id,
+            "created_by": self.created_by,
+            "state": self.state.value,
+            **{name: _isoformat(getattr(self, name)) for name in _LIFECYCLE_FIELDS},
+            "version": self.version,
+            "transitions": [
+                [t.from_state.value, t.to_state.value, t.actor_id, t.occurred_at.isoformat(), t.justification]
+                for t in self.transitions
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, data: dict[str, Any]) -> _Record:
+        return cls(
+            id=data["id"],
+            institution_id=data["institution_id"],
+            student_id=data["student_id"],
+            class_group_id=data["class_group_id"],
+            academic_period_id=data["academic_period_id"],
+            created_by=data["created_by"],
+            state=EnrollmentState(data["state"]),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            concluded_at=_parse_datetime(data["concluded_at"]),
+            cancelled_at=_parse_datetime(data["cancelled_at"]),
+            suspended_at=_parse_datetime(data["suspended_at"]),
+            reactivated_at=_parse_datetime(data["reactivated_at"]),
+            version=data["version"],
+            transitions=tuple(
+                StateTransition.rehydrate_trusted(
+                    from_state=EnrollmentState(from_state),
+                    to_state=EnrollmentState(to_state),
+                    actor_id=actor_id,
+                    occurred_at=datetime.fromisoformat(occurred_at),
+                    justification=justification,
+                )
+                for from_state, to_state, actor_id, occurred_at, justification in data["transitions"]
+            ),
+        )
+
+
+def _isoformat(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+class InMemoryEnrollmentRepository(EnrollmentRepository):
+    """
+    Thread-safe EnrollmentRepository over dicts.
+
+    - Hash indexes on id and on the business key (institution, student,
+      class group, period): create, get_by_id and save are O(1).
+    - Secondary indexes (sets of ids) by state, class group and academic
+      period answer find_ids_by_* without scanning.
+    - Writers lock the stripes of the ids / business keys they touch (a
+      fixed pool of `stripes` locks), so writes to different aggregates
+      rarely contend; loads read immutable records without locking.
+    - export_snapshot / import_snapshot write and read the whole store as
+      NDJSON, one enrollment (with its history) per line.
+    """
+
+    def __init__(self, *, stripes: int = 64) -> None:
+        if stripes < 1:
+            raise ValueError("stripes must be at least 1.")
+        self._stripes = [threading.Lock() for _ in range(stripes)]
+        self._records: dict[str, _Record] = {}
+        self._ids_by_key: dict[BusinessKey, str] = {}
+        self._index_lock = threading.Lock()
+        self._ids_by_state: defaultdict[EnrollmentState, set[str]] = defaultdict(set)
+        self._ids_by_class_group: defaultdict[str, set[str]] = defaultdict(set)
+        self._ids_by_period: defaultdict[str, set[str]] = defaultdict(set)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    # --- reads ---
+
+    def get_by_id(self, enrollment_id: str) -> Enrollment | None:
+        record = self._records.get(enrollment_id)
+        return record.to_domain() if record is not None else None
+
+    def get_many(self, enrollment_ids: Iterable[str]) -> dict[str, Enrollment | None]:
+        return {enrollment_id: self.get_by_id(enrollment_id) for enrollment_id in dict.fromkeys(enrollment_ids)}
+
+    def find_ids_by_class_group(self, *, class_group_id: str, academic_period_id: str) -> list[str]:
+        with self._index_lock:
+            in_group = self._ids_by_class_group.get(class_group_id, set())
+            in_period = self._ids_by_period.get(academic_period_id, set())
+            smaller, larger = sorted((in_group, in_period), key=len)
+            return sorted(smaller & larger)
+
+    def find_ids_by_state(self, state: EnrollmentState, *, academic_period_id: str | None = None) -> list[str]:
+        """Ids of the enrollments currently in `state` (optionally of one period), sorted."""
+        with self._index_lock:
+            ids = self._ids_by_state.get(state, set())
+            if academic_period_id is not None:
+                ids = ids & self._ids_by_period.get(academic_period_id, set())
+            return sorted(ids)
+
+    def find_ids_by_academic_period(self, academic_period_id: str) -> list[str]:
+        with self._index_lock:
+            return sorted(self._ids_by_period.get(academic_period_id, set()))
+
+    # --- writes ---
+
+    def save(self, enrollment: Enrollment) -> int:
+        """
+        Persist the pending transitions of an existing aggregate.
+
+        Same semantics as DjangoEnrollmentRepository.save: enrollment.version
+        is the origin version; a save whose last pending transition is already
+        stored under the same snapshot is a replay and returns the new version.
+        On success the aggregate is marked persisted at the new version.
+
+        Raises:
+            EnrollmentTechnicalPersistenceError: no pending transitions.
+            EnrollmentPersistenceNotFoundError: the enrollment was never created.
+            ConcurrencyConflictError: the stored version is not the origin version.
+        """
+        pending = enrollment.pending_transitions()
+        if not pending:
+            raise EnrollmentTechnicalPersistenceError(
+                code=ErrorCodes.MISSING_TRANSITIONS,
+                message="No transitions to persist for the enrollment.",
+                details={"enrollment_id": enrollment.id},
+            )
+
+        with self._locked(enrollment.id):
+            current = self._records.get(enrollment.id)
+            if current is None:
+                raise EnrollmentPersistenceNotFoundError(
+                    code="enrollment_not_found",
+                    message="The enrollment snapshot was not found for persistence update.",
+                    details={
+                        "enrollment_id": enrollment.id,
+                        "origin_version": enrollment.version,
+                        "attempted_new_version": enrollment.version + 1,
+                    },
+                )
+            new_version = enrollment.version + 1
+            if current.version != enrollment.version:
+                if (
+                    current.version == new_version
+                    and current.same_snapshot_as(enrollment)
+                    and pending[-1] in current.transitions[-len(pending):]
+                ):
+                    enrollment.mark_persisted(version=new_version)
+                    return new_version
+                raise ConcurrencyConflictError(
+                    code="version_mismatch",
+                    message=(
+                        "The enrollment exists, but its persisted version does not match "
+                        "the aggregate origin version."
+                    ),
+                    details={
+                        "aggregate_id": enrollment.id,
+                        "expected_version": enrollment.version,
+                        "persisted_version": current.version,
+                    },
+                )
+
+            self._records[enrollment.id] = _Record.of(
+                enrollment, version=new_version, transitions=current.transitions + tuple(pending)
+            )
+            if current.state != enrollment.state:
+                with self._index_lock:
+                    self._ids_by_state[current.state].discard(enrollment.id)
+                    self._ids_by_state[enrollment.state].add(enrollment.id)
+        enrollment.mark_persisted(version=new_version)
+        return new_version
+
+    def save_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        """save() per aggregate, reporting per-item failures as values (one aggregate per lock, not atomic)."""
+        self._reject_repeated_ids(enrollments, "save_many")
+        outcomes: dict[str, int | ApplicationPersistenceError] = {}
+        for enrollment in enrollments:
+            try:
+                outcomes[enrollment.id] = self.save(enrollment)
+            except ApplicationPersistenceError as e:
+                outcomes[enrollment.id] = e
+        return outcomes
+
+    def create(self, enrollment: Enrollment) -> int:
+        """
+        Store a new aggregate and return its version. Like the Django adapter,
+        only the snapshot is stored: a new aggregate has no history yet.
+
+        Raises:
+            EnrollmentDuplicationError: the id or the business key is already stored.
+        """
+        record = _Record.of(enrollment, version=enrollment.version, transitions=())
+        key = record.business_key
+        with self._locked(enrollment.id, key):
+            if enrollment.id in self._records or key in self._ids_by_key:
+                raise EnrollmentDuplicationError(
+                    code=ErrorCodes.DUPLICATE_ENROLLMENT,
+                    message="An enrollment with the same identifiers already exists.",
+                    # Same precedence as the Django adapter: the business key wins over the id
+                    details={"constraint": "unique_enrollment" if key in self._ids_by_key else "id"},
+                )
+            self._records[enrollment.id] = record
+            self._ids_by_key[key] = enrollment.id
+            self._index(record)
+        return record.version
+
+    def create_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        """create() per aggregate; a duplicate is reported as a value and does not stop the batch."""
+        self._reject_repeated_ids(enrollments, "create_many")
+        outcomes: dict[str, int | ApplicationPersistenceError] = {}
+        for enrollment in enrollments:
+            try:
+                outcomes[enrollment.id] = self.create(enrollment)
+            except EnrollmentDuplicationError as e:
+                outcomes[enrollment.id] = e
+        return outcomes
+
+    # --- snapshots ---
+
+    def export_snapshot(self, path: str | os.PathLike[str]) -> int:
+        """
+        Write every stored enrollment to `path` (NDJSON, first line a header)
+        and return how many were written. The copy is consistent: writers
+        wait while it is taken. The file is replaced atomically.
+        """
+        with self._all_locked():
+            records = list(self._records.values())
+
+        target = Path(path)
+        fd, tmp_path = tempfile.mkstemp(dir=target.parent, prefix=f".{target.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(json.dumps({"format": SNAPSHOT_FORMAT, "count": len(records)}) + "\n")
+                for record in records:
+                    handle.write(json.dumps(record.to_json()) + "\n")
+            os.replace(tmp_path, target)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return len(records)
+
+    def import_snapshot(self, path: str | os.PathLike[str]) -> int:
+        """Replace the whole store with a file written by export_snapshot; returns the count loaded."""
+        with open(path, encoding="utf-8") as handle:
+            header = json.loads(handle.readline() or "{}")
+            if header.get("format") != SNAPSHOT_FORMAT:
+                raise ValueError(f"{path} is not an enrollment snapshot ({SNAPSHOT_FORMAT}).")
+            records = [_Record.from_json(json.loads(line)) for line in handle if line.strip()]
+        if len(records) != header.get("count"):
+            raise ValueError(f"{path} is truncated: expected {header.get('count')} enrollments, read {len(records)}.")
+
+        with self._all_locked():
+            self._records = {record.id: record for record in records}
+            self._ids_by_key = {record.business_key: record.id for record in records}
+            self._ids_by_state.clear()
+            self._ids_by_class_group.clear()
+            self._ids_by_period.clear()
+            for record in records:
+                self._index(record)
+        return len(records)
+
+    # --- internals ---
+
+    def _index(self, record: _Record) -> None:
+        with self._index_lock:
+            self._ids_by_state[record.state].add(record.id)
+            self._ids_by_class_group[record.class_group_id].add(record.id)
+            self._ids_by_period[record.academic_period_id].add(record.id)
+
+    @contextmanager
+    def _locked(self, *keys: object) -> Iterator[None]:
+        # Always in stripe order, so two writers never wait on each other in a cycle
+        stripes = sorted({hash(key) % len(self._stripes) for key in keys})
+        with ExitStack() as stack:
+            for stripe in stripes:
+                stack.enter_context(self._stripes[stripe])
+            yield
+
+    @contextmanager
+    def _all_locked(self) -> Iterator[None]:
+        with ExitStack() as stack:
+            for lock in self._stripes:
+                stack.enter_context(lock)
+            yield
+
+    @staticmethod
+    def _reject_repeated_ids(enrollments: Sequence[Enrollment], method: str) -> None:
+        seen: set[str] = set()
+        for enrollment in enrollments:
+            if enrollment.id in seen:
+                raise ValueError(f"Duplicated enrollment id in {method} batch: {enrollment.id}")
+            seen.add(enrollment.id)
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import copy
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import contextmanager
 from datetime import UTC, datetime
 from typing import Protocol, cast
 
 from application.academic.enrollment.dto.errors.error_codes import ErrorCodes
 from application.academic.enrollment.errors.persistence_errors import (
+    ApplicationPersistenceError,
+    ConcurrencyConflictError,
     EnrollmentDuplicationError,
+    EnrollmentPersistenceNotFoundError,
     EnrollmentTechnicalPersistenceError,
 )
 from domain.academic.enrollment.entities.enrollment import Enrollment
@@ -52,15 +58,41 @@ class InMemoryEnrollmentRepository:
     def __init__(self) -> None:
         self.items: dict[str, HasAggregateId] = {}
         self.save_calls: int = 0
+        self.save_many_calls: list[list[str]] = []
+        self.create_many_calls: list[list[str]] = []
 
     def get_by_id(self, enrollment_id: str) -> Enrollment:
         return cast(Enrollment, self.items.get(enrollment_id))
 
+    def get_many(self, enrollment_ids: Iterable[str]) -> dict[str, Enrollment | None]:
+        return {
+            enrollment_id: cast(Enrollment, self.items.get(enrollment_id))
+            for enrollment_id in enrollment_ids
+        }
+
+    def find_ids_by_class_group(self, *, class_group_id: str, academic_period_id: str) -> list[str]:
+        return sorted(
+            item.id
+            for item in self.items.values()
+            if getattr(item, "class_group_id", None) == class_group_id
+            and getattr(item, "academic_period_id", None) == academic_period_id
+        )
+
     def save(self, enrollment: Enrollment) -> int:
         self.items[enrollment.id] = enrollment
         self.save_calls += 1
         return enrollment.version +1
 
+    def save_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        self.save_many_calls.append([enrollment.id for enrollment in enrollments])
+        outcomes: dict[str, int | ApplicationPersistenceError] = {}
+        for enrollment in enrollments:
+            try:
+                outcomes[enrollment.id] = self.save(enrollment)
+            except (ConcurrencyConflictError, EnrollmentPersistenceNotFoundError) as e:
+                outcomes[enrollment.id] = e
+        return outcomes
+
     def seed(self, enrollment: HasAggregateId) -> None:
         self.items[enrollment.id] = enrollment
 
@@ -92,6 +124,16 @@ class InMemoryEnrollmentRepository:
             
             # Como é uma criação, geralmente iniciamos com a versão do agregado ou 1
             return enrollment.version
+
+    def create_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        self.create_many_calls.append([enrollment.id for enrollment in enrollments])
+        outcomes: dict[str, int | ApplicationPersistenceError] = {}
+        for enrollment in enrollments:
+            try:
+                outcomes[enrollment.id] = self.create(enrollment)
+            except EnrollmentDuplicationError as e:
+                outcomes[enrollment.id] = e
+        return outcomes
     
 
 class FailingEnrollmentRepository(InMemoryEnrollmentRepository):
@@ -106,6 +148,14 @@ class FailingEnrollmentRepository(InMemoryEnrollmentRepository):
             message="Failed to persist enrollment due to a database error.",
             details={"error": self.message},
         )
+
+    def save_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        self.save_many_calls.append([enrollment.id for enrollment in enrollments])
+        raise EnrollmentTechnicalPersistenceError(
+            code=ErrorCodes.DATABASE_ERROR,
+            message="Failed to persist enrollments due to a database error.",
+            details={"error": self.message},
+        )
     
     def create(self, enrollment: Enrollment) -> int:
         self.save_calls += 1
@@ -115,6 +165,89 @@ class FailingEnrollmentRepository(InMemoryEnrollmentRepository):
             details={"error": self.message},   
         )
 
+    def create_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        self.create_many_calls.append([enrollment.id for enrollment in enrollments])
+        raise EnrollmentTechnicalPersistenceError(
+            code=ErrorCodes.DATABASE_ERROR,
+            message="Failed to create enrollments due to a database error.",
+            details={"error": self.message},
+        )
+
+
+
+class ConflictingEnrollmentRepository(InMemoryEnrollmentRepository):
+    """
+    Fails the first ``conflicts`` saves with a version conflict.
+    get_by_id returns a copy, like a real re-load; ``on_conflict`` lets a
+    test play the concurrent writer that won.
+    """
+    def __init__(self, *, conflicts: int, on_conflict: Callable[[], None] | None = None):
+        super().__init__()
+        self.conflicts = conflicts
+        self.on_conflict = on_conflict
+        self.load_calls = 0
+
+    def get_by_id(self, enrollment_id: str) -> Enrollment:
+        self.load_calls += 1
+        return cast(Enrollment, copy.deepcopy(self.items.get(enrollment_id)))
+
+    def save(self, enrollment: Enrollment) -> int:
+        if self.save_calls < self.conflicts:
+            self.save_calls += 1
+            if self.on_conflict is not None:
+                self.on_conflict()
+            raise ConcurrencyConflictError(
+                code="version_mismatch",
+                message="Enrollment was modified by another process.",
+                details={
+                    "aggregate_id": enrollment.id,
+                    "expected_version": enrollment.version,
+                    "persisted_version": enrollment.version + 1,
+                },
+            )
+        return super().save(enrollment)
+
+
+
+class AsyncInMemoryEnrollmentRepository:
+    """AsyncEnrollmentRepository fake delegating to a sync fake (shares its items and counters)."""
+    def __init__(self, inner: InMemoryEnrollmentRepository | None = None) -> None:
+        self.inner = inner or InMemoryEnrollmentRepository()
+
+    async def get_by_id(self, enrollment_id: str) -> Enrollment | None:
+        return self.inner.get_by_id(enrollment_id)
+
+    async def save(self, enrollment: Enrollment) -> int:
+        return self.inner.save(enrollment)
+
+    async def create(self, enrollment: Enrollment) -> int:
+        return self.inner.create(enrollment)
+
+
+class RecordingTransactionManager:
+    """TransactionManager fake: records each transaction and what the repository saw inside it."""
+    def __init__(self, repo: InMemoryEnrollmentRepository | None = None) -> None:
+        self.repo = repo
+        self.opened = 0
+        self.open = False
+        self.saves_inside = 0
+        self.rolled_back = 0
+
+    @contextmanager
+    def atomic(self) -> Iterator[None]:
+        self.opened += 1
+        self.open = True
+        saves_before = self.repo.save_calls if self.repo is not None else 0
+        try:
+            yield
+        except BaseException:
+            self.rolled_back += 1
+            raise
+        finally:
+            self.open = False
+            if self.repo is not None:
+                self.saves_inside += self.repo.save_calls - saves_before
+
     
 class ScriptedEnrollment:
     def __init__(
@@ -0,0 +1,105 @@
+import asyncio
+
+from application.academic.enrollment.dto.errors.error_codes import ErrorCodes
+from application.academic.enrollment.services.cancel_enrollment import AsyncCancelEnrollmentService
+from application.academic.enrollment.services.create_enrollment import AsyncCreateEnrollment
+from application.academic.enrollment.services.reactivate_enrollment import (
+    AsyncReactivateEnrollmentService,
+)
+from application.academic.enrollment.services.suspend_enrollment import (
+    AsyncSuspendEnrollmentService,
+)
+from application.shared.retry_policy import RetryPolicy
+from domain.academic.enrollment.events.enrollment_events import EnrollmentSuspended
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+from tests.application.academic.enrollment.fakes import (
+    AsyncInMemoryEnrollmentRepository,
+    ConflictingEnrollmentRepository,
+    FailingEnrollmentRepository,
+    make_enrollment,
+)
+
+
+def test_async_suspend_persists_and_returns_the_events():
+    repo = AsyncInMemoryEnrollmentRepository()
+    repo.inner.seed(make_enrollment(state=EnrollmentState.ACTIVE))
+    service = AsyncSuspendEnrollmentService(repo=repo)
+
+    result = asyncio.run(service.execute(enrollment_id="enr-1", actor_id="user-1", justification="leave"))
+
+    assert result.success is True
+    assert result.changed is True
+    assert result.new_state == EnrollmentState.SUSPENDED
+    assert isinstance(result.domain_events[0], EnrollmentSuspended)
+    assert repo.inner.save_calls == 1
+    assert repo.inner.items["enr-1"].peek_domain_events() == []
+
+
+def test_async_state_change_not_found():
+    service = AsyncReactivateEnrollmentService(repo=AsyncInMemoryEnrollmentRepository())
+
+    result = asyncio.run(service.execute(enrollment_id="missing", actor_id="user-1", justification="back"))
+
+    assert result.success is False
+    assert result.error is not None
+    assert result.error.code == ErrorCodes.ENROLLMENT_NOT_FOUND
+
+
+def test_async_state_change_maps_domain_and_persistence_failures():
+    rejected_repo = AsyncInMemoryEnrollmentRepository()
+    rejected_repo.inner.seed(make_enrollment(state=EnrollmentState.CONCLUDED))
+    failing_repo = AsyncInMemoryEnrollmentRepository(FailingEnrollmentRepository())
+    failing_repo.inner.seed(make_enrollment(state=EnrollmentState.ACTIVE))
+
+    rejected = asyncio.run(
+        AsyncCancelEnrollmentService(repo=rejected_repo).execute(
+            enrollment_id="enr-1", actor_id="user-1", justification="dropout",
+        )
+    )
+    failed = asyncio.run(
+        AsyncSuspendEnrollmentService(repo=failing_repo).execute(
+            enrollment_id="enr-1", actor_id="user-1", justification="leave",
+        )
+    )
+
+    assert rejected.success is False
+    assert rejected_repo.inner.save_calls == 0
+    assert failed.error is not None
+    assert failed.error.code == ErrorCodes.DATABASE_ERROR
+
+
+def test_async_state_change_retries_a_version_conflict():
+    inner = ConflictingEnrollmentRepository(conflicts=1)
+    inner.seed(make_enrollment(state=EnrollmentState.ACTIVE))
+    service = AsyncSuspendEnrollmentService(
+        repo=AsyncInMemoryEnrollmentRepository(inner),
+        retry_policy=RetryPolicy(base_delay=0.0, max_delay=0.0, deadline=None),
+    )
+
+    result = asyncio.run(service.execute(enrollment_id="enr-1", actor_id="user-1", justification="leave"))
+
+    assert result.changed is True
+    assert (inner.load_calls, inner.save_calls) == (2, 2)
+    assert service.retry_stats is not None
+    assert service.retry_stats.recovered == 1
+
+
+def test_async_create_enrollment_and_duplicate():
+    service = AsyncCreateEnrollment(repo=AsyncInMemoryEnrollmentRepository())
+    ids = {
+        "institution_id": "inst-1",
+        "student_id": "stu-1",
+        "class_group_id": "cls-1",
+        "academic_period_id": "per-1",
+        "actor_id": "user-1",
+    }
+
+    async def create_twice():
+        return await service.execute(**ids), await service.execute(**ids)
+
+    created, duplicate = asyncio.run(create_twice())
+
+    assert created.success is True
+    assert created.new_state == EnrollmentState.ACTIVE
+    assert duplicate.error is not None
+    assert duplicate.error.code == ErrorCodes.DUPLICATE_ENROLLMENT
@@ -0,0 +1,186 @@
+from collections.abc import Iterable
+from datetime import UTC, datetime
+
+import pytest
+
+from application.academic.enrollment.dto.errors.error_codes import ErrorCodes
+from application.academic.enrollment.errors.persistence_errors import ConcurrencyConflictError
+from application.academic.enrollment.services._bulk_state_change_flow import iter_batches
+from application.academic.enrollment.services.bulk_cancel_enrollment import (
+    BulkCancelEnrollmentService,
+)
+from application.academic.enrollment.services.bulk_conclude_enrollment import (
+    BulkConcludeEnrollmentService,
+)
+from application.academic.enrollment.services.bulk_suspend_enrollment import (
+    BulkSuspendEnrollmentService,
+)
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from domain.academic.enrollment.events.enrollment_events import (
+    EnrollmentCancelled,
+    EnrollmentConcluded,
+    EnrollmentSuspended,
+)
+from domain.academic.enrollment.value_objects.conclusion_verdict import ConclusionVerdict
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+from tests.application.academic.enrollment.fakes import (
+    InMemoryEnrollmentRepository,
+    make_enrollment,
+)
+
+
+def _seed(repo: InMemoryEnrollmentRepository, enrollment_id: str, state: EnrollmentState,
+          class_group_id: str = "cls-1") -> Enrollment:
+    enrollment = make_enrollment(state=state)
+    enrollment.id = enrollment_id
+    enrollment.class_group_id = class_group_id
+    repo.seed(enrollment)
+    return enrollment
+
+
+class SpyEnrollmentRepository(InMemoryEnrollmentRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.get_many_calls: list[list[str]] = []
+        self.get_by_id_calls = 0
+
+    def get_many(self, enrollment_ids: Iterable[str]) -> dict[str, Enrollment | None]:
+        ids = list(enrollment_ids)
+        self.get_many_calls.append(ids)
+        return super().get_many(ids)
+
+    def get_by_id(self, enrollment_id: str) -> Enrollment:
+        self.get_by_id_calls += 1
+        return super().get_by_id(enrollment_id)
+
+
+class ConflictingEnrollmentRepository(InMemoryEnrollmentRepository):
+    def __init__(self, conflicting_id: str) -> None:
+        super().__init__()
+        self.conflicting_id = conflicting_id
+
+    def save(self, enrollment: Enrollment) -> int:
+        if enrollment.id == self.conflicting_id:
+            raise ConcurrencyConflictError(
+                code="version_mismatch",
+                message="version mismatch",
+                details={"aggregate_id": enrollment.id, "expected_version": 1, "persisted_version": 2},
+            )
+        return super().save(enrollment)
+
+
+def test_bulk_suspend_returns_one_result_per_item_with_single_item_semantics():
+    repo = InMemoryEnrollmentRepository()
+    _seed(repo, "enr-active", EnrollmentState.ACTIVE)
+    _seed(repo, "enr-suspended", EnrollmentState.SUSPENDED)
+    _seed(repo, "enr-cancelled", EnrollmentState.CANCELLED)
+
+    results = BulkSuspendEnrollmentService(repo=repo).execute(
+        enrollment_ids=["enr-active", "enr-suspended", "enr-cancelled", "enr-missing"],
+        actor_id="user-1",
+        justification="period close",
+        occurred_at=datetime.now(UTC),
+    )
+
+    assert [r.aggregate_id for r in results] == ["enr-active", "enr-suspended", "enr-cancelled", "enr-missing"]
+
+    changed, no_op, invalid, missing = results
+    assert changed.success is True and changed.changed is True
+    assert changed.new_state == EnrollmentState.SUSPENDED
+    assert isinstance(changed.domain_events[0], EnrollmentSuspended)
+
+    assert no_op.success is True and no_op.changed is False
+    assert no_op.domain_events == ()
+
+    assert invalid.success is False
+    assert invalid.error is not None
+    assert invalid.error.code == ErrorCodes.INVALID_STATE_TRANSITION
+
+    assert missing.success is False
+    assert missing.error is not None
+    assert missing.error.code == ErrorCodes.ENROLLMENT_NOT_FOUND
+
+    assert repo.save_calls == 1
+    assert repo.get_by_id("enr-active").peek_domain_events() == []
+
+
+def test_bulk_service_reports_concurrency_conflict_per_item():
+    repo = ConflictingEnrollmentRepository(conflicting_id="enr-2")
+    _seed(repo, "enr-1", EnrollmentState.ACTIVE)
+    conflicting = _seed(repo, "enr-2", EnrollmentState.ACTIVE)
+
+    results = BulkCancelEnrollmentService(repo=repo).execute(
+        enrollment_ids=["enr-1", "enr-2"],
+        actor_id="user-1",
+        justification="duplicate record",
+    )
+
+    assert results[0].success is True
+    assert isinstance(results[0].domain_events[0], EnrollmentCancelled)
+
+    assert results[1].success is False
+    assert results[1].error is not None
+    assert results[1].error.code == ErrorCodes.CONCURRENCY_CONFLICT
+    assert results[1].error.details["persisted_version"] == 2
+    assert len(conflicting.peek_domain_events()) == 1
+
+
+def test_bulk_service_loads_in_batches_and_processes_duplicates_once():
+    repo = SpyEnrollmentRepository()
+    for index in range(5):
+        _seed(repo, f"enr-{index}", EnrollmentState.ACTIVE)
+
+    results = BulkSuspendEnrollmentService(repo=repo, batch_size=2).execute(
+        enrollment_ids=["enr-0", "enr-1", "enr-0", "enr-2", "enr-3", "enr-4"],
+        actor_id="user-1",
+        justification="period close",
+    )
+
+    assert [r.aggregate_id for r in results] == ["enr-0", "enr-1", "enr-2", "enr-3", "enr-4"]
+    assert all(r.changed for r in results)
+    assert repo.get_many_calls == [["enr-0", "enr-1"], ["enr-2", "enr-3"], ["enr-4"]]
+    assert repo.get_by_id_calls == 0
+
+
+def test_bulk_service_selects_enrollments_by_class_group_and_period():
+    repo = InMemoryEnrollmentRepository()
+    _seed(repo, "enr-b", EnrollmentState.ACTIVE, class_group_id="cls-1")
+    _seed(repo, "enr-a", EnrollmentState.ACTIVE, class_group_id="cls-1")
+    _seed(repo, "enr-other", EnrollmentState.ACTIVE, class_group_id="cls-2")
+
+    results = BulkCancelEnrollmentService(repo=repo).execute_for_class_group(
+        class_group_id="cls-1",
+        academic_period_id="per-1",
+        actor_id="user-1",
+        justification="class group closed",
+    )
+
+    assert [r.aggregate_id for r in results] == ["enr-a", "enr-b"]
+    assert all(r.new_state == EnrollmentState.CANCELLED for r in results)
+    assert repo.get_by_id("enr-other").state == EnrollmentState.ACTIVE
+
+
+def test_bulk_conclude_applies_per_item_verdict_overrides():
+    repo = InMemoryEnrollmentRepository()
+    _seed(repo, "enr-1", EnrollmentState.ACTIVE)
+    _seed(repo, "enr-2", EnrollmentState.ACTIVE)
+
+    results = BulkConcludeEnrollmentService(repo=repo).execute_for_class_group(
+        class_group_id="cls-1",
+        academic_period_id="per-1",
+        actor_id="user-1",
+        verdict=ConclusionVerdict.allowed(),
+        verdicts={"enr-2": ConclusionVerdict.denied(["insufficient attendance"])},
+    )
+
+    assert results[0].success is True
+    assert isinstance(results[0].domain_events[0], EnrollmentConcluded)
+    assert results[1].success is False
+    assert results[1].error is not None
+    assert results[1].error.code == ErrorCodes.CONCLUSION_NOT_ALLOWED
+    assert repo.get_by_id("enr-2").state == EnrollmentState.ACTIVE
+
+
+def test_iter_batches_rejects_non_positive_batch_size():
+    with pytest.raises(ValueError):
+        list(iter_batches(["enr-1"], 0))
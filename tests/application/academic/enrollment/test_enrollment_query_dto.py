@@ -0,0 +1,55 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from application.academic.enrollment.dto.enrollment_query import (
+    EnrollmentCursor,
+    EnrollmentListFilters,
+    check_page_size,
+)
+from application.academic.enrollment.errors.enrollment_errors import InvalidEnrollmentCursorError
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+
+INSTITUTION_ID = str(uuid.uuid4())
+
+
+def test_cursor_round_trips_for_the_same_filters():
+    filters = EnrollmentListFilters(institution_id=INSTITUTION_ID, states=frozenset({"active"}))
+    cursor = EnrollmentCursor(created_at=datetime(2026, 3, 1, 8, 30, 0, 123456, tzinfo=UTC), id=str(uuid.uuid4()))
+
+    token = cursor.encode(filters)
+
+    assert EnrollmentCursor.decode(token, filters) == cursor
+    assert filters.states == frozenset({EnrollmentState.ACTIVE})
+
+
+def test_cursor_is_rejected_for_other_filters():
+    filters = EnrollmentListFilters(institution_id=INSTITUTION_ID)
+    token = EnrollmentCursor(created_at=datetime.now(UTC), id=str(uuid.uuid4())).encode(filters)
+
+    with pytest.raises(InvalidEnrollmentCursorError):
+        EnrollmentCursor.decode(token, EnrollmentListFilters(institution_id=INSTITUTION_ID, student_id="std-1"))
+
+
+@pytest.mark.parametrize("token", ["", "not-base64!", "eyJjIjoxfQ", "WzFd"])
+def test_malformed_cursor_is_rejected(token):
+    with pytest.raises(InvalidEnrollmentCursorError):
+        EnrollmentCursor.decode(token, EnrollmentListFilters(institution_id=INSTITUTION_ID))
+
+
+def test_filters_reject_empty_institution_and_inverted_ranges():
+    now = datetime.now(UTC)
+
+    with pytest.raises(ValueError):
+        EnrollmentListFilters(institution_id="")
+    with pytest.raises(ValueError):
+        EnrollmentListFilters(institution_id=INSTITUTION_ID, created_from=now, created_to=now - timedelta(days=1))
+    with pytest.raises(ValueError):
+        EnrollmentListFilters(institution_id=INSTITUTION_ID, states=frozenset({"graduated"}))
+
+
+@pytest.mark.parametrize("page_size", [0, 501])
+def test_page_size_is_bounded(page_size):
+    with pytest.raises(ValueError):
+        check_page_size(page_size)
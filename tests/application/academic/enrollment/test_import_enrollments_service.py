@@ -0,0 +1,120 @@
+from collections.abc import Iterator
+
+import pytest
+
+from application.academic.enrollment.dto.enrollment_import import EnrollmentImportRow
+from application.academic.enrollment.dto.errors.error_codes import ErrorCodes
+from application.academic.enrollment.services.import_enrollments import ImportEnrollments
+from domain.academic.enrollment.events.enrollment_events import EnrollmentCreated
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+from tests.application.academic.enrollment.fakes import (
+    FailingEnrollmentRepository,
+    InMemoryEnrollmentRepository,
+)
+
+ACTOR_ID = "actor-1"
+
+
+def _row(row_number: int, student_id: str | None = None, **overrides: object) -> EnrollmentImportRow:
+    fields: dict[str, object] = {
+        "institution_id": "inst-1",
+        "student_id": student_id or f"stu-{row_number}",
+        "class_group_id": "cls-1",
+        "academic_period_id": "per-1",
+    }
+    fields.update(overrides)
+    return EnrollmentImportRow(row_number=row_number, fields={k: v for k, v in fields.items() if v is not None})
+
+
+def _import(repo, rows, chunk_size: int = 1000):
+    return list(ImportEnrollments(repo, chunk_size=chunk_size).execute(rows=rows, actor_id=ACTOR_ID))
+
+
+def test_valid_rows_are_created_with_one_batch_per_chunk() -> None:
+    repo = InMemoryEnrollmentRepository()
+
+    outcomes = _import(repo, [_row(n) for n in range(1, 6)], chunk_size=2)
+
+    assert [outcome.row_number for outcome in outcomes] == [1, 2, 3, 4, 5]
+    assert all(outcome.result.success and outcome.result.changed for outcome in outcomes)
+    assert all(outcome.result.new_state == EnrollmentState.ACTIVE for outcome in outcomes)
+    assert all(isinstance(outcome.result.domain_events[0], EnrollmentCreated) for outcome in outcomes)
+    assert [len(call) for call in repo.create_many_calls] == [2, 2, 1]
+    assert len(repo.items) == 5
+
+
+def test_duplicate_business_key_in_a_chunk_never_reaches_the_repository() -> None:
+    repo = InMemoryEnrollmentRepository()
+
+    outcomes = _import(repo, [_row(1, "stu-a"), _row(2, "stu-b"), _row(3, "stu-a")])
+
+    duplicate = outcomes[2].result
+    assert not duplicate.success
+    assert duplicate.error is not None
+    assert duplicate.error.code == ErrorCodes.DUPLICATE_ENROLLMENT
+    assert duplicate.error.details["duplicate_of_row"] == 1
+    assert [len(call) for call in repo.create_many_calls] == [2]
+
+
+def test_duplicate_business_key_across_chunks_is_reported_by_the_repository() -> None:
+    repo = InMemoryEnrollmentRepository()
+
+    outcomes = _import(repo, [_row(1, "stu-a"), _row(2, "stu-b"), _row(3, "stu-a")], chunk_size=2)
+
+    duplicate = outcomes[2].result
+    assert duplicate.error is not None
+    assert duplicate.error.code == ErrorCodes.DUPLICATE_ENROLLMENT
+    assert duplicate.aggregate_id is not None
+    assert len(repo.items) == 2
+
+
+def test_invalid_rows_are_reported_without_stopping_the_import() -> None:
+    repo = InMemoryEnrollmentRepository()
+    rows = [
+        _row(1),
+        _row(2, class_group_id="   "),
+        _row(3, academic_period_id=None),
+        EnrollmentImportRow(row_number=4, fields={}, parse_error="Invalid JSON: Expecting value."),
+        _row(5),
+    ]
+
+    outcomes = _import(repo, rows)
+
+    assert [outcome.result.success for outcome in outcomes] == [True, False, False, False, True]
+    errors = [outcome.result.error for outcome in outcomes[1:4]]
+    assert all(error is not None and error.code == ErrorCodes.INVALID_ENROLLMENT_DATA for error in errors)
+    assert errors[0] is not None and errors[0].details["domain_code"] == "invalid_class_group_id"
+    assert errors[1] is not None and errors[1].details["missing_fields"] == ["academic_period_id"]
+    assert errors[2] is not None and errors[2].message == "Invalid JSON: Expecting value."
+    assert repo.create_many_calls == [[outcomes[0].result.aggregate_id, outcomes[4].result.aggregate_id]]
+
+
+def test_batch_failure_is_reported_on_every_row_of_the_chunk() -> None:
+    repo = FailingEnrollmentRepository()
+
+    outcomes = _import(repo, [_row(1), _row(2)])
+
+    assert all(not outcome.result.success for outcome in outcomes)
+    assert {outcome.result.error.code for outcome in outcomes if outcome.result.error} == {ErrorCodes.DATABASE_ERROR}
+
+
+def test_rows_are_consumed_one_chunk_at_a_time() -> None:
+    repo = InMemoryEnrollmentRepository()
+    consumed: list[int] = []
+
+    def rows() -> Iterator[EnrollmentImportRow]:
+        for row_number in range(1, 7):
+            consumed.append(row_number)
+            yield _row(row_number)
+
+    outcomes = ImportEnrollments(repo, chunk_size=2).execute(rows=rows(), actor_id=ACTOR_ID)
+
+    assert consumed == []
+    assert next(outcomes).row_number == 1
+    assert consumed == [1, 2]
+    assert len(list(outcomes)) == 5
+
+
+def test_chunk_size_must_be_positive() -> None:
+    with pytest.raises(ValueError):
+        ImportEnrollments(InMemoryEnrollmentRepository(), chunk_size=0)
@@ -0,0 +1,107 @@
+from application.academic.enrollment.dto.errors.error_codes import ErrorCodes
+from application.academic.enrollment.services.cancel_enrollment import CancelEnrollmentService
+from application.academic.enrollment.services.suspend_enrollment import SuspendEnrollmentService
+from application.shared.retry_policy import RetryPolicy
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+from tests.application.academic.enrollment.fakes import (
+    ConflictingEnrollmentRepository,
+    RecordingTransactionManager,
+    make_enrollment,
+)
+
+NO_WAIT = RetryPolicy(max_attempts=3, base_delay=0.0, max_delay=0.0, deadline=None)
+
+
+def suspend(service: SuspendEnrollmentService):
+    return service.execute(enrollment_id="enr-1", actor_id="user-1", justification="leave")
+
+
+def test_conflict_is_retried_on_a_fresh_load():
+    repo = ConflictingEnrollmentRepository(conflicts=2)
+    repo.seed(make_enrollment(state=EnrollmentState.ACTIVE))
+    service = SuspendEnrollmentService(repo=repo, retry_policy=NO_WAIT)
+
+    result = suspend(service)
+
+    assert result.success is True
+    assert result.changed is True
+    assert result.new_state == EnrollmentState.SUSPENDED.value
+    assert repo.load_calls == 3
+    assert repo.save_calls == 3
+    stats = service.retry_stats
+    assert stats is not None
+    assert (stats.executions, stats.retries, stats.recovered, stats.exhausted) == (1, 2, 1, 0)
+
+
+def test_exhausted_retries_return_the_conflict_result():
+    repo = ConflictingEnrollmentRepository(conflicts=5)
+    repo.seed(make_enrollment(state=EnrollmentState.ACTIVE))
+    service = SuspendEnrollmentService(repo=repo, retry_policy=NO_WAIT)
+
+    result = suspend(service)
+
+    assert result.success is False
+    assert result.error is not None
+    assert result.error.code == ErrorCodes.CONCURRENCY_CONFLICT
+    assert repo.save_calls == 3
+    assert service.retry_stats is not None
+    assert service.retry_stats.exhausted == 1
+
+
+def test_retry_stops_when_the_winning_write_already_applied_the_command():
+    repo = ConflictingEnrollmentRepository(
+        conflicts=1,
+        on_conflict=lambda: repo.seed(make_enrollment(state=EnrollmentState.SUSPENDED)),
+    )
+    repo.seed(make_enrollment(state=EnrollmentState.ACTIVE))
+    service = SuspendEnrollmentService(repo=repo, retry_policy=NO_WAIT)
+
+    result = suspend(service)
+
+    assert result.success is True
+    assert result.changed is False
+    assert repo.load_calls == 2
+    assert repo.save_calls == 1
+
+
+def test_retry_surfaces_the_domain_rejection_after_a_concurrent_write():
+    repo = ConflictingEnrollmentRepository(
+        conflicts=1,
+        on_conflict=lambda: repo.seed(make_enrollment(state=EnrollmentState.CONCLUDED)),
+    )
+    repo.seed(make_enrollment(state=EnrollmentState.ACTIVE))
+    service = CancelEnrollmentService(repo=repo, retry_policy=NO_WAIT)
+
+    result = service.execute(enrollment_id="enr-1", actor_id="user-1", justification="dropout")
+
+    assert result.success is False
+    assert result.error is not None
+    assert result.error.code != ErrorCodes.CONCURRENCY_CONFLICT
+    assert repo.save_calls == 1
+
+
+def test_without_a_retry_policy_the_conflict_is_returned_at_once():
+    repo = ConflictingEnrollmentRepository(conflicts=1)
+    repo.seed(make_enrollment(state=EnrollmentState.ACTIVE))
+    service = SuspendEnrollmentService(repo=repo)
+
+    result = suspend(service)
+
+    assert result.error is not None
+    assert result.error.code == ErrorCodes.CONCURRENCY_CONFLICT
+    assert repo.load_calls == 1
+    assert service.retry_stats is None
+
+
+def test_each_attempt_runs_in_its_own_transaction():
+    repo = ConflictingEnrollmentRepository(conflicts=1)
+    repo.seed(make_enrollment(state=EnrollmentState.ACTIVE))
+    transaction = RecordingTransactionManager(repo)
+    service = SuspendEnrollmentService(repo=repo, retry_policy=NO_WAIT, transaction=transaction)
+
+    result = suspend(service)
+
+    assert result.success is True
+    assert transaction.opened == 2
+    assert transaction.saves_inside == 2
+    assert transaction.open is False
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import copy
 from datetime import UTC, date, datetime
 from typing import Protocol, cast
 
 from application.identity.user.dto.errors.error_codes import ErrorCodes
 from application.identity.user.errors.persistence_errors import (
+    ConcurrencyConflictError,
     UserDuplicationError,
     UserTechnicalPersistenceError,
 )
@@ -109,3 +111,40 @@ class FailingUserRepository(InMemoryUserRepository):
             message="Failed to create user due to a database error.",
             details={"error": self.message},   
         )
+
+
+class ConflictingUserRepository(InMemoryUserRepository):
+    """Fails the first ``conflicts`` saves with a version conflict; get_by_id returns a copy."""
+    def __init__(self, *, conflicts: int):
+        super().__init__()
+        self.conflicts = conflicts
+        self.load_calls = 0
+
+    def get_by_id(self, user_id: str) -> User:
+        self.load_calls += 1
+        return cast(User, copy.deepcopy(self.items.get(user_id)))
+
+    def save(self, user: User) -> int:
+        if self.save_calls < self.conflicts:
+            self.save_calls += 1
+            raise ConcurrencyConflictError(
+                code="version_mismatch",
+                message="User was modified by another process.",
+                details={"expected_version": user.version, "persisted_version": user.version + 1},
+            )
+        return super().save(user)
+
+
+class AsyncInMemoryUserRepository:
+    """AsyncUserRepository fake delegating to a sync fake (shares its items and counters)."""
+    def __init__(self, inner: InMemoryUserRepository | None = None) -> None:
+        self.inner = inner or InMemoryUserRepository()
+
+    async def get_by_id(self, user_id: str) -> User | None:
+        return self.inner.get_by_id(user_id)
+
+    async def save(self, user: User) -> int:
+        return self.inner.save(user)
+
+    async def create(self, user: User) -> int:
+        return self.inner.create(user)
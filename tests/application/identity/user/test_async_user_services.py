@@ -0,0 +1,78 @@
+import asyncio
+from datetime import UTC, date, datetime
+
+from application.identity.user.dto.errors.error_codes import ErrorCodes
+from application.identity.user.services.activate_user import AsyncActivateUserService
+from application.identity.user.services.create_user import AsyncCreateUser
+from application.identity.user.services.suspend_user import AsyncSuspendUserService
+from application.shared.retry_policy import RetryPolicy
+from domain.identity.user.events.user_events import UserActivated
+from domain.identity.user.value_objects.user_state import UserState
+from tests.application.identity.user.fakes_user import (
+    AsyncInMemoryUserRepository,
+    ConflictingUserRepository,
+    make_user,
+)
+
+
+def test_async_activate_user_success():
+    repo = AsyncInMemoryUserRepository()
+    repo.inner.items["user1_id"] = make_user(state=UserState.PENDING)
+
+    result = asyncio.run(
+        AsyncActivateUserService(repo=repo).execute(
+            user_id="user1_id", actor_id="actor-1", occurred_at=datetime.now(UTC),
+        )
+    )
+
+    assert result.success is True
+    assert result.new_state == UserState.ACTIVE
+    assert isinstance(result.domain_events[0], UserActivated)
+    assert repo.inner.save_calls == 1
+
+
+def test_async_suspend_user_retries_a_version_conflict():
+    inner = ConflictingUserRepository(conflicts=1)
+    inner.items["user1_id"] = make_user(state=UserState.ACTIVE)
+    service = AsyncSuspendUserService(
+        repo=AsyncInMemoryUserRepository(inner),
+        retry_policy=RetryPolicy(base_delay=0.0, max_delay=0.0, deadline=None),
+    )
+
+    result = asyncio.run(service.execute(user_id="user1_id", actor_id="actor-1", justification="abuse"))
+
+    assert result.changed is True
+    assert (inner.load_calls, inner.save_calls) == (2, 2)
+
+
+def test_async_suspend_user_not_found():
+    result = asyncio.run(
+        AsyncSuspendUserService(repo=AsyncInMemoryUserRepository()).execute(
+            user_id="missing", actor_id="actor-1", justification="abuse",
+        )
+    )
+
+    assert result.error is not None
+    assert result.error.code == ErrorCodes.USER_NOT_FOUND
+
+
+def test_async_create_user_and_duplicate():
+    service = AsyncCreateUser(repo=AsyncInMemoryUserRepository())
+    data = {
+        "identity_type": "cpf",
+        "identity_number": "12345678901",
+        "identity_issuer": "SSD",
+        "full_name": "John Doe",
+        "birth_date": date(1990, 1, 1),
+        "created_by": "actor-1",
+    }
+
+    async def create_twice():
+        return await service.execute(**data), await service.execute(**data)
+
+    created, duplicate = asyncio.run(create_twice())
+
+    assert created.success is True
+    assert created.new_state == "pending"
+    assert duplicate.error is not None
+    assert duplicate.error.code == ErrorCodes.DUPLICATE_USER
@@ -2,9 +2,11 @@ from datetime import UTC, datetime
 
 from application.identity.user.dto.errors.error_codes import ErrorCodes
 from application.identity.user.services.suspend_user import SuspendUserService
+from application.shared.retry_policy import RetryPolicy
 from domain.identity.user.events.user_events import UserSuspended
 from domain.identity.user.value_objects.user_state import UserState
 from tests.application.identity.user.fakes_user import (
+    ConflictingUserRepository,
     FailingUserRepository,
     InMemoryUserRepository,
     make_user,
@@ -118,4 +120,21 @@ def test_suspend_user_returns_failure_when_save_fails():
 
     assert result.error.details["aggregate_id"] == user.id
     assert result.error.details["action"] == "suspend"
-    assert result.error.details["current_state"] == UserState.SUSPENDED.value 
\ No newline at end of file
+    assert result.error.details["current_state"] == UserState.SUSPENDED.value
+
+
+def test_suspend_user_retries_a_version_conflict_on_a_fresh_load():
+    repo = ConflictingUserRepository(conflicts=1)
+    repo.items["user1_id"] = make_user(state=UserState.ACTIVE)
+    service = SuspendUserService(
+        repo=repo,
+        retry_policy=RetryPolicy(base_delay=0.0, max_delay=0.0, deadline=None),
+    )
+
+    result = service.execute(user_id="user1_id", actor_id="user-1", justification="justification")
+
+    assert result.success is True
+    assert result.changed is True
+    assert (repo.load_calls, repo.save_calls) == (2, 2)
+    assert service.retry_stats is not None
+    assert service.retry_stats.recovered == 1
@@ -0,0 +1,117 @@
+import random
+
+import pytest
+
+from application.shared.retry_policy import ConflictRetrier, RetryPolicy
+
+CONFLICT = "conflict"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_retrier(policy: RetryPolicy, clock: FakeClock | None = None) -> ConflictRetrier:
+    clock = clock or FakeClock()
+    return ConflictRetrier(
+        policy,
+        is_conflict=lambda result: result == CONFLICT,
+        sleep=clock.sleep,
+        clock=clock,
+        rng=random.Random(7),
+    )
+
+
+def scripted(*results: str):
+    remaining = list(results)
+    calls: list[int] = []
+
+    def attempt() -> str:
+        calls.append(1)
+        return remaining.pop(0)
+
+    return attempt, calls
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"max_attempts": 0},
+        {"base_delay": -0.1},
+        {"base_delay": 0.2, "max_delay": 0.1},
+        {"deadline": 0},
+    ],
+)
+def test_retry_policy_rejects_invalid_settings(kwargs):
+    with pytest.raises(ValueError):
+        RetryPolicy(**kwargs)
+
+
+def test_backoff_is_jittered_within_the_exponential_cap():
+    policy = RetryPolicy(base_delay=0.01, max_delay=0.03)
+    rng = random.Random(1)
+
+    for retry, cap in [(1, 0.01), (2, 0.02), (3, 0.03), (8, 0.03)]:
+        delays = {policy.backoff(retry, rng) for _ in range(50)}
+        assert all(0.0 <= delay <= cap for delay in delays)
+        assert len(delays) > 1
+
+
+def test_result_without_conflict_is_returned_without_retrying():
+    retrier = make_retrier(RetryPolicy())
+    attempt, calls = scripted("ok")
+
+    assert retrier.run(attempt) == "ok"
+    assert len(calls) == 1
+    assert retrier.stats.retries == 0
+
+
+def test_conflict_is_retried_until_an_attempt_succeeds():
+    clock = FakeClock()
+    retrier = make_retrier(RetryPolicy(max_attempts=3), clock)
+    attempt, calls = scripted(CONFLICT, CONFLICT, "ok")
+
+    assert retrier.run(attempt) == "ok"
+    assert len(calls) == 3
+    assert len(clock.sleeps) == 2
+
+
+def test_max_attempts_bounds_the_attempts_and_returns_the_last_conflict():
+    retrier = make_retrier(RetryPolicy(max_attempts=2))
+    attempt, calls = scripted(CONFLICT, CONFLICT, "ok")
+
+    assert retrier.run(attempt) == CONFLICT
+    assert len(calls) == 2
+
+
+def test_deadline_stops_retries_before_max_attempts():
+    clock = FakeClock()
+    retrier = make_retrier(RetryPolicy(max_attempts=100, base_delay=0.01, max_delay=0.01, deadline=0.1), clock)
+
+    def attempt() -> str:
+        clock.now += 0.02
+        return CONFLICT
+
+    assert retrier.run(attempt) == CONFLICT
+    assert clock.now <= 0.1 + 0.02
+    assert retrier.stats.exhausted == 1
+
+
+def test_stats_count_retries_recoveries_and_exhaustion():
+    retrier = make_retrier(RetryPolicy(max_attempts=2))
+
+    retrier.run(scripted("ok")[0])
+    retrier.run(scripted(CONFLICT, "ok")[0])
+    retrier.run(scripted(CONFLICT, CONFLICT)[0])
+
+    stats = retrier.stats
+    assert (stats.executions, stats.retries, stats.recovered, stats.exhausted) == (3, 2, 1, 1)
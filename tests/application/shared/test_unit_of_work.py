@@ -0,0 +1,204 @@
+from collections.abc import Iterable, Sequence
+from datetime import date
+
+import pytest
+
+from application.academic.enrollment.errors.persistence_errors import (
+    ApplicationPersistenceError,
+    ConcurrencyConflictError,
+)
+from application.academic.enrollment.services.cancel_enrollment import CancelEnrollmentService
+from application.shared.unit_of_work import UnitOfWork
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from domain.academic.enrollment.events.enrollment_events import (
+    EnrollmentCancelled,
+    EnrollmentCreated,
+)
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+from domain.identity.user.entities.user import User
+from domain.identity.user.events.user_events import UserCreated, UserInactivated
+from domain.identity.user.value_objects.legal_identity import LegalIdentity, LegalIdentityType
+from domain.identity.user.value_objects.user_state import UserState
+from tests.application.academic.enrollment.fakes import (
+    InMemoryEnrollmentRepository,
+    RecordingTransactionManager,
+    make_enrollment,
+)
+from tests.application.identity.user.fakes_user import InMemoryUserRepository, make_user
+
+ACTOR_ID = "actor-1"
+
+
+class SpyEnrollmentRepository(InMemoryEnrollmentRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.get_by_id_calls = 0
+        self.get_many_calls: list[list[str]] = []
+
+    def get_by_id(self, enrollment_id: str) -> Enrollment:
+        self.get_by_id_calls += 1
+        return super().get_by_id(enrollment_id)
+
+    def get_many(self, enrollment_ids: Iterable[str]) -> dict[str, Enrollment | None]:
+        ids = list(enrollment_ids)
+        self.get_many_calls.append(ids)
+        return super().get_many(ids)
+
+
+class ConflictOnBatchRepository(SpyEnrollmentRepository):
+    def save_many(self, enrollments: Sequence[Enrollment]) -> dict[str, int | ApplicationPersistenceError]:
+        outcomes = super().save_many(enrollments)
+        outcomes[enrollments[-1].id] = ConcurrencyConflictError(
+            code="version_mismatch",
+            message="Enrollment was modified by another process.",
+        )
+        return outcomes
+
+
+def _seed(repo: InMemoryEnrollmentRepository, *enrollment_ids: str) -> None:
+    for enrollment_id in enrollment_ids:
+        enrollment = make_enrollment(state=EnrollmentState.ACTIVE)
+        enrollment.id = enrollment_id
+        repo.seed(enrollment)
+
+
+@pytest.fixture
+def enrollments() -> SpyEnrollmentRepository:
+    repo = SpyEnrollmentRepository()
+    _seed(repo, "enr-1", "enr-2")
+    return repo
+
+
+@pytest.fixture
+def users() -> InMemoryUserRepository:
+    repo = InMemoryUserRepository()
+    repo.seed(make_user(state=UserState.ACTIVE))
+    return repo
+
+
+def test_cross_aggregate_workflow_commits_once_and_collects_events_after_commit(enrollments, users) -> None:
+    transaction = RecordingTransactionManager(enrollments)
+    uow = UnitOfWork(transaction=transaction, enrollments=enrollments, users=users)
+
+    with uow:
+        user = uow.users.get_by_id("user1_id")
+        user.inactivate(actor_id=ACTOR_ID, justification="left the institution")
+        for enrollment in uow.enrollments.get_many(["enr-1", "enr-2"]).values():
+            enrollment.cancel(actor_id=ACTOR_ID, justification="user inactivated")
+        assert uow.events == ()
+
+    assert (transaction.opened, transaction.rolled_back) == (1, 0)
+    assert enrollments.save_many_calls == [["enr-1", "enr-2"]]
+    assert transaction.saves_inside == 2
+    assert users.save_calls == 1
+    assert uow.committed
+    assert [type(event) for event in uow.events] == [UserInactivated, EnrollmentCancelled, EnrollmentCancelled]
+    assert user.peek_domain_events() == []
+
+
+def test_identity_map_returns_the_same_instance_without_reloading(enrollments) -> None:
+    with UnitOfWork(transaction=RecordingTransactionManager(), enrollments=enrollments) as uow:
+        first = uow.enrollments.get_by_id("enr-1")
+        assert uow.enrollments.get_by_id("enr-1") is first
+        assert uow.enrollments.get_by_id("missing") is None
+        assert uow.enrollments.get_by_id("missing") is None
+
+        loaded = uow.enrollments.get_many(["enr-1", "enr-2", "enr-2"])
+
+    assert loaded["enr-1"] is first
+    assert list(loaded) == ["enr-1", "enr-2"]
+    assert enrollments.get_by_id_calls == 2
+    assert enrollments.get_many_calls == [["enr-2"]]
+    # Nothing changed, nothing flushed
+    assert enrollments.save_many_calls == []
+
+
+def test_services_inside_the_unit_are_flushed_in_one_batch(enrollments) -> None:
+    with UnitOfWork(transaction=RecordingTransactionManager(), enrollments=enrollments) as uow:
+        service = CancelEnrollmentService(uow.enrollments)
+        results = [
+            service.execute(enrollment_id=enrollment_id, actor_id=ACTOR_ID, justification="closed")
+            for enrollment_id in ("enr-1", "enr-2")
+        ]
+        assert enrollments.save_calls == 0
+
+    assert all(result.success for result in results)
+    assert enrollments.save_many_calls == [["enr-1", "enr-2"]]
+    # The results carry a copy; the aggregates kept the events for the flush
+    assert uow.events == tuple(event for result in results for event in result.domain_events)
+    assert [type(event) for event in uow.events] == [EnrollmentCancelled] * 2
+
+
+def test_created_aggregates_are_not_saved_again_and_their_events_are_collected(enrollments) -> None:
+    users = InMemoryUserRepository()
+    user = User.create(
+        legal_identity=LegalIdentity(
+            identity_type=LegalIdentityType.CPF, identity_number="52998224725", identity_issuer="SSP"
+        ),
+        full_name="new-user",
+        birth_date=date(1990, 1, 1),
+        created_by=ACTOR_ID,
+    )
+    enrollment = Enrollment.create(
+        institution_id="inst-9",
+        student_id=user.id,
+        class_group_id="class-9",
+        academic_period_id="period-9",
+        actor_id=ACTOR_ID,
+    )
+
+    with UnitOfWork(transaction=RecordingTransactionManager(), enrollments=enrollments, users=users) as uow:
+        uow.users.create(user)
+        uow.enrollments.create(enrollment)
+
+    assert users.save_calls == 0
+    assert enrollments.save_many_calls == []
+    assert [type(event) for event in uow.events] == [UserCreated, EnrollmentCreated]
+    assert user.peek_domain_events() == [] and enrollment.peek_domain_events() == []
+
+
+def test_failed_flush_rolls_back_and_keeps_events_buffered(users) -> None:
+    enrollments = ConflictOnBatchRepository()
+    _seed(enrollments, "enr-1", "enr-2")
+    transaction = RecordingTransactionManager()
+    uow = UnitOfWork(transaction=transaction, enrollments=enrollments, users=users)
+
+    with pytest.raises(ConcurrencyConflictError), uow:
+        user = uow.users.get_by_id("user1_id")
+        user.inactivate(actor_id=ACTOR_ID, justification="left the institution")
+        for enrollment in uow.enrollments.get_many(["enr-1", "enr-2"]).values():
+            enrollment.cancel(actor_id=ACTOR_ID, justification="user inactivated")
+
+    assert transaction.rolled_back == 1
+    assert not uow.committed
+    assert uow.events == ()
+    assert len(user.peek_domain_events()) == 1
+    assert all(len(e.peek_domain_events()) == 1 for e in enrollments.get_many(["enr-1", "enr-2"]).values())
+
+
+def test_exception_in_the_block_flushes_nothing(enrollments) -> None:
+    transaction = RecordingTransactionManager()
+
+    with pytest.raises(RuntimeError), UnitOfWork(transaction=transaction, enrollments=enrollments) as uow:
+        uow.enrollments.get_by_id("enr-1").cancel(actor_id=ACTOR_ID, justification="closed")
+        raise RuntimeError("boom")
+
+    assert transaction.rolled_back == 1
+    assert enrollments.save_many_calls == []
+
+
+def test_a_second_instance_of_a_tracked_aggregate_is_rejected(enrollments) -> None:
+    other = make_enrollment(state=EnrollmentState.ACTIVE)
+
+    with pytest.raises(ValueError), UnitOfWork(transaction=RecordingTransactionManager(), enrollments=enrollments) as uow:
+        uow.enrollments.get_by_id("enr-1")
+        uow.enrollments.save(other)
+
+
+def test_a_unit_of_work_is_single_use(enrollments) -> None:
+    uow = UnitOfWork(transaction=RecordingTransactionManager(), enrollments=enrollments)
+    with uow:
+        pass
+
+    with pytest.raises(RuntimeError), uow:
+        pass
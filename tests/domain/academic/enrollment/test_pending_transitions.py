@@ -0,0 +1,93 @@
+from datetime import UTC, datetime, timedelta
+
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+from domain.academic.enrollment.value_objects.state_transition import StateTransition
+from domain.shared.lazy_history import LazyHistory
+
+
+def make_enrollment(
+        *, transitions: list[StateTransition] | LazyHistory[StateTransition] | None = None
+) -> Enrollment:
+    return Enrollment(
+        id="enr-1",
+        institution_id="inst-1",
+        student_id="stu-1",
+        class_group_id="cls-1",
+        academic_period_id="per-1",
+        state=EnrollmentState.ACTIVE,
+        created_by="user-1",
+        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+        transitions=transitions if transitions is not None else [],
+    )
+
+
+def test_transitions_given_at_construction_are_not_pending() -> None:
+    history = [
+        StateTransition(
+            from_state=EnrollmentState.ACTIVE,
+            to_state=EnrollmentState.SUSPENDED,
+            actor_id="user-1",
+            occurred_at=datetime(2026, 1, 2, tzinfo=UTC),
+        ),
+        StateTransition(
+            from_state=EnrollmentState.SUSPENDED,
+            to_state=EnrollmentState.ACTIVE,
+            actor_id="user-1",
+            occurred_at=datetime(2026, 1, 3, tzinfo=UTC),
+        ),
+    ]
+    enrollment = make_enrollment(transitions=history)
+
+    assert enrollment.pending_transitions() == []
+
+
+def test_every_command_since_rehydration_is_pending_in_order() -> None:
+    enrollment = make_enrollment()
+    start = datetime(2026, 2, 1, tzinfo=UTC)
+
+    enrollment.suspend(actor_id="user-1", justification="leave", occurred_at=start)
+    enrollment.reactivate(actor_id="user-1", justification="back", occurred_at=start + timedelta(days=1))
+
+    pending = enrollment.pending_transitions()
+    assert [t.to_state for t in pending] == [EnrollmentState.SUSPENDED, EnrollmentState.ACTIVE]
+    assert pending == enrollment.transitions
+
+
+def test_mark_persisted_moves_the_high_water_mark_and_the_version() -> None:
+    enrollment = make_enrollment()
+    enrollment.suspend(actor_id="user-1", justification="leave")
+    enrollment.mark_persisted(version=2)
+
+    enrollment.cancel(actor_id="user-1", justification="dropout")
+
+    assert enrollment.version == 2
+    assert [t.to_state for t in enrollment.pending_transitions()] == [EnrollmentState.CANCELLED]
+    assert len(enrollment.transitions) == 2
+
+
+def test_commands_on_a_lazy_history_do_not_load_it() -> None:
+    persisted = StateTransition(
+        from_state=EnrollmentState.ACTIVE,
+        to_state=EnrollmentState.SUSPENDED,
+        actor_id="user-1",
+        occurred_at=datetime(2026, 1, 2, tzinfo=UTC),
+    )
+    loads: list[int] = []
+
+    def load() -> list[StateTransition]:
+        loads.append(1)
+        return [persisted]
+
+    history = LazyHistory(load)
+    enrollment = make_enrollment(transitions=history)
+
+    enrollment.suspend(actor_id="user-1", justification="leave", occurred_at=datetime(2026, 2, 1, tzinfo=UTC))
+    pending = enrollment.pending_transitions()
+    enrollment.mark_persisted(version=2)
+
+    assert loads == []
+    assert not history.is_loaded
+    assert [t.to_state for t in pending] == [EnrollmentState.SUSPENDED]
+    assert enrollment.transitions == [persisted, *pending]
+    assert loads == [1]
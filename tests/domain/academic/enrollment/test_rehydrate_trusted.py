@@ -0,0 +1,65 @@
+from dataclasses import fields
+from datetime import UTC, datetime
+
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+from domain.academic.enrollment.value_objects.state_transition import StateTransition
+
+CREATED_AT = datetime(2026, 1, 1, 8, 0, tzinfo=UTC)
+SUSPENDED_AT = datetime(2026, 1, 2, 8, 0, tzinfo=UTC)
+
+
+def _values() -> dict:
+    return {
+        "id": "enr-1",
+        "institution_id": "inst-1",
+        "student_id": "stu-1",
+        "class_group_id": "cls-1",
+        "academic_period_id": "per-1",
+        "created_by": "user-1",
+        "state": EnrollmentState.SUSPENDED,
+        "created_at": CREATED_AT,
+        "concluded_at": None,
+        "cancelled_at": None,
+        "suspended_at": SUSPENDED_AT,
+        "reactivated_at": None,
+        "version": 2,
+    }
+
+
+def _transition_values() -> dict:
+    return {
+        "from_state": EnrollmentState.ACTIVE,
+        "actor_id": "user-1",
+        "to_state": EnrollmentState.SUSPENDED,
+        "occurred_at": SUSPENDED_AT,
+        "justification": "reason",
+    }
+
+
+def test_trusted_enrollment_sets_every_constructor_field() -> None:
+    transitions = [StateTransition(**_transition_values())]
+    validated = Enrollment(**_values(), transitions=list(transitions))
+
+    trusted = Enrollment.rehydrate_trusted(**_values(), transitions=list(transitions))
+
+    for field in fields(Enrollment):
+        assert getattr(trusted, field.name) == getattr(validated, field.name), field.name
+    assert trusted.pending_transitions() == []
+    assert trusted.peek_domain_events() == []
+
+
+def test_trusted_transition_matches_validated_one() -> None:
+    assert StateTransition.rehydrate_trusted(**_transition_values()) == StateTransition(**_transition_values())
+
+
+def test_trusted_enrollment_accepts_commands_and_tracks_pending_transitions() -> None:
+    transitions = [StateTransition.rehydrate_trusted(**_transition_values())]
+    enrollment = Enrollment.rehydrate_trusted(**_values(), transitions=transitions)
+
+    enrollment.reactivate(actor_id="user-2", justification="back", occurred_at=datetime(2026, 1, 3, tzinfo=UTC))
+
+    assert enrollment.state is EnrollmentState.ACTIVE
+    assert enrollment.suspended_at is None
+    assert [t.to_state for t in enrollment.pending_transitions()] == [EnrollmentState.ACTIVE]
+    assert len(enrollment.pull_domain_events()) == 1
@@ -119,4 +119,16 @@ def test_raises_invalid_event_state(make_user) -> None:
     err = exc_info.value
     assert err.code == "invalid_state_transition"
     assert err.message == "Cannot transition from pending to suspended."
-    assert err.details is not None
\ No newline at end of file
+    assert err.details is not None
+
+def test_activate_rejects_suspended_user_which_must_be_unlocked(make_user) -> None:
+    user = make_user(state=UserState.SUSPENDED)
+
+    with pytest.raises(InvalidStateTransitionError) as exc_info:
+        user.activate(actor_id="admin-1")
+
+    err = exc_info.value
+    assert err.code == "invalid_state_transition"
+    assert err.details == {"event": "UserActivated", "actual_state": "suspended", "expected_state": "pending"}
+    assert user.state == UserState.SUSPENDED
+    assert user.peek_domain_events() == []
@@ -0,0 +1,91 @@
+import pytest
+
+from domain.shared.lazy_history import LazyHistory
+
+
+class CountingLoader:
+    def __init__(self, items: list[int]) -> None:
+        self.items = items
+        self.calls = 0
+
+    def __call__(self) -> list[int]:
+        self.calls += 1
+        return list(self.items)
+
+
+def test_append_does_not_load_and_keeps_local_items_after_the_persisted_ones() -> None:
+    loader = CountingLoader([1, 2])
+    history = LazyHistory(loader)
+
+    history.append(3)
+    history.append(4)
+
+    assert loader.calls == 0
+    assert not history.is_loaded
+    assert list(history) == [1, 2, 3, 4]
+    assert loader.calls == 1
+
+
+def test_reads_load_the_persisted_prefix_once() -> None:
+    loader = CountingLoader([1, 2, 3])
+    history = LazyHistory(loader)
+
+    assert len(history) == 3
+    assert history[0] == 1
+    assert history[-1] == 3
+    assert history[1:] == [2, 3]
+    assert 2 in history
+    history.append(4)
+    assert list(history) == [1, 2, 3, 4]
+    assert loader.calls == 1
+    assert history.is_loaded
+
+
+def test_equality_compares_the_loaded_items() -> None:
+    assert LazyHistory(CountingLoader([1, 2])) == [1, 2]
+    assert LazyHistory(CountingLoader([1, 2])) == (1, 2)
+    assert LazyHistory(CountingLoader([1])) == LazyHistory(CountingLoader([1]))
+    assert LazyHistory(CountingLoader([1])) != [2]
+    assert LazyHistory(CountingLoader([])) != "not a sequence"
+
+
+def test_repr_does_not_load() -> None:
+    loader = CountingLoader([1])
+    history = LazyHistory(loader)
+    history.append(2)
+
+    assert repr(history) == "LazyHistory(<not loaded>, appended=[2])"
+    assert loader.calls == 0
+    list(history)
+    assert repr(history) == "LazyHistory([1, 2])"
+
+
+def test_failed_load_can_be_retried() -> None:
+    attempts: list[int] = []
+
+    def flaky() -> list[int]:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise ConnectionError("database unavailable")
+        return [1]
+
+    history = LazyHistory(flaky)
+    history.append(2)
+
+    with pytest.raises(ConnectionError):
+        len(history)
+
+    assert not history.is_loaded
+    assert list(history) == [1, 2]
+    assert len(attempts) == 2
+
+
+def test_appended_items_stored_before_the_load_are_not_duplicated() -> None:
+    stored = [1, 2]
+    history = LazyHistory(lambda: list(stored))
+
+    history.append(3)
+    stored.append(3)
+    history.append(4)
+
+    assert list(history) == [1, 2, 3, 4]
@@ -0,0 +1,99 @@
+import sys
+import tracemalloc
+from dataclasses import FrozenInstanceError, fields
+from datetime import UTC, date, datetime
+
+import pytest
+
+from domain.academic.enrollment.events import enrollment_events
+from domain.academic.enrollment.value_objects.conclusion_verdict import ConclusionVerdict
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+from domain.academic.enrollment.value_objects.state_transition import StateTransition
+from domain.identity.user.events import user_events
+from domain.identity.user.value_objects.legal_identity import LegalIdentity, LegalIdentityType
+from domain.identity.user.value_objects.user_state import UserState
+from domain.identity.user.value_objects.user_transition import UserTransition
+from domain.shared.domain_event import DomainEvent
+
+NOW = datetime(2026, 3, 1, 9, 0, tzinfo=UTC)
+
+# Upper bound for one loaded transition: the object plus its slot in the history list
+MAX_BYTES_PER_TRANSITION = 88
+
+
+def _instances() -> list[object]:
+    legal_identity = LegalIdentity(
+        identity_type=LegalIdentityType.CPF, identity_number="52998224725", identity_issuer="SSP"
+    )
+    return [
+        StateTransition(from_state=EnrollmentState.ACTIVE, to_state=EnrollmentState.SUSPENDED, actor_id="actor"),
+        UserTransition(from_state=UserState.PENDING, to_state=UserState.ACTIVE, actor_id="actor"),
+        ConclusionVerdict.allowed(),
+        legal_identity,
+        enrollment_events.EnrollmentSuspended(
+            aggregate_id="enr-1", actor_id="actor", from_state=EnrollmentState.ACTIVE,
+            to_state=EnrollmentState.SUSPENDED, justification="leave",
+        ),
+        user_events.UserActivated(
+            aggregate_id="usr-1", actor_id="actor", from_state=UserState.PENDING, to_state=UserState.ACTIVE,
+        ),
+        user_events.UserCreated(
+            aggregate_id="usr-1", actor_id="actor", legal_identity=legal_identity, full_name="Ana",
+            birth_date=date(2000, 1, 1),
+        ),
+    ]
+
+
+def _event_classes() -> list[type[DomainEvent]]:
+    modules = (enrollment_events, user_events)
+    return [DomainEvent] + [
+        value for module in modules for value in vars(module).values()
+        if isinstance(value, type) and issubclass(value, DomainEvent) and value.__module__ == module.__name__
+    ]
+
+
+@pytest.mark.parametrize("cls", _event_classes(), ids=lambda cls: cls.__name__)
+def test_every_domain_event_class_is_slotted(cls) -> None:
+    assert "__slots__" in vars(cls)
+    assert "__dict__" not in vars(cls)
+
+
+@pytest.mark.parametrize("instance", _instances(), ids=lambda instance: type(instance).__name__)
+def test_value_objects_and_events_have_no_instance_dict_and_stay_frozen(instance) -> None:
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(FrozenInstanceError):
+        setattr(instance, fields(instance)[0].name, None)
+    with pytest.raises((AttributeError, TypeError)):
+        instance.undeclared = 1
+
+
+@pytest.mark.parametrize("instance", _instances(), ids=lambda instance: type(instance).__name__)
+def test_construction_is_keyword_only(instance) -> None:
+    values = [getattr(instance, f.name) for f in fields(instance) if f.init]
+
+    with pytest.raises(TypeError):
+        type(instance)(*values)
+
+
+def test_loaded_transitions_stay_under_the_footprint_cap() -> None:
+    count = 10_000
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        history = [
+            StateTransition.rehydrate_trusted(
+                from_state=EnrollmentState.ACTIVE,
+                actor_id="actor",
+                to_state=EnrollmentState.SUSPENDED,
+                occurred_at=NOW,
+                justification=None,
+            )
+            for _ in range(count)
+        ]
+        retained, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert len(history) == count
+    assert (retained - baseline) / count <= MAX_BYTES_PER_TRANSITION
+    assert sys.getsizeof(history[0]) <= MAX_BYTES_PER_TRANSITION - 8
@@ -0,0 +1,198 @@
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import StrEnum
+
+import pytest
+
+from domain.academic.enrollment.entities.enrollment_state_machine import ENROLLMENT_STATE_MACHINE
+from domain.academic.enrollment.events.enrollment_events import (
+    EnrollmentCancelled,
+    EnrollmentSuspended,
+)
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+from domain.identity.user.entities.user_state_machine import USER_STATE_MACHINE
+from domain.identity.user.value_objects.user_state import UserState
+from domain.shared.domain_event import DomainEvent
+from domain.shared.state_machine import (
+    EdgeSpec,
+    IntegrityFault,
+    IntegrityViolation,
+    StateMachineDefinition,
+    StateSpec,
+)
+
+NOW = datetime(2026, 3, 1, 9, 0, tzinfo=UTC)
+
+
+class Light(StrEnum):
+    OFF = "off"
+    ON = "on"
+    BROKEN = "broken"
+
+
+@dataclass
+class Lamp:
+    on_at: datetime | None = None
+    off_at: datetime | None = None
+    broken_at: datetime | None = None
+
+
+def _definition(**overrides) -> StateMachineDefinition:
+    values = {
+        "name": "lamp",
+        "state_enum": Light,
+        "timestamp_fields": ("on_at", "off_at", "broken_at"),
+        "states": (
+            StateSpec(state=Light.OFF, forbidden=("on_at", "broken_at")),
+            StateSpec(state=Light.ON, required=("on_at",), forbidden=("broken_at",)),
+            StateSpec(state=Light.BROKEN, required=("broken_at",)),
+        ),
+        "edges": (
+            EdgeSpec(source=Light.OFF, target=Light.ON, command="switch_on", event_cls=DomainEvent, stamps="on_at"),
+            EdgeSpec(source=Light.ON, target=Light.OFF, command="switch_off", event_cls=DomainEvent, stamps="off_at"),
+            EdgeSpec(
+                source=Light.ON, target=Light.BROKEN, command="break", event_cls=DomainEvent, stamps="broken_at",
+                stamp_once=True,
+            ),
+        ),
+        "reset_on_transition": ("on_at",),
+    }
+    values.update(overrides)
+    return StateMachineDefinition(**values)
+
+
+def test_enrollment_machine_edges_match_the_lifecycle() -> None:
+    allowed = {
+        (source, target)
+        for source in EnrollmentState
+        for target in EnrollmentState
+        if ENROLLMENT_STATE_MACHINE.can_transition(source, target)
+    }
+
+    assert allowed == {
+        (EnrollmentState.ACTIVE, EnrollmentState.SUSPENDED),
+        (EnrollmentState.SUSPENDED, EnrollmentState.ACTIVE),
+        (EnrollmentState.ACTIVE, EnrollmentState.CONCLUDED),
+        (EnrollmentState.ACTIVE, EnrollmentState.CANCELLED),
+        (EnrollmentState.SUSPENDED, EnrollmentState.CANCELLED),
+    }
+    assert ENROLLMENT_STATE_MACHINE.edge(EnrollmentState.ACTIVE, EnrollmentState.SUSPENDED).event_cls is (
+        EnrollmentSuspended
+    )
+    assert ENROLLMENT_STATE_MACHINE.edge(EnrollmentState.SUSPENDED, EnrollmentState.CANCELLED).event_cls is (
+        EnrollmentCancelled
+    )
+    assert ENROLLMENT_STATE_MACHINE.sources(EnrollmentState.CANCELLED) == (
+        EnrollmentState.ACTIVE,
+        EnrollmentState.SUSPENDED,
+    )
+    assert ENROLLMENT_STATE_MACHINE.is_terminal(EnrollmentState.CONCLUDED)
+    assert not ENROLLMENT_STATE_MACHINE.is_terminal(EnrollmentState.SUSPENDED)
+
+
+def test_user_machine_edges_match_the_lifecycle() -> None:
+    assert USER_STATE_MACHINE.targets(UserState.PENDING) == (UserState.ACTIVE, UserState.INACTIVE)
+    assert USER_STATE_MACHINE.targets(UserState.INACTIVE) == ()
+    assert USER_STATE_MACHINE.edge(UserState.SUSPENDED, UserState.ACTIVE).command == "unlock"
+    assert USER_STATE_MACHINE.edge(UserState.PENDING, UserState.ACTIVE).command == "activate"
+
+
+def test_lookups_accept_raw_state_values_and_reject_unknown_ones() -> None:
+    machine = _definition().compile()
+
+    assert machine.can_transition("off", "on")
+    assert machine.ordinal("broken") == 2
+    assert machine.ordinal("melted") is None
+    assert machine.edge("melted", Light.ON) is None
+    assert not machine.can_transition(Light.OFF, "melted")
+    assert machine.targets("melted") == ()
+    assert machine.sources("melted") == ()
+    assert not machine.is_terminal("melted")
+
+
+@pytest.mark.parametrize(
+    "state, lamp, expected",
+    [
+        (Light.OFF, Lamp(), None),
+        (Light.ON, Lamp(on_at=NOW, off_at=NOW), None),
+        (Light.ON, Lamp(), IntegrityViolation(IntegrityFault.MISSING, "on_at")),
+        (Light.ON, Lamp(broken_at=NOW), IntegrityViolation(IntegrityFault.MISSING, "on_at")),
+        (Light.ON, Lamp(on_at=NOW, broken_at=NOW), IntegrityViolation(IntegrityFault.FORBIDDEN, "broken_at")),
+        (Light.OFF, Lamp(broken_at=NOW), IntegrityViolation(IntegrityFault.FORBIDDEN, "broken_at")),
+        ("melted", Lamp(), IntegrityViolation(IntegrityFault.UNKNOWN_STATE)),
+    ],
+)
+def test_integrity_violation_reports_the_first_broken_rule(state, lamp, expected) -> None:
+    assert _definition().compile().integrity_violation(state, lamp) == expected
+
+
+def test_apply_timestamps_resets_then_stamps_and_honours_stamp_once() -> None:
+    machine = _definition().compile()
+    earlier = datetime(2026, 1, 1, tzinfo=UTC)
+
+    lamp = Lamp(on_at=earlier)
+    machine.apply_timestamps(lamp, machine.edge(Light.ON, Light.OFF), NOW)
+    assert lamp == Lamp(on_at=None, off_at=NOW)
+
+    lamp = Lamp(on_at=earlier, broken_at=earlier)
+    machine.apply_timestamps(lamp, machine.edge(Light.ON, Light.BROKEN), NOW)
+    assert lamp.broken_at == earlier
+
+
+def test_integrity_rules_follow_enum_order() -> None:
+    assert _definition().compile().integrity_rules() == (
+        (Light.OFF, (), ("on_at", "broken_at")),
+        (Light.ON, ("on_at",), ("broken_at",)),
+        (Light.BROKEN, ("broken_at",), ()),
+    )
+
+
+@pytest.mark.parametrize(
+    "overrides, message",
+    [
+        ({"states": (StateSpec(state=Light.OFF), StateSpec(state=Light.ON))}, "no StateSpec"),
+        (
+            {"states": (StateSpec(state=Light.OFF),) * 2 + (StateSpec(state=Light.ON), StateSpec(state=Light.BROKEN))},
+            "declared twice",
+        ),
+        (
+            {"states": (
+                StateSpec(state=Light.OFF, required=("lit_at",)),
+                StateSpec(state=Light.ON),
+                StateSpec(state=Light.BROKEN),
+            )},
+            "undeclared fields",
+        ),
+        (
+            {"states": (
+                StateSpec(state=Light.OFF, required=("on_at",), forbidden=("on_at",)),
+                StateSpec(state=Light.ON),
+                StateSpec(state=Light.BROKEN),
+            )},
+            "requires and forbids",
+        ),
+        (
+            {"edges": (EdgeSpec(source=Light.ON, target=Light.ON, command="x", event_cls=DomainEvent),)},
+            "self-loop",
+        ),
+        (
+            {"edges": (EdgeSpec(source=Light.OFF, target=Light.ON, command="x", event_cls=DomainEvent),) * 2},
+            "declared twice",
+        ),
+        (
+            {"edges": (
+                EdgeSpec(source=Light.OFF, target=Light.ON, command="x", event_cls=DomainEvent, stamps="lit_at"),
+            )},
+            "undeclared field",
+        ),
+        (
+            {"edges": (
+                EdgeSpec(source=UserState.ACTIVE, target=Light.ON, command="x", event_cls=DomainEvent),
+            )},
+            "is not a Light",
+        ),
+    ],
+)
+def test_compile_rejects_inconsistent_definitions(overrides, message) -> None:
+    with pytest.raises(ValueError, match=message):
+        _definition(**overrides).compile()
@@ -0,0 +1,157 @@
+import threading
+import time
+import uuid
+
+import pytest
+
+from infrastructure.concurrency.keyed_executor import KeyedLaneExecutor, LaneBackpressureError
+
+
+def test_commands_for_one_key_run_in_submission_order_on_one_lane():
+    seen: list[tuple[int, str]] = []
+
+    def record(step: int) -> int:
+        seen.append((step, threading.current_thread().name))
+        return step
+
+    with KeyedLaneExecutor(lanes=4) as executor:
+        futures = [executor.submit("enr-1", record, step) for step in range(200)]
+        assert [future.result(timeout=5) for future in futures] == list(range(200))
+
+    assert [step for step, _ in seen] == list(range(200))
+    assert len({thread for _, thread in seen}) == 1
+
+
+def test_different_keys_run_in_parallel():
+    release = threading.Event()
+    keys = [str(uuid.uuid4()) for _ in range(64)]
+    with KeyedLaneExecutor(lanes=4) as executor:
+        key_a = keys[0]
+        key_b = next(key for key in keys if executor.lane_for(key) != executor.lane_for(key_a))
+        blocked = executor.submit(key_a, release.wait, 5)
+
+        assert executor.submit(key_b, lambda: "done").result(timeout=5) == "done"
+        assert not blocked.done()
+        release.set()
+        assert blocked.result(timeout=5) is True
+
+
+def test_keys_are_spread_over_the_lanes_and_resizing_moves_few_of_them():
+    keys = [str(uuid.uuid4()) for _ in range(4000)]
+    with KeyedLaneExecutor(lanes=8) as eight, KeyedLaneExecutor(lanes=9) as nine:
+        per_lane = [0] * 8
+        for key in keys:
+            per_lane[eight.lane_for(key)] += 1
+        moved = sum(eight.lane_for(key) != nine.lane_for(key) for key in keys)
+
+    assert min(per_lane) > len(keys) / 8 / 2
+    # Ideal is 1/9 of the keys; a modulo hash would move about 8/9
+    assert moved / len(keys) < 0.25
+
+
+def blocking(started: threading.Event, release: threading.Event):
+    def run() -> bool:
+        started.set()
+        return release.wait(5)
+    return run
+
+
+def test_full_lane_applies_backpressure():
+    started, release = threading.Event(), threading.Event()
+    with KeyedLaneExecutor(lanes=1, max_queue_depth=2) as executor:
+        executor.submit("enr-1", blocking(started, release))
+        started.wait(5)  # the first command is running, off the queue
+        executor.submit("enr-1", lambda: None)
+        executor.submit("enr-1", lambda: None)
+
+        with pytest.raises(LaneBackpressureError) as error:
+            executor.submit("enr-1", lambda: None, timeout=0.01)
+        release.set()
+
+    assert error.value.details == {"key": "enr-1", "lane": 0, "queue_depth": 2}
+
+
+def test_failures_are_set_on_the_future_and_counted_per_lane():
+    def boom() -> None:
+        raise ValueError("boom")
+
+    with KeyedLaneExecutor(lanes=2) as executor:
+        lane = executor.lane_for("enr-1")
+        failing = executor.submit("enr-1", boom)
+        executor.submit("enr-1", lambda: None).result(timeout=5)
+        assert executor.drain(timeout=5)
+
+        with pytest.raises(ValueError, match="boom"):
+            failing.result()
+        stats = executor.stats[lane]
+
+    assert (stats.lane, stats.submitted, stats.completed, stats.failed, stats.queue_depth) == (lane, 2, 2, 1, 0)
+    assert stats.p50_latency_ms is not None
+    assert stats.p99_latency_ms is not None
+    assert stats.p99_latency_ms >= stats.p50_latency_ms
+
+
+def test_drain_waits_for_submitted_commands():
+    done: list[int] = []
+    with KeyedLaneExecutor(lanes=2) as executor:
+        for step in range(20):
+            executor.submit(f"enr-{step % 3}", lambda step=step: (time.sleep(0.001), done.append(step)))
+
+        assert executor.drain(timeout=5) is True
+        assert sorted(done) == list(range(20))
+
+
+def test_drain_times_out_while_a_command_is_still_running():
+    release = threading.Event()
+    with KeyedLaneExecutor(lanes=1) as executor:
+        executor.submit("enr-1", release.wait, 5)
+
+        assert executor.drain(timeout=0.01) is False
+        release.set()
+        assert executor.drain(timeout=5) is True
+
+
+def test_shutdown_rejects_new_commands_and_can_cancel_queued_ones():
+    started, release = threading.Event(), threading.Event()
+    exits: list[str] = []
+    executor = KeyedLaneExecutor(lanes=1, on_lane_exit=lambda: exits.append(threading.current_thread().name))
+    running = executor.submit("enr-1", blocking(started, release))
+    started.wait(5)
+    queued = executor.submit("enr-1", lambda: "never")
+
+    executor.shutdown(wait=False, cancel_pending=True)
+    with pytest.raises(RuntimeError):
+        executor.submit("enr-1", lambda: None)
+    release.set()
+    executor.shutdown(wait=True)
+
+    assert running.result() is True
+    assert queued.cancelled()
+    assert exits == ["lane-0"]
+    assert executor.drain(timeout=0) is True
+
+
+def test_command_accepted_while_shutting_down_still_runs():
+    executor = KeyedLaneExecutor(lanes=1)
+    lane_queue = executor._lanes[0].queue
+    put = lane_queue.put
+    accepted = threading.Event()
+
+    def slow_put(item, *args, **kwargs):
+        if item is not None and hasattr(item, "future"):
+            # submit() is past the shutdown check but has not queued its command yet
+            accepted.set()
+            time.sleep(0.05)
+        put(item, *args, **kwargs)
+
+    lane_queue.put = slow_put
+    futures = []
+    submitter = threading.Thread(target=lambda: futures.append(executor.submit("enr-1", lambda: "ran")))
+    submitter.start()
+    accepted.wait(5)
+
+    executor.shutdown(wait=True)
+    submitter.join(5)
+
+    assert futures[0].result(timeout=1) == "ran"
+    assert executor.drain(timeout=1) is True
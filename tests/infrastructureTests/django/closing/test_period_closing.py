@@ -0,0 +1,239 @@
+import uuid
+from datetime import UTC, datetime
+from io import StringIO
+
+import pytest
+from apps.academic.closing.engine import PeriodClosingEngine
+from apps.academic.closing.policies import AllowAllConclusionPolicy
+from apps.academic.enrollments.transition_id import make_transition_id
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.models.enrollment_transition import EnrollmentTransitionModel
+from apps.academic.models.outbox_event import OutboxEventModel
+from apps.academic.models.period_closing import PeriodClosingReportModel, PeriodClosingRunModel
+from apps.academic.read_models import enrollment_state_counts
+from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from application.academic.enrollment.services.conclude_enrollment import ConcludeEnrollmentService
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from domain.academic.enrollment.value_objects.conclusion_verdict import ConclusionVerdict
+
+ACTOR_ID = str(uuid.uuid4())
+CLOSED_AT = datetime(2026, 12, 18, 17, 30, 15, 250000, tzinfo=UTC)
+SNAPSHOT_COLUMNS = ("state", "concluded_at", "cancelled_at", "suspended_at", "reactivated_at", "version")
+TRANSITION_COLUMNS = ("action", "from_state", "to_state", "occurred_at", "justification", "actor_id")
+
+
+class ScriptedPolicy:
+    """Denies / requires justification for the listed enrollments; fails on chunk `fail_on_call`."""
+
+    def __init__(self, denied=(), needs_justification=(), fail_on_call=None):
+        self.denied = set(denied)
+        self.needs_justification = set(needs_justification)
+        self.fail_on_call = fail_on_call
+        self.calls = 0
+
+    def evaluate_many(self, candidates):
+        self.calls += 1
+        if self.calls == self.fail_on_call:
+            raise ConnectionError("grades service unavailable")
+        verdicts = {}
+        for candidate in candidates:
+            if candidate.enrollment_id in self.denied:
+                verdicts[candidate.enrollment_id] = ConclusionVerdict.denied(["failing_grade"])
+            else:
+                verdicts[candidate.enrollment_id] = ConclusionVerdict.allowed(
+                    requires_justification=candidate.enrollment_id in self.needs_justification
+                )
+        return verdicts
+
+
+def _create(period_id: str, count: int) -> list[str]:
+    repository = DjangoEnrollmentRepository()
+    class_group_id = str(uuid.uuid4())
+    ids = []
+    for _ in range(count):
+        enrollment = Enrollment.create(
+            institution_id=str(uuid.uuid4()),
+            student_id=str(uuid.uuid4()),
+            class_group_id=class_group_id,
+            academic_period_id=period_id,
+            actor_id=ACTOR_ID,
+        )
+        repository.create(enrollment)
+        ids.append(enrollment.id)
+    return sorted(ids)
+
+
+def _concluded_events(enrollment_id: str) -> list[tuple]:
+    return list(
+        OutboxEventModel.objects.filter(aggregate_id=enrollment_id, event_type="EnrollmentConcluded")
+        .values_list("aggregate_version", "occurred_at", "payload")
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_closing_writes_what_the_per_aggregate_conclusion_writes():
+    (service_id,) = _create(str(uuid.uuid4()), 1)
+    period_id = str(uuid.uuid4())
+    (closed_id,) = _create(period_id, 1)
+
+    result = ConcludeEnrollmentService(repo=DjangoEnrollmentRepository()).execute(
+        enrollment_id=service_id,
+        actor_id=ACTOR_ID,
+        verdict=ConclusionVerdict.allowed(),
+        occurred_at=CLOSED_AT,
+        justification="end of year",
+    )
+    assert result.success
+    progress = PeriodClosingEngine(AllowAllConclusionPolicy()).close_period(
+        academic_period_id=period_id, actor_id=ACTOR_ID, occurred_at=CLOSED_AT, justification="end of year",
+    )
+
+    assert (progress.status, progress.concluded, progress.reported) == ("completed", 1, 0)
+    snapshots = EnrollmentModel.objects.in_bulk([service_id, closed_id])
+    assert [getattr(snapshots[uuid.UUID(closed_id)], c) for c in SNAPSHOT_COLUMNS] == [
+        getattr(snapshots[uuid.UUID(service_id)], c) for c in SNAPSHOT_COLUMNS
+    ]
+    service_transition = EnrollmentTransitionModel.objects.values_list(*TRANSITION_COLUMNS).get(enrollment_id=service_id)
+    closed_transition = EnrollmentTransitionModel.objects.get(enrollment_id=closed_id)
+    assert tuple(getattr(closed_transition, c) for c in TRANSITION_COLUMNS) == service_transition
+    assert closed_transition.transition_id == make_transition_id(
+        enrollment_id=uuid.UUID(closed_id),
+        action="conclude",
+        from_state="active",
+        to_state="concluded",
+        occurred_at=CLOSED_AT,
+        actor_id=ACTOR_ID,
+        justification="end of year",
+    )
+    assert _concluded_events(closed_id) == _concluded_events(service_id)
+    assert enrollment_state_counts.verify() == []
+
+    # The aggregate path still rehydrates the set-based result.
+    loaded = DjangoEnrollmentRepository().get_by_id(closed_id)
+    assert loaded is not None and loaded.state.value == "concluded"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_denied_and_unjustified_enrollments_are_reported_and_stay_active():
+    period_id = str(uuid.uuid4())
+    ids = _create(period_id, 4)
+    policy = ScriptedPolicy(denied=[ids[0]], needs_justification=[ids[1]])
+
+    progress = PeriodClosingEngine(policy).close_period(academic_period_id=period_id, actor_id=ACTOR_ID)
+
+    assert (progress.concluded, progress.reported) == (2, 2)
+    report = dict(PeriodClosingReportModel.objects.values_list("enrollment_id", "outcome"))
+    assert report == {uuid.UUID(ids[0]): "denied", uuid.UUID(ids[1]): "justification_required"}
+    assert PeriodClosingReportModel.objects.get(enrollment_id=ids[0]).reasons == ["failing_grade"]
+    assert set(EnrollmentModel.objects.filter(state="active").values_list("id", flat=True)) == {
+        uuid.UUID(ids[0]), uuid.UUID(ids[1]),
+    }
+
+    justified = PeriodClosingEngine(ScriptedPolicy(needs_justification=[ids[1]])).close_period(
+        academic_period_id=period_id, actor_id=ACTOR_ID, justification="council decision",
+    )
+    assert (justified.concluded, justified.reported) == (2, 0)
+
+
+class CancellingPolicy(ScriptedPolicy):
+    """Allows everything, but another writer cancels `cancelled` while the verdicts are computed."""
+
+    def __init__(self, cancelled):
+        super().__init__()
+        self.cancelled = cancelled
+
+    def evaluate_many(self, candidates):
+        EnrollmentModel.objects.filter(id=self.cancelled).update(state="cancelled", cancelled_at=CLOSED_AT)
+        return super().evaluate_many(candidates)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_enrollment_changed_between_read_and_update_is_reported():
+    period_id = str(uuid.uuid4())
+    ids = _create(period_id, 3)
+
+    progress = PeriodClosingEngine(CancellingPolicy(cancelled=ids[1])).close_period(
+        academic_period_id=period_id, actor_id=ACTOR_ID,
+    )
+
+    assert (progress.concluded, progress.reported) == (2, 1)
+    report = dict(PeriodClosingReportModel.objects.values_list("enrollment_id", "outcome"))
+    assert report == {uuid.UUID(ids[1]): "skipped_concurrent_change"}
+    assert not EnrollmentTransitionModel.objects.filter(enrollment_id=ids[1], action="conclude").exists()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failed_chunk_rolls_back_and_the_run_resumes_without_duplicates():
+    period_id = str(uuid.uuid4())
+    ids = _create(period_id, 5)
+    crashing = PeriodClosingEngine(ScriptedPolicy(fail_on_call=2), chunk_size=2)
+
+    with pytest.raises(ConnectionError):
+        crashing.close_period(academic_period_id=period_id, actor_id=ACTOR_ID, occurred_at=CLOSED_AT)
+
+    run = PeriodClosingRunModel.objects.get()
+    assert (run.status, run.concluded_count, str(run.last_enrollment_id)) == ("running", 2, ids[1])
+
+    # Resuming ignores new parameters: the run's frozen occurred_at keeps transition ids stable.
+    progress = PeriodClosingEngine(AllowAllConclusionPolicy(), chunk_size=2).close_period(
+        academic_period_id=period_id, actor_id=str(uuid.uuid4()),
+    )
+
+    assert (progress.run_id, progress.status, progress.concluded) == (str(run.id), "completed", 5)
+    assert EnrollmentTransitionModel.objects.filter(action="conclude", occurred_at=CLOSED_AT).count() == 5
+    assert OutboxEventModel.objects.filter(event_type="EnrollmentConcluded").count() == 5
+    assert enrollment_state_counts.verify() == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_replayed_chunk_is_idempotent():
+    period_id = str(uuid.uuid4())
+    _create(period_id, 3)
+    engine = PeriodClosingEngine(AllowAllConclusionPolicy())
+    run = engine.open_run(academic_period_id=period_id, actor_id=ACTOR_ID, occurred_at=CLOSED_AT)
+    engine.run(str(run.id))
+
+    # Simulate a retry of an already committed chunk (e.g. the cursor update was lost).
+    PeriodClosingRunModel.objects.filter(id=run.id).update(status="running", last_enrollment_id=None)
+    engine.run(str(run.id))
+
+    assert EnrollmentTransitionModel.objects.filter(action="conclude").count() == 3
+    assert OutboxEventModel.objects.filter(event_type="EnrollmentConcluded").count() == 3
+    assert enrollment_state_counts.verify() == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_each_chunk_concludes_with_one_update_and_one_transition_insert():
+    period_id = str(uuid.uuid4())
+    _create(period_id, 7)
+
+    with CaptureQueriesContext(connection) as ctx:
+        progress = PeriodClosingEngine(AllowAllConclusionPolicy(), chunk_size=3).close_period(
+            academic_period_id=period_id, actor_id=ACTOR_ID,
+        )
+
+    statements = [q["sql"] for q in ctx.captured_queries]
+    assert progress.chunks == 3
+    assert sum(s.startswith('UPDATE "enrollments"') for s in statements) == 3
+    assert sum(s.startswith("INSERT") and '"enrollment_transitions"' in s[:50] for s in statements) == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_close_academic_period_command():
+    period_id = str(uuid.uuid4())
+    _create(period_id, 3)
+    out = StringIO()
+
+    call_command(
+        "close_academic_period", "--period", period_id, "--actor", ACTOR_ID,
+        "--chunk-size", "2", "--max-chunks", "1", stdout=out,
+    )
+    call_command("close_academic_period", "--period", period_id, "--actor", ACTOR_ID, stdout=out)
+
+    lines = out.getvalue().splitlines()
+    assert "status=running chunks=1 concluded=2" in lines[0]
+    assert "status=completed chunks=1 concluded=3" in lines[1]
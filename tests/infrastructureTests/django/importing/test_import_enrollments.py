@@ -0,0 +1,175 @@
+import csv
+import json
+import uuid
+from datetime import UTC, datetime
+from io import StringIO
+from pathlib import Path
+
+import pytest
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.models.outbox_event import OutboxEventModel
+from apps.academic.read_models import enrollment_state_counts
+from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from application.academic.enrollment.dto.errors.error_codes import ErrorCodes
+from application.academic.enrollment.errors.persistence_errors import (
+    EnrollmentDuplicationError,
+    EnrollmentTechnicalPersistenceError,
+)
+from domain.academic.enrollment.entities.enrollment import Enrollment
+
+ACTOR_ID = str(uuid.uuid4())
+INSTITUTION_ID = str(uuid.uuid4())
+CLASS_GROUP_ID = str(uuid.uuid4())
+PERIOD_ID = str(uuid.uuid4())
+
+
+def _new(student_id: str | None = None) -> Enrollment:
+    return Enrollment.create(
+        institution_id=INSTITUTION_ID,
+        student_id=student_id or str(uuid.uuid4()),
+        class_group_id=CLASS_GROUP_ID,
+        academic_period_id=PERIOD_ID,
+        actor_id=ACTOR_ID,
+    )
+
+
+def _record(student_id: str | None = None) -> dict[str, str]:
+    return {
+        "institution_id": INSTITUTION_ID,
+        "student_id": student_id or str(uuid.uuid4()),
+        "class_group_id": CLASS_GROUP_ID,
+        "academic_period_id": PERIOD_ID,
+    }
+
+
+def _results(path: Path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_create_many_reports_duplicates_per_row_without_aborting_the_batch() -> None:
+    repository = DjangoEnrollmentRepository()
+    existing = _new()
+    repository.create(existing)
+    clash = _new(student_id=existing.student_id)
+    twin_a, twin_b = _new(), _new()
+    twin_b.student_id = twin_a.student_id
+    fresh = _new()
+
+    outcomes = repository.create_many([clash, twin_a, twin_b, fresh])
+
+    assert list(outcomes) == [clash.id, twin_a.id, twin_b.id, fresh.id]
+    assert isinstance(outcomes[clash.id], EnrollmentDuplicationError)
+    assert outcomes[twin_a.id] == 1
+    assert isinstance(outcomes[twin_b.id], EnrollmentDuplicationError)
+    assert outcomes[fresh.id] == 1
+    assert set(EnrollmentModel.objects.values_list("id", flat=True)) == {
+        uuid.UUID(e.id) for e in (existing, twin_a, fresh)
+    }
+    assert OutboxEventModel.objects.filter(aggregate_id__in=[twin_a.id, fresh.id]).count() == 2
+    assert not OutboxEventModel.objects.filter(aggregate_id__in=[clash.id, twin_b.id]).exists()
+    assert enrollment_state_counts.verify() == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_retried_create_many_reports_duplicates_without_counting_twice() -> None:
+    repository = DjangoEnrollmentRepository()
+    batch = [_new(), _new()]
+    repository.create_many(batch)
+
+    # Same aggregates again, as after a commit whose outcome was unknown
+    outcomes = repository.create_many(batch)
+
+    assert all(isinstance(outcome, EnrollmentDuplicationError) for outcome in outcomes.values())
+    assert {outcome.details["constraint"] for outcome in outcomes.values()} == {"unique_enrollment"}
+    assert OutboxEventModel.objects.filter(aggregate_id__in=[e.id for e in batch]).count() == 2
+    assert enrollment_state_counts.verify() == []
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="INSERT OR IGNORE is SQLite only")
+def test_create_many_on_sqlite_does_not_report_check_violations_as_duplicates() -> None:
+    inconsistent, fine = _new(), _new()
+    # Active with a cancellation timestamp: rejected by ck_enrollment_state_timestamps
+    inconsistent.cancelled_at = datetime.now(UTC)
+
+    outcomes = DjangoEnrollmentRepository().create_many([inconsistent, fine])
+
+    assert isinstance(outcomes[inconsistent.id], EnrollmentTechnicalPersistenceError)
+    assert outcomes[inconsistent.id].code == ErrorCodes.ENROLLMENT_CREATION_FAILED
+    assert outcomes[fine.id] == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_create_many_reports_unpreparable_rows_per_row() -> None:
+    broken = _new(student_id="not-a-uuid")
+    fine = _new()
+
+    outcomes = DjangoEnrollmentRepository().create_many([broken, fine])
+
+    assert isinstance(outcomes[broken.id], EnrollmentTechnicalPersistenceError)
+    assert outcomes[broken.id].code == ErrorCodes.ENROLLMENT_CREATION_FAILED
+    assert outcomes[fine.id] == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_create_many_statement_count_does_not_grow_with_batch_size() -> None:
+    repository = DjangoEnrollmentRepository()
+
+    with CaptureQueriesContext(connection) as small:
+        repository.create_many([_new() for _ in range(2)])
+    with CaptureQueriesContext(connection) as large:
+        repository.create_many([_new() for _ in range(50)])
+
+    assert len(large.captured_queries) == len(small.captured_queries)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_import_command_streams_a_csv_file_and_writes_one_result_per_row(tmp_path) -> None:
+    repeated = _record()
+    records = [_record(), repeated, {**_record(), "student_id": ""}, _record(), dict(repeated)]
+    source = tmp_path / "enrollments.csv"
+    with source.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(records[0]))
+        writer.writeheader()
+        writer.writerows(records)
+    stdout = StringIO()
+
+    call_command("import_enrollments", str(source), "--actor", ACTOR_ID, "--chunk-size", "2", stdout=stdout)
+
+    results = _results(tmp_path / "enrollments.csv.results.ndjson")
+    assert [r["row"] for r in results] == [1, 2, 3, 4, 5]
+    assert [r["success"] for r in results] == [True, True, False, True, False]
+    assert results[2]["error"]["code"] == ErrorCodes.INVALID_ENROLLMENT_DATA
+    # Row 5 repeats row 2 from another chunk: the unique constraint reports it
+    assert results[4]["error"]["code"] == ErrorCodes.DUPLICATE_ENROLLMENT
+    assert results[0]["new_state"] == "active"
+    assert EnrollmentModel.objects.count() == 3
+    assert "rows=5 created=3 failed=2" in stdout.getvalue()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_import_command_reads_ndjson_and_reports_malformed_lines(tmp_path) -> None:
+    source = tmp_path / "enrollments.ndjson"
+    source.write_text(f"{json.dumps(_record())}\n\n{{not json\n[1, 2]\n{json.dumps(_record())}\n", encoding="utf-8")
+    output = tmp_path / "results.ndjson"
+
+    call_command("import_enrollments", str(source), "--actor", ACTOR_ID, "--output", str(output), stdout=StringIO())
+
+    results = _results(output)
+    assert [(r["row"], r["success"]) for r in results] == [(1, True), (2, False), (3, False), (4, True)]
+    assert results[1]["error"]["message"].startswith("Invalid JSON")
+    assert results[2]["error"]["message"] == "Expected a JSON object."
+    assert EnrollmentModel.objects.count() == 2
+
+
+def test_import_command_needs_a_known_format(tmp_path) -> None:
+    source = tmp_path / "enrollments.txt"
+    source.write_text("", encoding="utf-8")
+
+    with pytest.raises(CommandError):
+        call_command("import_enrollments", str(source), "--actor", ACTOR_ID, stdout=StringIO())
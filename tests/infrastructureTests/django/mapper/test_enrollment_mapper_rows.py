@@ -0,0 +1,61 @@
+import uuid
+from datetime import UTC, datetime, timedelta, timezone
+
+from apps.academic.mappers.enrollment_mapper import EnrollmentMapper
+
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+
+
+def _snapshot_row(*, state: str = "suspended", suspended_at: datetime | None = None) -> tuple:
+    return (
+        uuid.UUID("00000000-0000-0000-0000-000000000001"),
+        uuid.UUID("00000000-0000-0000-0000-000000000002"),
+        uuid.UUID("00000000-0000-0000-0000-000000000003"),
+        uuid.UUID("00000000-0000-0000-0000-000000000004"),
+        uuid.UUID("00000000-0000-0000-0000-000000000005"),
+        "creator",
+        state,
+        datetime(2026, 1, 1, tzinfo=UTC),
+        None,
+        None,
+        suspended_at,
+        None,
+        3,
+    )
+
+
+def test_to_state_transition_builds_value_object_from_raw_row() -> None:
+    actor_id = uuid.uuid4()
+    occurred_at = datetime(2026, 1, 2, 9, 0, tzinfo=timezone(timedelta(hours=-3)))
+
+    transition = EnrollmentMapper.to_state_transition(
+        ("active", "suspended", actor_id, occurred_at, "reason")
+    )
+
+    assert transition.from_state == EnrollmentState.ACTIVE
+    assert transition.to_state == EnrollmentState.SUSPENDED
+    assert transition.actor_id == str(actor_id)
+    assert transition.occurred_at == occurred_at
+    assert transition.occurred_at.tzinfo == UTC
+    assert transition.justification == "reason"
+
+
+def test_to_domain_from_rows_rebuilds_aggregate() -> None:
+    suspended_at = datetime(2026, 1, 2, tzinfo=UTC)
+    actor_id = uuid.uuid4()
+
+    enrollment = EnrollmentMapper.to_domain_from_rows(
+        snapshot_row=_snapshot_row(suspended_at=suspended_at),
+        transition_rows=[("active", "suspended", actor_id, suspended_at, "reason")],
+    )
+
+    assert enrollment.id == "00000000-0000-0000-0000-000000000001"
+    assert enrollment.institution_id == "00000000-0000-0000-0000-000000000002"
+    assert enrollment.academic_period_id == "00000000-0000-0000-0000-000000000005"
+    assert enrollment.created_by == "creator"
+    assert enrollment.state == EnrollmentState.SUSPENDED
+    assert enrollment.suspended_at == suspended_at
+    assert enrollment.version == 3
+    assert len(enrollment.transitions) == 1
+    assert enrollment.transitions[0].actor_id == str(actor_id)
+    assert enrollment.peek_domain_events() == []
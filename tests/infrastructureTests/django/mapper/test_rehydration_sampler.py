@@ -0,0 +1,100 @@
+import logging
+import random
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from apps.academic.mappers.enrollment_mapper import EnrollmentMapper
+from apps.academic.mappers.rehydration_sampler import RehydrationSampler, RehydrationStats
+from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+from domain.shared.domain_error import DomainError
+from infrastructureTests.django.mapper.test_enrollment_mapper_rows import _snapshot_row
+
+SUSPENDED_AT = datetime(2026, 1, 2, tzinfo=UTC)
+ACTOR_ID = uuid.uuid4()
+TRANSITION_ROWS = [("active", "suspended", ACTOR_ID, SUSPENDED_AT, "reason")]
+
+
+@pytest.mark.parametrize("sample_rate", [-0.1, 1.5])
+def test_rejects_sample_rate_outside_unit_interval(sample_rate) -> None:
+    with pytest.raises(ValueError):
+        RehydrationSampler(sample_rate)
+
+
+def test_trusted_and_validated_paths_build_equal_aggregates() -> None:
+    trusted_sampler, validating_sampler = RehydrationSampler(0.0), RehydrationSampler(1.0)
+
+    trusted = EnrollmentMapper.to_domain_from_rows(
+        snapshot_row=_snapshot_row(suspended_at=SUSPENDED_AT), transition_rows=TRANSITION_ROWS, sampler=trusted_sampler
+    )
+    validated = EnrollmentMapper.to_domain_from_rows(
+        snapshot_row=_snapshot_row(suspended_at=SUSPENDED_AT),
+        transition_rows=TRANSITION_ROWS,
+        sampler=validating_sampler,
+    )
+
+    assert trusted == validated
+    assert trusted.state is EnrollmentState.SUSPENDED
+    assert trusted.transitions[0].actor_id == str(ACTOR_ID)
+    assert trusted.pending_transitions() == []
+    assert trusted_sampler.stats == RehydrationStats(trusted=1, validated=0, sampled_failures=0)
+    assert validating_sampler.stats == RehydrationStats(trusted=0, validated=1, sampled_failures=0)
+
+
+def test_sampled_validation_counts_logs_and_raises_on_corrupt_rows(caplog) -> None:
+    sampler = RehydrationSampler(1.0)
+    corrupt = _snapshot_row(suspended_at=None)  # SUSPENDED without suspended_at
+
+    with caplog.at_level(logging.ERROR, logger="apps.academic.rehydration"), pytest.raises(DomainError) as exc_info:
+        EnrollmentMapper.to_domain_from_rows(snapshot_row=corrupt, transition_rows=(), sampler=sampler)
+
+    assert exc_info.value.code == "missing_suspended_at"
+    assert sampler.stats.sampled_failures == 1
+    assert caplog.records[0].error_code == "missing_suspended_at"
+
+
+def test_unsampled_rows_are_trusted_as_stored() -> None:
+    sampler = RehydrationSampler(0.0)
+
+    enrollment = EnrollmentMapper.to_domain_from_rows(
+        snapshot_row=_snapshot_row(suspended_at=None), transition_rows=(), sampler=sampler
+    )
+
+    assert enrollment.suspended_at is None
+    assert sampler.stats.sampled_failures == 0
+
+
+def test_sample_rate_is_honoured_over_many_loads() -> None:
+    sampler = RehydrationSampler(0.25, rng=random.Random(7))
+
+    for _ in range(4000):
+        sampler.should_validate()
+
+    stats = sampler.stats
+    assert stats.trusted + stats.validated == 4000
+    assert 850 < stats.validated < 1150
+
+
+@pytest.mark.django_db
+def test_repository_loads_go_through_the_injected_sampler() -> None:
+    sampler = RehydrationSampler(0.0)
+    repository = DjangoEnrollmentRepository(rehydration_sampler=sampler)
+    enrollment = Enrollment.create(
+        institution_id=str(uuid.uuid4()),
+        student_id=str(uuid.uuid4()),
+        class_group_id=str(uuid.uuid4()),
+        academic_period_id=str(uuid.uuid4()),
+        actor_id=str(uuid.uuid4()),
+    )
+    repository.create(enrollment)
+
+    loaded = repository.get_by_id(enrollment.id)
+    many = repository.get_many([enrollment.id])
+
+    assert loaded is not None
+    assert loaded.id == enrollment.id
+    assert many[enrollment.id] == loaded
+    assert sampler.stats.trusted == 2
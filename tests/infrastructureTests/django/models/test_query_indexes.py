@@ -0,0 +1,73 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.models.enrollment_transition import EnrollmentTransitionModel
+from django.db import connection
+from django.db.models import QuerySet
+
+from infrastructureTests.factory.new_enrollment_factory import (
+    factory_create_new_enrollment_for_tests,
+)
+
+ID = uuid.uuid4()
+OPEN_STATES = ["active", "suspended"]
+
+# One queryset per access path, built as the adapters build it:
+# listings (DjangoEnrollmentQuery), find_ids_by_class_group, the period
+# closing scan and the audit-by-actor lookup.
+ACCESS_PATHS = {
+    "ix_enrollment_institution_st": lambda: EnrollmentModel.objects.filter(
+        institution_id=ID, state="cancelled"
+    ).values_list("id"),
+    "ix_enrollment_group_period_st": lambda: EnrollmentModel.objects.filter(
+        class_group_id=ID, academic_period_id=ID
+    ).order_by("id").values_list("id", flat=True),
+    "ix_enrollment_student_created": lambda: EnrollmentModel.objects.filter(
+        student_id=ID
+    ).order_by("created_at").values_list("id"),
+    "ix_enrollment_open_listing": lambda: EnrollmentModel.objects.filter(
+        institution_id=ID, state__in=OPEN_STATES
+    ).order_by("created_at", "id").values_list("id")[:51],
+    "ix_enrollment_active_period": lambda: EnrollmentModel.objects.filter(
+        academic_period_id=ID, state="active", id__gt=ID
+    ).order_by("id").values_list("id")[:500],
+    "ix_transition_actor_occurred": lambda: EnrollmentTransitionModel.objects.filter(
+        actor_id=ID, occurred_at__gte=datetime(2026, 1, 1, tzinfo=UTC)
+    ).order_by("occurred_at").values_list("id"),
+}
+
+
+def _plan(queryset: QuerySet) -> str:
+    if connection.vendor != "postgresql":
+        return queryset.explain()
+    with connection.cursor() as cursor:
+        # Test tables are tiny: without this the planner reads them sequentially
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    return queryset.explain()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("index_name", [
+    pytest.param(name, marks=pytest.mark.skipif(
+        connection.vendor != "postgresql",
+        reason="SQLite seeks (institution_id, state) per IN value and sorts instead",
+    )) if name == "ix_enrollment_open_listing" else name
+    for name in ACCESS_PATHS
+])
+def test_access_path_is_served_by_its_index(index_name) -> None:
+    factory_create_new_enrollment_for_tests()
+
+    assert index_name in _plan(ACCESS_PATHS[index_name]())
+
+
+@pytest.mark.django_db
+def test_partial_indexes_are_not_used_for_closed_rows() -> None:
+    plan = _plan(
+        EnrollmentModel.objects.filter(institution_id=ID, state="cancelled")
+        .order_by("created_at", "id")
+        .values_list("id")
+    )
+
+    assert "ix_enrollment_open_listing" not in plan
@@ -0,0 +1,76 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.models.enrollment_transition import EnrollmentTransitionModel
+from django.db import IntegrityError, transaction
+
+from infrastructureTests.factory.new_enrollment_factory import (
+    factory_create_new_enrollment_for_tests,
+)
+
+NOW = datetime(2026, 3, 1, 9, 0, tzinfo=UTC)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "state, timestamps",
+    [
+        ("suspended", {}),
+        ("active", {"cancelled_at": NOW}),
+        ("concluded", {"concluded_at": NOW, "suspended_at": NOW}),
+        ("cancelled", {"concluded_at": NOW}),
+    ],
+)
+def test_snapshot_with_timestamps_inconsistent_with_its_state_is_rejected(state, timestamps) -> None:
+    with pytest.raises(IntegrityError), transaction.atomic():
+        factory_create_new_enrollment_for_tests(state=state, **timestamps)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "state, timestamps",
+    [
+        ("active", {}),
+        ("suspended", {"suspended_at": NOW}),
+        ("concluded", {"concluded_at": NOW}),
+        ("cancelled", {"cancelled_at": NOW}),
+    ],
+)
+def test_snapshot_consistent_with_its_state_is_accepted(state, timestamps) -> None:
+    factory_create_new_enrollment_for_tests(state=state, **timestamps)
+
+    assert EnrollmentModel.objects.filter(state=state).count() == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "action, from_state, to_state, accepted",
+    [
+        ("suspend", "active", "suspended", True),
+        ("cancel", "suspended", "cancelled", True),
+        ("conclude", "suspended", "concluded", False),
+        ("reactivate", "concluded", "active", False),
+        ("cancel", "active", "suspended", False),
+    ],
+)
+def test_transition_rows_must_follow_an_edge_of_the_state_machine(action, from_state, to_state, accepted) -> None:
+    enrollment = factory_create_new_enrollment_for_tests()
+
+    def insert() -> None:
+        EnrollmentTransitionModel.objects.create(
+            enrollment=enrollment,
+            action=action,
+            from_state=from_state,
+            to_state=to_state,
+            actor_id=uuid.uuid4(),
+            occurred_at=NOW,
+        )
+
+    if accepted:
+        insert()
+        assert EnrollmentTransitionModel.objects.count() == 1
+    else:
+        with pytest.raises(IntegrityError), transaction.atomic():
+            insert()
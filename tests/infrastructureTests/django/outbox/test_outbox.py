@@ -0,0 +1,227 @@
+import copy
+import uuid
+from datetime import UTC, datetime, timedelta
+from io import StringIO
+
+import pytest
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.models.outbox_event import OutboxEventModel
+from apps.academic.outbox.dispatcher import OutboxDispatcher, OutboxRetryPolicy
+from apps.academic.outbox.sinks import OutboxMessage
+from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+from django.core.management import call_command
+
+from application.academic.enrollment.errors.persistence_errors import ConcurrencyConflictError
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from infrastructureTests.factory.new_enrollment_factory import (
+    factory_create_new_enrollment_for_tests,
+)
+
+PENDING = OutboxEventModel.StatusChoices.PENDING
+DISPATCHED = OutboxEventModel.StatusChoices.DISPATCHED
+DEAD_LETTER = OutboxEventModel.StatusChoices.DEAD_LETTER
+
+
+class RecordingSink:
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.delivered: list[OutboxMessage] = []
+
+    def deliver(self, message: OutboxMessage) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("broker unavailable")
+        self.delivered.append(message)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 5, 1, 12, 0, tzinfo=UTC)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+def _suspend(repository: DjangoEnrollmentRepository) -> Enrollment:
+    enrollment = factory_create_new_enrollment_for_tests()
+    loaded = repository.get_by_id(str(enrollment.id))
+    assert loaded is not None
+    loaded.suspend(actor_id=str(uuid.uuid4()), justification="outbox", occurred_at=datetime.now(UTC))
+    return loaded
+
+
+def _seed_outbox(count: int, *, created_at: datetime) -> None:
+    OutboxEventModel.objects.bulk_create([
+        OutboxEventModel(
+            event_type="EnrollmentSuspended",
+            aggregate_type="enrollment",
+            aggregate_id=uuid.uuid4(),
+            aggregate_version=2,
+            occurred_at=created_at,
+            payload={"n": n},
+            created_at=created_at,
+            available_at=created_at,
+        )
+        for n in range(count)
+    ])
+
+
+@pytest.mark.django_db(transaction=True)
+def test_save_records_pending_events_in_the_outbox():
+    repository = DjangoEnrollmentRepository()
+    enrollment = _suspend(repository)
+    event = enrollment.peek_domain_events()[0]
+
+    retried = copy.deepcopy(enrollment)
+    new_version = repository.save(enrollment)
+    repository.save(retried)  # replay must not duplicate the record
+
+    record = OutboxEventModel.objects.get()
+    assert str(record.event_id) == event.event_id
+    assert record.event_type == "EnrollmentSuspended"
+    assert record.aggregate_type == "enrollment"
+    assert str(record.aggregate_id) == enrollment.id
+    assert record.aggregate_version == new_version
+    assert record.status == PENDING
+    assert record.payload == {
+        "actor_id": event.actor_id,
+        "from_state": "active",
+        "to_state": "suspended",
+        "justification": "outbox",
+    }
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failed_save_records_nothing_in_the_outbox():
+    repository = DjangoEnrollmentRepository()
+    enrollment = _suspend(repository)
+    EnrollmentModel.objects.filter(id=enrollment.id).update(version=enrollment.version + 1)
+
+    with pytest.raises(ConcurrencyConflictError):
+        repository.save(enrollment)
+
+    assert OutboxEventModel.objects.count() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_create_and_save_many_record_events_in_the_outbox():
+    repository = DjangoEnrollmentRepository()
+    created = Enrollment.create(
+        institution_id=str(uuid.uuid4()),
+        student_id=str(uuid.uuid4()),
+        class_group_id=str(uuid.uuid4()),
+        academic_period_id=str(uuid.uuid4()),
+        actor_id=str(uuid.uuid4()),
+    )
+    repository.create(created)
+    batch = [_suspend(repository) for _ in range(2)]
+    repository.save_many(batch)
+
+    assert sorted(OutboxEventModel.objects.values_list("event_type", flat=True)) == [
+        "EnrollmentCreated",
+        "EnrollmentSuspended",
+        "EnrollmentSuspended",
+    ]
+    created_record = OutboxEventModel.objects.get(event_type="EnrollmentCreated")
+    assert created_record.aggregate_version == 1
+    assert created_record.payload["student_id"] == created.student_id
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dispatcher_delivers_in_batches_and_marks_records_dispatched():
+    _seed_outbox(5, created_at=datetime.now(UTC))
+    sink = RecordingSink()
+    dispatcher = OutboxDispatcher(sink, batch_size=2)
+
+    reports = [dispatcher.dispatch_once() for _ in range(4)]
+
+    assert [r.claimed for r in reports] == [2, 2, 1, 0]
+    assert [m.payload["n"] for m in sink.delivered] == [0, 1, 2, 3, 4]
+    assert OutboxEventModel.objects.filter(status=DISPATCHED, locked_by__isnull=True).count() == 5
+    assert dispatcher.lag().pending == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_leased_records_are_not_claimed_by_another_worker_until_the_lease_expires():
+    clock = FakeClock()
+    _seed_outbox(3, created_at=clock.now)
+    first = OutboxDispatcher(RecordingSink(), worker_id="w1", lease_seconds=30, clock=clock)
+    second = OutboxDispatcher(RecordingSink(), worker_id="w2", lease_seconds=30, clock=clock)
+
+    assert len(first.claim_batch()) == 3
+    assert second.claim_batch() == []
+
+    clock.now += timedelta(seconds=31)  # w1 crashed without finishing
+    assert len(second.claim_batch()) == 3
+    assert set(OutboxEventModel.objects.values_list("locked_by", flat=True)) == {"w2"}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failed_delivery_is_retried_with_backoff_then_dead_lettered():
+    clock = FakeClock()
+    _seed_outbox(1, created_at=clock.now)
+    sink = RecordingSink(failures=10)
+    dispatcher = OutboxDispatcher(
+        sink,
+        clock=clock,
+        retry_policy=OutboxRetryPolicy(max_attempts=3, backoff_base_seconds=10, backoff_max_seconds=15),
+    )
+
+    assert dispatcher.dispatch_once().retried == 1
+    record = OutboxEventModel.objects.get()
+    assert record.attempts == 1
+    assert record.available_at == clock.now + timedelta(seconds=10)
+    assert record.last_error == "ConnectionError: broker unavailable"
+
+    assert dispatcher.dispatch_once().claimed == 0  # backoff not elapsed yet
+    clock.now += timedelta(seconds=10)
+    assert dispatcher.dispatch_once().retried == 1
+    assert OutboxEventModel.objects.get().available_at == clock.now + timedelta(seconds=15)
+
+    clock.now += timedelta(seconds=15)
+    assert dispatcher.dispatch_once().dead_lettered == 1
+
+    lag = dispatcher.lag()
+    assert lag.pending == 0
+    assert lag.dead_letter == 1
+    assert sink.delivered == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_lag_reports_oldest_pending_age():
+    clock = FakeClock()
+    _seed_outbox(2, created_at=clock.now - timedelta(minutes=5))
+
+    lag = OutboxDispatcher(RecordingSink(), clock=clock).lag()
+
+    assert lag.pending == 2
+    assert lag.dead_letter == 0
+    assert lag.oldest_pending_age_seconds == 300
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dispatch_outbox_command_drains_the_outbox_once():
+    _seed_outbox(3, created_at=datetime.now(UTC))
+    out = StringIO()
+
+    call_command("dispatch_outbox", "--once", "--batch-size", "2", stdout=out)
+
+    assert OutboxEventModel.objects.filter(status=DISPATCHED).count() == 3
+    assert "dispatched=3" in out.getvalue()
+    assert "pending=0" in out.getvalue()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_dispatch_outbox_command_reports_lag_while_running():
+    _seed_outbox(3, created_at=datetime.now(UTC))
+    out = StringIO()
+
+    call_command(
+        "dispatch_outbox", "--max-batches", "3", "--batch-size", "1", "--report-interval", "0", stdout=out,
+    )
+
+    reports = out.getvalue().splitlines()
+    # One line per batch while running, then the final one
+    assert len(reports) == 4
+    assert [line.split()[1] for line in reports] == ["batches=1", "batches=2", "batches=3", "batches=3"]
+    assert "pending=2" in reports[0]
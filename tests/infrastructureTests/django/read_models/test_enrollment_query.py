@@ -0,0 +1,137 @@
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from apps.academic.read_models.enrollment_query import DjangoEnrollmentQuery
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from application.academic.enrollment.dto.enrollment_query import EnrollmentListFilters
+from application.academic.enrollment.errors.enrollment_errors import InvalidEnrollmentCursorError
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+from infrastructureTests.factory.new_enrollment_factory import (
+    factory_create_new_enrollment_for_tests,
+)
+
+INSTITUTION_ID = uuid.uuid4()
+CLASS_GROUP_ID = uuid.uuid4()
+BASE = datetime(2026, 2, 1, 8, 0, tzinfo=UTC)
+
+
+def _seed() -> list[str]:
+    """Seven enrollments; three share a created_at so `id` must break the tie."""
+    created = [BASE, BASE, BASE, BASE + timedelta(hours=1), BASE + timedelta(hours=2),
+               BASE + timedelta(days=1), BASE + timedelta(days=2)]
+    states = ["active", "suspended", "active", "cancelled", "active", "active", "suspended"]
+    ids = []
+    for created_at, state in zip(created, states, strict=True):
+        model = factory_create_new_enrollment_for_tests(
+            institution_id=INSTITUTION_ID,
+            class_group_id=CLASS_GROUP_ID,
+            created_at=created_at,
+            state=state,
+            suspended_at=created_at if state == "suspended" else None,
+            cancelled_at=created_at if state == "cancelled" else None,
+        )
+        ids.append(str(model.id))
+    factory_create_new_enrollment_for_tests(created_at=BASE)  # other institution
+    return [enrollment_id for _, enrollment_id in sorted(zip(created, ids, strict=True))]
+
+
+def _walk(query: DjangoEnrollmentQuery, filters: EnrollmentListFilters, page_size: int) -> list[list[str]]:
+    pages, cursor = [], None
+    while True:
+        page = query.page(filters, page_size=page_size, cursor=cursor)
+        pages.append([row.id for row in page.rows])
+        cursor = page.next_cursor
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.django_db(transaction=True)
+def test_pages_cover_every_row_once_in_a_stable_total_order():
+    expected = _seed()
+    query = DjangoEnrollmentQuery()
+    filters = EnrollmentListFilters(institution_id=str(INSTITUTION_ID))
+
+    pages = _walk(query, filters, page_size=2)
+
+    assert [len(p) for p in pages] == [2, 2, 2, 1]
+    assert [row_id for page in pages for row_id in page] == expected
+
+
+@pytest.mark.django_db(transaction=True)
+def test_each_page_is_one_query_without_offset():
+    _seed()
+    query = DjangoEnrollmentQuery()
+    filters = EnrollmentListFilters(institution_id=str(INSTITUTION_ID))
+    first = query.page(filters, page_size=3)
+
+    with CaptureQueriesContext(connection) as ctx:
+        query.page(filters, page_size=3, cursor=first.next_cursor)
+
+    assert len(ctx.captured_queries) == 1
+    assert "OFFSET" not in ctx.captured_queries[0]["sql"].upper()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rows_inserted_before_the_cursor_do_not_shift_later_pages():
+    expected = _seed()
+    query = DjangoEnrollmentQuery()
+    filters = EnrollmentListFilters(institution_id=str(INSTITUTION_ID))
+    first = query.page(filters, page_size=3)
+
+    factory_create_new_enrollment_for_tests(institution_id=INSTITUTION_ID, created_at=BASE - timedelta(days=1))
+    second = query.page(filters, page_size=3, cursor=first.next_cursor)
+
+    assert [row.id for row in second.rows] == expected[3:6]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_filters_by_state_and_created_range():
+    _seed()
+    query = DjangoEnrollmentQuery()
+    filters = EnrollmentListFilters(
+        institution_id=str(INSTITUTION_ID),
+        class_group_id=str(CLASS_GROUP_ID),
+        states=frozenset({EnrollmentState.ACTIVE}),
+        created_from=BASE + timedelta(minutes=1),
+        created_to=BASE + timedelta(days=2),
+    )
+
+    page = query.page(filters)
+
+    assert [(row.state, row.created_at) for row in page.rows] == [
+        ("active", BASE + timedelta(hours=2)),
+        ("active", BASE + timedelta(days=1)),
+    ]
+    assert page.next_cursor is None
+    assert page.rows[0].institution_id == str(INSTITUTION_ID)
+    assert page.rows[0].version == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_cursor_from_other_filters_is_rejected():
+    _seed()
+    query = DjangoEnrollmentQuery()
+    filters = EnrollmentListFilters(institution_id=str(INSTITUTION_ID))
+    cursor = query.page(filters, page_size=2).next_cursor
+
+    with pytest.raises(InvalidEnrollmentCursorError):
+        query.page(EnrollmentListFilters(institution_id=str(uuid.uuid4())), cursor=cursor)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_export_stream_matches_the_paged_listing():
+    _seed()
+    query = DjangoEnrollmentQuery()
+    filters = EnrollmentListFilters(
+        institution_id=str(INSTITUTION_ID),
+        states=frozenset({EnrollmentState.ACTIVE, EnrollmentState.SUSPENDED}),
+    )
+
+    paged = [row for page in _walk(query, filters, page_size=2) for row in page]
+    exported = list(query.iter_rows(filters, chunk_size=2))
+
+    assert [row.id for row in exported] == paged
+    assert len(exported) == 6
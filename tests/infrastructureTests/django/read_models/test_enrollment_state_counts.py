@@ -0,0 +1,163 @@
+import threading
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from io import StringIO
+
+import pytest
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.models.enrollment_state_count import EnrollmentStateCountModel
+from apps.academic.read_models import enrollment_state_counts
+from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+from django.core.management import CommandError, call_command
+from django.db import connection, connections, transaction
+
+from application.academic.enrollment.errors.persistence_errors import ConcurrencyConflictError
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from infrastructureTests.factory.new_enrollment_factory import (
+    factory_create_new_enrollment_for_tests,
+)
+
+INSTITUTION_ID = str(uuid.uuid4())
+PERIOD_ID = str(uuid.uuid4())
+CLASS_GROUP_ID = str(uuid.uuid4())
+
+
+def _create(repository: DjangoEnrollmentRepository, class_group_id: str = CLASS_GROUP_ID) -> Enrollment:
+    enrollment = Enrollment.create(
+        institution_id=INSTITUTION_ID,
+        student_id=str(uuid.uuid4()),
+        class_group_id=class_group_id,
+        academic_period_id=PERIOD_ID,
+        actor_id=str(uuid.uuid4()),
+    )
+    repository.create(enrollment)
+    loaded = repository.get_by_id(enrollment.id)
+    assert loaded is not None
+    return loaded
+
+
+def _counts(**scope: str) -> dict[str, int]:
+    return enrollment_state_counts.count_by_state(institution_id=INSTITUTION_ID, **scope)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_create_and_save_maintain_the_counts_incrementally():
+    repository = DjangoEnrollmentRepository()
+    first = _create(repository)
+    second = _create(repository)
+    _create(repository, class_group_id=str(uuid.uuid4()))
+
+    assert _counts() == {"active": 3}
+
+    first.suspend(actor_id=str(uuid.uuid4()), justification="leave")
+    repository.save(first)
+    second.cancel(actor_id=str(uuid.uuid4()), justification="dropout")
+    repository.save(second)
+
+    assert _counts() == {"active": 1, "cancelled": 1, "suspended": 1}
+    assert _counts(academic_period_id=PERIOD_ID, class_group_id=CLASS_GROUP_ID) == {
+        "cancelled": 1,
+        "suspended": 1,
+    }
+    assert enrollment_state_counts.verify() == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_round_trip_transitions_net_out_and_save_many_applies_one_batch():
+    repository = DjangoEnrollmentRepository()
+    round_trip = _create(repository)
+    batch = [_create(repository) for _ in range(2)]
+
+    start = datetime.now(UTC)
+    round_trip.suspend(actor_id=str(uuid.uuid4()), justification="leave", occurred_at=start)
+    round_trip.reactivate(actor_id=str(uuid.uuid4()), justification="back", occurred_at=start + timedelta(seconds=1))
+    repository.save(round_trip)
+    for enrollment in batch:
+        enrollment.suspend(actor_id=str(uuid.uuid4()), justification="bulk")
+    repository.save_many(batch)
+
+    assert _counts() == {"active": 1, "suspended": 2}
+    assert enrollment_state_counts.verify() == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_failed_save_leaves_the_counts_untouched():
+    repository = DjangoEnrollmentRepository()
+    enrollment = _create(repository)
+    EnrollmentModel.objects.filter(id=enrollment.id).update(version=enrollment.version + 1)
+    enrollment.suspend(actor_id=str(uuid.uuid4()), justification="leave")
+
+    with pytest.raises(ConcurrencyConflictError):
+        repository.save(enrollment)
+
+    assert _counts() == {"active": 1}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_verify_reports_drift_and_rebuild_fixes_it():
+    factory_create_new_enrollment_for_tests(state="cancelled", cancelled_at=datetime.now(UTC))
+    factory_create_new_enrollment_for_tests()
+
+    mismatches = enrollment_state_counts.verify()
+    assert sorted((m.key.state, m.expected, m.projected) for m in mismatches) == [
+        ("active", 1, 0),
+        ("cancelled", 1, 0),
+    ]
+
+    assert enrollment_state_counts.rebuild() == 2
+    assert enrollment_state_counts.verify() == []
+    assert EnrollmentStateCountModel.objects.count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_verify_and_rebuild_commands():
+    factory_create_new_enrollment_for_tests()
+
+    with pytest.raises(CommandError):
+        call_command("verify_enrollment_state_counts", stdout=StringIO())
+
+    out = StringIO()
+    call_command("rebuild_enrollment_state_counts", stdout=out)
+    call_command("verify_enrollment_state_counts", stdout=out)
+
+    assert "1 counters" in out.getvalue()
+    assert "consistent" in out.getvalue()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rebuild_keeps_deltas_of_writers_committing_while_it_runs() -> None:
+    if connection.vendor != "postgresql":
+        pytest.skip("Needs concurrent connections and table locks (PostgreSQL).")
+    repository = DjangoEnrollmentRepository()
+    _create(repository)
+    delta_applied, release_writer = threading.Event(), threading.Event()
+
+    def writer() -> None:
+        try:
+            with transaction.atomic():
+                _create(repository)
+                delta_applied.set()
+                release_writer.wait(5)
+        finally:
+            connections.close_all()
+
+    def rebuilder() -> None:
+        try:
+            enrollment_state_counts.rebuild()
+        finally:
+            connections.close_all()
+
+    writer_thread = threading.Thread(target=writer)
+    writer_thread.start()
+    delta_applied.wait(5)
+    rebuild_thread = threading.Thread(target=rebuilder)
+    rebuild_thread.start()
+    # Let the rebuild reach the lock (or, unguarded, its aggregate query) first
+    time.sleep(0.2)
+    release_writer.set()
+    writer_thread.join()
+    rebuild_thread.join()
+
+    assert _counts() == {"active": 2}
+    assert enrollment_state_counts.verify() == []
@@ -1,14 +1,19 @@
+import copy
 import uuid
 from datetime import UTC, datetime
 
 import pytest
+from apps.academic.mappers.enrollment_mapper import EnrollmentMapper
 from apps.academic.models.enrollment_model import EnrollmentModel
 from apps.academic.models.enrollment_transition import EnrollmentTransitionModel
 from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from application.academic.enrollment.dto.errors.error_codes import ErrorCodes
 from application.academic.enrollment.errors.persistence_errors import (
     ConcurrencyConflictError,
+    EnrollmentPersistenceNotFoundError,
     EnrollmentTechnicalPersistenceError,
 )
 from infrastructure.django.apps.academic.enrollments.transition_id import (
@@ -151,12 +156,14 @@ def test_retry_should_not_create_transition():
     result.suspend(actor_id=actor_id, justification=justification, occurred_at=occurred_at)
     initial_transitions_count = len(result.transitions)
     
-    # 5. First persistence attempt (Expected success)
+    # 5. First persistence attempt (Expected success); the retry starts from the
+    # aggregate as it was before the save, as a caller that never saw it succeed
+    retried = copy.deepcopy(result)
     first_version = repository.save(result)
     
     # 6. Second persistence attempt (Simulating a Retry/Idempotency scenario)
     # The repository should hit the `updated_rows == 0` block and validate the snapshot
-    retry_version = repository.save(result)
+    retry_version = repository.save(retried)
 
     # ASSERT
     # 7. Validate version consistency and memory state
@@ -290,3 +297,332 @@ def test_snapshot_and_transition_ensure_safe_rehydration():
     assert result_reactivated.transitions[1].occurred_at == occurred_at_fake
     count_transitions = EnrollmentTransitionModel.objects.filter(enrollment_id=str(enrollment.id)).count()
     assert count_transitions == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_by_id_loads_snapshot_and_transitions_in_one_query(django_assert_num_queries):
+    enrollment = factory_create_new_enrollment_for_tests()
+    repository = DjangoEnrollmentRepository()
+
+    loaded = repository.get_by_id(enrollment_id=str(enrollment.id))
+    assert loaded is not None
+    loaded.suspend(actor_id=str(uuid.uuid4()), justification="first", occurred_at=datetime(2026, 1, 1, tzinfo=UTC))
+    repository.save(loaded)
+    reloaded = repository.get_by_id(enrollment_id=str(enrollment.id))
+    assert reloaded is not None
+    reloaded.reactivate(actor_id=str(uuid.uuid4()), justification="second", occurred_at=datetime(2026, 1, 2, tzinfo=UTC))
+    repository.save(reloaded)
+
+    with django_assert_num_queries(1):
+        result = repository.get_by_id(enrollment_id=str(enrollment.id))
+
+    assert result is not None
+    assert result.version == enrollment.version + 2
+    assert [(t.from_state.value, t.to_state.value) for t in result.transitions] == [
+        ("active", "suspended"),
+        ("suspended", "active"),
+    ]
+    assert [t.justification for t in result.transitions] == ["first", "second"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_by_id_without_history_loads_in_one_query(django_assert_num_queries):
+    enrollment = factory_create_new_enrollment_for_tests()
+    repository = DjangoEnrollmentRepository()
+
+    with django_assert_num_queries(1):
+        result = repository.get_by_id(enrollment_id=str(enrollment.id))
+
+    assert result is not None
+    assert result.transitions == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_many_groups_transitions_per_enrollment_and_reports_missing_ids():
+    repository = DjangoEnrollmentRepository()
+    first = factory_create_new_enrollment_for_tests()
+    second = factory_create_new_enrollment_for_tests()
+    missing_id = str(uuid.uuid4())
+
+    loaded = repository.get_by_id(enrollment_id=str(first.id))
+    assert loaded is not None
+    loaded.suspend(actor_id=str(uuid.uuid4()), justification="first", occurred_at=datetime(2026, 1, 1, tzinfo=UTC))
+    repository.save(loaded)
+
+    result = repository.get_many([str(first.id), missing_id, str(second.id), str(first.id)])
+
+    assert list(result) == [str(first.id), missing_id, str(second.id)]
+    assert result[missing_id] is None
+
+    first_loaded = result[str(first.id)]
+    second_loaded = result[str(second.id)]
+    assert first_loaded is not None
+    assert second_loaded is not None
+    assert first_loaded.state.value == "suspended"
+    assert [t.justification for t in first_loaded.transitions] == ["first"]
+    assert second_loaded.state.value == "active"
+    assert second_loaded.transitions == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_many_costs_two_queries_per_chunk(django_assert_num_queries):
+    repository = DjangoEnrollmentRepository()
+    repository.get_many_chunk_size = 2
+    ids = [str(factory_create_new_enrollment_for_tests().id) for _ in range(5)]
+
+    with django_assert_num_queries(6):
+        result = repository.get_many(ids)
+
+    assert all(result[enrollment_id] is not None for enrollment_id in ids)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_many_with_no_ids_runs_no_query(django_assert_num_queries):
+    repository = DjangoEnrollmentRepository()
+
+    with django_assert_num_queries(0):
+        assert repository.get_many([]) == {}
+
+
+@pytest.mark.django_db(transaction=True)
+def test_find_ids_by_class_group_filters_by_class_group_and_period():
+    repository = DjangoEnrollmentRepository()
+    class_group_id = uuid.uuid4()
+    academic_period_id = uuid.uuid4()
+    expected = sorted(
+        str(factory_create_new_enrollment_for_tests(
+            class_group_id=class_group_id, academic_period_id=academic_period_id
+        ).id)
+        for _ in range(3)
+    )
+    factory_create_new_enrollment_for_tests(class_group_id=class_group_id)
+    factory_create_new_enrollment_for_tests(academic_period_id=academic_period_id)
+
+    result = repository.find_ids_by_class_group(
+        class_group_id=str(class_group_id),
+        academic_period_id=str(academic_period_id),
+    )
+
+    assert result == expected
+
+
+@pytest.fixture(params=["native", "portable"])
+def bulk_repository(request, monkeypatch) -> DjangoEnrollmentRepository:
+    """save_many under the backend's native UPDATE and under the portable fallback."""
+    if request.param == "portable":
+        monkeypatch.setattr(
+            DjangoEnrollmentRepository,
+            "_bulk_update_returning",
+            staticmethod(DjangoEnrollmentRepository._bulk_update_portable),
+        )
+    return DjangoEnrollmentRepository()
+
+
+def _load_and_suspend(repository: DjangoEnrollmentRepository, justification: str = "bulk"):
+    enrollment = factory_create_new_enrollment_for_tests()
+    loaded = repository.get_by_id(enrollment_id=str(enrollment.id))
+    assert loaded is not None
+    loaded.suspend(actor_id=str(uuid.uuid4()), justification=justification, occurred_at=datetime.now(UTC))
+    return loaded
+
+
+@pytest.mark.django_db(transaction=True)
+def test_save_many_reports_one_outcome_per_aggregate(bulk_repository):
+    saved = _load_and_suspend(bulk_repository)
+    conflicting = _load_and_suspend(bulk_repository)
+    missing = _load_and_suspend(bulk_repository)
+    untouched = bulk_repository.get_by_id(str(factory_create_new_enrollment_for_tests().id))
+    assert untouched is not None
+
+    EnrollmentModel.objects.filter(id=conflicting.id).update(version=conflicting.version + 5)
+    EnrollmentModel.objects.filter(id=missing.id).delete()
+
+    origin_version = saved.version
+    outcomes = bulk_repository.save_many([saved, conflicting, missing, untouched])
+
+    assert list(outcomes) == [saved.id, conflicting.id, missing.id, untouched.id]
+    assert outcomes[saved.id] == origin_version + 1 == saved.version
+    assert saved.pending_transitions() == []
+
+    conflict = outcomes[conflicting.id]
+    assert isinstance(conflict, ConcurrencyConflictError)
+    assert conflict.code == "version_mismatch"
+    assert conflict.details is not None
+    assert conflict.details["persisted_version"] == conflicting.version + 5
+
+    assert isinstance(outcomes[missing.id], EnrollmentPersistenceNotFoundError)
+
+    missing_transitions = outcomes[untouched.id]
+    assert isinstance(missing_transitions, EnrollmentTechnicalPersistenceError)
+    assert missing_transitions.code == ErrorCodes.MISSING_TRANSITIONS
+
+    snapshot = EnrollmentModel.objects.get(id=saved.id)
+    assert snapshot.state == "suspended"
+    assert snapshot.version == saved.version
+    assert EnrollmentModel.objects.get(id=conflicting.id).state == "active"
+    assert len(conflicting.pending_transitions()) == 1
+    assert EnrollmentTransitionModel.objects.filter(enrollment_id=saved.id).count() == 1
+    assert EnrollmentTransitionModel.objects.count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_save_many_retry_returns_versions_without_duplicating_transitions(bulk_repository):
+    enrollments = [_load_and_suspend(bulk_repository) for _ in range(3)]
+    retried = copy.deepcopy(enrollments)
+
+    first = bulk_repository.save_many(enrollments)
+    retry = bulk_repository.save_many(retried)
+
+    assert retry == first
+    assert all(first[e.id] == e.version for e in enrollments)
+    assert EnrollmentTransitionModel.objects.count() == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_save_many_query_count_does_not_grow_with_batch_size(bulk_repository):
+
+    small = [_load_and_suspend(bulk_repository) for _ in range(2)]
+    large = [_load_and_suspend(bulk_repository) for _ in range(6)]
+
+    with CaptureQueriesContext(connection) as small_ctx:
+        bulk_repository.save_many(small)
+    with CaptureQueriesContext(connection) as large_ctx:
+        bulk_repository.save_many(large)
+
+    assert len(large_ctx.captured_queries) == len(small_ctx.captured_queries)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_save_many_rolls_back_whole_batch_on_database_error(bulk_repository):
+    healthy = _load_and_suspend(bulk_repository)
+    broken = _load_and_suspend(bulk_repository)
+
+    # A pre-existing row with the same transition_id makes the bulk INSERT fail.
+    EnrollmentMapper.to_transition(state_transition=broken.transitions[-1], enrollment_id=broken.id).save()
+
+    with pytest.raises(EnrollmentTechnicalPersistenceError) as e:
+        bulk_repository.save_many([healthy, broken])
+
+    assert e.value.code == ErrorCodes.DATABASE_ERROR
+    assert EnrollmentModel.objects.get(id=healthy.id).version == healthy.version
+    assert EnrollmentTransitionModel.objects.filter(enrollment_id=healthy.id).count() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_save_many_rejects_duplicated_ids():
+    repository = DjangoEnrollmentRepository()
+    enrollment = _load_and_suspend(repository)
+
+    with pytest.raises(ValueError):
+        repository.save_many([enrollment, enrollment])
+
+
+@pytest.mark.django_db(transaction=True)
+def test_save_persists_every_pending_transition_in_one_insert():
+    enrollment = factory_create_new_enrollment_for_tests()
+    repository = DjangoEnrollmentRepository()
+    repository.use_returning_save = False
+    loaded = repository.get_by_id(enrollment_id=str(enrollment.id))
+    assert loaded is not None
+
+    actor_id = str(uuid.uuid4())
+    loaded.suspend(actor_id=actor_id, justification="leave", occurred_at=datetime(2026, 3, 1, tzinfo=UTC))
+    loaded.reactivate(actor_id=actor_id, justification="back", occurred_at=datetime(2026, 3, 2, tzinfo=UTC))
+    loaded.suspend(actor_id=actor_id, justification="again", occurred_at=datetime(2026, 3, 3, tzinfo=UTC))
+
+    retried = copy.deepcopy(loaded)
+    with CaptureQueriesContext(connection) as ctx:
+        new_version = repository.save(loaded)
+
+    statements = [query["sql"] for query in ctx.captured_queries]
+    assert sum(sql.startswith("UPDATE") for sql in statements) == 1
+    assert sum(sql.startswith('INSERT INTO "enrollment_transitions"') for sql in statements) == 1
+
+    assert new_version == enrollment.version + 1
+    reloaded = repository.get_by_id(enrollment_id=str(enrollment.id))
+    assert reloaded is not None
+    assert reloaded.transitions == loaded.transitions
+    assert reloaded.pending_transitions() == []
+
+    # Retrying the same save is a replay: same version, no duplicated history.
+    assert repository.save(retried) == new_version
+    assert EnrollmentTransitionModel.objects.filter(enrollment_id=str(enrollment.id)).count() == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_save_without_pending_transitions_is_rejected():
+    enrollment = factory_create_new_enrollment_for_tests()
+    repository = DjangoEnrollmentRepository()
+    loaded = repository.get_by_id(enrollment_id=str(enrollment.id))
+    assert loaded is not None
+    loaded.suspend(actor_id=str(uuid.uuid4()), justification="leave", occurred_at=datetime.now(UTC))
+    repository.save(loaded)
+
+    reloaded = repository.get_by_id(enrollment_id=str(enrollment.id))
+    assert reloaded is not None
+
+    with pytest.raises(EnrollmentTechnicalPersistenceError) as e:
+        repository.save(reloaded)
+
+    assert e.value.code == ErrorCodes.MISSING_TRANSITIONS
+
+
+@pytest.mark.django_db(transaction=True)
+def test_save_many_persists_every_pending_transition(bulk_repository):
+    enrollments = [_load_and_suspend(bulk_repository) for _ in range(2)]
+    for enrollment in enrollments:
+        enrollment.reactivate(actor_id=str(uuid.uuid4()), justification="fix", occurred_at=datetime.now(UTC))
+
+    retried = copy.deepcopy(enrollments)
+    outcomes = bulk_repository.save_many(enrollments)
+
+    assert all(outcomes[e.id] == e.version + 1 for e in retried)
+    assert EnrollmentTransitionModel.objects.count() == 4
+    assert bulk_repository.save_many(retried) == outcomes
+    assert EnrollmentTransitionModel.objects.count() == 4
+
+
+@pytest.mark.django_db(transaction=True)
+def test_lazy_history_commands_and_save_never_read_the_transitions():
+    enrollment = factory_create_new_enrollment_for_tests()
+    eager = DjangoEnrollmentRepository()
+    loaded = eager.get_by_id(enrollment_id=str(enrollment.id))
+    assert loaded is not None
+    loaded.suspend(actor_id=str(uuid.uuid4()), justification="first", occurred_at=datetime(2026, 1, 1, tzinfo=UTC))
+    eager.save(loaded)
+
+    repository = DjangoEnrollmentRepository(lazy_history=True)
+    with CaptureQueriesContext(connection) as ctx:
+        result = repository.get_by_id(enrollment_id=str(enrollment.id))
+        assert result is not None
+        result.reactivate(actor_id=str(uuid.uuid4()), justification="second", occurred_at=datetime(2026, 1, 2, tzinfo=UTC))
+        repository.save(result)
+
+    transition_reads = [
+        q["sql"] for q in ctx.captured_queries
+        if q["sql"].lstrip().upper().startswith("SELECT") and "enrollment_transitions" in q["sql"]
+    ]
+    assert transition_reads == []
+    assert EnrollmentTransitionModel.objects.filter(enrollment_id=str(enrollment.id)).count() == 2
+
+    # The history still reads back in full, persisted prefix first
+    assert [t.justification for t in result.transitions] == ["first", "second"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_lazy_get_many_loads_snapshots_only(django_assert_num_queries):
+    repository = DjangoEnrollmentRepository(lazy_history=True)
+    ids = [str(factory_create_new_enrollment_for_tests().id) for _ in range(3)]
+    missing_id = str(uuid.uuid4())
+
+    with django_assert_num_queries(1):
+        result = repository.get_many([*ids, missing_id])
+
+    assert result[missing_id] is None
+    with django_assert_num_queries(1):
+        assert result[ids[0]].transitions == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_lazy_get_by_id_returns_none_for_unknown_id():
+    assert DjangoEnrollmentRepository(lazy_history=True).get_by_id(str(uuid.uuid4())) is None
@@ -0,0 +1,88 @@
+import asyncio
+import uuid
+
+import pytest
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.repositories.async_django_enrollment_repository import (
+    AsyncDjangoEnrollmentRepository,
+)
+from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+from asgiref.sync import async_to_sync
+
+from application.academic.enrollment.errors.persistence_errors import ConcurrencyConflictError
+from application.academic.enrollment.services.create_enrollment import AsyncCreateEnrollment
+from application.academic.enrollment.services.suspend_enrollment import (
+    AsyncSuspendEnrollmentService,
+)
+from infrastructureTests.factory.new_enrollment_factory import (
+    factory_create_new_enrollment_for_tests,
+)
+
+ACTOR_ID = str(uuid.uuid4())
+
+# async_to_sync runs the coroutine in its own loop and sends thread-sensitive
+# ORM work back to the test thread, so it sees the test's transaction.
+
+
+@pytest.mark.django_db
+def test_async_get_by_id_matches_the_sync_repository() -> None:
+    snapshot = factory_create_new_enrollment_for_tests()
+    sync_repository = DjangoEnrollmentRepository()
+    enrollment = sync_repository.get_by_id(str(snapshot.id))
+    assert enrollment is not None
+    enrollment.suspend(actor_id=ACTOR_ID, justification="leave")
+    sync_repository.save(enrollment)
+
+    loaded = async_to_sync(AsyncDjangoEnrollmentRepository().get_by_id)(str(snapshot.id))
+
+    assert loaded is not None
+    assert (loaded.state, loaded.version) == (enrollment.state, enrollment.version + 1)
+    assert list(loaded.transitions) == list(enrollment.transitions)
+
+
+@pytest.mark.django_db
+def test_async_get_by_id_missing_is_none() -> None:
+    assert async_to_sync(AsyncDjangoEnrollmentRepository().get_by_id)(str(uuid.uuid4())) is None
+
+
+@pytest.mark.django_db
+def test_async_services_create_and_change_state_concurrently() -> None:
+    repository = AsyncDjangoEnrollmentRepository()
+    create = AsyncCreateEnrollment(repo=repository)
+    suspend = AsyncSuspendEnrollmentService(repo=repository)
+
+    async def scenario():
+        created = await asyncio.gather(*(
+            create.execute(
+                institution_id=str(uuid.uuid4()),
+                student_id=str(uuid.uuid4()),
+                class_group_id=str(uuid.uuid4()),
+                academic_period_id=str(uuid.uuid4()),
+                actor_id=ACTOR_ID,
+            )
+            for _ in range(5)
+        ))
+        suspended = await asyncio.gather(*(
+            suspend.execute(enrollment_id=result.aggregate_id, actor_id=ACTOR_ID, justification="leave")
+            for result in created
+        ))
+        return created, suspended
+
+    created, suspended = async_to_sync(scenario)()
+
+    assert all(result.success for result in created + suspended)
+    ids = [result.aggregate_id for result in created]
+    assert set(EnrollmentModel.objects.filter(id__in=ids).values_list("state", flat=True)) == {"suspended"}
+
+
+@pytest.mark.django_db
+def test_async_save_of_a_stale_aggregate_is_a_conflict() -> None:
+    snapshot = factory_create_new_enrollment_for_tests()
+    repository = AsyncDjangoEnrollmentRepository()
+    enrollment = async_to_sync(repository.get_by_id)(str(snapshot.id))
+    assert enrollment is not None
+    EnrollmentModel.objects.filter(id=snapshot.id).update(version=enrollment.version + 1)
+    enrollment.suspend(actor_id=ACTOR_ID, justification="leave")
+
+    with pytest.raises(ConcurrencyConflictError):
+        async_to_sync(repository.save)(enrollment)
@@ -0,0 +1,209 @@
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.repositories.cached_enrollment_repository import CachedEnrollmentRepository
+from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+from apps.academic.repositories.enrollment_cache import (
+    CachedEnrollment,
+    DjangoCacheEnrollmentCache,
+    LocalLRUEnrollmentCache,
+)
+from django.db import transaction
+
+from application.academic.enrollment.errors.persistence_errors import ConcurrencyConflictError
+from application.academic.enrollment.services.cancel_enrollment import CancelEnrollmentService
+from infrastructureTests.factory.new_enrollment_factory import (
+    factory_create_new_enrollment_for_tests,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _entry(version: int) -> CachedEnrollment:
+    return CachedEnrollment(version=version, snapshot_row=("row",))
+
+
+@pytest.fixture(params=["local", "django"])
+def cached_repository(request) -> CachedEnrollmentRepository:
+    if request.param == "local":
+        backend = LocalLRUEnrollmentCache(max_entries=100, ttl_seconds=60)
+    else:
+        backend = DjangoCacheEnrollmentCache(key_prefix=f"test:{uuid.uuid4()}:")
+    return CachedEnrollmentRepository(inner=DjangoEnrollmentRepository(), backend=backend)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_second_read_is_served_from_cache_without_queries(cached_repository, django_assert_num_queries):
+    enrollment = factory_create_new_enrollment_for_tests()
+
+    first = cached_repository.get_by_id(str(enrollment.id))
+    with django_assert_num_queries(0):
+        second = cached_repository.get_by_id(str(enrollment.id))
+
+    assert first is not None and second is not None
+    assert second is not first
+    assert second == first
+    assert cached_repository.stats.hits == 1
+    assert cached_repository.stats.misses == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_save_replaces_entry_with_the_new_version(cached_repository, django_assert_num_queries):
+    enrollment = factory_create_new_enrollment_for_tests()
+    loaded = cached_repository.get_by_id(str(enrollment.id))
+    assert loaded is not None
+
+    loaded.suspend(actor_id=str(uuid.uuid4()), justification="cached", occurred_at=datetime.now(UTC))
+    new_version = cached_repository.save(loaded)
+
+    with django_assert_num_queries(0):
+        reloaded = cached_repository.get_by_id(str(enrollment.id))
+
+    assert reloaded is not None
+    assert reloaded.version == new_version
+    assert reloaded.state.value == "suspended"
+    assert [t.justification for t in reloaded.transitions] == ["cached"]
+    assert reloaded.peek_domain_events() == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_conflict_blocks_stale_entries_until_newer_state_is_read(cached_repository):
+    enrollment = factory_create_new_enrollment_for_tests()
+    stale = cached_repository.get_by_id(str(enrollment.id))
+    assert stale is not None
+
+    concurrent_writer = DjangoEnrollmentRepository()
+    winner = concurrent_writer.get_by_id(str(enrollment.id))
+    assert winner is not None
+    winner.cancel(actor_id=str(uuid.uuid4()), justification="winner", occurred_at=datetime.now(UTC))
+    concurrent_writer.save(winner)
+
+    stale.suspend(actor_id=str(uuid.uuid4()), justification="late", occurred_at=datetime.now(UTC))
+
+    with pytest.raises(ConcurrencyConflictError):
+        cached_repository.save(stale)
+
+    # A slow reader that still holds the old version cannot refill the cache.
+    cached_repository.backend.put(stale.id, CachedEnrollment(version=stale.version, snapshot_row=("stale",)))
+
+    fresh = cached_repository.get_by_id(str(enrollment.id))
+    assert fresh is not None
+    assert fresh.state.value == "cancelled"
+    assert fresh.version == stale.version + 1
+    assert cached_repository.stats.invalidations == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_rolled_back_write_never_reaches_the_cache(cached_repository):
+    enrollment = factory_create_new_enrollment_for_tests()
+    enrollment_id = str(enrollment.id)
+    cached_repository.get_by_id(enrollment_id)
+
+    with pytest.raises(RuntimeError), transaction.atomic():
+        result = CancelEnrollmentService(cached_repository).execute(
+            enrollment_id=enrollment_id, actor_id=str(uuid.uuid4()), justification="rolled back",
+        )
+        assert result.success
+        # Reads inside the block see the uncommitted write, but are not cached either
+        assert cached_repository.get_by_id(enrollment_id).state.value == "cancelled"
+        raise RuntimeError("rollback")
+
+    assert EnrollmentModel.objects.get(id=enrollment_id).state == "active"
+    reloaded = cached_repository.get_by_id(enrollment_id)
+    assert reloaded is not None
+    assert (reloaded.state.value, reloaded.version) == ("active", 1)
+    assert CancelEnrollmentService(cached_repository).execute(
+        enrollment_id=enrollment_id, actor_id=str(uuid.uuid4()), justification="committed",
+    ).success
+
+
+@pytest.mark.django_db(transaction=True)
+def test_committed_write_is_cached_once_the_transaction_commits(cached_repository, django_assert_num_queries):
+    enrollment_id = str(factory_create_new_enrollment_for_tests().id)
+
+    with transaction.atomic():
+        loaded = cached_repository.get_by_id(enrollment_id)
+        assert loaded is not None
+        loaded.suspend(actor_id=str(uuid.uuid4()), justification="committed", occurred_at=datetime.now(UTC))
+        cached_repository.save(loaded)
+        assert cached_repository.backend.get(enrollment_id) is None
+
+    with django_assert_num_queries(0):
+        reloaded = cached_repository.get_by_id(enrollment_id)
+    assert reloaded is not None and reloaded.state.value == "suspended"
+
+
+@pytest.mark.django_db(transaction=True)
+def test_get_many_reads_only_the_missing_ids_from_the_inner_repository(cached_repository, django_assert_num_queries):
+    cached_id = str(factory_create_new_enrollment_for_tests().id)
+    uncached_id = str(factory_create_new_enrollment_for_tests().id)
+    missing_id = str(uuid.uuid4())
+    cached_repository.get_by_id(cached_id)
+
+    with django_assert_num_queries(2):
+        result = cached_repository.get_many([cached_id, uncached_id, missing_id])
+
+    assert list(result) == [cached_id, uncached_id, missing_id]
+    assert result[missing_id] is None
+    with django_assert_num_queries(0):
+        assert cached_repository.get_by_id(uncached_id) == result[uncached_id]
+
+
+def test_local_cache_evicts_least_recently_used_entries():
+    cache = LocalLRUEnrollmentCache(max_entries=2, ttl_seconds=60)
+    cache.put("a", _entry(1))
+    cache.put("b", _entry(1))
+    cache.get("a")
+    cache.put("c", _entry(1))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.evictions == 1
+
+
+def test_local_cache_expires_entries_after_ttl():
+    clock = FakeClock()
+    cache = LocalLRUEnrollmentCache(ttl_seconds=10, clock=clock)
+    cache.put("a", _entry(1))
+
+    clock.now = 9.9
+    assert cache.get("a") is not None
+    clock.now = 10.0
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_local_cache_never_replaces_an_entry_with_an_older_version():
+    cache = LocalLRUEnrollmentCache()
+    cache.put("a", _entry(3))
+    cache.put("a", _entry(2))
+
+    stored = cache.get("a")
+    assert stored is not None
+    assert stored.version == 3
+
+
+def test_tombstone_replaces_an_entry_with_a_newer_version():
+    cache = LocalLRUEnrollmentCache()
+    cache.put("a", _entry(3))
+    cache.put("a", CachedEnrollment(version=2, snapshot_row=None))
+
+    stored = cache.get("a")
+    assert stored is not None
+    assert stored.is_tombstone and stored.version == 2
+
+
+def test_local_cache_rejects_invalid_configuration():
+    with pytest.raises(ValueError):
+        LocalLRUEnrollmentCache(max_entries=0)
+    with pytest.raises(ValueError):
+        LocalLRUEnrollmentCache(ttl_seconds=0)
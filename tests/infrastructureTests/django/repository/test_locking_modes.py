@@ -0,0 +1,98 @@
+"""Pessimistic locking modes of DjangoEnrollmentRepository (load-for-update)."""
+
+import threading
+import uuid
+
+import pytest
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.repositories.django_enrollment_repository import (
+    DjangoEnrollmentRepository,
+    LockingMode,
+)
+from apps.academic.repositories.django_transaction_manager import DjangoTransactionManager
+from django.db import connection, connections, transaction
+from django.db.transaction import TransactionManagementError
+from django.test.utils import CaptureQueriesContext
+
+from application.academic.enrollment.services.reactivate_enrollment import (
+    ReactivateEnrollmentService,
+)
+from application.academic.enrollment.services.suspend_enrollment import SuspendEnrollmentService
+from infrastructureTests.factory.new_enrollment_factory import (
+    factory_create_new_enrollment_for_tests,
+)
+
+ACTOR_ID = str(uuid.uuid4())
+PESSIMISTIC = [LockingMode.FOR_UPDATE, LockingMode.ADVISORY]
+LOCK_SQL = {LockingMode.FOR_UPDATE: "FOR UPDATE", LockingMode.ADVISORY: "pg_advisory_xact_lock"}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("lazy_history", [False, True])
+@pytest.mark.parametrize("locking", PESSIMISTIC)
+def test_locked_load_returns_the_aggregate_and_takes_the_lock(locking, lazy_history) -> None:
+    snapshot = factory_create_new_enrollment_for_tests()
+    repository = DjangoEnrollmentRepository(locking=locking, lazy_history=lazy_history)
+
+    with transaction.atomic(), CaptureQueriesContext(connection) as ctx:
+        enrollment = repository.get_by_id(str(snapshot.id))
+
+    assert enrollment is not None
+    assert enrollment.id == str(snapshot.id)
+    if connection.vendor == "postgresql":
+        assert any(LOCK_SQL[locking] in query["sql"] for query in ctx.captured_queries)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("locking", PESSIMISTIC)
+def test_locked_load_outside_a_transaction_is_rejected(locking) -> None:
+    snapshot = factory_create_new_enrollment_for_tests()
+
+    with pytest.raises(TransactionManagementError):
+        DjangoEnrollmentRepository(locking=locking).get_by_id(str(snapshot.id))
+
+
+@pytest.mark.django_db
+def test_optimistic_load_takes_no_lock() -> None:
+    snapshot = factory_create_new_enrollment_for_tests()
+
+    with CaptureQueriesContext(connection) as ctx:
+        assert DjangoEnrollmentRepository().get_by_id(str(snapshot.id)) is not None
+
+    assert not any("FOR UPDATE" in query["sql"] for query in ctx.captured_queries)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize("locking", PESSIMISTIC)
+def test_contended_commands_queue_on_the_lock_instead_of_conflicting(locking) -> None:
+    if connection.vendor != "postgresql":
+        pytest.skip("Needs row/advisory locks and concurrent connections (PostgreSQL).")
+    enrollment_id = str(factory_create_new_enrollment_for_tests().id)
+    repository = DjangoEnrollmentRepository(locking=locking)
+    services = [
+        SuspendEnrollmentService(repo=repository, transaction=DjangoTransactionManager()),
+        ReactivateEnrollmentService(repo=repository, transaction=DjangoTransactionManager()),
+    ]
+    workers, commands_per_worker = 6, 5
+    start = threading.Barrier(workers)
+    results = []
+
+    def worker(index: int) -> None:
+        try:
+            start.wait()
+            for step in range(commands_per_worker):
+                service = services[(index + step) % 2]
+                results.append(service.execute(enrollment_id=enrollment_id, actor_id=ACTOR_ID, justification="load"))
+        finally:
+            connections.close_all()
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(results) == workers * commands_per_worker
+    assert all(result.success for result in results), [result.error for result in results if not result.success]
+    changed = sum(result.changed for result in results)
+    assert EnrollmentModel.objects.get(id=enrollment_id).version == 1 + changed
@@ -0,0 +1,205 @@
+"""Contract shared by both save() strategies: the PostgreSQL CTE and the portable ORM path."""
+
+import copy
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.models.enrollment_transition import EnrollmentTransitionModel
+from apps.academic.models.outbox_event import OutboxEventModel
+from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from application.academic.enrollment.errors.persistence_errors import (
+    ConcurrencyConflictError,
+    EnrollmentPersistenceNotFoundError,
+    EnrollmentTechnicalPersistenceError,
+)
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from infrastructureTests.factory.new_enrollment_factory import (
+    factory_create_new_enrollment_for_tests,
+)
+
+ACTOR_ID = str(uuid.uuid4())
+
+# (success, conflict) statements per save(): snapshot + transitions (+ classification),
+# then the state counts upsert and the outbox insert on success.
+EXPECTED_QUERIES = {"returning": (3, 1), "portable": (4, 3)}
+
+
+@pytest.fixture(params=["returning", "portable"])
+def strategy(request) -> str:
+    if request.param == "returning" and connection.vendor != "postgresql":
+        pytest.skip("The single-statement save is PostgreSQL only.")
+    return request.param
+
+
+@pytest.fixture
+def repository(strategy) -> DjangoEnrollmentRepository:
+    repository = DjangoEnrollmentRepository()
+    repository.use_returning_save = strategy == "returning"
+    return repository
+
+
+def _loaded(repository: DjangoEnrollmentRepository) -> Enrollment:
+    snapshot = factory_create_new_enrollment_for_tests()
+    enrollment = repository.get_by_id(str(snapshot.id))
+    assert enrollment is not None
+    return enrollment
+
+
+def _unacknowledged(enrollment: Enrollment) -> Enrollment:
+    """The aggregate as a caller that never saw the save succeed still holds it (pending, origin version)."""
+    return copy.deepcopy(enrollment)
+
+
+def _transitions(enrollment_id: str) -> list[tuple[str, str | None]]:
+    return list(
+        EnrollmentTransitionModel.objects.filter(enrollment_id=enrollment_id)
+        .order_by("occurred_at")
+        .values_list("to_state", "justification")
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_save_updates_snapshot_history_and_outbox(repository) -> None:
+    enrollment = _loaded(repository)
+    enrollment.suspend(actor_id=ACTOR_ID, justification="leave", occurred_at=datetime(2026, 3, 1, tzinfo=UTC))
+    enrollment.reactivate(actor_id=ACTOR_ID, justification="back", occurred_at=datetime(2026, 3, 2, tzinfo=UTC))
+
+    origin_version = enrollment.version
+    new_version = repository.save(enrollment)
+
+    snapshot = EnrollmentModel.objects.get(id=enrollment.id)
+    assert new_version == origin_version + 1
+    assert (enrollment.version, enrollment.pending_transitions()) == (new_version, [])
+    assert (snapshot.version, snapshot.state) == (new_version, "active")
+    assert snapshot.reactivated_at == datetime(2026, 3, 2, tzinfo=UTC)
+    assert _transitions(enrollment.id) == [("suspended", "leave"), ("active", "back")]
+    assert OutboxEventModel.objects.filter(aggregate_id=enrollment.id, aggregate_version=new_version).count() == 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_retrying_a_save_is_an_idempotent_replay(repository) -> None:
+    enrollment = _loaded(repository)
+    enrollment.suspend(actor_id=ACTOR_ID, justification="leave", occurred_at=datetime(2026, 3, 1, tzinfo=UTC))
+    retried = _unacknowledged(enrollment)
+    new_version = repository.save(enrollment)
+
+    assert repository.save(retried) == new_version
+    assert _transitions(enrollment.id) == [("suspended", "leave")]
+    assert OutboxEventModel.objects.filter(aggregate_id=enrollment.id).count() == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_saved_aggregate_can_be_changed_and_saved_again(repository) -> None:
+    enrollment = _loaded(repository)
+    enrollment.suspend(actor_id=ACTOR_ID, justification="leave", occurred_at=datetime(2026, 3, 1, tzinfo=UTC))
+    first_version = repository.save(enrollment)
+
+    enrollment.reactivate(actor_id=ACTOR_ID, justification="back", occurred_at=datetime(2026, 3, 2, tzinfo=UTC))
+
+    assert repository.save(enrollment) == first_version + 1
+    assert EnrollmentModel.objects.get(id=enrollment.id).version == first_version + 1
+    assert _transitions(enrollment.id) == [("suspended", "leave"), ("active", "back")]
+
+
+@pytest.mark.django_db
+def test_rolled_back_save_keeps_the_aggregate_pending(repository, django_capture_on_commit_callbacks) -> None:
+    enrollment = _loaded(repository)
+    enrollment.suspend(actor_id=ACTOR_ID, justification="leave")
+    origin_version = enrollment.version
+
+    with django_capture_on_commit_callbacks(execute=False):
+        repository.save(enrollment)
+
+    assert enrollment.version == origin_version
+    assert len(enrollment.pending_transitions()) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_stale_version_is_a_conflict_reporting_the_persisted_version(repository) -> None:
+    enrollment = _loaded(repository)
+    enrollment.suspend(actor_id=ACTOR_ID, justification="leave")
+    EnrollmentModel.objects.filter(id=enrollment.id).update(version=enrollment.version + 4)
+
+    with pytest.raises(ConcurrencyConflictError) as error:
+        repository.save(enrollment)
+
+    assert error.value.details == {
+        "aggregate_id": enrollment.id,
+        "expected_version": enrollment.version,
+        "persisted_version": enrollment.version + 4,
+    }
+    assert _transitions(enrollment.id) == []
+
+
+@pytest.mark.django_db(transaction=True)
+def test_replayed_transition_with_a_different_snapshot_is_a_conflict(repository) -> None:
+    enrollment = _loaded(repository)
+    enrollment.suspend(actor_id=ACTOR_ID, justification="leave", occurred_at=datetime(2026, 3, 1, tzinfo=UTC))
+    retried = _unacknowledged(enrollment)
+    repository.save(enrollment)
+    EnrollmentModel.objects.filter(id=enrollment.id).update(version=retried.version + 2)
+
+    with pytest.raises(ConcurrencyConflictError) as error:
+        repository.save(retried)
+
+    assert error.value.details["persisted_version"] == retried.version + 2
+
+
+@pytest.mark.django_db(transaction=True)
+def test_missing_snapshot_is_not_found(repository) -> None:
+    enrollment = Enrollment.create(
+        institution_id=str(uuid.uuid4()),
+        student_id=str(uuid.uuid4()),
+        class_group_id=str(uuid.uuid4()),
+        academic_period_id=str(uuid.uuid4()),
+        actor_id=ACTOR_ID,
+    )
+    enrollment.suspend(actor_id=ACTOR_ID, justification="leave")
+
+    with pytest.raises(EnrollmentPersistenceNotFoundError):
+        repository.save(enrollment)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_transition_already_stored_under_a_fresh_snapshot_rolls_back(repository) -> None:
+    enrollment = _loaded(repository)
+    enrollment.suspend(actor_id=ACTOR_ID, justification="leave", occurred_at=datetime(2026, 3, 1, tzinfo=UTC))
+    enrollment, saved = _unacknowledged(enrollment), enrollment
+    repository.save(saved)
+    # Put the snapshot back at the origin version: the UPDATE applies again,
+    # but the pending transition_id is already stored.
+    EnrollmentModel.objects.filter(id=enrollment.id).update(version=enrollment.version, state="active", suspended_at=None)
+
+    with pytest.raises(EnrollmentTechnicalPersistenceError):
+        repository.save(enrollment)
+
+    snapshot = EnrollmentModel.objects.get(id=enrollment.id)
+    assert (snapshot.version, snapshot.state) == (enrollment.version, "active")
+    assert _transitions(enrollment.id) == [("suspended", "leave")]
+
+
+def _statements(ctx: CaptureQueriesContext) -> int:
+    """Captured statements, leaving out transaction control (BEGIN/COMMIT/ROLLBACK)."""
+    return sum(query["sql"] not in ("BEGIN", "COMMIT", "ROLLBACK") for query in ctx.captured_queries)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_statements_per_save(repository, strategy) -> None:
+    success, conflict = EXPECTED_QUERIES[strategy]
+    enrollment = _loaded(repository)
+    enrollment.suspend(actor_id=ACTOR_ID, justification="leave")
+    stale = _loaded(repository)
+    stale.suspend(actor_id=ACTOR_ID, justification="leave")
+    EnrollmentModel.objects.filter(id=stale.id).update(version=stale.version + 1)
+
+    with CaptureQueriesContext(connection) as saved:
+        repository.save(enrollment)
+    with CaptureQueriesContext(connection) as conflicted, pytest.raises(ConcurrencyConflictError):
+        repository.save(stale)
+
+    assert (_statements(saved), _statements(conflicted)) == (success, conflict)
@@ -0,0 +1,87 @@
+"""UnitOfWork over the Django enrollment repository: one transaction, batched flush."""
+
+import uuid
+
+import pytest
+from apps.academic.models.enrollment_model import EnrollmentModel
+from apps.academic.models.outbox_event import OutboxEventModel
+from apps.academic.repositories.django_enrollment_repository import DjangoEnrollmentRepository
+from apps.academic.repositories.django_transaction_manager import DjangoTransactionManager
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from application.academic.enrollment.errors.persistence_errors import ConcurrencyConflictError
+from application.academic.enrollment.services.cancel_enrollment import CancelEnrollmentService
+from application.shared.unit_of_work import UnitOfWork
+from domain.academic.enrollment.events.enrollment_events import EnrollmentCancelled
+from infrastructureTests.factory.new_enrollment_factory import (
+    factory_create_new_enrollment_for_tests,
+)
+
+ACTOR_ID = str(uuid.uuid4())
+
+
+def _cancel_all(enrollment_ids: list[str]) -> tuple[UnitOfWork, CaptureQueriesContext]:
+    uow = UnitOfWork(transaction=DjangoTransactionManager(), enrollments=DjangoEnrollmentRepository())
+    with CaptureQueriesContext(connection) as ctx, uow:
+        for enrollment in uow.enrollments.get_many(enrollment_ids).values():
+            assert enrollment is not None
+            enrollment.cancel(actor_id=ACTOR_ID, justification="student left")
+        # Already in the identity map: no statement
+        for enrollment_id in enrollment_ids:
+            uow.enrollments.get_by_id(enrollment_id)
+    return uow, ctx
+
+
+def _new_ids(count: int) -> list[str]:
+    return [str(factory_create_new_enrollment_for_tests().id) for _ in range(count)]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_workflow_commits_in_one_transaction_with_a_constant_statement_count() -> None:
+    small_ids, large_ids = _new_ids(2), _new_ids(6)
+
+    _, small = _cancel_all(small_ids)
+    uow, large = _cancel_all(large_ids)
+
+    assert len(large.captured_queries) == len(small.captured_queries)
+    assert sum(query["sql"] == "BEGIN" for query in large.captured_queries) <= 1
+    assert set(EnrollmentModel.objects.filter(id__in=large_ids).values_list("state", flat=True)) == {"cancelled"}
+    assert OutboxEventModel.objects.filter(aggregate_id__in=large_ids).count() == 6
+    assert [type(event) for event in uow.events] == [EnrollmentCancelled] * 6
+
+
+@pytest.mark.django_db(transaction=True)
+def test_conflict_at_flush_rolls_back_every_aggregate() -> None:
+    enrollment_ids = _new_ids(3)
+    repository = DjangoEnrollmentRepository()
+    uow = UnitOfWork(transaction=DjangoTransactionManager(), enrollments=repository)
+
+    with pytest.raises(ConcurrencyConflictError), uow:
+        for enrollment in uow.enrollments.get_many(enrollment_ids).values():
+            assert enrollment is not None
+            enrollment.cancel(actor_id=ACTOR_ID, justification="student left")
+        EnrollmentModel.objects.filter(id=enrollment_ids[-1]).update(version=5)
+
+    assert set(EnrollmentModel.objects.filter(id__in=enrollment_ids).values_list("state", flat=True)) == {"active"}
+    assert not OutboxEventModel.objects.filter(aggregate_id__in=enrollment_ids).exists()
+    assert uow.events == ()
+
+
+@pytest.mark.django_db(transaction=True)
+def test_service_inside_the_unit_writes_its_events_to_the_outbox() -> None:
+    enrollment_ids = _new_ids(2)
+    uow = UnitOfWork(transaction=DjangoTransactionManager(), enrollments=DjangoEnrollmentRepository())
+
+    with uow:
+        service = CancelEnrollmentService(uow.enrollments)
+        results = [
+            service.execute(enrollment_id=enrollment_id, actor_id=ACTOR_ID, justification="closed")
+            for enrollment_id in enrollment_ids
+        ]
+
+    assert all(result.success for result in results)
+    assert set(EnrollmentModel.objects.filter(id__in=enrollment_ids).values_list("state", flat=True)) == {"cancelled"}
+    outbox_types = OutboxEventModel.objects.filter(aggregate_id__in=enrollment_ids).values_list("event_type", flat=True)
+    assert list(outbox_types) == ["EnrollmentCancelled"] * 2
+    assert [type(event) for event in uow.events] == [EnrollmentCancelled] * 2
@@ -0,0 +1,259 @@
+import copy
+import threading
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from application.academic.enrollment.dto.errors.error_codes import ErrorCodes
+from application.academic.enrollment.errors.persistence_errors import (
+    ConcurrencyConflictError,
+    EnrollmentDuplicationError,
+    EnrollmentPersistenceNotFoundError,
+    EnrollmentTechnicalPersistenceError,
+)
+from application.academic.enrollment.services.bulk_cancel_enrollment import (
+    BulkCancelEnrollmentService,
+)
+from domain.academic.enrollment.entities.enrollment import Enrollment
+from domain.academic.enrollment.value_objects.conclusion_verdict import ConclusionVerdict
+from domain.academic.enrollment.value_objects.enrollment_status import EnrollmentState
+from infrastructure.memory.in_memory_enrollment_repository import InMemoryEnrollmentRepository
+
+ACTOR_ID = str(uuid.uuid4())
+CLASS_GROUP_ID = str(uuid.uuid4())
+PERIOD_ID = str(uuid.uuid4())
+
+
+def _new(*, student_id: str | None = None, class_group_id: str = CLASS_GROUP_ID) -> Enrollment:
+    return Enrollment.create(
+        institution_id="inst-1",
+        student_id=student_id or str(uuid.uuid4()),
+        class_group_id=class_group_id,
+        academic_period_id=PERIOD_ID,
+        actor_id=ACTOR_ID,
+    )
+
+
+def _stored(repository: InMemoryEnrollmentRepository, **kwargs) -> Enrollment:
+    enrollment = _new(**kwargs)
+    repository.create(enrollment)
+    loaded = repository.get_by_id(enrollment.id)
+    assert loaded is not None
+    return loaded
+
+
+@pytest.fixture
+def repository() -> InMemoryEnrollmentRepository:
+    return InMemoryEnrollmentRepository(stripes=8)
+
+
+def test_loads_return_fresh_aggregates(repository) -> None:
+    enrollment = _stored(repository)
+
+    first, second = repository.get_by_id(enrollment.id), repository.get_by_id(enrollment.id)
+
+    assert first == second and first is not second
+    assert repository.get_by_id("missing") is None
+    assert repository.get_many([enrollment.id, "missing", enrollment.id]) == {enrollment.id: first, "missing": None}
+
+
+def test_create_rejects_a_repeated_id_or_business_key(repository) -> None:
+    enrollment = _new()
+    assert repository.create(enrollment) == 1
+
+    other_key = _new()
+    other_key.id = enrollment.id
+
+    with pytest.raises(EnrollmentDuplicationError) as same_id:
+        repository.create(other_key)
+    with pytest.raises(EnrollmentDuplicationError) as same_key:
+        repository.create(_new(student_id=enrollment.student_id))
+    with pytest.raises(EnrollmentDuplicationError) as both:
+        repository.create(enrollment)
+
+    assert same_id.value.details == {"constraint": "id"}
+    assert same_key.value.details == {"constraint": "unique_enrollment"}
+    # The business key wins, as in DjangoEnrollmentRepository
+    assert both.value.details == {"constraint": "unique_enrollment"}
+    assert len(repository) == 1
+
+
+def test_save_appends_the_pending_history_and_bumps_the_version(repository) -> None:
+    enrollment = _stored(repository)
+    enrollment.suspend(actor_id=ACTOR_ID, justification="leave", occurred_at=datetime(2026, 3, 1, tzinfo=UTC))
+    enrollment.reactivate(actor_id=ACTOR_ID, justification="back", occurred_at=datetime(2026, 3, 2, tzinfo=UTC))
+
+    assert repository.save(enrollment) == 2
+
+    loaded = repository.get_by_id(enrollment.id)
+    assert loaded is not None
+    assert (loaded.version, loaded.state) == (2, EnrollmentState.ACTIVE)
+    assert [t.to_state for t in loaded.transitions] == [EnrollmentState.SUSPENDED, EnrollmentState.ACTIVE]
+    assert loaded.pending_transitions() == []
+
+
+def test_retrying_a_save_is_an_idempotent_replay(repository) -> None:
+    enrollment = _stored(repository)
+    enrollment.suspend(actor_id=ACTOR_ID, justification="leave")
+    retried = copy.deepcopy(enrollment)
+
+    assert repository.save(enrollment) == repository.save(retried) == 2
+    loaded = repository.get_by_id(enrollment.id)
+    assert loaded is not None and len(loaded.transitions) == 1
+
+
+def test_saved_aggregate_can_be_changed_and_saved_again(repository) -> None:
+    enrollment = _stored(repository)
+    enrollment.suspend(actor_id=ACTOR_ID, justification="leave")
+    assert repository.save(enrollment) == 2
+    assert (enrollment.version, enrollment.pending_transitions()) == (2, [])
+
+    enrollment.reactivate(actor_id=ACTOR_ID, justification="back")
+
+    assert repository.save(enrollment) == 3
+    loaded = repository.get_by_id(enrollment.id)
+    assert loaded is not None and [t.to_state for t in loaded.transitions] == [
+        EnrollmentState.SUSPENDED, EnrollmentState.ACTIVE,
+    ]
+
+
+def test_stale_version_is_a_conflict(repository) -> None:
+    winner = _stored(repository)
+    loser = repository.get_by_id(winner.id)
+    assert loser is not None
+    winner.suspend(actor_id=ACTOR_ID, justification="leave")
+    loser.cancel(actor_id=ACTOR_ID, justification="left")
+    repository.save(winner)
+
+    with pytest.raises(ConcurrencyConflictError) as error:
+        repository.save(loser)
+
+    assert error.value.details == {"aggregate_id": winner.id, "expected_version": 1, "persisted_version": 2}
+
+
+def test_save_without_record_or_without_transitions_fails(repository) -> None:
+    unsaved = _new()
+    unsaved.suspend(actor_id=ACTOR_ID, justification="leave")
+    untouched = _stored(repository)
+
+    with pytest.raises(EnrollmentPersistenceNotFoundError):
+        repository.save(unsaved)
+    with pytest.raises(EnrollmentTechnicalPersistenceError) as error:
+        repository.save(untouched)
+    assert error.value.code == ErrorCodes.MISSING_TRANSITIONS
+
+
+def test_secondary_indexes_follow_creates_and_saves(repository) -> None:
+    in_group = sorted([_stored(repository).id, _stored(repository).id])
+    other = _stored(repository, class_group_id=str(uuid.uuid4()))
+    other.conclude(actor_id=ACTOR_ID, verdict=ConclusionVerdict())
+    repository.save(other)
+
+    assert repository.find_ids_by_class_group(class_group_id=CLASS_GROUP_ID, academic_period_id=PERIOD_ID) == in_group
+    assert repository.find_ids_by_class_group(class_group_id=CLASS_GROUP_ID, academic_period_id="other") == []
+    assert repository.find_ids_by_state(EnrollmentState.ACTIVE) == in_group
+    assert repository.find_ids_by_state(EnrollmentState.CONCLUDED, academic_period_id=PERIOD_ID) == [other.id]
+    assert repository.find_ids_by_academic_period(PERIOD_ID) == sorted([*in_group, other.id])
+
+
+def test_batch_methods_report_per_item_outcomes(repository) -> None:
+    existing = _stored(repository)
+    fresh, clash = _new(), _new(student_id=existing.student_id)
+
+    created = repository.create_many([fresh, clash])
+    assert created[fresh.id] == 1
+    assert isinstance(created[clash.id], EnrollmentDuplicationError)
+
+    stale = repository.get_by_id(existing.id)
+    assert stale is not None
+    existing.suspend(actor_id=ACTOR_ID, justification="leave")
+    repository.save(existing)
+    stale.cancel(actor_id=ACTOR_ID, justification="left")
+    loaded_fresh = repository.get_by_id(fresh.id)
+    assert loaded_fresh is not None
+    loaded_fresh.suspend(actor_id=ACTOR_ID, justification="leave")
+
+    saved = repository.save_many([stale, loaded_fresh])
+    assert isinstance(saved[stale.id], ConcurrencyConflictError)
+    assert saved[fresh.id] == 2
+
+
+def test_application_services_run_on_it(repository) -> None:
+    ids = [_stored(repository).id for _ in range(3)]
+
+    results = BulkCancelEnrollmentService(repository).execute_for_class_group(
+        class_group_id=CLASS_GROUP_ID, academic_period_id=PERIOD_ID, actor_id=ACTOR_ID, justification="closed",
+    )
+
+    assert all(result.success and result.changed for result in results)
+    assert repository.find_ids_by_state(EnrollmentState.CANCELLED) == sorted(ids)
+
+
+def test_concurrent_writers_never_lose_an_update(repository) -> None:
+    enrollment = _stored(repository)
+    same_key = _new()
+    start = threading.Barrier(8)
+    saves: list[bool] = []
+    creates: list[bool] = []
+
+    def write(index: int) -> None:
+        mine = repository.get_by_id(enrollment.id)
+        assert mine is not None
+        mine.suspend(actor_id=ACTOR_ID, justification=f"writer {index}")
+        twin = _new(student_id=same_key.student_id)
+        start.wait()
+        try:
+            repository.save(mine)
+            saves.append(True)
+        except ConcurrencyConflictError:
+            saves.append(False)
+        try:
+            repository.create(twin)
+            creates.append(True)
+        except EnrollmentDuplicationError:
+            creates.append(False)
+
+    threads = [threading.Thread(target=write, args=(index,)) for index in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert saves.count(True) == 1
+    assert creates.count(True) == 1
+    loaded = repository.get_by_id(enrollment.id)
+    assert loaded is not None and (loaded.version, len(loaded.transitions)) == (2, 1)
+
+
+def test_snapshot_round_trip(repository, tmp_path) -> None:
+    suspended = _stored(repository)
+    suspended.suspend(actor_id=ACTOR_ID, justification="leave", occurred_at=datetime(2026, 3, 1, tzinfo=UTC))
+    repository.save(suspended)
+    active = _stored(repository)
+    path = tmp_path / "enrollments.ndjson"
+
+    assert repository.export_snapshot(path) == 2
+
+    restored = InMemoryEnrollmentRepository()
+    assert restored.import_snapshot(path) == 2
+    assert restored.get_by_id(suspended.id) == repository.get_by_id(suspended.id)
+    assert restored.get_by_id(active.id) == repository.get_by_id(active.id)
+    assert restored.find_ids_by_state(EnrollmentState.SUSPENDED) == [suspended.id]
+    with pytest.raises(EnrollmentDuplicationError):
+        restored.create(_new(student_id=active.student_id))
+
+
+def test_import_rejects_foreign_or_truncated_files(repository, tmp_path) -> None:
+    _stored(repository)
+    path = tmp_path / "enrollments.ndjson"
+    repository.export_snapshot(path)
+    header, _ = path.read_text(encoding="utf-8").splitlines()
+    path.write_text(header + "\n", encoding="utf-8")
+    foreign = tmp_path / "other.ndjson"
+    foreign.write_text('{"format": "something-else"}\n', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="truncated"):
+        InMemoryEnrollmentRepository().import_snapshot(path)
+    with pytest.raises(ValueError, match="not an enrollment snapshot"):
+        InMemoryEnrollmentRepository().import_snapshot(foreign)